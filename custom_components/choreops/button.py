@@ -655,6 +655,7 @@ class AssigneeChoreClaimButton(ChoreOpsCoordinatorEntity, ButtonEntity):
         self._assignee_id = assignee_id
         self._assignee_name = assignee_name
         self._chore_id = chore_id
+        self._update_keys = frozenset({(const.DATA_CHORES, chore_id)})
         self._chore_name = chore_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}_{chore_id}{const.BUTTON_KC_UID_SUFFIX_CLAIM}"
         self._attr_translation_placeholders = {
@@ -790,6 +791,7 @@ class ApproverChoreApproveButton(ChoreOpsCoordinatorEntity, ButtonEntity):
         self._assignee_id = assignee_id
         self._assignee_name = assignee_name
         self._chore_id = chore_id
+        self._update_keys = frozenset({(const.DATA_CHORES, chore_id)})
         self._chore_name = chore_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}_{chore_id}{const.BUTTON_KC_UID_SUFFIX_APPROVE}"
         self._attr_translation_placeholders = {
@@ -911,6 +913,7 @@ class ApproverChoreDisapproveButton(ChoreOpsCoordinatorEntity, ButtonEntity):
         self._assignee_id = assignee_id
         self._assignee_name = assignee_name
         self._chore_id = chore_id
+        self._update_keys = frozenset({(const.DATA_CHORES, chore_id)})
         self._chore_name = chore_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}_{chore_id}{const.BUTTON_KC_UID_SUFFIX_DISAPPROVE}"
         self._attr_icon = icon
@@ -1077,6 +1080,12 @@ class AssigneeRewardRedeemButton(ChoreOpsCoordinatorEntity, ButtonEntity):
         self._assignee_id = assignee_id
         self._assignee_name = assignee_name
         self._reward_id = reward_id
+        self._update_keys = frozenset(
+            {
+                (const.DATA_USERS, assignee_id),
+                (const.DATA_REWARDS, reward_id),
+            }
+        )
         self._reward_name = reward_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}_{reward_id}{const.BUTTON_KC_UID_SUFFIX_ASSIGNEE_REWARD_REDEEM}"
         self._attr_translation_placeholders = {
@@ -1221,6 +1230,12 @@ class ApproverRewardApproveButton(ChoreOpsCoordinatorEntity, ButtonEntity):
         self._assignee_id = assignee_id
         self._assignee_name = assignee_name
         self._reward_id = reward_id
+        self._update_keys = frozenset(
+            {
+                (const.DATA_USERS, assignee_id),
+                (const.DATA_REWARDS, reward_id),
+            }
+        )
         self._reward_name = reward_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}_{reward_id}{const.BUTTON_KC_UID_SUFFIX_APPROVE_REWARD}"
         self._attr_translation_placeholders = {
@@ -1345,6 +1360,12 @@ class ApproverRewardDisapproveButton(ChoreOpsCoordinatorEntity, ButtonEntity):
         self._assignee_id = assignee_id
         self._assignee_name = assignee_name
         self._reward_id = reward_id
+        self._update_keys = frozenset(
+            {
+                (const.DATA_USERS, assignee_id),
+                (const.DATA_REWARDS, reward_id),
+            }
+        )
         self._reward_name = reward_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}_{reward_id}{const.BUTTON_KC_UID_SUFFIX_DISAPPROVE_REWARD}"
         self._attr_translation_placeholders = {
@@ -1506,6 +1527,12 @@ class ApproverBonusApplyButton(ChoreOpsCoordinatorEntity, ButtonEntity):
         self._assignee_id = assignee_id
         self._assignee_name = assignee_name
         self._bonus_id = bonus_id
+        self._update_keys = frozenset(
+            {
+                (const.DATA_USERS, assignee_id),
+                (const.DATA_BONUSES, bonus_id),
+            }
+        )
         self._bonus_name = bonus_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}_{bonus_id}{const.BUTTON_KC_UID_SUFFIX_APPROVER_BONUS_APPLY}"
         self._user_icon = icon
@@ -1643,6 +1670,12 @@ class ApproverPenaltyApplyButton(ChoreOpsCoordinatorEntity, ButtonEntity):
         self._assignee_id = assignee_id
         self._assignee_name = assignee_name
         self._penalty_id = penalty_id
+        self._update_keys = frozenset(
+            {
+                (const.DATA_USERS, assignee_id),
+                (const.DATA_PENALTIES, penalty_id),
+            }
+        )
         self._penalty_name = penalty_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}_{penalty_id}{const.BUTTON_KC_UID_SUFFIX_APPROVER_PENALTY_APPLY}"
         self._user_icon = icon
@@ -1780,6 +1813,7 @@ class ApproverPointsAdjustButton(ChoreOpsCoordinatorEntity, ButtonEntity):
         super().__init__(coordinator)
         self._entry = entry
         self._assignee_id = assignee_id
+        self._update_keys = frozenset({(const.DATA_USERS, assignee_id)})
         self._assignee_name = assignee_name
         self._delta = delta
         self._points_label = str(points_label)
@@ -7,6 +7,9 @@
 Provides a read-only calendar view of chore due dates and schedule information.
 """
 
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 import datetime
 from typing import TYPE_CHECKING, Any, cast
 
@@ -40,6 +43,72 @@ if TYPE_CHECKING:
 # Set to 0 (unlimited) for coordinator-based entities that don't poll
 PARALLEL_UPDATES = 0
 
+# Recurring frequencies expanded from the scheduling source of truth
+_SCHEDULED_FREQUENCIES = frozenset(
+    {
+        const.FREQUENCY_DAILY,
+        const.FREQUENCY_WEEKLY,
+        const.FREQUENCY_BIWEEKLY,
+        const.FREQUENCY_MONTHLY,
+        const.FREQUENCY_QUARTERLY,
+        const.FREQUENCY_YEARLY,
+        const.FREQUENCY_CUSTOM,
+        const.FREQUENCY_CUSTOM_FROM_COMPLETE,
+        const.FREQUENCY_CUSTOM_FROM_COMPLETE_DATE_ONLY,
+        const.FREQUENCY_DAILY_MULTI,
+    }
+)
+
+
+@dataclass(slots=True)
+class _ChoreOccurrences:
+    """Materialized calendar events for one chore on one assignee calendar.
+
+    Events are kept in due-time order with parallel due/start/end arrays, so a
+    window query is a bisect range lookup. Recurring series are materialized
+    lazily from their anchor due date as later windows are requested, never
+    past ``limit``: only windows starting at or before the anchor render a
+    series, so anchor + daily horizon is the furthest any window can reach
+    (and nothing before the anchor is ever materialized).
+    """
+
+    token: tuple[Any, ...] | None
+    recurring: bool = False
+    anchor: datetime.datetime | None = None
+    limit: datetime.datetime | None = None
+    dues: list[datetime.datetime] = field(default_factory=list)
+    starts: list[datetime.datetime] = field(default_factory=list)
+    ends: list[datetime.datetime] = field(default_factory=list)
+    events: list[CalendarEvent] = field(default_factory=list)
+    source: Iterator[tuple[datetime.datetime, CalendarEvent]] | None = None
+    pending: tuple[datetime.datetime, CalendarEvent] | None = None
+
+    def append(self, due_dt: datetime.datetime, event: CalendarEvent) -> None:
+        """Append one occurrence (callers append in due-time order)."""
+        self.dues.append(due_dt)
+        self.starts.append(cast("datetime.datetime", event.start))
+        self.ends.append(cast("datetime.datetime", event.end))
+        self.events.append(event)
+
+    def extend_to(self, bound: datetime.datetime) -> None:
+        """Materialize pending occurrences due at or before ``bound``.
+
+        The bound is capped at ``limit``; once the series passes it the
+        occurrence generator is released.
+        """
+        if self.limit is not None and bound > self.limit:
+            bound = self.limit
+        while self.pending is not None and self.pending[0] <= bound:
+            self.append(*self.pending)
+            self.pending = next(self.source, None) if self.source else None
+        if (
+            self.pending is not None
+            and self.limit is not None
+            and self.pending[0] > self.limit
+        ):
+            self.source = None
+            self.pending = None
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -122,6 +191,14 @@ class AssigneeScheduleCalendar(CalendarEntity):
             tuple[str, int, str, tuple[int, ...], str], RecurrenceEngine
         ] = {}
         self._rrule_cache: dict[tuple[str, int, str, tuple[int, ...], str], str] = {}
+        # chore_id -> materialized occurrences, patched per chore on change
+        self._occurrence_store: dict[str, _ChoreOccurrences] = {}
+        # Visible item tokens, maintained from mutation signals; the revision
+        # counter only moves when one of them actually changes
+        self._chore_tokens: dict[str, tuple[Any, ...]] = {}
+        self._challenge_tokens: dict[str, tuple[Any, ...]] = {}
+        self._tokens_primed = False
+        self._cache_revision = 0
         self._dashboard_translations: dict[str, str] = {}
 
     def _get_timed_event_bounds(
@@ -153,12 +230,15 @@ class AssigneeScheduleCalendar(CalendarEntity):
             const.SIGNAL_SUFFIX_CHORE_CREATED,
             const.SIGNAL_SUFFIX_CHORE_UPDATED,
             const.SIGNAL_SUFFIX_CHORE_DELETED,
-            const.SIGNAL_SUFFIX_CHORE_RESCHEDULED,
-            const.SIGNAL_SUFFIX_CHORE_STATUS_RESET,
             const.SIGNAL_SUFFIX_CHALLENGE_CREATED,
             const.SIGNAL_SUFFIX_CHALLENGE_UPDATED,
             const.SIGNAL_SUFFIX_CHALLENGE_DELETED,
         )
+        # Resets and reschedules only matter when they move a schedule token
+        schedule_signals = (
+            const.SIGNAL_SUFFIX_CHORE_RESCHEDULED,
+            const.SIGNAL_SUFFIX_CHORE_STATUS_RESET,
+        )
 
         for suffix in invalidation_signals:
             signal = get_event_signal(self._config_entry.entry_id, suffix)
@@ -167,6 +247,13 @@ class AssigneeScheduleCalendar(CalendarEntity):
                     self.hass, signal, self._on_calendar_data_changed
                 )
             )
+        for suffix in schedule_signals:
+            signal = get_event_signal(self._config_entry.entry_id, suffix)
+            self.async_on_remove(
+                async_dispatcher_connect(
+                    self.hass, signal, self._on_chore_schedule_changed
+                )
+            )
 
     def _clear_event_caches(self) -> None:
         """Clear all read-path caches used by this calendar entity."""
@@ -176,70 +263,153 @@ class AssigneeScheduleCalendar(CalendarEntity):
 
     @callback
     def _on_calendar_data_changed(self, _payload: dict[str, Any] | None = None) -> None:
-        """Invalidate cached event artifacts when underlying data mutates."""
-        self._clear_event_caches()
-        self.async_write_ha_state()
+        """Invalidate cached event artifacts when a chore or challenge mutates."""
+        self._apply_calendar_mutation(_payload, force=True)
 
-    def _build_cache_revision(self) -> int:
-        """Build a lightweight revision token for this assignee's visible calendar data."""
-        revision = 0
+    @callback
+    def _on_chore_schedule_changed(
+        self, _payload: dict[str, Any] | None = None
+    ) -> None:
+        """Refresh a chore token after a reset/reschedule, invalidating on change."""
+        self._apply_calendar_mutation(_payload, force=False)
 
-        for chore in self.coordinator.chores_data.values():
-            if self._assignee_id not in chore.get(
-                const.DATA_CHORE_ASSIGNED_USER_IDS, []
-            ):
-                continue
-            if not chore.get(const.DATA_CHORE_SHOW_ON_CALENDAR, True):
-                continue
+    def _apply_calendar_mutation(
+        self, payload: dict[str, Any] | None, *, force: bool
+    ) -> None:
+        """Patch the token maps for one mutation and invalidate what it moved.
 
-            completion_criteria = chore.get(
-                const.DATA_CHORE_COMPLETION_CRITERIA, const.SENTINEL_EMPTY
+        Only the mutated chore's materialized occurrences are dropped; payloads
+        without a chore_id or challenge_id (bulk resets) rebuild every token.
+        """
+        payload = payload or {}
+        chore_id = payload.get(const.DATA_CHORE_ID)
+        challenge_id = payload.get(const.DATA_CHALLENGE_ID)
+
+        if not self._tokens_primed:
+            # Nothing has been served yet; tokens are primed on the next read
+            changed = True
+        elif chore_id:
+            chore = self.coordinator.chores_data.get(chore_id)
+            changed = self._store_token(
+                self._chore_tokens,
+                chore_id,
+                self._build_chore_token(chore) if chore is not None else None,
             )
-            if completion_criteria == const.COMPLETION_CRITERIA_INDEPENDENT:
-                due_date = chore.get(const.DATA_CHORE_PER_ASSIGNEE_DUE_DATES, {}).get(
-                    self._assignee_id
-                )
-                applicable_days = tuple(
-                    chore.get(const.DATA_CHORE_PER_ASSIGNEE_APPLICABLE_DAYS, {}).get(
-                        self._assignee_id, []
-                    )
-                )
-            else:
-                due_date = chore.get(const.DATA_CHORE_DUE_DATE)
-                applicable_days = tuple(chore.get(const.DATA_CHORE_APPLICABLE_DAYS, []))
-
-            chore_token = (
-                chore.get(const.DATA_CHORE_INTERNAL_ID, const.SENTINEL_EMPTY),
-                chore.get(
-                    const.DATA_CHORE_RECURRING_FREQUENCY,
-                    const.FREQUENCY_NONE,
-                ),
-                due_date,
-                chore.get(
-                    const.DATA_CHORE_DUE_WINDOW_OFFSET,
-                    const.DEFAULT_DUE_WINDOW_OFFSET,
-                ),
-                chore.get(const.DATA_CHORE_DAILY_MULTI_TIMES, const.SENTINEL_EMPTY),
-                applicable_days,
-                chore.get(const.DATA_CHORE_CUSTOM_INTERVAL, 1),
-                chore.get(const.DATA_CHORE_CUSTOM_INTERVAL_UNIT, const.TIME_UNIT_DAYS),
+        elif challenge_id:
+            challenge = self.coordinator.challenges_data.get(challenge_id)
+            changed = self._store_token(
+                self._challenge_tokens,
+                challenge_id,
+                self._build_challenge_token(challenge)
+                if challenge is not None
+                else None,
             )
-            revision ^= hash(chore_token)
+        else:
+            previous = (self._chore_tokens, self._challenge_tokens)
+            self._prime_revision_tokens()
+            changed = previous != (self._chore_tokens, self._challenge_tokens)
 
-        for challenge in self.coordinator.challenges_data.values():
-            if self._assignee_id not in challenge.get(
-                const.DATA_CHALLENGE_ASSIGNED_USER_IDS, []
-            ):
+        if not (changed or force):
+            return
+
+        self._cache_revision += 1
+        self._clear_event_caches()
+        if chore_id:
+            self._occurrence_store.pop(chore_id, None)
+        elif not challenge_id:
+            self._occurrence_store.clear()
+        # A rollover or bulk reset fires one signal per chore; write state once
+        self.coordinator.async_call_after_batch(self.async_write_ha_state)
+
+    @staticmethod
+    def _store_token(
+        tokens: dict[str, tuple[Any, ...]],
+        item_id: str,
+        token: tuple[Any, ...] | None,
+    ) -> bool:
+        """Store or drop one item token; return True when the map changed."""
+        if token is None:
+            return tokens.pop(item_id, None) is not None
+        if tokens.get(item_id) == token:
+            return False
+        tokens[item_id] = token
+        return True
+
+    def _prime_revision_tokens(self) -> None:
+        """Build the chore and challenge token maps from coordinator data."""
+        self._chore_tokens = {}
+        chores_data = self.coordinator.chores_data
+        assigned_chore_ids = self.coordinator.get_assignment_index(
+            const.ITEM_TYPE_CHORE
+        ).item_ids_for(self._assignee_id)
+        for chore_id in assigned_chore_ids:
+            chore = chores_data.get(chore_id)
+            if chore is None:
                 continue
+            chore_token = self._build_chore_token(chore)
+            if chore_token is not None:
+                self._chore_tokens[chore_id] = chore_token
+
+        self._challenge_tokens = {}
+        for challenge_id, challenge in self.coordinator.challenges_data.items():
+            challenge_token = self._build_challenge_token(challenge)
+            if challenge_token is not None:
+                self._challenge_tokens[challenge_id] = challenge_token
+
+        self._tokens_primed = True
+
+    def _build_chore_token(self, chore: dict) -> tuple[Any, ...] | None:
+        """Build the schedule token for a chore, or None when not on this calendar."""
+        if self._assignee_id not in chore.get(const.DATA_CHORE_ASSIGNED_USER_IDS, []):
+            return None
+        if not chore.get(const.DATA_CHORE_SHOW_ON_CALENDAR, True):
+            return None
 
-            challenge_token = (
-                challenge.get(const.DATA_CHALLENGE_INTERNAL_ID, const.SENTINEL_EMPTY),
-                challenge.get(const.DATA_CHALLENGE_START_DATE),
-                challenge.get(const.DATA_CHALLENGE_END_DATE),
+        completion_criteria = chore.get(
+            const.DATA_CHORE_COMPLETION_CRITERIA, const.SENTINEL_EMPTY
+        )
+        if completion_criteria == const.COMPLETION_CRITERIA_INDEPENDENT:
+            due_date = chore.get(const.DATA_CHORE_PER_ASSIGNEE_DUE_DATES, {}).get(
+                self._assignee_id
             )
-            revision ^= hash(challenge_token)
+            applicable_days = tuple(
+                chore.get(const.DATA_CHORE_PER_ASSIGNEE_APPLICABLE_DAYS, {}).get(
+                    self._assignee_id, []
+                )
+            )
+        else:
+            due_date = chore.get(const.DATA_CHORE_DUE_DATE)
+            applicable_days = tuple(chore.get(const.DATA_CHORE_APPLICABLE_DAYS, []))
 
-        return revision
+        return (
+            chore.get(const.DATA_CHORE_INTERNAL_ID, const.SENTINEL_EMPTY),
+            chore.get(
+                const.DATA_CHORE_RECURRING_FREQUENCY,
+                const.FREQUENCY_NONE,
+            ),
+            due_date,
+            chore.get(
+                const.DATA_CHORE_DUE_WINDOW_OFFSET,
+                const.DEFAULT_DUE_WINDOW_OFFSET,
+            ),
+            chore.get(const.DATA_CHORE_DAILY_MULTI_TIMES, const.SENTINEL_EMPTY),
+            applicable_days,
+            chore.get(const.DATA_CHORE_CUSTOM_INTERVAL, 1),
+            chore.get(const.DATA_CHORE_CUSTOM_INTERVAL_UNIT, const.TIME_UNIT_DAYS),
+        )
+
+    def _build_challenge_token(self, challenge: dict) -> tuple[Any, ...] | None:
+        """Build the window token for a challenge, or None when not on this calendar."""
+        if self._assignee_id not in challenge.get(
+            const.DATA_CHALLENGE_ASSIGNED_USER_IDS, []
+        ):
+            return None
+
+        return (
+            challenge.get(const.DATA_CHALLENGE_INTERNAL_ID, const.SENTINEL_EMPTY),
+            challenge.get(const.DATA_CHALLENGE_START_DATE),
+            challenge.get(const.DATA_CHALLENGE_END_DATE),
+        )
 
     def _get_cached_events(
         self,
@@ -247,10 +417,12 @@ class AssigneeScheduleCalendar(CalendarEntity):
         window_end: datetime.datetime,
     ) -> list[CalendarEvent]:
         """Return cached events for a window or generate and cache them."""
+        if not self._tokens_primed:
+            self._prime_revision_tokens()
         cache_key = (
             window_start.isoformat(),
             window_end.isoformat(),
-            self._build_cache_revision(),
+            self._cache_revision,
         )
         cached = self._events_cache.get(cache_key)
         if cached is not None:
@@ -568,16 +740,13 @@ class AssigneeScheduleCalendar(CalendarEntity):
             reference_time=current_due_utc,
         )
 
-    def _add_daily_multi_occurrence_event(
+    def _build_daily_multi_occurrence_event(
         self,
-        events: list[CalendarEvent],
         summary: str,
         description: str,
         occurrence_utc: datetime.datetime,
-        window_start: datetime.datetime,
-        window_end: datetime.datetime,
-    ) -> None:
-        """Add one DAILY_MULTI slot occurrence using the persisted due-time series."""
+    ) -> CalendarEvent:
+        """Build one DAILY_MULTI slot occurrence using the persisted due-time series."""
         local_occurrence = dt_util.as_local(occurrence_utc)
         hour = local_occurrence.hour
         if hour < 12:
@@ -587,52 +756,39 @@ class AssigneeScheduleCalendar(CalendarEntity):
         else:
             time_label = "Evening"
 
-        event_summary = f"{summary} ({time_label})"
-        event_end = occurrence_utc + datetime.timedelta(minutes=15)
-        event = CalendarEvent(
-            summary=event_summary,
+        return CalendarEvent(
+            summary=f"{summary} ({time_label})",
             start=occurrence_utc,
-            end=event_end,
+            end=occurrence_utc + datetime.timedelta(minutes=15),
             description=description,
         )
-        self._add_event_if_overlaps(events, event, window_start, window_end)
 
-    def _generate_schedule_source_events(
+    def _iter_schedule_occurrences(
         self,
-        events: list[CalendarEvent],
         chore_id: str,
         summary: str,
         description: str,
         chore_info: ChoreData,
         due_dt: datetime.datetime,
-        window_start: datetime.datetime,
-        window_end: datetime.datetime,
-    ) -> None:
-        """Generate due-dated recurrence events from the scheduling source of truth."""
+    ) -> Iterator[tuple[datetime.datetime, CalendarEvent]]:
+        """Yield ``(due, event)`` occurrences from the scheduling source of truth.
+
+        The series starts at ``due_dt`` and is unbounded apart from the
+        MAX_DATE_CALCULATION_ITERATIONS safety cap; callers stop consuming
+        once occurrences pass their window.
+        """
         recurring = chore_info.get(
             const.DATA_CHORE_RECURRING_FREQUENCY,
             const.FREQUENCY_NONE,
         )
-        generation_end = self._scheduled_window_end(
-            recurring,
-            window_start,
-            window_end,
-        )
-
         current_due_utc = due_dt
         iterations = 0
-        while (
-            current_due_utc <= generation_end
-            and iterations < const.MAX_DATE_CALCULATION_ITERATIONS
-        ):
+        while iterations < const.MAX_DATE_CALCULATION_ITERATIONS:
             if recurring == const.FREQUENCY_DAILY_MULTI:
-                self._add_daily_multi_occurrence_event(
-                    events,
+                event = self._build_daily_multi_occurrence_event(
                     summary,
                     description,
                     current_due_utc,
-                    window_start,
-                    window_end,
                 )
             else:
                 event_start, event_end = self._get_timed_event_bounds(
@@ -645,7 +801,7 @@ class AssigneeScheduleCalendar(CalendarEntity):
                     end=event_end,
                     description=description,
                 )
-                self._add_event_if_overlaps(events, event, window_start, window_end)
+            yield current_due_utc, event
 
             next_due_utc = self._next_scheduled_occurrence(
                 chore_info,
@@ -657,11 +813,43 @@ class AssigneeScheduleCalendar(CalendarEntity):
             current_due_utc = next_due_utc
             iterations += 1
 
-        if iterations >= const.MAX_DATE_CALCULATION_ITERATIONS:
-            const.LOGGER.warning(
-                "Calendar: Max schedule iterations reached for %s",
-                summary,
-            )
+        const.LOGGER.warning(
+            "Calendar: Max schedule iterations reached for %s",
+            summary,
+        )
+
+    def _generate_schedule_source_events(
+        self,
+        events: list[CalendarEvent],
+        chore_id: str,
+        summary: str,
+        description: str,
+        chore_info: ChoreData,
+        due_dt: datetime.datetime,
+        window_start: datetime.datetime,
+        window_end: datetime.datetime,
+    ) -> None:
+        """Generate due-dated recurrence events from the scheduling source of truth."""
+        recurring = chore_info.get(
+            const.DATA_CHORE_RECURRING_FREQUENCY,
+            const.FREQUENCY_NONE,
+        )
+        generation_end = self._scheduled_window_end(
+            recurring,
+            window_start,
+            window_end,
+        )
+
+        for occurrence_utc, event in self._iter_schedule_occurrences(
+            chore_id,
+            summary,
+            description,
+            chore_info,
+            due_dt,
+        ):
+            if occurrence_utc > generation_end:
+                return
+            self._add_event_if_overlaps(events, event, window_start, window_end)
 
     def _generate_recurring_daily_with_due_date(
         self,
@@ -953,26 +1141,14 @@ class AssigneeScheduleCalendar(CalendarEntity):
             window_end,
         )
 
-    def _generate_events_for_chore(
-        self,
-        chore: dict,
-        window_start: datetime.datetime,
-        window_end: datetime.datetime,
-    ) -> list[CalendarEvent]:
-        """Generate calendar events for a chore within the given time window.
+    def _materialize_chore(self, chore: dict) -> _ChoreOccurrences:
+        """Build the materialized occurrence entry for a chore.
 
         ChoreOps calendars only surface chores with anchored due dates. Date-less
-        chores are intentionally excluded from calendar output.
-
-        Args:
-            chore: Chore dictionary with configuration data
-            window_start: Start of calendar window
-            window_end: End of calendar window
-
-        Returns:
-            List of CalendarEvent objects for this chore
+        chores are intentionally excluded from calendar output (empty entry).
+        Recurring series are left pending and expanded by window queries.
         """
-        events: list[CalendarEvent] = []
+        entry = _ChoreOccurrences(token=self._build_chore_token(chore))
 
         chore_id = chore.get(const.DATA_CHORE_INTERNAL_ID, const.SENTINEL_EMPTY)
         summary = chore.get(
@@ -1005,51 +1181,97 @@ class AssigneeScheduleCalendar(CalendarEntity):
                 due_dt = parsed
 
         if not due_dt:
-            return events
+            return entry
 
         # --- Non-recurring chores ---
         if recurring == const.FREQUENCY_NONE:
-            self._generate_non_recurring_with_due_date(
-                events,
-                chore_id,
-                summary,
-                description,
+            event_start, event_end = self._get_timed_event_bounds(chore_id, due_dt)
+            entry.append(
                 due_dt,
-                window_start,
-                window_end,
+                CalendarEvent(
+                    summary=summary,
+                    start=event_start,
+                    end=event_end,
+                    description=description,
+                ),
             )
-            return events
+            return entry
 
         # --- Recurring chores with a due_date ---
-        if due_dt < window_start:
-            return events
-
-        schedule_chore = self._build_schedule_chore_info(chore, applicable_days)
-
-        if recurring in (
-            const.FREQUENCY_DAILY,
-            const.FREQUENCY_WEEKLY,
-            const.FREQUENCY_BIWEEKLY,
-            const.FREQUENCY_MONTHLY,
-            const.FREQUENCY_QUARTERLY,
-            const.FREQUENCY_YEARLY,
-            const.FREQUENCY_CUSTOM,
-            const.FREQUENCY_CUSTOM_FROM_COMPLETE,
-            const.FREQUENCY_CUSTOM_FROM_COMPLETE_DATE_ONLY,
-            const.FREQUENCY_DAILY_MULTI,
-        ):
-            self._generate_schedule_source_events(
-                events,
+        entry.recurring = True
+        entry.anchor = due_dt
+        entry.limit = due_dt + datetime.timedelta(days=self._daily_horizon_days())
+        if recurring in _SCHEDULED_FREQUENCIES:
+            entry.source = self._iter_schedule_occurrences(
                 chore_id,
                 summary,
                 description,
-                schedule_chore,
+                self._build_schedule_chore_info(chore, applicable_days),
                 due_dt,
-                window_start,
-                self._daily_window_end(window_start, window_end),
             )
+            entry.pending = next(entry.source, None)
+        return entry
 
-        return events
+    def _select_chore_events(
+        self,
+        entry: _ChoreOccurrences,
+        window_start: datetime.datetime,
+        window_end: datetime.datetime,
+    ) -> list[CalendarEvent]:
+        """Return the materialized events of one chore visible in a window."""
+        if not entry.recurring:
+            return [
+                event
+                for event in entry.events
+                if self._event_overlaps_window(event, window_start, window_end)
+            ]
+
+        # Recurring series only render when anchored inside the window, and
+        # expand up to the (daily-capped) horizon from the window start
+        if entry.anchor is None or entry.anchor < window_start:
+            return []
+        horizon_end = self._daily_window_end(window_start, window_end)
+        entry.extend_to(horizon_end)
+
+        first = bisect_right(entry.ends, window_start)
+        last = min(
+            bisect_right(entry.dues, horizon_end),
+            bisect_left(entry.starts, horizon_end),
+        )
+        return entry.events[first:last]
+
+    def _generate_events_for_chore(
+        self,
+        chore: dict,
+        window_start: datetime.datetime,
+        window_end: datetime.datetime,
+    ) -> list[CalendarEvent]:
+        """Generate calendar events for a chore within the given time window.
+
+        ChoreOps calendars only surface chores with anchored due dates. Date-less
+        chores are intentionally excluded from calendar output.
+
+        Args:
+            chore: Chore dictionary with configuration data
+            window_start: Start of calendar window
+            window_end: End of calendar window
+
+        Returns:
+            List of CalendarEvent objects for this chore
+        """
+        return self._select_chore_events(
+            self._materialize_chore(chore), window_start, window_end
+        )
+
+    def _get_chore_occurrences(
+        self, chore_id: str, chore: dict, token: tuple[Any, ...]
+    ) -> _ChoreOccurrences:
+        """Return the stored occurrences for a chore, rebuilding on token change."""
+        entry = self._occurrence_store.get(chore_id)
+        if entry is None or entry.token != token:
+            entry = self._materialize_chore(chore)
+            self._occurrence_store[chore_id] = entry
+        return entry
 
     def _generate_events_for_challenge(
         self,
@@ -1156,25 +1378,32 @@ class AssigneeScheduleCalendar(CalendarEntity):
         self, window_start: datetime.datetime, window_end: datetime.datetime
     ) -> list[CalendarEvent]:
         """Generate chores + challenges for this assignee in the given window."""
+        if not self._tokens_primed:
+            self._prime_revision_tokens()
+
         events = []
-        # chores
-        for chore in self.coordinator.chores_data.values():
-            if self._assignee_id in chore.get(const.DATA_CHORE_ASSIGNED_USER_IDS, []):
-                if not chore.get(const.DATA_CHORE_SHOW_ON_CALENDAR, True):
-                    continue
-                events.extend(
-                    self._generate_events_for_chore(chore, window_start, window_end)
+        chores_data = self.coordinator.chores_data
+        # chores: range lookups over the per-chore materialized occurrences
+        for chore_id, chore_token in self._chore_tokens.items():
+            chore = chores_data.get(chore_id)
+            if chore is None:
+                continue
+            events.extend(
+                self._select_chore_events(
+                    self._get_chore_occurrences(chore_id, chore, chore_token),
+                    window_start,
+                    window_end,
                 )
+            )
         # challenges
-        for challenge in self.coordinator.challenges_data.values():
-            if self._assignee_id in challenge.get(
-                const.DATA_CHALLENGE_ASSIGNED_USER_IDS, []
-            ):
-                events.extend(
-                    self._generate_events_for_challenge(
-                        challenge, window_start, window_end
-                    )
-                )
+        challenges_data = self.coordinator.challenges_data
+        for challenge_id in self._challenge_tokens:
+            challenge = challenges_data.get(challenge_id)
+            if challenge is None:
+                continue
+            events.extend(
+                self._generate_events_for_challenge(challenge, window_start, window_end)
+            )
         return events
 
     @property
@@ -73,6 +73,8 @@ STORE: Final = "store"
 STORAGE_DIRECTORY: Final = "choreops"
 STORAGE_KEY: Final = "choreops_data"
 STORAGE_VERSION: Final = 1
+# Scoped (debounced) saves between full-diff checks outside tests/debug logging
+STORAGE_VERIFY_EVERY_N_SAVES: Final = 20
 ENTRY_DATA_PENDING_STORAGE_KEY: Final = "pending_storage_key"
 
 # Runtime flag keys (stored in hass.data, not persisted)
@@ -364,6 +366,7 @@ DATA_META_SCHEMA_VERSION: Final = "schema_version"
 DATA_META_LAST_MIGRATION_DATE: Final = "last_migration_date"
 DATA_META_MIGRATIONS_APPLIED: Final = "migrations_applied"
 DATA_META_PENDING_EVALUATIONS: Final = "pending_evaluations"
+DATA_META_PENDING_REMINDERS: Final = "pending_reminders"
 DATA_META_LAST_MIDNIGHT_PROCESSED: Final = "last_midnight_processed"
 DATA_META_SHARED_ADMIN_UI_CONTROL: Final = "shared_admin_ui_control"
 
@@ -402,6 +405,24 @@ STORAGE_PATH_SEGMENT: Final = ".storage"  # Storage directory name
 # Update interval (seconds)
 DEFAULT_UPDATE_INTERVAL: Final = 5
 
+# Upper bound (seconds) a closing coordinator.batch() waits for signal handlers
+# spawned inside it before flushing; stragglers then persist on their own
+BATCH_SETTLE_TIMEOUT_SECONDS: Final = 30
+
+# Notification dispatch queue: concurrent notify service calls and the cap on
+# messages waiting for a worker (overflow is dropped and counted)
+NOTIFY_DISPATCH_MAX_WORKERS: Final = 4
+NOTIFY_DISPATCH_MAX_QUEUED: Final = 250
+# Seconds a queued message waits before sending, so a newer message for the
+# same (service, tag) raised right after it replaces it instead of following it
+NOTIFY_DISPATCH_HOLD_SECONDS: Final = 0.5
+
+# Assignees with at least this many due/overdue notifications from one
+# time-check scan get a single digest instead of one push per chore
+NOTIFY_DIGEST_MIN_ENTRIES: Final = 2
+# Action buttons a digest carries (one per chore, most urgent first)
+NOTIFY_DIGEST_MAX_ACTIONS: Final = 3
+
 
 # ================================================================================================
 # Core Constants (used by other constants)
@@ -1006,6 +1027,26 @@ CHALLENGE_TO_CANONICAL_TARGET_MAP: Final = {
     CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW: CANONICAL_TARGET_TYPE_TOTAL_WITHIN_WINDOW,
 }
 
+# Gamification signal families: the domain event groups a badge/achievement
+# target depends on. Pending evaluations record which families changed so only
+# dependent targets are re-evaluated. Also carried as STATS_UPDATED "family".
+GAMIFICATION_SIGNAL_FAMILY_CHORES: Final = "chores"
+GAMIFICATION_SIGNAL_FAMILY_OVERDUE: Final = "overdue"
+GAMIFICATION_SIGNAL_FAMILY_POINTS: Final = "points"
+GAMIFICATION_SIGNAL_FAMILIES_ALL: Final = frozenset(
+    {
+        GAMIFICATION_SIGNAL_FAMILY_CHORES,
+        GAMIFICATION_SIGNAL_FAMILY_OVERDUE,
+        GAMIFICATION_SIGNAL_FAMILY_POINTS,
+    }
+)
+
+ACHIEVEMENT_SIGNAL_FAMILIES: Final = {
+    ACHIEVEMENT_TYPE_DAILY_MIN: frozenset({GAMIFICATION_SIGNAL_FAMILY_CHORES}),
+    ACHIEVEMENT_TYPE_STREAK: frozenset({GAMIFICATION_SIGNAL_FAMILY_CHORES}),
+    ACHIEVEMENT_TYPE_TOTAL: frozenset({GAMIFICATION_SIGNAL_FAMILY_CHORES}),
+}
+
 
 # ------------------------------------------------------------------------------------------------
 # Data Keys
@@ -1040,6 +1081,10 @@ DATA_NOTIF_LAST_DUE_START: Final = "last_due_start"
 DATA_NOTIF_LAST_DUE_REMINDER: Final = "last_due_reminder"
 DATA_NOTIF_LAST_OVERDUE: Final = "last_overdue"
 
+# Snoozed reminder queue entries (meta.pending_reminders): fire time plus
+# DATA_USER_ID and either DATA_CHORE_ID or DATA_REWARD_ID
+DATA_REMINDER_FIRE_AT: Final = "fire_at"
+
 # USER data keys
 DATA_USER_BADGES_EARNED_NAME: Final = "badge_name"
 DATA_USER_BADGES_EARNED_LAST_AWARDED: Final = "last_awarded_date"
@@ -1642,6 +1687,13 @@ CHORE_OVERDUE_RESOLVED_EVENT_DURATION_SECONDS: Final = "overdue_duration_seconds
 CHORE_OVERDUE_RESOLVED_EVENT_STARTED_AT: Final = "overdue_started_at"
 CHORE_OVERDUE_RESOLVED_EVENT_RESOLVED_AT: Final = "overdue_resolved_at"
 
+# Set on due-window, due-reminder and overdue events from a batched time-check
+# scan; NotificationManager may fold those into one digest per recipient
+CHORE_TIME_SCAN_EVENT_DIGEST: Final = "time_scan_digest"
+# Set on every event emitted inside a bulk service batch; NotificationManager
+# merges claim/approval/reward/bonus notifications per recipient at the flush
+NOTIFY_EVENT_BULK_DIGEST: Final = "bulk_digest"
+
 DATA_CHORE_STATE: Final = "state"
 DATA_CHORE_TIMESTAMP: Final = "timestamp"
 
@@ -2203,6 +2255,26 @@ TRANS_KEY_NOTIF_MESSAGE_CHORE_STANDBY_NEEDED: Final = (
     "notification_message_chore_standby_needed"
 )
 
+TRANS_KEY_NOTIF_TITLE_CHORE_DIGEST_ASSIGNEE: Final = (
+    "notification_title_chore_digest_assignee"
+)
+TRANS_KEY_NOTIF_MESSAGE_CHORE_DIGEST_ASSIGNEE: Final = (
+    "notification_message_chore_digest_assignee"
+)
+TRANS_KEY_NOTIF_TITLE_CHORE_DIGEST_APPROVER: Final = (
+    "notification_title_chore_digest_approver"
+)
+TRANS_KEY_NOTIF_MESSAGE_CHORE_DIGEST_APPROVER: Final = (
+    "notification_message_chore_digest_approver"
+)
+
+TRANS_KEY_NOTIF_TITLE_BULK_UPDATES_ASSIGNEE: Final = (
+    "notification_title_bulk_updates_assignee"
+)
+TRANS_KEY_NOTIF_MESSAGE_BULK_UPDATES_ASSIGNEE: Final = (
+    "notification_message_bulk_updates_assignee"
+)
+
 TRANS_KEY_NOTIF_TITLE_CHORE_MISSED_ASSIGNEE: Final = (
     "notification_title_chore_missed_assignee"
 )
@@ -2316,6 +2388,13 @@ TRANS_KEY_NOTIF_MESSAGE_PENDING_CHORES_APPROVER: Final = (
     "notification_message_pending_chores_approver"
 )
 
+TRANS_KEY_NOTIF_TITLE_BULK_CLAIMED_APPROVER: Final = (
+    "notification_title_bulk_claimed_approver"
+)
+TRANS_KEY_NOTIF_MESSAGE_BULK_CLAIMED_APPROVER: Final = (
+    "notification_message_bulk_claimed_approver"
+)
+
 # Approver: Reward Claim/Approval Workflow
 TRANS_KEY_NOTIF_TITLE_REWARD_CLAIMED_APPROVER: Final = (
     "notification_title_reward_claimed_approver"
@@ -2901,11 +2980,15 @@ ISO_DATE_STRING_LENGTH: Final = 10
 # Services
 # ------------------------------------------------------------------------------------------------
 SERVICE_APPLY_BONUS: Final = "apply_bonus"
+SERVICE_APPLY_BONUS_BULK: Final = "apply_bonus_bulk"
 SERVICE_APPLY_PENALTY: Final = "apply_penalty"
 SERVICE_MANUAL_ADJUST_POINTS: Final = "manual_adjust_points"
 SERVICE_APPROVE_CHORE: Final = "approve_chore"
+SERVICE_APPROVE_CHORES: Final = "approve_chores"
 SERVICE_APPROVE_REWARD: Final = "approve_reward"
+SERVICE_APPROVE_REWARDS: Final = "approve_rewards"
 SERVICE_CLAIM_CHORE: Final = "claim_chore"
+SERVICE_CLAIM_CHORES: Final = "claim_chores"
 SERVICE_ADD_CHORE: Final = (
     "create_chore"  # Alias for SERVICE_CREATE_CHORE (test compatibility)
 )
@@ -2937,6 +3020,8 @@ SERVICE_UPDATE_REWARD: Final = "update_reward"
 SERVICE_GENERATE_ACTIVITY_REPORT: Final = "generate_activity_report"
 SERVICE_MANAGE_UI_CONTROL: Final = "manage_ui_control"
 SERVICE_GET_LEDGER: Final = "get_ledger"
+# Upper bound on items per bulk workflow call (claim/approve/apply many)
+SERVICE_BULK_MAX_ITEMS: Final = 100
 
 
 # ------------------------------------------------------------------------------------------------
@@ -2990,6 +3075,8 @@ SERVICE_FIELD_UI_CONTROL_ACTION: Final = "ui_control_action"
 SERVICE_FIELD_UI_CONTROL_KEY: Final = "key"
 SERVICE_FIELD_UI_CONTROL_VALUE: Final = "value"
 SERVICE_FIELD_APPROVER_NAME: Final = "approver_name"
+# Bulk workflow services: list of per-item field mappings
+SERVICE_FIELD_ITEMS: Final = "items"
 SERVICE_FIELD_REASON: Final = "reason"
 SERVICE_FIELD_POINTS_AMOUNT: Final = "amount"
 
@@ -3123,6 +3210,19 @@ SERVICE_FIELD_REPORT_OUTPUT_FORMAT: Final = "output_format"
 # Ledger service fields
 SERVICE_FIELD_LEDGER_LIMIT: Final = "limit"
 
+# Paginated response fields (get_ledger, generate_activity_report)
+SERVICE_FIELD_PAGE_CURSOR: Final = "cursor"
+SERVICE_FIELD_PAGE_SIZE: Final = "page_size"
+
+# Page defaults: ledger pages count entries, report pages count day blocks
+# (at most a month per page). Report pages also stop once rendered markdown
+# reaches the character budget so a single response stays well under HA
+# service response limits.
+DEFAULT_LEDGER_PAGE_SIZE: Final = 200
+DEFAULT_REPORT_PAGE_SIZE: Final = 7
+REPORT_PAGE_MAX_DAYS: Final = 31
+REPORT_PAGE_MAX_CHARS: Final = 32000
+
 # Report output modes
 REPORT_OUTPUT_FORMAT_MARKDOWN: Final = "markdown"
 REPORT_OUTPUT_FORMAT_HTML: Final = "html"
@@ -3337,6 +3437,9 @@ TRANS_KEY_ERROR_SHARED_CHORE_ASSIGNEE: Final = (
 TRANS_KEY_ERROR_INVALID_DATE_FORMAT: Final = (
     "invalid_date_format"  # Invalid date format
 )
+TRANS_KEY_ERROR_INVALID_PAGE_CURSOR: Final = (
+    "invalid_page_cursor"  # Pagination cursor '{cursor}' is invalid
+)
 TRANS_KEY_ERROR_DATE_IN_PAST: Final = "date_in_past"  # Due date cannot be in the past
 TRANS_KEY_ERROR_FUTURE_DUE_DATE_REQUIRED: Final = (
     "future_due_date_required"  # The requested changes require a future due date
@@ -3969,6 +4072,7 @@ NOTIFY_NOTIFICATION_ID = "notification_id"
 NOTIFY_APPROVER_NAME = "approver_name"
 NOTIFY_PERSISTENT_NOTIFICATION = "persistent_notification"
 NOTIFY_TITLE = "title"
+NOTIFY_TITLE_DETAIL = "title_detail"  # Appended to a translated action title
 
 # Notification tag system
 # Tags enable smart notification replacement: same tag = replace in-place, no stacking
@@ -3980,6 +4084,7 @@ NOTIFY_TAG_TYPE_SYSTEM = "system"  # System notifications (achievements, etc.)
 NOTIFY_TAG_TYPE_STATUS = "status"  # Status update replacements
 NOTIFY_TAG_TYPE_OVERDUE = "overdue"  # Overdue chore notifications
 NOTIFY_TAG_TYPE_DUE_WINDOW = "due_window"  # Due window chore notifications
+NOTIFY_TAG_TYPE_DIGEST = "digest"  # Per-assignee due/overdue digests
 
 
 # ------------------------------------------------------------------------------------------------
@@ -12,20 +12,26 @@ Architecture (v0.5.0+):
 """
 
 import asyncio
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import timedelta
+import logging
 import sys
 import time
 from typing import Any, Literal, cast
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from . import const
 from .engines.statistics_engine import StatisticsEngine
 from .helpers.entity_helpers import (
+    AssignmentIndex,
+    NameIndex,
     remove_entities_by_item_id,
     remove_orphaned_assignee_chore_entities,
     remove_orphaned_assignee_reward_entities,
@@ -54,7 +60,9 @@ from .type_defs import (
     ChoreEntitySyncContext,
     ChoresCollection,
     PenaltiesCollection,
+    PersistScope,
     RewardsCollection,
+    UpdateKey,
     UserData,
     UsersCollection,
 )
@@ -63,6 +71,13 @@ from .type_defs import (
 # Must be defined after imports but before class since it references the class
 type ChoreOpsConfigEntry = ConfigEntry["ChoreOpsDataCoordinator"]
 
+# Storage buckets covered by the assignee <-> item assignment indexes
+_ASSIGNMENT_INDEX_BUCKETS: dict[str, str] = {
+    const.ITEM_TYPE_CHORE: const.DATA_CHORES,
+    const.ITEM_TYPE_REWARD: const.DATA_REWARDS,
+    const.ITEM_TYPE_BADGE: const.DATA_BADGES,
+}
+
 
 @dataclass(slots=True)
 class ChoreEntitySyncResult:
@@ -74,6 +89,28 @@ class ChoreEntitySyncResult:
     orphaned_shared_sensors_removed: int = 0
 
 
+@dataclass(slots=True)
+class _DeferredUpdates:
+    """Persist and entity refresh work accumulated inside a batch() scope."""
+
+    depth: int = 0
+    persist: bool = False
+    enforce_schema: bool = True
+    refresh: bool = False
+    refresh_scope: PersistScope | None = None
+    digest_notifications: bool = False
+    tasks: set[asyncio.Task[Any]] = field(default_factory=set)
+    callbacks: dict[Callable[[], None], None] = field(default_factory=dict)
+
+
+# Open batch() scopes per coordinator, carried in the asyncio context so a
+# batch only captures work from the task that opened it and the handler tasks
+# it spawns. Unrelated service calls and button presses keep persisting as usual.
+_OPEN_BATCHES: ContextVar[Mapping[int, _DeferredUpdates]] = ContextVar(
+    "choreops_open_batches", default={}
+)
+
+
 class ChoreOpsDataCoordinator(DataUpdateCoordinator):
     """Coordinator for ChoreOps integration.
 
@@ -119,6 +156,53 @@ class ChoreOpsDataCoordinator(DataUpdateCoordinator):
         # Test mode uses 0 debounce to avoid 5-second waits in async_block_till_done()
         self._persist_task: asyncio.Task | None = None
         self._persist_debounce_seconds = 0 if self._test_mode else 5
+        # Scoped saves since the last full-diff check (production sampling)
+        self._saves_since_verify = 0
+
+        # Targeted entity refresh registry: update key -> entity callbacks.
+        # Keyed entities skip scoped refreshes that don't touch their keys.
+        self._keyed_listeners: dict[UpdateKey, set[CALLBACK_TYPE]] = {}
+        self._keyed_callbacks: dict[CALLBACK_TYPE, int] = {}
+        # Set while async_set_updated_data_for() runs the base method, so its
+        # closing full fan-out becomes a keyed one for this change set.
+        self._scoped_fan_out: tuple[PersistScope | None] | None = None
+
+        # Data revisions for derived caches (dashboard chore rows). Unscoped
+        # persists and full refreshes bump the global revision; scoped persists
+        # bump only the (bucket, item_id) revisions they name.
+        self._data_revision = 0
+        self._bucket_revisions: dict[str, int] = {}
+        self._item_revisions: dict[UpdateKey, int] = {}
+        # Per-assignee chore state revisions: (user_id, chore_id) for scopes
+        # naming both, (user_id, None) for user scopes naming no chore.
+        self._assignee_chore_revisions: dict[tuple[str, str | None], int] = {}
+
+        # Cached role views (users/assignees/approvers). Stamped with the users
+        # bucket identity, its size and a revision bumped by UserManager CRUD and
+        # role/capability edits, not by ordinary persists. Disabled until the
+        # integrity gate has run, since migrations flip role flags in place.
+        self._users_revision = 0
+        self._user_views_enabled = False
+        self._user_views: (
+            tuple[
+                tuple[object, int, int],
+                UsersCollection,
+                AssigneesCollection,
+                ApproversCollection,
+            ]
+            | None
+        ) = None
+
+        # Cached name -> ID indexes keyed by (item_type, role). Stamped with the
+        # bucket identity, its size and a per-item-type revision bumped by
+        # manager create/update/delete paths.
+        self._name_index_revisions: dict[str, int] = {}
+        self._name_indexes: dict[tuple[str, str | None], NameIndex] = {}
+
+        # Assignee <-> item assignment indexes keyed by item type (chore,
+        # reward, badge). Rebuilt at DATA_READY, patched per item by manager
+        # create/update/delete paths and pruned when a user is deleted.
+        self._assignment_indexes: dict[str, AssignmentIndex] = {}
 
         # System manager for reactive entity registry cleanup (v0.5.0+)
         # Listens to DELETED signals, runs startup safety net
@@ -176,10 +260,13 @@ class ChoreOpsDataCoordinator(DataUpdateCoordinator):
             signal = get_event_signal(
                 self.config_entry.entry_id, const.SIGNAL_SUFFIX_PERIODIC_UPDATE
             )
-            async_dispatcher_send(self.hass, signal, {})
+            # One write and one entity refresh for every scan transition,
+            # reminder stamp and stats update the pulse triggers
+            async with self.batch():
+                async_dispatcher_send(self.hass, signal, {})
 
-            # Notify entities of changes
-            self.async_update_listeners()
+                # Notify entities of changes
+                self.async_update_listeners()
 
             return self._data
         except Exception as err:
@@ -228,6 +315,7 @@ class ChoreOpsDataCoordinator(DataUpdateCoordinator):
         # Coordinator: "I have data, but don't know if it's correct for v50.
         # SystemManager, please fix it and don't return until it's safe."
         await self.system_manager.ensure_data_integrity(current_version=current_version)
+        self._user_views_enabled = True
 
         # 4. Domain Initialization (Managers self-init via DATA_READY cascade)
         # SystemManager.ensure_data_integrity() emits DATA_READY at the end, triggering:
@@ -249,7 +337,13 @@ class ChoreOpsDataCoordinator(DataUpdateCoordinator):
     # Storage
     # -------------------------------------------------------------------------------------
 
-    def _persist(self, immediate: bool = False, enforce_schema: bool = True):
+    def _persist(
+        self,
+        immediate: bool = False,
+        enforce_schema: bool = True,
+        *,
+        changed: PersistScope | None = None,
+    ):
         """Save coordinator data to persistent storage.
 
         Default behavior is debounced persistence (5-10 second delay) to batch multiple
@@ -261,6 +355,11 @@ class ChoreOpsDataCoordinator(DataUpdateCoordinator):
                       - Config flow operations (user expects immediate feedback)
                       - Unload operations (must complete before shutdown)
                       If False (default), schedule save with debouncing to batch updates.
+            changed: Optional dirty scope (bucket key -> changed item IDs, or None
+                      for the whole bucket). When every caller inside a debounce
+                      window supplies a scope, the store re-snapshots only those
+                      subtrees. Omitting it (or immediate=True) forces a full
+                      snapshot, so unscoped callers are always safe.
 
         Philosophy:
             - Debounced=True (immediate=False) is the default because:
@@ -271,6 +370,8 @@ class ChoreOpsDataCoordinator(DataUpdateCoordinator):
             - Use immediate=True only for critical paths where data integrity
               or user feedback timing is essential
         """
+        self._bump_data_revisions(changed)
+
         # Thread safety: Schedule to event loop if called from worker thread
         # This can happen when dispatcher signals are fired from sync contexts
         try:
@@ -281,16 +382,72 @@ class ChoreOpsDataCoordinator(DataUpdateCoordinator):
         if loop is None or loop != self.hass.loop:
             # Not in event loop thread - schedule to run in event loop
             self.hass.loop.call_soon_threadsafe(
-                self._persist_impl, immediate, enforce_schema
+                self._persist_impl, immediate, enforce_schema, changed
             )
             return
 
-        self._persist_impl(immediate, enforce_schema)
+        self._persist_impl(immediate, enforce_schema, changed)
 
     def _persist_impl(
-        self, immediate: bool = False, enforce_schema: bool = True
+        self,
+        immediate: bool = False,
+        enforce_schema: bool = True,
+        changed: PersistScope | None = None,
     ) -> None:
         """Implementation of _persist - must be called from event loop thread."""
+        # Record dirty scope before any debounce so every caller in the window
+        # contributes; unscoped or immediate persists fall back to full snapshots
+        if immediate or changed is None:
+            self.store.mark_all_dirty()
+        else:
+            for bucket_key, item_ids in changed.items():
+                self.store.mark_dirty(bucket_key, item_ids)
+
+        batch = self._batch
+        if batch is not None and not immediate:
+            batch.persist = True
+            batch.enforce_schema = batch.enforce_schema and enforce_schema
+            return
+
+        self._schedule_save(immediate, enforce_schema)
+
+    def _mark_changed(self, changed: PersistScope) -> None:
+        """Record in-place writes for the next save without scheduling one.
+
+        For bookkeeping containers created on first access (landlord
+        structures, progress defaults) that need neither a save nor an entity
+        refresh of their own; the next _persist() writes them with its scope.
+        """
+        for bucket_key, item_ids in changed.items():
+            self.store.mark_dirty(bucket_key, item_ids)
+
+    def _verify_scoped_persists(self) -> bool:
+        """Return True when scoped saves should be checked against a full diff.
+
+        Every save is checked in tests and with debug logging; otherwise every
+        STORAGE_VERIFY_EVERY_N_SAVES-th save is. A manager that mutated data in
+        place without naming it in ``changed`` is then logged and the store
+        falls back to a full snapshot, so the write is late but never lost.
+        Test mode raises on such misses (see _sync_store()).
+        """
+        if self._test_mode or const.LOGGER.isEnabledFor(logging.DEBUG):
+            return True
+        self._saves_since_verify += 1
+        if self._saves_since_verify < const.STORAGE_VERIFY_EVERY_N_SAVES:
+            return False
+        self._saves_since_verify = 0
+        return True
+
+    def _sync_store(self) -> None:
+        """Apply marked changes to the store snapshot ahead of a save."""
+        self.store.sync_data(
+            self._data,
+            verify=self._verify_scoped_persists(),
+            strict=self._test_mode,
+        )
+
+    def _schedule_save(self, immediate: bool, enforce_schema: bool) -> None:
+        """Save now or (re)start the debounce timer for already-marked changes."""
         # Treat 0 debounce (test mode) as immediate to avoid task overhead
         effective_immediate = immediate or self._persist_debounce_seconds == 0
 
@@ -304,7 +461,7 @@ class ChoreOpsDataCoordinator(DataUpdateCoordinator):
             perf_start = time.perf_counter()
             if enforce_schema:
                 self._enforce_runtime_schema_on_persist()
-            self.store.set_data(self._data)
+            self._sync_store()
             self.hass.add_job(self.store.async_save)
             perf_duration = time.perf_counter() - perf_start
             const.LOGGER.debug(
@@ -331,7 +488,7 @@ class ChoreOpsDataCoordinator(DataUpdateCoordinator):
 
             if enforce_schema:
                 self._enforce_runtime_schema_on_persist()
-            self.store.set_data(self._data)
+            self._sync_store()
             await self.store.async_save()
 
             perf_duration = time.perf_counter() - perf_start
@@ -368,7 +525,9 @@ class ChoreOpsDataCoordinator(DataUpdateCoordinator):
         self._data[const.DATA_META] = meta
         self._data.pop(const.DATA_SCHEMA_VERSION, None)
 
-    def _persist_and_update(self, immediate: bool = False) -> None:
+    def _persist_and_update(
+        self, immediate: bool = False, *, changed: PersistScope | None = None
+    ) -> None:
         """Persist data AND update entity listeners to reflect state changes.
 
         Use this for ALL workflow operations that change user-visible state.
@@ -382,6 +541,8 @@ class ChoreOpsDataCoordinator(DataUpdateCoordinator):
             immediate: If True, persist immediately without debouncing.
                       If False (default), use debounced persistence.
                       See _persist() docstring for immediate=True use cases.
+            changed: Optional dirty scope forwarded to _persist(). Also limits the
+                      entity refresh to entities keyed to those items.
 
         Example:
             # Workflow operation that changes user-visible state
@@ -390,8 +551,318 @@ class ChoreOpsDataCoordinator(DataUpdateCoordinator):
                 self.coordinator._persist_and_update()  # ✅ Persist + refresh entities
                 self.emit(SIGNAL_SUFFIX_CHORE_CLAIMED, chore_id=chore_id)
         """
-        self._persist(immediate=immediate)
-        self.hass.loop.call_soon_threadsafe(self.async_update_listeners)
+        self._persist(immediate=immediate, changed=changed)
+        if self._batch is not None:
+            self._defer_refresh(changed)
+            return
+        self.hass.loop.call_soon_threadsafe(self.async_update_listeners_for, changed)
+
+    @asynccontextmanager
+    async def batch(
+        self, *, digest_notifications: bool = False
+    ) -> AsyncIterator[None]:
+        """Coalesce persistence and entity refreshes for a multi-item workflow.
+
+        Inside the scope, _persist() only marks dirty store scopes, entity
+        refreshes merge into one change set and async_call_after_batch()
+        callbacks are queued. Async signal handlers dispatched inside the scope
+        are tracked, and the outermost exit waits for them (bounded by
+        BATCH_SETTLE_TIMEOUT_SECONDS) so their cascades join the same flush:
+        one save, one refresh covering every touched item, then each queued
+        callback once. Scopes nest; inner exits flush nothing.
+
+        The scope belongs to the calling task (and tasks it spawns); other
+        tasks persist normally meanwhile, and _persist(immediate=True) always
+        saves at once. The flush runs even if the scope is cancelled.
+
+        Args:
+            digest_notifications: Flag signals emitted for the rest of the
+                outermost scope with NOTIFY_EVENT_BULK_DIGEST, so the
+                NotificationManager merges their notifications per recipient
+                when the batch flushes (bulk services).
+
+        Example:
+            async with coordinator.batch():
+                for assignee_id, chore_id in claims:
+                    await coordinator.chore_manager.approve_chore(
+                        approver_name, assignee_id, chore_id
+                    )
+        """
+        batch = self._batch
+        token = None
+        if batch is None:
+            batch = _DeferredUpdates()
+            token = _OPEN_BATCHES.set({**_OPEN_BATCHES.get(), id(self): batch})
+        batch.depth += 1
+        if digest_notifications:
+            batch.digest_notifications = True
+        try:
+            yield
+        finally:
+            try:
+                if batch.depth == 1:
+                    await self._settle_batch_tasks(batch)
+            finally:
+                batch.depth -= 1
+                if token is not None:
+                    _OPEN_BATCHES.reset(token)
+                if batch.depth == 0:
+                    self._flush_batch(batch)
+
+    @property
+    def _batch(self) -> _DeferredUpdates | None:
+        """Return the batch open in the current task context, if any."""
+        batch = _OPEN_BATCHES.get().get(id(self))
+        if batch is None or batch.depth == 0:
+            # Handler tasks outliving their batch see it closed and persist normally
+            return None
+        return batch
+
+    def _flush_batch(self, batch: _DeferredUpdates) -> None:
+        """Save, refresh and run deferred callbacks for a closed batch."""
+        if batch.persist:
+            self._schedule_save(False, batch.enforce_schema)
+        if batch.refresh:
+            self.async_update_listeners_for(batch.refresh_scope)
+        for deferred_callback in batch.callbacks:
+            deferred_callback()
+
+    async def _settle_batch_tasks(self, batch: _DeferredUpdates) -> None:
+        """Wait for signal handler tasks spawned inside a batch to finish."""
+        # Let handlers queued by the last mutation start before collecting
+        await asyncio.sleep(0)
+        deadline = self.hass.loop.time() + const.BATCH_SETTLE_TIMEOUT_SECONDS
+        while batch.tasks:
+            pending = {task for task in batch.tasks if not task.done()}
+            batch.tasks.clear()
+            if not pending:
+                continue
+            remaining = deadline - self.hass.loop.time()
+            if remaining > 0:
+                _done, pending = await asyncio.wait(pending, timeout=remaining)
+            if pending:
+                const.LOGGER.warning(
+                    "Batch flushed with %d signal handler(s) still running",
+                    len(pending),
+                )
+                return
+
+    @property
+    def in_batch(self) -> bool:
+        """Return True while a batch() scope is open in the current task."""
+        return self._batch is not None
+
+    @property
+    def in_digest_batch(self) -> bool:
+        """Return True while the open batch merges notifications per recipient."""
+        batch = self._batch
+        return batch is not None and batch.digest_notifications
+
+    @callback
+    def async_track_batch_task(self, task: asyncio.Task[Any]) -> None:
+        """Hold the open batch (if any) until a signal handler task finishes."""
+        if self._batch is not None and not task.done():
+            self._batch.tasks.add(task)
+
+    @callback
+    def async_call_after_batch(self, deferred_callback: Callable[[], None]) -> None:
+        """Run a callback now, or once when the open batch flushes.
+
+        Used for dispatcher-driven refreshes (e.g. entity state writes after a
+        cache invalidation) so a burst of signals produces one refresh.
+        """
+        if self._batch is None:
+            deferred_callback()
+            return
+        self._batch.callbacks[deferred_callback] = None
+
+    def _defer_refresh(self, changed: PersistScope | None) -> None:
+        """Merge an entity refresh request into the open batch."""
+        batch = self._batch
+        if batch is None:
+            return
+        if not batch.refresh:
+            batch.refresh = True
+            batch.refresh_scope = (
+                None
+                if changed is None
+                else {
+                    bucket_key: None if item_ids is None else set(item_ids)
+                    for bucket_key, item_ids in changed.items()
+                }
+            )
+            return
+        merged = batch.refresh_scope
+        if merged is None:
+            return
+        if changed is None:
+            batch.refresh_scope = None
+            return
+        for bucket_key, item_ids in changed.items():
+            if bucket_key in merged and merged[bucket_key] is None:
+                continue
+            if item_ids is None:
+                merged[bucket_key] = None
+                continue
+            current = merged.setdefault(bucket_key, set())
+            cast("set[str]", current).update(item_ids)
+
+    @callback
+    def async_add_keyed_listener(
+        self,
+        update_keys: frozenset[UpdateKey],
+        update_callback: CALLBACK_TYPE,
+    ) -> CALLBACK_TYPE:
+        """Subscribe an entity callback to targeted refreshes for its keys.
+
+        The callback must also be a regular coordinator listener; this only
+        lets async_update_listeners_for() skip it when none of its keys changed.
+
+        Returns:
+            Callable that removes the keyed subscription.
+        """
+        for update_key in update_keys:
+            self._keyed_listeners.setdefault(update_key, set()).add(update_callback)
+        self._keyed_callbacks[update_callback] = (
+            self._keyed_callbacks.get(update_callback, 0) + 1
+        )
+
+        @callback
+        def remove_listener() -> None:
+            for update_key in update_keys:
+                callbacks = self._keyed_listeners.get(update_key)
+                if callbacks is None:
+                    continue
+                callbacks.discard(update_callback)
+                if not callbacks:
+                    del self._keyed_listeners[update_key]
+            remaining = self._keyed_callbacks.get(update_callback, 0) - 1
+            if remaining > 0:
+                self._keyed_callbacks[update_callback] = remaining
+            else:
+                self._keyed_callbacks.pop(update_callback, None)
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Bump the global data revision, then refresh every entity."""
+        if self._scoped_fan_out is not None:
+            (changed,) = self._scoped_fan_out
+            self._scoped_fan_out = None
+            self.async_update_listeners_for(changed)
+            return
+        self._data_revision += 1
+        if self._batch is not None:
+            self._defer_refresh(None)
+            return
+        super().async_update_listeners()
+
+    def _bump_data_revisions(self, changed: PersistScope | None) -> None:
+        """Advance data revisions for a change set (global when unscoped)."""
+        if changed is None:
+            self._data_revision += 1
+            return
+        for bucket_key, item_ids in changed.items():
+            if item_ids is None:
+                self._bucket_revisions[bucket_key] = (
+                    self._bucket_revisions.get(bucket_key, 0) + 1
+                )
+                continue
+            for item_id in item_ids:
+                update_key = (bucket_key, item_id)
+                self._item_revisions[update_key] = (
+                    self._item_revisions.get(update_key, 0) + 1
+                )
+
+        user_ids = changed.get(const.DATA_USERS)
+        if not user_ids:
+            return
+        chore_ids: Iterable[str | None] = changed.get(const.DATA_CHORES) or (None,)
+        for user_id in user_ids:
+            for chore_id in chore_ids:
+                pair_key = (user_id, chore_id)
+                self._assignee_chore_revisions[pair_key] = (
+                    self._assignee_chore_revisions.get(pair_key, 0) + 1
+                )
+
+    def get_data_revision(self, bucket_key: str, item_id: str) -> tuple[int, int, int]:
+        """Return the (global, bucket, item) revisions for one data item.
+
+        The tuple changes on every unscoped persist or full refresh, and on any
+        scoped persist naming the whole bucket or (bucket_key, item_id). Derived
+        caches compare it to decide whether a cached value is stale.
+        """
+        return (
+            self._data_revision,
+            self._bucket_revisions.get(bucket_key, 0),
+            self._item_revisions.get((bucket_key, item_id), 0),
+        )
+
+    def get_assignee_chore_revision(
+        self, assignee_id: str, chore_id: str
+    ) -> tuple[int, int, int]:
+        """Return the revisions covering one assignee's state for one chore.
+
+        Changes on whole-users-bucket persists, on scopes naming both the
+        assignee and the chore, and on assignee scopes that name no chore
+        (the touched chores are unknown). Combine with get_data_revision()
+        for the chore itself.
+        """
+        return (
+            self._bucket_revisions.get(const.DATA_USERS, 0),
+            self._assignee_chore_revisions.get((assignee_id, None), 0),
+            self._assignee_chore_revisions.get((assignee_id, chore_id), 0),
+        )
+
+    @callback
+    def async_update_listeners_for(self, changed: PersistScope | None) -> None:
+        """Refresh entities affected by a change set (all entities if unscoped).
+
+        Keyed entities refresh only when one of their keys is in ``changed``;
+        entities without keys (system-wide aggregates) always refresh.
+
+        Args:
+            changed: Bucket key -> changed item IDs. None, or a None entry for
+                any bucket, falls back to async_update_listeners().
+        """
+        if self._batch is not None:
+            self._defer_refresh(changed)
+            return
+        if changed is None or any(item_ids is None for item_ids in changed.values()):
+            self.async_update_listeners()
+            return
+
+        targets: set[CALLBACK_TYPE] = set()
+        for bucket_key, item_ids in changed.items():
+            for item_id in item_ids or ():
+                targets.update(self._keyed_listeners.get((bucket_key, item_id), ()))
+
+        for update_callback, _context in list(self._listeners.values()):
+            if (
+                update_callback in self._keyed_callbacks
+                and update_callback not in targets
+            ):
+                continue
+            update_callback()
+
+    @callback
+    def async_set_updated_data_for(self, changed: PersistScope | None) -> None:
+        """Scoped async_set_updated_data(): same bookkeeping, targeted refresh.
+
+        Runs the base method for its bookkeeping (publish _data, mark success,
+        restart the refresh interval); the listener update it ends with only
+        refreshes entities keyed to ``changed``.
+
+        Args:
+            changed: Bucket key -> changed item IDs, as for
+                async_update_listeners_for().
+        """
+        self._scoped_fan_out = (changed,)
+        try:
+            super().async_set_updated_data(self._data)
+        finally:
+            self._scoped_fan_out = None
 
     async def async_sync_entities_after_service_create(self) -> None:
         """Synchronize entity graph after service-driven dynamic creates.
@@ -617,25 +1088,123 @@ class ChoreOpsDataCoordinator(DataUpdateCoordinator):
     # Properties for Easy Access
     # -------------------------------------------------------------------------------------
 
-    @property
-    def users_data(self) -> UsersCollection:
-        """Return canonical users data for schema45+ runtime logic."""
+    def invalidate_user_views(self) -> None:
+        """Drop cached users/assignees/approvers views after a user mutation.
+
+        Views hold the live user records, so only membership and role or
+        capability changes need this; plain field writes (points, ledger,
+        stats) stay visible without a rebuild.
+        """
+        self._users_revision += 1
+        self._user_views = None
+
+    def invalidate_name_index(self, item_type: str) -> None:
+        """Mark cached name indexes for an item type stale after a mutation."""
+        self._name_index_revisions[item_type] = (
+            self._name_index_revisions.get(item_type, 0) + 1
+        )
+
+    def get_name_index(
+        self,
+        item_type: str,
+        records: Mapping[str, Any],
+        name_key: str,
+        *,
+        role: str | None = None,
+    ) -> NameIndex:
+        """Return the name index for a bucket, rebuilding it only when stale."""
+        stamp = (len(records), self._name_index_revisions.get(item_type, 0))
+        cache_key = (item_type, role)
+        index = self._name_indexes.get(cache_key)
+        if index is None or index.records is not records or index.stamp != stamp:
+            index = NameIndex.build(records, name_key, stamp)
+            self._name_indexes[cache_key] = index
+        return index
+
+    def get_assignment_index(self, item_type: str) -> AssignmentIndex:
+        """Return the assignment index for chores, rewards or badges.
+
+        Built on first use and rebuilt when the bucket itself was replaced
+        (e.g. after a restore); otherwise kept current by the manager paths.
+        """
+        bucket_key = _ASSIGNMENT_INDEX_BUCKETS[item_type]
+        records = self._data.get(bucket_key, {})
+        index = self._assignment_indexes.get(item_type)
+        if index is None or index.records is not records:
+            index = AssignmentIndex.build(records, const.DATA_ASSIGNED_USER_IDS)
+            self._assignment_indexes[item_type] = index
+        return index
+
+    def rebuild_assignment_indexes(self) -> None:
+        """Rebuild every assignment index from storage (called at DATA_READY)."""
+        self._assignment_indexes.clear()
+        for item_type in _ASSIGNMENT_INDEX_BUCKETS:
+            self.get_assignment_index(item_type)
+
+    def update_assignment_index(self, item_type: str, item_id: str) -> None:
+        """Patch one item's assignments after a create, update or delete."""
+        index = self._assignment_indexes.get(item_type)
+        if index is not None:
+            index.update_item(item_id)
+
+    def remove_user_from_assignment_indexes(self, user_id: str) -> None:
+        """Drop a deleted user from every assignment index."""
+        for index in self._assignment_indexes.values():
+            index.remove_assignee(user_id)
+
+    def _get_user_views(
+        self,
+    ) -> tuple[UsersCollection, AssigneesCollection, ApproversCollection]:
+        """Return role views, rebuilding them only when the users data changed."""
         users = self._data.get(const.DATA_USERS, {})
-        if isinstance(users, dict) and users:
-            return {
+        stamp = (
+            users,
+            len(users) if isinstance(users, dict) else -1,
+            self._users_revision,
+        )
+        cached = self._user_views
+        if (
+            cached is not None
+            and self._user_views_enabled
+            and cached[0][0] is users
+            and cached[0][1:] == stamp[1:]
+        ):
+            return cached[1], cached[2], cached[3]
+
+        users_view: UsersCollection = (
+            {
                 user_id: cast("UserData", user_data)
                 for user_id, user_data in users.items()
                 if isinstance(user_data, dict)
             }
-
-        legacy_assignees = self._data.get(const.DATA_USERS, {})
-        if not isinstance(legacy_assignees, dict):
-            return {}
-        return {
-            assignee_id: cast("UserData", assignee_data)
-            for assignee_id, assignee_data in legacy_assignees.items()
-            if isinstance(assignee_data, dict)
+            if isinstance(users, dict)
+            else {}
+        )
+        assignees_view: AssigneesCollection = {
+            user_id: user_data
+            for user_id, user_data in users_view.items()
+            if user_data.get(const.DATA_USER_CAN_BE_ASSIGNED, False)
+        }
+        approvers_view: ApproversCollection = {
+            user_id: user_data
+            for user_id, user_data in users_view.items()
+            if (
+                user_data.get(const.DATA_USER_CAN_APPROVE, False)
+                or user_data.get(const.DATA_USER_CAN_MANAGE, False)
+                or bool(user_data.get(const.DATA_USER_ASSOCIATED_USER_IDS))
+            )
         }
+        if self._user_views_enabled:
+            self._user_views = (stamp, users_view, assignees_view, approvers_view)
+        return users_view, assignees_view, approvers_view
+
+    @property
+    def users_data(self) -> UsersCollection:
+        """Return canonical users data for schema45+ runtime logic.
+
+        Cached view: treat as read-only (records are the live storage dicts).
+        """
+        return self._get_user_views()[0]
 
     @property
     def users_for_management(self) -> UsersCollection:
@@ -689,12 +1258,7 @@ class ChoreOpsDataCoordinator(DataUpdateCoordinator):
         During schema45 migration window, `users` is canonical while much of
         runtime still consumes `assignees_data`.
         """
-        return {
-            user_id: user_data
-            for user_id, user_data in self.users_data.items()
-            if isinstance(user_data, dict)
-            and user_data.get(const.DATA_USER_CAN_BE_ASSIGNED, False)
-        }
+        return self._get_user_views()[1]
 
     @property
     def approvers_data(self) -> ApproversCollection:
@@ -702,20 +1266,7 @@ class ChoreOpsDataCoordinator(DataUpdateCoordinator):
 
         Approver role records are derived from canonical `users`.
         """
-        users = self.users_data
-        if users:
-            return {
-                user_id: user_data
-                for user_id, user_data in users.items()
-                if isinstance(user_data, dict)
-                and (
-                    user_data.get(const.DATA_USER_CAN_APPROVE, False)
-                    or user_data.get(const.DATA_USER_CAN_MANAGE, False)
-                    or bool(user_data.get(const.DATA_USER_ASSOCIATED_USER_IDS))
-                )
-            }
-
-        return {}
+        return self._get_user_views()[2]
 
     @property
     def chores_data(self) -> ChoresCollection:
@@ -18,7 +18,7 @@ from .chore_engine import (
     ChoreEngine,
     TransitionEffect,
 )
-from .economy_engine import EconomyEngine, InsufficientFundsError
+from .economy_engine import EconomyEngine, InsufficientFundsError, LedgerTimeIndex
 from .gamification_engine import GamificationEngine
 from .schedule_engine import RecurrenceEngine, calculate_next_due_date_from_chore_info
 from .statistics_engine import StatisticsEngine
@@ -34,6 +34,7 @@ __all__ = [
     "EconomyEngine",
     "GamificationEngine",
     "InsufficientFundsError",
+    "LedgerTimeIndex",
     "RecurrenceEngine",
     "StatisticsEngine",
     "TransitionEffect",
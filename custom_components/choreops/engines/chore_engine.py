@@ -1485,7 +1485,9 @@ class ChoreEngine:
         try:
             engine = RecurrenceEngine(schedule_config)
 
-            # Check if any scheduled occurrences were missed
+            # Check if any scheduled occurrences were missed. The engine is
+            # anchored on the previous completion, so this is one closed-form
+            # step to the next occurrence however long the gap was.
             if engine.has_missed_occurrences(schedule_prev_dt, schedule_current_dt):
                 return 1  # Broke streak
 
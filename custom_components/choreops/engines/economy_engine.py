@@ -3,6 +3,7 @@
 This engine provides stateless, pure Python functions for:
 - Point arithmetic with consistent rounding
 - Ledger entry creation and pruning
+- Chronological ledger range reads (LedgerTimeIndex)
 - Sufficient funds validation (NSF checks)
 - Multiplier calculations
 
@@ -15,12 +16,15 @@ See docs/ARCHITECTURE.md for the Engine vs Manager distinction.
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .. import const
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from ..type_defs import LedgerEntry
 
 
@@ -29,6 +33,19 @@ def _now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
+def _coerce_ledger_timestamp(raw_timestamp: Any) -> datetime | None:
+    """Parse a raw ledger timestamp to an aware datetime, or None if invalid."""
+    if not isinstance(raw_timestamp, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(raw_timestamp)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed
+
+
 class InsufficientFundsError(Exception):
     """Raised when a withdrawal would result in negative balance.
 
@@ -188,48 +205,226 @@ class EconomyEngine:
         max_entries: int = DEFAULT_MAX_LEDGER_ENTRIES,
         max_age_days: int | None = None,
         now_utc: datetime | None = None,
+        index: LedgerTimeIndex | None = None,
     ) -> list[LedgerEntry]:
         """Trim ledger to maximum entries, keeping most recent.
 
         Modifies the list in place and returns it for convenience.
-        Newest entries are at the END of the list (append order).
+        Age pruning goes through a LedgerTimeIndex (see drop_before()).
+        Entries without a parseable timestamp are never dropped for age, only
+        by the max_entries cap.
 
         Args:
             ledger: List of ledger entries to prune
             max_entries: Maximum entries to keep (default 50)
             max_age_days: Optional age-based retention window in days
             now_utc: Optional current time override for deterministic tests
+            index: Optional time index over ``ledger``, kept aligned with the
+                pruned list; one is built for this call if missing or stale
 
         Returns:
             The pruned ledger list (same object, modified in place)
         """
+        if index is not None and not index.is_current(ledger):
+            index = None
+
         if max_age_days is not None and max_age_days > 0:
             current_time = now_utc or datetime.now(UTC)
             cutoff = current_time - timedelta(days=max_age_days)
+            if index is None:
+                index = LedgerTimeIndex(ledger)
+            index.drop_before(cutoff)
 
-            retained_entries: list[LedgerEntry] = []
-            for entry in ledger:
-                raw_timestamp = entry.get(const.DATA_LEDGER_TIMESTAMP)
-                if not isinstance(raw_timestamp, str):
-                    retained_entries.append(entry)
-                    continue
+        if len(ledger) > max_entries:
+            # Remove oldest entries (beginning of list)
+            del ledger[: len(ledger) - max_entries]
+            if index is not None:
+                index.trim(len(ledger))
+        return ledger
 
-                try:
-                    parsed = datetime.fromisoformat(raw_timestamp)
-                except ValueError:
-                    retained_entries.append(entry)
-                    continue
 
-                if parsed.tzinfo is None:
-                    parsed = parsed.replace(tzinfo=UTC)
+class LedgerTimeIndex:
+    """Parallel epoch array over one assignee ledger for bisect range reads.
 
-                if parsed >= cutoff:
-                    retained_entries.append(entry)
+    EconomyManager only ever appends to a ledger and prunes from the front, so
+    ledgers are chronological. The index parses each timestamp once, keeps the
+    epochs aligned 1:1 with ledger positions, and answers range queries by
+    bisect instead of parsing and filtering every entry per read.
 
-            if len(retained_entries) != len(ledger):
-                ledger[:] = retained_entries
+    Entries without a parseable timestamp carry the previous epoch forward so
+    the array stays monotonic; they are skipped by range queries. Ledgers
+    restored out of order are detected and served by a sorted fallback.
+    """
 
-        if len(ledger) > max_entries:
-            # Remove oldest entries (beginning of list)
-            del ledger[: len(ledger) - max_entries]
-        return ledger
+    __slots__ = ("_epochs", "_head", "_ledger", "_ordered", "_tail", "_valid")
+
+    def __init__(self, ledger: list[LedgerEntry]) -> None:
+        """Index an existing ledger list (the list is referenced, not copied)."""
+        self._ledger = ledger
+        self._epochs: list[float] = []
+        self._valid: list[bool] = []
+        self._ordered = True
+        self._head: object | None = None
+        self._tail: object | None = None
+        self._reindex()
+
+    def __len__(self) -> int:
+        """Return the number of indexed ledger positions."""
+        return len(self._epochs)
+
+    def _reindex(self) -> None:
+        """Rebuild the parallel arrays from the referenced ledger list."""
+        self._epochs.clear()
+        self._valid.clear()
+        self._ordered = True
+        for entry in self._ledger:
+            self._push(entry)
+        self._sync_ends()
+
+    def _sync_ends(self) -> None:
+        """Remember the ledger's first and last entries for is_current()."""
+        self._head = self._ledger[0] if self._ledger else None
+        self._tail = self._ledger[-1] if self._ledger else None
+
+    def _push(self, entry: Any) -> None:
+        """Parse one entry and append its epoch to the parallel arrays."""
+        parsed = (
+            _coerce_ledger_timestamp(entry.get(const.DATA_LEDGER_TIMESTAMP))
+            if isinstance(entry, dict)
+            else None
+        )
+        previous = self._epochs[-1] if self._epochs else float("-inf")
+        if parsed is None:
+            self._epochs.append(previous)
+            self._valid.append(False)
+            return
+        epoch = parsed.timestamp()
+        if epoch < previous:
+            self._ordered = False
+        self._epochs.append(epoch)
+        self._valid.append(True)
+
+    def is_current(self, ledger: Any) -> bool:
+        """Return True when the index still mirrors the given ledger list."""
+        if ledger is not self._ledger or len(ledger) != len(self._epochs):
+            return False
+        if not ledger:
+            return True
+        return ledger[0] is self._head and ledger[-1] is self._tail
+
+    def append(self, entry: LedgerEntry) -> None:
+        """Record an entry that was just appended to the ledger."""
+        self._push(entry)
+        if self._head is None:
+            self._head = entry
+        self._tail = entry
+
+    def trim(self, retained: int) -> None:
+        """Drop leading positions after the ledger was pruned to ``retained``."""
+        removed = len(self._epochs) - retained
+        if removed <= 0:
+            return
+        del self._epochs[:removed]
+        del self._valid[:removed]
+        self._sync_ends()
+
+    def drop_before(self, cutoff: datetime) -> int:
+        """Remove dated entries older than ``cutoff`` from the ledger and index.
+
+        Chronological ledgers lose an expired prefix found by bisect. Ledgers
+        restored out of order are filtered entry by entry instead, because a
+        recent entry may sit behind an older one. Entries without a parseable
+        timestamp are kept either way.
+
+        Returns:
+            Number of entries removed.
+        """
+        cutoff_epoch = cutoff.timestamp()
+        ledger = self._ledger
+        epochs = self._epochs
+        valid = self._valid
+
+        if not self._ordered:
+            kept = [
+                entry
+                for entry, epoch, is_valid in zip(ledger, epochs, valid, strict=True)
+                if not is_valid or epoch >= cutoff_epoch
+            ]
+            removed = len(ledger) - len(kept)
+            if removed:
+                ledger[:] = kept
+                self._reindex()
+            return removed
+
+        expired = bisect_left(epochs, cutoff_epoch)
+        undated = [position for position in range(expired) if not valid[position]]
+        removed = expired - len(undated)
+        if removed:
+            ledger[:expired] = [ledger[position] for position in undated]
+            epochs[:expired] = [epochs[position] for position in undated]
+            valid[:expired] = [False] * len(undated)
+            self._sync_ends()
+        return removed
+
+    def range(
+        self, start: datetime, end: datetime, *, reverse: bool = False
+    ) -> Iterator[tuple[float, LedgerEntry]]:
+        """Yield ``(epoch, entry)`` pairs with ``start <= time <= end``.
+
+        Pairs are yielded oldest first, or newest first when ``reverse`` is set.
+        """
+        start_epoch = start.timestamp()
+        end_epoch = end.timestamp()
+        if not self._ordered:
+            pairs = [
+                (epoch, entry)
+                for epoch, entry in self._sorted_pairs()
+                if start_epoch <= epoch <= end_epoch
+            ]
+            yield from reversed(pairs) if reverse else pairs
+            return
+
+        epochs = self._epochs
+        valid = self._valid
+        ledger = self._ledger
+        positions = range(
+            bisect_left(epochs, start_epoch), bisect_right(epochs, end_epoch)
+        )
+        for position in reversed(positions) if reverse else positions:
+            if valid[position]:
+                yield epochs[position], ledger[position]
+
+    def iter_entries(
+        self, after_epoch: float | None = None
+    ) -> Iterator[tuple[float, LedgerEntry]]:
+        """Stream dict entries as ``(epoch, entry)`` in chronological order.
+
+        Entries with an unparseable timestamp are included at their ledger
+        position, keyed by the carried-forward epoch. When ``after_epoch`` is
+        given, streaming starts at the first entry with ``epoch >= after_epoch``.
+        """
+        if not self._ordered:
+            for epoch, entry in self._sorted_pairs(include_invalid=True):
+                if after_epoch is None or epoch >= after_epoch:
+                    yield epoch, entry
+            return
+
+        first = 0 if after_epoch is None else bisect_left(self._epochs, after_epoch)
+        for position in range(first, len(self._epochs)):
+            entry = self._ledger[position]
+            if isinstance(entry, dict):
+                yield self._epochs[position], entry
+
+    def _sorted_pairs(
+        self, include_invalid: bool = False
+    ) -> list[tuple[float, LedgerEntry]]:
+        """Return entries stably sorted by epoch (out-of-order ledgers only)."""
+        pairs = [
+            (epoch, entry)
+            for epoch, is_valid, entry in zip(
+                self._epochs, self._valid, self._ledger, strict=True
+            )
+            if isinstance(entry, dict) and (is_valid or include_invalid)
+        ]
+        pairs.sort(key=lambda pair: pair[0])
+        return pairs
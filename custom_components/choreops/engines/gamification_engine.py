@@ -114,6 +114,38 @@ class GamificationEngine:
         cls._register_handlers()
         return cls._PERIODIC_TARGET_METADATA.get(target_type)
 
+    @classmethod
+    def get_badge_signal_families(cls, badge_data: dict[str, Any]) -> frozenset[str]:
+        """Return the signal families a badge's evaluation depends on.
+
+        Cumulative badges only track points. Periodic targets declare their
+        families in the handler registry; unknown targets depend on everything.
+        """
+        if badge_data.get(const.DATA_BADGE_TYPE) == const.BADGE_TYPE_CUMULATIVE:
+            return frozenset({const.GAMIFICATION_SIGNAL_FAMILY_POINTS})
+        target = badge_data.get(const.DATA_BADGE_TARGET) or {}
+        metadata = cls.get_periodic_target_metadata(
+            str(target.get(const.DATA_BADGE_TARGET_TYPE, ""))
+        )
+        if metadata is None:
+            return const.GAMIFICATION_SIGNAL_FAMILIES_ALL
+        return cast("frozenset[str]", metadata["signal_families"])
+
+    @staticmethod
+    def get_achievement_signal_families(
+        achievement_data: dict[str, Any],
+    ) -> frozenset[str]:
+        """Return the signal families an achievement's evaluation depends on.
+
+        Badge-linked totals count badge awards, which any family can trigger.
+        """
+        if achievement_data.get(const.DATA_ACHIEVEMENT_SOURCE_BADGE_ID):
+            return const.GAMIFICATION_SIGNAL_FAMILIES_ALL
+        return const.ACHIEVEMENT_SIGNAL_FAMILIES.get(
+            str(achievement_data.get(const.DATA_ACHIEVEMENT_TYPE, "")),
+            const.GAMIFICATION_SIGNAL_FAMILIES_ALL,
+        )
+
     @classmethod
     def _register_handlers(cls) -> None:
         """Register all criterion handlers.
@@ -124,6 +156,21 @@ class GamificationEngine:
         if cls._CRITERION_HANDLERS:
             return  # Already registered
 
+        points_families = frozenset({const.GAMIFICATION_SIGNAL_FAMILY_POINTS})
+        points_chores_families = frozenset(
+            {
+                const.GAMIFICATION_SIGNAL_FAMILY_POINTS,
+                const.GAMIFICATION_SIGNAL_FAMILY_CHORES,
+            }
+        )
+        chores_families = frozenset({const.GAMIFICATION_SIGNAL_FAMILY_CHORES})
+        daily_families = frozenset(
+            {
+                const.GAMIFICATION_SIGNAL_FAMILY_CHORES,
+                const.GAMIFICATION_SIGNAL_FAMILY_OVERDUE,
+            }
+        )
+
         target_specs: list[tuple[str, CriterionHandler, dict[str, Any]]] = [
             (
                 const.BADGE_TARGET_THRESHOLD_TYPE_POINTS,
@@ -131,6 +178,7 @@ class GamificationEngine:
                 {
                     "canonical_type": "points",
                     "persist_bucket": "points_cycle",
+                    "signal_families": points_families,
                 },
             ),
             (
@@ -139,6 +187,7 @@ class GamificationEngine:
                 {
                     "canonical_type": "points_chores",
                     "persist_bucket": "points_cycle",
+                    "signal_families": points_chores_families,
                 },
             ),
             (
@@ -147,6 +196,7 @@ class GamificationEngine:
                 {
                     "canonical_type": "chore_count",
                     "persist_bucket": "chores_cycle",
+                    "signal_families": chores_families,
                 },
             ),
             (
@@ -156,6 +206,7 @@ class GamificationEngine:
                     "canonical_type": "daily_completion",
                     "percent_required": 1.0,
                     "persist_bucket": "days_cycle",
+                    "signal_families": daily_families,
                 },
             ),
             (
@@ -165,6 +216,7 @@ class GamificationEngine:
                     "canonical_type": "daily_completion",
                     "percent_required": 0.8,
                     "persist_bucket": "days_cycle",
+                    "signal_families": daily_families,
                 },
             ),
             (
@@ -175,6 +227,7 @@ class GamificationEngine:
                     "percent_required": 1.0,
                     "require_no_overdue": True,
                     "persist_bucket": "days_cycle",
+                    "signal_families": daily_families,
                 },
             ),
             (
@@ -185,6 +238,7 @@ class GamificationEngine:
                     "percent_required": 1.0,
                     "use_due_only_scope": True,
                     "persist_bucket": "days_cycle",
+                    "signal_families": daily_families,
                 },
             ),
             (
@@ -195,6 +249,7 @@ class GamificationEngine:
                     "percent_required": 0.8,
                     "use_due_only_scope": True,
                     "persist_bucket": "days_cycle",
+                    "signal_families": daily_families,
                 },
             ),
             (
@@ -206,6 +261,7 @@ class GamificationEngine:
                     "use_due_only_scope": True,
                     "require_no_overdue": True,
                     "persist_bucket": "days_cycle",
+                    "signal_families": daily_families,
                 },
             ),
             (
@@ -215,6 +271,7 @@ class GamificationEngine:
                     "canonical_type": "daily_minimum",
                     "min_count_required": 3,
                     "persist_bucket": "days_cycle",
+                    "signal_families": daily_families,
                 },
             ),
             (
@@ -224,6 +281,7 @@ class GamificationEngine:
                     "canonical_type": "daily_minimum",
                     "min_count_required": 5,
                     "persist_bucket": "days_cycle",
+                    "signal_families": daily_families,
                 },
             ),
             (
@@ -233,6 +291,7 @@ class GamificationEngine:
                     "canonical_type": "daily_minimum",
                     "min_count_required": 7,
                     "persist_bucket": "days_cycle",
+                    "signal_families": daily_families,
                 },
             ),
             (
@@ -242,6 +301,7 @@ class GamificationEngine:
                     "canonical_type": "completion_streak",
                     "percent_required": 1.0,
                     "persist_bucket": "days_cycle",
+                    "signal_families": daily_families,
                 },
             ),
             (
@@ -251,6 +311,7 @@ class GamificationEngine:
                     "canonical_type": "completion_streak",
                     "percent_required": 0.8,
                     "persist_bucket": "days_cycle",
+                    "signal_families": daily_families,
                 },
             ),
             (
@@ -261,6 +322,7 @@ class GamificationEngine:
                     "percent_required": 1.0,
                     "require_no_overdue": True,
                     "persist_bucket": "days_cycle",
+                    "signal_families": daily_families,
                 },
             ),
             (
@@ -271,6 +333,7 @@ class GamificationEngine:
                     "percent_required": 0.8,
                     "use_due_only_scope": True,
                     "persist_bucket": "days_cycle",
+                    "signal_families": daily_families,
                 },
             ),
             (
@@ -282,6 +345,7 @@ class GamificationEngine:
                     "use_due_only_scope": True,
                     "require_no_overdue": True,
                     "persist_bucket": "days_cycle",
+                    "signal_families": daily_families,
                 },
             ),
         ]
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from calendar import monthrange
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, ClassVar, cast
 
 from dateutil.relativedelta import relativedelta
 from dateutil.rrule import (
@@ -44,6 +44,8 @@ from ..utils.dt_utils import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from ..type_defs import ChoreData, ScheduleConfig
 
 
@@ -123,6 +125,9 @@ class RecurrenceEngine:
         # DAILY_MULTI times (pipe-separated string, e.g., "08:00|12:00|18:00")
         self._daily_multi_times = config.get("daily_multi_times", "")
 
+        # Compiled rrule for DAILY/WEEKLY/BIWEEKLY, built once on first use
+        self._compiled_rule: rrule | None = None
+
     def get_next_occurrence(
         self, after: datetime | None = None, require_future: bool = True
     ) -> datetime | None:
@@ -178,17 +183,40 @@ class RecurrenceEngine:
             return []
 
         occurrences: list[datetime] = []
-        current = self.get_next_occurrence(after=start, require_future=False)
-
-        iteration = 0
-        while current and current <= end and iteration < limit:
+        for iteration, current in enumerate(self._iter_occurrences(start)):
+            if iteration >= limit or current > end:
+                break
             if current >= start:
                 occurrences.append(current)
-            current = self.get_next_occurrence(after=current, require_future=True)
-            iteration += 1
 
         return occurrences
 
+    def _iter_occurrences(self, start: datetime) -> Iterator[datetime]:
+        """Yield successive occurrences, beginning with the one at/after ``start``.
+
+        Equivalent to chaining get_next_occurrence() calls, but each frequency
+        family iterates natively: one compiled rrule, one relativedelta
+        stepper, or one pass over the DAILY_MULTI slot series.
+        """
+        if self._frequency == const.FREQUENCY_DAILY_MULTI:
+            yield from self._iter_multi_daily(start)
+            return
+        if self._frequency in self.PERIOD_END_FREQUENCIES:
+            current = self._calculate_period_end(start, require_future=False)
+            while current is not None:
+                yield current
+                current = self._calculate_period_end(current, require_future=True)
+            return
+        if self._is_custom_frequency() or self._needs_clamping():
+            yield from self._iter_with_relativedelta(start)
+            return
+
+        rule = self._get_compiled_rule()
+        if rule is None:
+            return
+        for occurrence in rule.xafter(as_local(start), inc=True):
+            yield as_utc(occurrence)
+
     def has_missed_occurrences(
         self,
         last_completion: datetime,
@@ -214,28 +242,29 @@ class RecurrenceEngine:
             Weekly Monday: last=Jan 6, current=Jan 13 → False (consecutive Mondays)
         """
         # No schedule = no missed occurrences
-        if self._frequency == const.FREQUENCY_NONE:
+        if self._frequency == const.FREQUENCY_NONE or not self._base_date:
             return False
 
-        # Get all occurrences between completions
-        occurrences = self.get_occurrences(
-            start=last_completion,
-            end=current_completion,
-            limit=100,
-        )
-
-        # Filter to occurrences strictly between the two completion times.
-        # If any such occurrence exists, it was missed.
+        # An occurrence was missed exactly when the first one after the last
+        # completion falls strictly before the current completion. Fixed
+        # intervals fast-forward to it and rrule-backed schedules take a single
+        # after() step, so the check is constant-time however long the gap.
         #
         # NOTE: rrule.after() truncates microseconds to 0, so we must do the same
         # for current_completion to ensure an occurrence falling at "now" (same
         # second but different microseconds) is not incorrectly counted as missed.
         current_truncated = current_completion.replace(microsecond=0)
-        missed = [
-            occ for occ in occurrences if last_completion < occ < current_truncated
-        ]
-
-        return len(missed) > 0
+        next_occurrence = self._first_occurrence_after(last_completion)
+        return next_occurrence is not None and next_occurrence < current_truncated
+
+    def _first_occurrence_after(self, reference_utc: datetime) -> datetime | None:
+        """Return the first get_occurrences() element strictly after a reference."""
+        for iteration, occurrence in enumerate(self._iter_occurrences(reference_utc)):
+            if occurrence > reference_utc:
+                return occurrence
+            if iteration >= const.MAX_DATE_CALCULATION_ITERATIONS:
+                break
+        return None
 
     def to_rrule_string(self) -> str:
         """Generate RFC 5545 RRULE string for iCal export.
@@ -286,6 +315,23 @@ class RecurrenceEngine:
         Returns:
             Next occurrence as UTC datetime.
         """
+        rule = self._get_compiled_rule()
+        if rule is None:
+            return None
+
+        # Get next occurrence after reference (converted to local for rrule)
+        reference_local = as_local(reference_utc)
+        next_occurrence = rule.after(reference_local, inc=not require_future)
+
+        if next_occurrence:
+            return as_utc(next_occurrence)
+        return None
+
+    def _get_compiled_rule(self) -> rrule | None:
+        """Return the engine's rrule, compiling it on first use."""
+        if self._compiled_rule is not None:
+            return self._compiled_rule
+
         freq = self._frequency
         base_local = as_local(self._base_date) if self._base_date else None
         if not base_local:
@@ -306,20 +352,13 @@ class RecurrenceEngine:
 
         # Build rrule with native byweekday support
         # Type stubs expect Literal[0-6], but rrule accepts int at runtime
-        rule = rrule(
+        self._compiled_rule = rrule(
             rrule_freq,  # type: ignore[arg-type]
             interval=interval,
             dtstart=base_local,
             byweekday=rrule_weekdays,  # Native weekday filtering
         )
-
-        # Get next occurrence after reference (converted to local for rrule)
-        reference_local = as_local(reference_utc)
-        next_occurrence = rule.after(reference_local, inc=not require_future)
-
-        if next_occurrence:
-            return as_utc(next_occurrence)
-        return None
+        return self._compiled_rule
 
     # =========================================================================
     # Private: relativedelta-based calculation (clamping frequencies)
@@ -347,7 +386,19 @@ class RecurrenceEngine:
         if not self._base_date:
             return None
 
-        result = self._base_date
+        result = self._advance_with_relativedelta(reference_utc, require_future)
+
+        # Apply applicable_days constraint if configured
+        if self._applicable_days:
+            result = self._snap_to_applicable_day(result)
+
+        return result
+
+    def _advance_with_relativedelta(
+        self, reference_utc: datetime, require_future: bool
+    ) -> datetime:
+        """Step from base_date to the reference without applicable_days snapping."""
+        result = cast("datetime", self._base_date)
 
         # OPTIMIZATION: Fast-forward for fixed-length intervals
         # Only loop for variable-length units (months/years) where clamping matters
@@ -376,12 +427,35 @@ class RecurrenceEngine:
         if require_future and result <= reference_utc:
             result = result + self._get_relativedelta()
 
-        # Apply applicable_days constraint if configured
-        if self._applicable_days:
-            result = self._snap_to_applicable_day(result)
-
         return result
 
+    def _iter_with_relativedelta(self, start: datetime) -> Iterator[datetime]:
+        """Yield relativedelta occurrences by stepping the unsnapped series.
+
+        Each occurrence is the first base_date step after the previous
+        (snapped) occurrence, snapped to applicable_days - the same result
+        _calculate_with_relativedelta gives, without re-walking from base_date.
+        """
+        if not self._base_date:
+            return
+
+        delta = self._get_relativedelta()
+        step = self._advance_with_relativedelta(start, require_future=False)
+        while True:
+            occurrence = (
+                self._snap_to_applicable_day(step) if self._applicable_days else step
+            )
+            yield occurrence
+
+            iteration = 0
+            while (
+                step <= occurrence and iteration < const.MAX_DATE_CALCULATION_ITERATIONS
+            ):
+                step = step + delta
+                iteration += 1
+            if step <= occurrence:
+                return
+
     def _is_fixed_interval(self) -> bool:
         """Check if the interval has a fixed length (hours/days/weeks).
 
@@ -897,6 +971,32 @@ class RecurrenceEngine:
         )
         return None
 
+    def _iter_multi_daily(self, start: datetime) -> Iterator[datetime]:
+        """Yield DAILY_MULTI occurrences strictly after ``start``.
+
+        Follows _calculate_multi_daily: every slot of the base day, then the
+        first slot of each following day, parsing each day's slots once.
+        """
+        current = self._calculate_multi_daily(start)
+        if current is None or not self._base_date:
+            return
+        yield current
+
+        base_date = as_local(self._base_date).date()
+        for day_offset in range(const.MAX_DATE_CALCULATION_ITERATIONS + 1):
+            day_slots = parse_daily_multi_times(
+                self._daily_multi_times,
+                reference_date=base_date + timedelta(days=day_offset),
+                timezone_info=const.DEFAULT_TIME_ZONE,
+            )
+            if day_offset:
+                day_slots = day_slots[:1]
+            for slot_local in day_slots:
+                slot_utc = as_utc(slot_local)
+                if slot_utc > current:
+                    current = slot_utc
+                    yield current
+
 
 # =============================================================================
 # Module-level convenience functions
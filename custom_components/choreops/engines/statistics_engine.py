@@ -8,13 +8,16 @@ This engine centralizes all period-based statistics tracking across ChoreOps:
 
 Design Principles:
     - Stateless: No coordinator reference, operates on passed data structures
+      (the only instance state is a memoized range index over daily buckets)
     - Consistent: Single source of truth for period key generation
     - Efficient: Batch updates with optional auto-pruning
 """
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from datetime import date, datetime, timedelta
+from itertools import accumulate
 from typing import TYPE_CHECKING, Any, Final
 
 from .. import const
@@ -32,6 +35,86 @@ DEFAULT_RETENTION: Final[dict[str, int]] = {
     const.PERIOD_YEARLY: const.DEFAULT_RETENTION_YEARLY,
 }
 
+# Upper bound on memoized range indexes before the cache is reset; containers
+# replaced wholesale (resets, deletes) otherwise leave unreachable entries.
+_RANGE_INDEX_CACHE_MAX: Final = 2048
+
+
+class DailyRangeIndex:
+    """Sorted-key prefix sums and range maxima over one daily bucket container.
+
+    Built lazily per metric, so any date-range sum or max costs two binary
+    searches over the sorted day keys instead of a scan of every bucket.
+    """
+
+    __slots__ = ("_buckets", "_maxima", "_prefix_sums", "day_keys")
+
+    def __init__(self, daily_data: Mapping[str, Any]) -> None:
+        """Index the dict-valued buckets of a daily period container."""
+        self.day_keys: list[str] = sorted(
+            day_key
+            for day_key, bucket in daily_data.items()
+            if isinstance(day_key, str) and isinstance(bucket, dict)
+        )
+        self._buckets: list[dict[str, Any]] = [
+            daily_data[day_key] for day_key in self.day_keys
+        ]
+        self._prefix_sums: dict[str, list[int | float]] = {}
+        self._maxima: dict[str, list[list[int | float]]] = {}
+
+    def _values(self, metric: str) -> list[int | float]:
+        """Return numeric metric values in day order (0 when missing)."""
+        values: list[int | float] = []
+        for bucket in self._buckets:
+            value = bucket.get(metric, 0)
+            values.append(value if isinstance(value, (int, float)) else 0)
+        return values
+
+    def _span(self, start_key: str, end_key: str) -> tuple[int, int]:
+        """Return the [lo, hi) positions of day keys within start..end."""
+        return (
+            bisect_left(self.day_keys, start_key),
+            bisect_right(self.day_keys, end_key),
+        )
+
+    def sum(self, metric: str, start_key: str, end_key: str) -> int | float:
+        """Return the metric total over day keys in [start_key, end_key]."""
+        prefix = self._prefix_sums.get(metric)
+        if prefix is None:
+            prefix = list(accumulate(self._values(metric), initial=0))
+            self._prefix_sums[metric] = prefix
+        lo, hi = self._span(start_key, end_key)
+        if lo >= hi:
+            return 0
+        return prefix[hi] - prefix[lo]
+
+    def max(self, metric: str, start_key: str, end_key: str) -> int | float:
+        """Return the metric maximum over day keys in [start_key, end_key].
+
+        Uses a sparse table, so each query reads two precomputed windows.
+        Returns 0 for empty ranges or when every value is below zero.
+        """
+        table = self._maxima.get(metric)
+        if table is None:
+            table = [self._values(metric)]
+            width = 1
+            while width * 2 <= len(table[0]):
+                previous = table[-1]
+                table.append(
+                    [
+                        max(previous[index], previous[index + width])
+                        for index in range(len(previous) - width)
+                    ]
+                )
+                width *= 2
+            self._maxima[metric] = table
+        lo, hi = self._span(start_key, end_key)
+        if lo >= hi:
+            return 0
+        level = (hi - lo).bit_length() - 1
+        row = table[level]
+        return max(0, row[lo], row[hi - (1 << level)])
+
 
 class StatisticsEngine:
     """Unified engine for tracking period-based statistics.
@@ -63,6 +146,16 @@ class StatisticsEngine:
         stats.prune_history(period_data, retention_config)
     """
 
+    def __init__(self) -> None:
+        """Initialize the memoized daily range indexes.
+
+        Entries hold their container (so its id() cannot be reused while
+        cached) and the container revision they were built at. Revisions are
+        bumped by every engine write to the daily buckets.
+        """
+        self._range_indexes: dict[int, tuple[dict[str, Any], int, DailyRangeIndex]] = {}
+        self._range_revisions: dict[int, int] = {}
+
     # ────────────────────────────────────────────────────────────────
     # Period Key Generation
     # ────────────────────────────────────────────────────────────────
@@ -192,6 +285,7 @@ class StatisticsEngine:
                 const.PERIOD_MONTHLY: const.PERIOD_MONTHLY,
                 const.PERIOD_YEARLY: const.PERIOD_YEARLY,
             }
+        self.invalidate_range_index(period_data, period_key_mapping)
 
         # Update each period bucket with appropriate metrics
         for period_type, period_key in keys.items():
@@ -288,6 +382,7 @@ class StatisticsEngine:
                 const.PERIOD_MONTHLY: const.PERIOD_MONTHLY,
                 const.PERIOD_YEARLY: const.PERIOD_YEARLY,
             }
+        self.invalidate_range_index(period_data, period_key_mapping)
 
         for period_type, period_key in keys.items():
             data_key = period_key_mapping.get(period_type, period_type)
@@ -492,6 +587,8 @@ class StatisticsEngine:
             if day < cutoff_daily:
                 del daily_data[day]
                 total_pruned += 1
+        if total_pruned:
+            self.invalidate_range_index(period_data, period_key_mapping)
 
         # Weekly: keep configured weeks
         weekly_key = period_key_mapping.get(
@@ -547,6 +644,48 @@ class StatisticsEngine:
 
         return total_pruned
 
+    # ────────────────────────────────────────────────────────────────
+    # Range Queries
+    # ────────────────────────────────────────────────────────────────
+
+    def get_daily_range_index(self, daily_data: dict[str, Any]) -> DailyRangeIndex:
+        """Return the memoized range index for a daily bucket container.
+
+        The index is reused while the container's revision is unchanged.
+        record_transaction, record_maximum and prune_history bump it; code that
+        edits daily buckets outside the engine must call invalidate_range_index().
+        """
+        container_id = id(daily_data)
+        revision = self._range_revisions.get(container_id, 0)
+        cached = self._range_indexes.get(container_id)
+        if cached is not None and cached[1] == revision:
+            return cached[2]
+
+        if len(self._range_indexes) >= _RANGE_INDEX_CACHE_MAX:
+            self._range_indexes.clear()
+            self._range_revisions.clear()
+            revision = 0
+        index = DailyRangeIndex(daily_data)
+        self._range_indexes[container_id] = (daily_data, revision, index)
+        return index
+
+    def invalidate_range_index(
+        self,
+        period_data: Mapping[str, Any],
+        period_key_mapping: Mapping[str, str] | None = None,
+    ) -> None:
+        """Bump the revision of a container's daily buckets (stales its index)."""
+        daily_key = (period_key_mapping or {}).get(
+            const.PERIOD_DAILY, const.PERIOD_DAILY
+        )
+        daily_data = period_data.get(daily_key)
+        # Only cached containers need a revision; held entries keep ids unique
+        if daily_data is not None and id(daily_data) in self._range_indexes:
+            container_id = id(daily_data)
+            self._range_revisions[container_id] = (
+                self._range_revisions.get(container_id, 0) + 1
+            )
+
     # ────────────────────────────────────────────────────────────────
     # Utility Methods
     # ────────────────────────────────────────────────────────────────
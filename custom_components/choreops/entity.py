@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import const
 from .coordinator import ChoreOpsDataCoordinator
 
+if TYPE_CHECKING:
+    from .type_defs import UpdateKey
+
 
 class ChoreOpsCoordinatorEntity(CoordinatorEntity[ChoreOpsDataCoordinator]):
     """Base entity class for ChoreOps sensors with typed coordinator access.
@@ -15,11 +20,26 @@ class ChoreOpsCoordinatorEntity(CoordinatorEntity[ChoreOpsDataCoordinator]):
     - Typed coordinator property pattern eliminating duplication across 30+ entity classes
     - Explicit `available` property checking coordinator update success (Platinum requirement)
     - Unavailability logging pattern (`_unavailable_logged`) per HA guidelines
+    - Targeted refresh keys (`_update_keys`) for coordinator.async_update_listeners_for
     """
 
     # Platinum requirement: Track unavailability logging state
     _unavailable_logged: bool = False
 
+    # (bucket_key, item_id) pairs this entity renders. Keyed entities skip
+    # targeted refreshes for unrelated items; None = refresh on every update.
+    _update_keys: frozenset[UpdateKey] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Register the targeted refresh subscription alongside the listener."""
+        await super().async_added_to_hass()
+        if self._update_keys is not None:
+            self.async_on_remove(
+                self.coordinator.async_add_keyed_listener(
+                    self._update_keys, self._handle_coordinator_update
+                )
+            )
+
     @property
     def coordinator(self) -> ChoreOpsDataCoordinator:
         """Return typed coordinator.
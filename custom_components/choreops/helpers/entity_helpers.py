@@ -9,7 +9,7 @@ All functions here require a `hass` object or interact with HA registries.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import re
 import time
 from typing import TYPE_CHECKING, Any, cast
@@ -436,6 +436,154 @@ def get_friendly_label(hass: HomeAssistant, label_name: str) -> str:
 # ==============================================================================
 
 
+@dataclass(slots=True)
+class NameIndex:
+    """Name -> internal ID index over one storage bucket (or user role view).
+
+    Exact names resolve first. Otherwise a case-folded name resolves when it
+    is unique in the bucket; case-folded collisions are reported through
+    ``duplicates`` and never resolve. The coordinator caches one index per
+    (item_type, role) and rebuilds it when the bucket or its revision moves.
+    """
+
+    records: Mapping[str, Any]
+    stamp: tuple[int, int]
+    exact: dict[str, str] = field(default_factory=dict)
+    folded: dict[str, list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        records: Mapping[str, Any],
+        name_key: str,
+        stamp: tuple[int, int],
+    ) -> NameIndex:
+        """Index every named record of a bucket."""
+        index = cls(records=records, stamp=stamp)
+        for item_id, item_info in records.items():
+            name = item_info.get(name_key)
+            if not isinstance(name, str):
+                continue
+            index.exact.setdefault(name, item_id)
+            index.folded.setdefault(name.casefold(), []).append(item_id)
+        return index
+
+    @property
+    def duplicates(self) -> dict[str, list[str]]:
+        """Return case-folded names shared by more than one item."""
+        return {name: ids for name, ids in self.folded.items() if len(ids) > 1}
+
+    def lookup(self, item_name: str) -> str | None:
+        """Resolve a name exactly, then case-insensitively when unambiguous."""
+        item_id = self.exact.get(item_name)
+        if item_id is not None:
+            return item_id
+        candidates = self.folded.get(item_name.casefold(), [])
+        if len(candidates) == 1:
+            return candidates[0]
+        if candidates:
+            const.LOGGER.warning(
+                "Name '%s' matches %d items case-insensitively; use the exact name",
+                item_name,
+                len(candidates),
+            )
+        return None
+
+
+@dataclass(slots=True)
+class AssignmentIndex:
+    """Bidirectional assignee <-> item index over one storage bucket.
+
+    ``by_item`` holds each item's assignees as a frozenset and ``by_assignee``
+    the reverse sets; items with an empty assignment list are kept in
+    ``unassigned`` because some callers treat them as assigned to everyone.
+    Ordered reads follow the bucket's insertion order so results match a
+    plain scan of the bucket. The coordinator rebuilds the index at
+    DATA_READY and patches single items as managers create, update or
+    delete them.
+    """
+
+    records: Mapping[str, Any]
+    assigned_key: str
+    by_item: dict[str, frozenset[str]] = field(default_factory=dict)
+    by_assignee: dict[str, set[str]] = field(default_factory=dict)
+    unassigned: set[str] = field(default_factory=set)
+    order: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, records: Mapping[str, Any], assigned_key: str) -> AssignmentIndex:
+        """Index the assignment lists of every record in a bucket."""
+        index = cls(records=records, assigned_key=assigned_key)
+        for item_id in records:
+            index.update_item(item_id)
+        return index
+
+    def update_item(self, item_id: str) -> None:
+        """Re-read one item's assignment list (drops the item when it is gone)."""
+        item_info = self.records.get(item_id)
+        if not isinstance(item_info, dict):
+            self.remove_item(item_id)
+            return
+
+        assigned = item_info.get(self.assigned_key)
+        assignees = frozenset(
+            assigned if isinstance(assigned, (list, tuple, set, frozenset)) else ()
+        )
+        previous = self.by_item.get(item_id, frozenset())
+        for assignee_id in previous - assignees:
+            self._discard(assignee_id, item_id)
+        for assignee_id in assignees - previous:
+            self.by_assignee.setdefault(assignee_id, set()).add(item_id)
+
+        self.by_item[item_id] = assignees
+        self.order.setdefault(item_id, len(self.order))
+        if assignees:
+            self.unassigned.discard(item_id)
+        else:
+            self.unassigned.add(item_id)
+
+    def remove_item(self, item_id: str) -> None:
+        """Forget a deleted item."""
+        for assignee_id in self.by_item.pop(item_id, frozenset()):
+            self._discard(assignee_id, item_id)
+        self.unassigned.discard(item_id)
+        self.order.pop(item_id, None)
+
+    def remove_assignee(self, assignee_id: str) -> None:
+        """Forget a deleted user on every item it was assigned to."""
+        for item_id in self.by_assignee.pop(assignee_id, set()):
+            self.by_item[item_id] = self.by_item[item_id] - {assignee_id}
+            if not self.by_item[item_id]:
+                self.unassigned.add(item_id)
+
+    def assignees_for(self, item_id: str) -> frozenset[str]:
+        """Return the assignees of one item."""
+        return self.by_item.get(item_id, frozenset())
+
+    def item_ids_for(
+        self, assignee_id: str, *, include_unassigned: bool = False
+    ) -> list[str]:
+        """Return an assignee's item IDs in bucket order.
+
+        Args:
+            assignee_id: Internal ID of the assignee.
+            include_unassigned: Also return items with no assignees.
+        """
+        item_ids = set(self.by_assignee.get(assignee_id, ()))
+        if include_unassigned:
+            item_ids |= self.unassigned
+        return sorted(item_ids, key=self.order.__getitem__)
+
+    def _discard(self, assignee_id: str, item_id: str) -> None:
+        """Drop one reverse edge, pruning empty assignee sets."""
+        item_ids = self.by_assignee.get(assignee_id)
+        if item_ids is None:
+            return
+        item_ids.discard(item_id)
+        if not item_ids:
+            del self.by_assignee[assignee_id]
+
+
 def get_item_id_by_name(
     coordinator: ChoreOpsDataCoordinator,
     item_type: str,
@@ -447,6 +595,8 @@ def get_item_id_by_name(
 
     Searches the storage for a Domain Item (Assignee, Chore, Reward, etc.) by its name
     and returns the internal_id (UUID) if found. This is NOT looking up an HA Entity.
+    Resolution goes through the coordinator's cached NameIndex: exact names
+    first, then case-insensitive names that match a single item.
 
     Args:
         coordinator: The ChoreOps data coordinator.
@@ -494,10 +644,9 @@ def get_item_id_by_name(
                 f"{const.ROLE_ASSIGNEE}, {const.ROLE_APPROVER}"
             )
 
-        for item_id, item_info in user_records.items():
-            if item_info.get(name_key) == item_name:
-                return item_id
-        return None
+        return coordinator.get_name_index(
+            item_type, user_records, name_key, role=role
+        ).lookup(item_name)
 
     if item_type not in item_map:
         raise ValueError(
@@ -506,10 +655,7 @@ def get_item_id_by_name(
 
     mapped_records, name_key = item_map[item_type]
     records = cast("dict[str, Any]", mapped_records)
-    for item_id, item_info in records.items():
-        if item_info.get(name_key) == item_name:
-            return item_id
-    return None
+    return coordinator.get_name_index(item_type, records, name_key).lookup(item_name)
 
 
 def get_item_id_or_raise(
@@ -6,17 +6,28 @@ Service handlers should delegate heavy composition logic here and remain thin.
 
 from __future__ import annotations
 
-from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import UTC, date, datetime, time, timedelta
+import heapq
 import html
+import math
 from typing import TYPE_CHECKING, Any, cast
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from .. import const
+from ..engines.economy_engine import LedgerTimeIndex
 from ..utils.dt_utils import dt_parse
 
 if TYPE_CHECKING:
-    from ..type_defs import ActivityReportResponse, ReportDailyBlock, ReportRangeResult
+    from collections.abc import Iterator
+
+    from ..type_defs import (
+        ActivityReportPage,
+        ActivityReportResponse,
+        LedgerEntry,
+        ReportDailyBlock,
+        ReportRangeResult,
+    )
 
 
 DEFAULT_REPORT_TRANSLATIONS: dict[str, str] = {
@@ -179,10 +190,13 @@ def build_activity_report(
     stats_manager: Any | None = None,
     report_translations: dict[str, str] | None = None,
     include_supplemental: bool = True,
+    economy_manager: Any | None = None,
 ) -> ActivityReportResponse:
     """Build a markdown activity report from ledger data.
 
     This is a read-only projection and does not mutate coordinator storage.
+    When ``economy_manager`` is provided, ledger ranges are read from its
+    maintained time indexes instead of parsing every entry.
     """
     start_dt = _coerce_datetime(range_result["start_iso"])
     end_dt = _coerce_datetime(range_result["end_iso"])
@@ -199,89 +213,24 @@ def build_activity_report(
         )
         for candidate_assignee_id in assignee_ids
     ]
-    single_assignee_scope = len(assignee_ids) == 1
-
-    daily_aggregate: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {
-            "earned": 0.0,
-            "spent": 0.0,
-            "transactions": 0,
-            "events": [],
-        }
-    )
 
     total_earned = 0.0
     total_spent = 0.0
     transactions_count = 0
 
-    for candidate_assignee_id in assignee_ids:
-        assignee_info = assignees_data.get(candidate_assignee_id, {})
-        assignee_name = str(
-            assignee_info.get(const.DATA_USER_NAME, candidate_assignee_id)
-        )
-        for entry in _iter_ledger_entries_in_range(assignee_info, start_dt, end_dt):
-            amount = float(entry.get(const.DATA_LEDGER_AMOUNT, 0.0))
-            timestamp = str(entry.get(const.DATA_LEDGER_TIMESTAMP, ""))
-            parsed_timestamp = _coerce_datetime(timestamp)
-            if parsed_timestamp is None:
-                continue
-
-            day = parsed_timestamp.astimezone(local_tz).strftime("%Y-%m-%d")
-
-            if amount >= 0:
-                total_earned += amount
-                daily_aggregate[day]["earned"] = (
-                    float(daily_aggregate[day]["earned"]) + amount
-                )
-            else:
-                spent = abs(amount)
-                total_spent += spent
-                daily_aggregate[day]["spent"] = (
-                    float(daily_aggregate[day]["spent"]) + spent
-                )
-
-            daily_aggregate[day]["transactions"] = (
-                int(daily_aggregate[day]["transactions"]) + 1
-            )
-            daily_aggregate[day]["events"].append(
-                _format_ledger_event_line(
-                    entry,
-                    assignee_name=assignee_name,
-                    single_assignee_scope=single_assignee_scope,
-                    timezone=local_tz,
-                )
-            )
-            transactions_count += 1
-
     daily_blocks: list[ReportDailyBlock] = []
-    for day in sorted(daily_aggregate.keys(), reverse=True):
-        earned = round(
-            float(daily_aggregate[day]["earned"]), const.DATA_FLOAT_PRECISION
-        )
-        spent = round(float(daily_aggregate[day]["spent"]), const.DATA_FLOAT_PRECISION)
-        net = round(earned - spent, const.DATA_FLOAT_PRECISION)
-        tx_count = int(daily_aggregate[day]["transactions"])
-        event_lines = cast("list[str]", daily_aggregate[day]["events"])
-        event_markdown = "\n".join(f"- {event_line}" for event_line in event_lines)
-
-        daily_blocks.append(
-            {
-                "date": day,
-                "earned": earned,
-                "spent": spent,
-                "net": net,
-                "transactions": tx_count,
-                "markdown_section": (
-                    f"### {day}\n"
-                    f"- 🌟 Points earned: {earned}\n"
-                    f"- 🎁 Points spent: {spent}\n"
-                    f"- 📊 Net change: {net}\n"
-                    f"- ✅ Activities: {tx_count}\n"
-                    f"- 🧾 Ledger detail:\n"
-                    f"{event_markdown}"
-                ),
-            }
-        )
+    for report_day in _iter_report_days(
+        assignees_data,
+        assignee_ids,
+        start_dt,
+        end_dt,
+        local_tz,
+        economy_manager,
+    ):
+        total_earned += report_day.earned
+        total_spent += report_day.spent
+        transactions_count += report_day.transactions
+        daily_blocks.append(_build_daily_block(report_day))
 
     supplemental_rollup = _build_supplemental_period_rollup(
         assignees_data,
@@ -412,31 +361,310 @@ def convert_markdown_to_html(markdown_text: str) -> str:
     return "\n".join(html_lines)
 
 
-def _iter_ledger_entries_in_range(
-    assignee_info: dict[str, Any],
-    start_dt: datetime,
-    end_dt: datetime,
-) -> list[dict[str, Any]]:
-    """Return ledger entries for an assignee in the requested datetime range."""
-    ledger = assignee_info.get(const.DATA_USER_LEDGER, [])
+@dataclass(slots=True)
+class _ReportDay:
+    """Ledger aggregate for one local day of an activity report."""
+
+    day: str
+    earned: float = 0.0
+    spent: float = 0.0
+    transactions: int = 0
+    # (assignee position, epoch, rendered line); ordered when the day closes
+    events: list[tuple[int, float, str]] = field(default_factory=list)
+
+
+def _get_ledger_index(
+    assignee_id: str,
+    assignees_data: dict[str, Any],
+    economy_manager: Any | None,
+) -> LedgerTimeIndex | None:
+    """Return the maintained ledger index, or a transient one for this read."""
+    if economy_manager is not None:
+        index = economy_manager.get_ledger_index(assignee_id)
+        if index is not None:
+            return cast("LedgerTimeIndex", index)
+    ledger = assignees_data.get(assignee_id, {}).get(const.DATA_USER_LEDGER)
     if not isinstance(ledger, list):
-        return []
+        return None
+    return LedgerTimeIndex(ledger)
+
 
-    entries: list[dict[str, Any]] = []
-    for raw_entry in ledger:
-        if not isinstance(raw_entry, dict):
+def _tag_ledger_stream(
+    stream: Iterator[tuple[float, LedgerEntry]],
+    *tags: Any,
+) -> Iterator[tuple[Any, ...]]:
+    """Tag each ``(epoch, entry)`` pair as ``(epoch, *tags, entry)``."""
+    for epoch, entry in stream:
+        yield (epoch, *tags, entry)
+
+
+def _iter_report_days(
+    assignees_data: dict[str, Any],
+    assignee_ids: list[str],
+    start_dt: datetime,
+    end_dt: datetime,
+    local_tz: ZoneInfo,
+    economy_manager: Any | None = None,
+    *,
+    include_events: bool = True,
+) -> Iterator[_ReportDay]:
+    """Yield per-day ledger aggregates for the range, newest day first.
+
+    Per-assignee ledger ranges are merged newest first by epoch, so only the
+    day currently being aggregated is held in memory. Within a day, events
+    are listed per assignee (in ``assignee_ids`` order) and oldest first.
+    """
+    single_assignee_scope = len(assignee_ids) == 1
+    streams: list[Iterator[tuple[Any, ...]]] = []
+    for position, candidate_assignee_id in enumerate(assignee_ids):
+        index = _get_ledger_index(
+            candidate_assignee_id, assignees_data, economy_manager
+        )
+        if index is None:
             continue
+        assignee_name = str(
+            assignees_data.get(candidate_assignee_id, {}).get(
+                const.DATA_USER_NAME, candidate_assignee_id
+            )
+        )
+        streams.append(
+            _tag_ledger_stream(
+                index.range(start_dt, end_dt, reverse=True), position, assignee_name
+            )
+        )
+
+    current: _ReportDay | None = None
+    for epoch, position, assignee_name, entry in heapq.merge(
+        *streams, key=lambda item: item[0], reverse=True
+    ):
+        local_timestamp = datetime.fromtimestamp(epoch, local_tz)
+        day = local_timestamp.strftime("%Y-%m-%d")
+        if current is None or current.day != day:
+            if current is not None:
+                yield _close_report_day(current)
+            current = _ReportDay(day=day)
+
+        amount = float(entry.get(const.DATA_LEDGER_AMOUNT, 0.0))
+        if amount >= 0:
+            current.earned += amount
+        else:
+            current.spent += abs(amount)
+        current.transactions += 1
+        if include_events:
+            current.events.append(
+                (
+                    position,
+                    epoch,
+                    _format_ledger_event_line(
+                        cast("dict[str, Any]", entry),
+                        assignee_name=assignee_name,
+                        single_assignee_scope=single_assignee_scope,
+                        local_time=local_timestamp,
+                    ),
+                )
+            )
+
+    if current is not None:
+        yield _close_report_day(current)
+
+
+def _close_report_day(report_day: _ReportDay) -> _ReportDay:
+    """Order a finished day's events per assignee, oldest first."""
+    # Events arrived newest first; reverse before the stable sort so entries
+    # sharing a timestamp keep their ledger order.
+    report_day.events.reverse()
+    report_day.events.sort(key=lambda event: (event[0], event[1]))
+    return report_day
+
+
+def _build_daily_block(report_day: _ReportDay) -> ReportDailyBlock:
+    """Build the rounded daily block and markdown section for one report day."""
+    earned = round(report_day.earned, const.DATA_FLOAT_PRECISION)
+    spent = round(report_day.spent, const.DATA_FLOAT_PRECISION)
+    net = round(earned - spent, const.DATA_FLOAT_PRECISION)
+    day = report_day.day
+    event_markdown = "\n".join(f"- {event[2]}" for event in report_day.events)
+    return {
+        "date": day,
+        "earned": earned,
+        "spent": spent,
+        "net": net,
+        "transactions": report_day.transactions,
+        "markdown_section": (
+            f"### {day}\n"
+            f"- 🌟 Points earned: {earned}\n"
+            f"- 🎁 Points spent: {spent}\n"
+            f"- 📊 Net change: {net}\n"
+            f"- ✅ Activities: {report_day.transactions}\n"
+            f"- 🧾 Ledger detail:\n"
+            f"{event_markdown}"
+        ),
+    }
+
+
+def build_activity_report_page(
+    assignees_data: dict[str, Any],
+    range_result: ReportRangeResult,
+    assignee_id: str | None = None,
+    *,
+    cursor: str | None = None,
+    page_size: int = const.DEFAULT_REPORT_PAGE_SIZE,
+    max_chars: int = const.REPORT_PAGE_MAX_CHARS,
+    report_translations: dict[str, str] | None = None,
+    economy_manager: Any | None = None,
+) -> ActivityReportPage:
+    """Build one cursor page of daily report blocks, newest day first.
+
+    Day blocks are rendered incrementally and the page stops after
+    ``page_size`` days or once the markdown would exceed ``max_chars`` (a page
+    always holds at least one day). ``cursor`` is the previous page's
+    ``next_cursor`` (a local ``YYYY-MM-DD`` day key). Range totals are only
+    computed for the first page.
+
+    Raises:
+        ValueError: If the report range or cursor is invalid.
+    """
+    start_dt = _coerce_datetime(range_result["start_iso"])
+    end_dt = _coerce_datetime(range_result["end_iso"])
+    if start_dt is None or end_dt is None:
+        raise ValueError("Invalid report range")
+    local_tz = _resolve_timezone(range_result.get("timezone", "UTC"))
+
+    page_end_dt = end_dt
+    if cursor is not None:
+        cursor_day = date.fromisoformat(cursor)
+        page_end_dt = min(
+            end_dt,
+            datetime.combine(cursor_day + timedelta(days=1), time.min, local_tz)
+            - timedelta(microseconds=1),
+        )
+
+    translations = _resolve_report_translations(report_translations)
+    assignee_ids = [assignee_id] if assignee_id else list(assignees_data.keys())
+
+    daily_blocks: list[ReportDailyBlock] = []
+    sections: list[str] = []
+    used_chars = 0
+    next_cursor: str | None = None
+    for report_day in _iter_report_days(
+        assignees_data,
+        assignee_ids,
+        start_dt,
+        page_end_dt,
+        local_tz,
+        economy_manager,
+    ):
+        block = _build_daily_block(report_day)
+        section = _render_daily_block(block, translations)
+        if daily_blocks and (
+            len(daily_blocks) >= page_size or used_chars + len(section) > max_chars
+        ):
+            next_cursor = report_day.day
+            break
+        daily_blocks.append(block)
+        sections.append(section)
+        used_chars += len(section) + 1
+
+    page: ActivityReportPage = {
+        "range": range_result,
+        "scope": {
+            "assignee_filter_applied": assignee_id is not None,
+            "assignee_ids": assignee_ids,
+        },
+        "cursor": cursor,
+        "next_cursor": next_cursor,
+        "page_size": page_size,
+        "daily": daily_blocks,
+        "markdown": "\n".join(sections) if sections else translations["no_activity"],
+    }
+
+    if cursor is None:
+        total_earned = 0.0
+        total_spent = 0.0
+        transactions_count = 0
+        for report_day in _iter_report_days(
+            assignees_data,
+            assignee_ids,
+            start_dt,
+            end_dt,
+            local_tz,
+            economy_manager,
+            include_events=False,
+        ):
+            total_earned += report_day.earned
+            total_spent += report_day.spent
+            transactions_count += report_day.transactions
+        page["summary"] = {
+            "total_earned": round(total_earned, const.DATA_FLOAT_PRECISION),
+            "total_spent": round(total_spent, const.DATA_FLOAT_PRECISION),
+            "net": round(total_earned - total_spent, const.DATA_FLOAT_PRECISION),
+            "transactions_count": transactions_count,
+        }
+
+    return page
+
+
+def iter_ledger_stream(
+    assignees_data: dict[str, Any],
+    assignee_ids: list[str],
+    economy_manager: Any | None = None,
+    cursor: str | None = None,
+) -> Iterator[tuple[str, str, LedgerEntry]]:
+    """Stream ledger entries for the assignees merged oldest first.
+
+    Yields ``(resume_cursor, assignee_id, entry)`` where ``resume_cursor``
+    continues the stream right after that entry. Cursors are
+    ``"<epoch>:<n>"``: resume at ``epoch``, skipping the ``n`` entries with
+    exactly that epoch that were already returned.
+
+    Raises:
+        ValueError: If ``cursor`` is malformed.
+    """
+    after_epoch, skip = (None, 0) if cursor is None else _decode_ledger_cursor(cursor)
+
+    streams: list[Iterator[tuple[Any, ...]]] = []
+    for candidate_assignee_id in assignee_ids:
+        index = _get_ledger_index(
+            candidate_assignee_id, assignees_data, economy_manager
+        )
+        if index is not None:
+            streams.append(
+                _tag_ledger_stream(
+                    index.iter_entries(after_epoch), candidate_assignee_id
+                )
+            )
 
-        timestamp = raw_entry.get(const.DATA_LEDGER_TIMESTAMP)
-        parsed = _coerce_datetime(timestamp)
-        if parsed is None:
+    return _iter_merged_ledger(streams, after_epoch, skip)
+
+
+def _iter_merged_ledger(
+    streams: list[Iterator[tuple[Any, ...]]],
+    after_epoch: float | None,
+    skip: int,
+) -> Iterator[tuple[str, str, LedgerEntry]]:
+    """Merge tagged ledger streams by epoch and attach resume cursors."""
+    last_epoch, ties = after_epoch, skip
+    for epoch, candidate_assignee_id, entry in heapq.merge(
+        *streams, key=lambda item: item[0]
+    ):
+        if skip and epoch == after_epoch:
+            skip -= 1
             continue
+        ties = ties + 1 if epoch == last_epoch else 1
+        last_epoch = epoch
+        yield f"{epoch!r}:{ties}", candidate_assignee_id, entry
 
-        if start_dt <= parsed <= end_dt:
-            entries.append(raw_entry)
 
-    entries.sort(key=lambda entry: str(entry.get(const.DATA_LEDGER_TIMESTAMP, "")))
-    return entries
+def _decode_ledger_cursor(cursor: str) -> tuple[float, int]:
+    """Decode an ``"<epoch>:<n>"`` ledger cursor."""
+    raw_epoch, separator, raw_skip = cursor.rpartition(":")
+    if not separator:
+        raise ValueError(f"Invalid ledger cursor: {cursor}")
+    epoch = float(raw_epoch)
+    skip = int(raw_skip)
+    if math.isnan(epoch) or skip < 0:
+        raise ValueError(f"Invalid ledger cursor: {cursor}")
+    return epoch, skip
 
 
 def _build_supplemental_period_rollup(
@@ -938,13 +1166,12 @@ def _format_ledger_event_line(
     entry: dict[str, Any],
     assignee_name: str,
     single_assignee_scope: bool,
-    timezone: ZoneInfo,
+    local_time: datetime,
 ) -> str:
     """Format one ledger entry into an assignee-friendly markdown bullet line."""
     amount = float(entry.get(const.DATA_LEDGER_AMOUNT, 0.0))
     source = str(entry.get(const.DATA_LEDGER_SOURCE, const.POINTS_SOURCE_OTHER))
     item_name = str(entry.get(const.DATA_LEDGER_ITEM_NAME, "Activity")).strip()
-    timestamp = str(entry.get(const.DATA_LEDGER_TIMESTAMP, ""))
 
     source_label_map = {
         const.POINTS_SOURCE_CHORES: "Chore",
@@ -966,15 +1193,10 @@ def _format_ledger_event_line(
         else f"-{round(abs(amount), const.DATA_FLOAT_PRECISION)}"
     )
 
-    parsed_time = _coerce_datetime(timestamp)
-    time_label = ""
-    if parsed_time is not None:
-        time_label = parsed_time.astimezone(timezone).strftime("%H:%M")
+    time_label = local_time.strftime("%H:%M")
 
     name_prefix = "" if single_assignee_scope else f"{assignee_name}: "
-    if time_label:
-        return f"{icon} {name_prefix}{time_label} — {source_label}: {item_name} ({signed_amount} pts)"
-    return f"{icon} {name_prefix}{source_label}: {item_name} ({signed_amount} pts)"
+    return f"{icon} {name_prefix}{time_label} — {source_label}: {item_name} ({signed_amount} pts)"
 
 
 def _resolve_timezone(timezone_name: str) -> ZoneInfo:
@@ -41,6 +41,23 @@ def _read_json_file(file_path: str) -> dict:
         return json.load(f)
 
 
+def _with_english_fallback(
+    data: dict[str, Any], english: dict[str, Any]
+) -> dict[str, Any]:
+    """Return translations with keys missing from ``data`` taken from English.
+
+    Sections present in both (e.g. ``actions``) are merged one level deep.
+    """
+    merged = dict(english)
+    for key, value in data.items():
+        english_value = english.get(key)
+        if isinstance(value, dict) and isinstance(english_value, dict):
+            merged[key] = {**english_value, **value}
+        else:
+            merged[key] = value
+    return merged
+
+
 def _get_translations_path() -> str:
     """Get the absolute path to the translations_custom directory.
 
@@ -207,6 +224,7 @@ async def load_notification_translation(
     Returns:
         A dict with notification keys mapping to {title, message} dicts.
         If the requested language is not found, returns English translations.
+        Keys the requested language lacks are filled in from English.
     """
     # Normalize language: default to English if empty/None
     if not language:
@@ -236,13 +254,19 @@ async def load_notification_translation(
         try:
             data = await hass.async_add_executor_job(_read_json_file, lang_path)
             const.LOGGER.debug("Loaded %s notification translations", language)
-            # Cache the loaded translations
-            _translation_cache[cache_key] = data
-            return data
         except (OSError, json.JSONDecodeError) as err:
             const.LOGGER.error(
                 "Error loading %s notification translations: %s", language, err
             )
+        else:
+            if language != "en":
+                # Crowdin files lag behind English when new keys are added
+                data = _with_english_fallback(
+                    data, await load_notification_translation(hass, "en")
+                )
+            # Cache the loaded translations
+            _translation_cache[cache_key] = data
+            return data
 
     # Fall back to English if requested language not found or errored
     if language != "en":
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback as ha_callback
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
@@ -14,7 +16,7 @@ from .. import const
 from ..helpers.entity_helpers import get_event_signal
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Coroutine
 
     from homeassistant.core import HomeAssistant
 
@@ -34,6 +36,11 @@ class BaseManager(ABC):
       (workflow operations: claim, approve, timer-triggered state transitions)
     - Use coordinator._persist() alone for internal bookkeeping
       (notification metadata, system config cleanup)
+    - Pass changed={bucket_key: [item_ids]} to either call when the touched
+      items are known, so the store re-snapshots only those subtrees. Omit it
+      when unsure - unscoped persists always take a full snapshot.
+    - Use coordinator._mark_changed() for containers created on first access
+      outside a persisting workflow, so the next scoped save includes them.
 
     Subclasses must implement:
     - async_setup(): Subscribe to events, initialize state
@@ -70,6 +77,9 @@ class BaseManager(ABC):
             )
         """
         signal = get_event_signal(self.entry_id, suffix)
+        if self.coordinator.in_digest_batch:
+            # Bulk service batch: notifications are merged when it flushes
+            payload.setdefault(const.NOTIFY_EVENT_BULK_DIGEST, True)
         const.LOGGER.debug(
             "Emitting event '%s' for instance %s with payload keys: %s",
             suffix,
@@ -79,7 +89,13 @@ class BaseManager(ABC):
         # Pass payload as single dict argument (dispatcher only supports *args)
         async_dispatcher_send(self.hass, signal, payload)
 
-    def listen(self, suffix: str, callback: Callable[..., Any]) -> None:
+    def listen(
+        self,
+        suffix: str,
+        callback: Callable[..., Any],
+        *,
+        track_in_batch: bool = False,
+    ) -> None:
         """Subscribe to instance-scoped event with automatic cleanup.
 
         The subscription is automatically cleaned up when the config entry is unloaded.
@@ -90,6 +106,9 @@ class BaseManager(ABC):
             suffix: Signal suffix constant to listen for
             callback: Function called when event fires (receives payload dict as arg)
                       Can be sync (returns None) or async (returns Coroutine)
+            track_in_batch: For async callbacks, hold an open coordinator.batch()
+                      until the handler finishes so its persists and refreshes
+                      join the batch flush (used for rollover-style fan-out)
 
         Example:
             def _on_points_changed(self, payload: dict[str, Any]) -> None:
@@ -101,6 +120,8 @@ class BaseManager(ABC):
             self.listen(const.SIGNAL_SUFFIX_POINTS_CHANGED, self._on_points_changed)
         """
         signal = get_event_signal(self.entry_id, suffix)
+        if track_in_batch and asyncio.iscoroutinefunction(callback):
+            callback = self._batch_tracked(callback)
         unsub = async_dispatcher_connect(self.hass, signal, callback)
         self.coordinator.config_entry.async_on_unload(unsub)
         const.LOGGER.debug(
@@ -110,6 +131,18 @@ class BaseManager(ABC):
             self.entry_id,
         )
 
+    def _batch_tracked(
+        self, handler: Callable[..., Coroutine[Any, Any, None]]
+    ) -> Callable[..., None]:
+        """Wrap an async signal handler so an open batch waits for it."""
+
+        @ha_callback
+        def _dispatch(*args: Any) -> None:
+            task = self.hass.async_create_task(handler(*args))
+            self.coordinator.async_track_batch_task(task)
+
+        return _dispatch
+
     @abstractmethod
     async def async_setup(self) -> None:
         """Set up the manager (subscribe to events, initialize state).
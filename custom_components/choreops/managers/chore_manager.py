@@ -21,6 +21,7 @@ import asyncio
 from contextlib import AsyncExitStack
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+import heapq
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
@@ -63,6 +64,7 @@ if TYPE_CHECKING:
         ChoreData,
         ChoreEntitySyncContext,
         GlobalChoreStateContext,
+        PersistScope,
         ResetApplyContext,
         ResetBoundaryCategory,
         ResetContext,
@@ -177,6 +179,34 @@ class ChoreManager(BaseManager):
         ] = {}
         self._max_due_cache_entries = 2048
         self._pending_overdue_resolution_signals: list[dict[str, Any]] = []
+        self._pending_reschedule_signals: list[dict[str, Any]] = []
+
+        # Deadline index for due_date-trigger scans
+        # - heap: (deadline, generation, chore_id, assignee_id) for pairs whose
+        #   earliest time-scan threshold has not been reached yet
+        # - active: chore_id -> assignee_ids whose threshold already passed
+        # - signatures: chore_id -> scheduling inputs the entries were built from
+        # - dirty: chores to re-index on the next refresh; resign_all re-checks
+        #   every signature instead (startup, midnight, signals without chore)
+        # assignee_id "" marks the chore-level due date (SHARED/ROTATION resets)
+        self._deadline_heap: list[tuple[datetime, int, str, str]] = []
+        self._deadline_generation: dict[str, int] = {}
+        self._deadline_signatures: dict[str, tuple[Any, ...]] = {}
+        self._deadline_dirty: set[str] = set()
+        self._deadline_resign_all = True
+        self._deadline_active: dict[str, set[str]] = {}
+        self._deadline_pending: dict[str, int] = {}
+        self._deadline_seq = 0
+
+        # Exact-time wakeup for the earliest pending deadline. Armed after the
+        # first periodic update (notifier and stats managers are ready then).
+        self._deadline_timer: asyncio.TimerHandle | None = None
+        self._deadline_timer_at: datetime | None = None
+        self._deadline_wakeups_enabled = False
+        self._is_unloading = False
+        # Serializes the interval pass and deadline wakeups so two scans never
+        # interleave across their awaits
+        self._time_scan_lock = asyncio.Lock()
 
     async def async_setup(self) -> None:
         """Set up the ChoreManager.
@@ -194,10 +224,18 @@ class ChoreManager(BaseManager):
         self.listen(const.SIGNAL_SUFFIX_USER_DELETED, self._on_assignee_deleted)
 
         # Listen for midnight rollover to perform nightly tasks
-        self.listen(const.SIGNAL_SUFFIX_MIDNIGHT_ROLLOVER, self._on_midnight_rollover)
+        self.listen(
+            const.SIGNAL_SUFFIX_MIDNIGHT_ROLLOVER,
+            self._on_midnight_rollover,
+            track_in_batch=True,
+        )
 
         # Listen for periodic updates to perform interval maintenance
-        self.listen(const.SIGNAL_SUFFIX_PERIODIC_UPDATE, self._on_periodic_update)
+        self.listen(
+            const.SIGNAL_SUFFIX_PERIODIC_UPDATE,
+            self._on_periodic_update,
+            track_in_batch=True,
+        )
 
         # Phase 3: Invalidate time-scan caches on data mutation signals
         self.listen(
@@ -218,6 +256,8 @@ class ChoreManager(BaseManager):
         self.listen(const.SIGNAL_SUFFIX_USER_UPDATED, self._on_time_scan_inputs_changed)
         self.listen(const.SIGNAL_SUFFIX_USER_DELETED, self._on_time_scan_inputs_changed)
 
+        self.coordinator.config_entry.async_on_unload(self._cancel_deadline_timer)
+
         const.LOGGER.debug("ChoreManager initialized for entry %s", self.entry_id)
 
     def _clear_time_scan_caches(self) -> None:
@@ -230,6 +270,260 @@ class ChoreManager(BaseManager):
     ) -> None:
         """Invalidate time-scan caches when chore scheduling inputs change."""
         self._clear_time_scan_caches()
+        chore_id = (payload or {}).get("chore_id")
+        self._invalidate_deadline_index(chore_id if isinstance(chore_id, str) else None)
+        if self._deadline_wakeups_enabled:
+            self._refresh_deadline_entries(dt_util.utcnow())
+            self._arm_deadline_timer()
+
+    # =========================================================================
+    # Deadline Index (due_date-trigger time scans)
+    # =========================================================================
+    # A (assignee, chore) pair cannot appear in any due_date-trigger scan
+    # category before its earliest threshold: due - due_window_offset,
+    # due - reminder_offset (when notifications are enabled) or due itself.
+    # Pairs wait in a min-heap until that instant and then stay "active"
+    # (evaluated every scan, exactly like the full scan) until the chore's
+    # scheduling inputs change. Writers mark the chores they touch (directly
+    # or through CHORE_* signals carrying a chore_id), so a tick re-indexes
+    # only those. Startup, midnight and signals without a chore_id re-check
+    # every chore's signature, which also catches unannounced in-place edits.
+    # Active pairs keep their next threshold in the heap so the wakeup timer
+    # also fires when a pair moves from due window to reminder to overdue.
+
+    def _invalidate_deadline_index(self, chore_id: str | None = None) -> None:
+        """Mark deadline entries for a rebuild on the next refresh.
+
+        Args:
+            chore_id: Chore to rebuild, or None to re-check every chore's
+                signature and rebuild those that changed.
+        """
+        if chore_id is None:
+            self._deadline_resign_all = True
+            return
+        self._deadline_dirty.add(chore_id)
+
+    @staticmethod
+    def _deadline_signature(chore_info: ChoreData | dict[str, Any]) -> tuple[Any, ...]:
+        """Return the chore fields that determine its time-scan thresholds."""
+        per_assignee_due = chore_info.get(const.DATA_CHORE_PER_ASSIGNEE_DUE_DATES)
+        return (
+            chore_info.get(const.DATA_CHORE_DUE_DATE),
+            dict(per_assignee_due) if isinstance(per_assignee_due, dict) else None,
+            tuple(chore_info.get(const.DATA_CHORE_ASSIGNED_USER_IDS, [])),
+            chore_info.get(const.DATA_CHORE_COMPLETION_CRITERIA),
+            chore_info.get(const.DATA_CHORE_DUE_WINDOW_OFFSET),
+            chore_info.get(const.DATA_CHORE_DUE_REMINDER_OFFSET),
+            chore_info.get(const.DATA_CHORE_NOTIFY_ON_DUE_WINDOW),
+            chore_info.get(const.DATA_CHORE_NOTIFY_DUE_REMINDER),
+        )
+
+    def _pair_thresholds(
+        self,
+        chore_id: str,
+        chore_info: ChoreData | dict[str, Any],
+        due_dt: datetime | None,
+    ) -> list[datetime]:
+        """Return sorted instants at which a due date changes scan categories."""
+        if due_dt is None:
+            return []
+
+        thresholds = {due_dt}
+        due_window_offset, reminder_offset = self._get_chore_offsets_cached(
+            chore_id,
+            cast("dict[str, Any]", chore_info),
+        )
+        if due_window_offset and chore_info.get(
+            const.DATA_CHORE_NOTIFY_ON_DUE_WINDOW,
+            const.DEFAULT_NOTIFY_ON_DUE_WINDOW,
+        ):
+            thresholds.add(due_dt - due_window_offset)
+        if reminder_offset and chore_info.get(
+            const.DATA_CHORE_NOTIFY_DUE_REMINDER,
+            const.DEFAULT_NOTIFY_DUE_REMINDER,
+        ):
+            thresholds.add(due_dt - reminder_offset)
+        return sorted(thresholds)
+
+    def _push_next_threshold(
+        self,
+        chore_id: str,
+        chore_info: ChoreData | dict[str, Any],
+        assignee_id: str,
+        after: datetime,
+    ) -> bool:
+        """Queue the pair's first threshold later than ``after``.
+
+        Returns:
+            True if any threshold is at or before ``after`` (pair is active).
+        """
+        due_dt = self.get_due_date(chore_id, assignee_id or None)
+        thresholds = self._pair_thresholds(chore_id, chore_info, due_dt)
+        for threshold in thresholds:
+            if threshold > after:
+                heapq.heappush(
+                    self._deadline_heap,
+                    (
+                        threshold,
+                        self._deadline_generation[chore_id],
+                        chore_id,
+                        assignee_id,
+                    ),
+                )
+                self._deadline_pending[chore_id] = (
+                    self._deadline_pending.get(chore_id, 0) + 1
+                )
+                break
+        return bool(thresholds) and thresholds[0] <= after
+
+    def _index_chore_deadlines(
+        self,
+        chore_id: str,
+        chore_info: ChoreData | dict[str, Any],
+        now_utc: datetime,
+    ) -> None:
+        """Rebuild heap entries for one chore (older entries become stale)."""
+        self._deadline_seq += 1
+        self._deadline_generation[chore_id] = self._deadline_seq
+        self._deadline_signatures[chore_id] = self._deadline_signature(chore_info)
+        self._deadline_pending[chore_id] = 0
+
+        pair_ids = [
+            assignee_id
+            for assignee_id in chore_info.get(const.DATA_CHORE_ASSIGNED_USER_IDS, [])
+            if assignee_id
+        ]
+        if ChoreEngine.uses_chore_level_due_date(chore_info):
+            pair_ids.append("")
+
+        active = {
+            assignee_id
+            for assignee_id in pair_ids
+            if self._push_next_threshold(chore_id, chore_info, assignee_id, now_utc)
+        }
+        if active:
+            self._deadline_active[chore_id] = active
+        else:
+            self._deadline_active.pop(chore_id, None)
+
+    def _drop_chore_deadlines(self, chore_id: str) -> None:
+        """Forget a deleted chore (its heap entries become stale)."""
+        self._deadline_signatures.pop(chore_id, None)
+        self._deadline_generation.pop(chore_id, None)
+        self._deadline_active.pop(chore_id, None)
+        self._deadline_pending.pop(chore_id, None)
+
+    def _refresh_deadline_entries(self, now_utc: datetime) -> None:
+        """Re-index marked chores, or every changed chore after a full re-sign."""
+        chores_data = self._coordinator.chores_data
+        if self._deadline_resign_all:
+            self._deadline_resign_all = False
+            self._deadline_dirty.clear()
+            for chore_id in [
+                c for c in self._deadline_signatures if c not in chores_data
+            ]:
+                self._drop_chore_deadlines(chore_id)
+            for chore_id, chore_info in chores_data.items():
+                signature = self._deadline_signature(chore_info)
+                if self._deadline_signatures.get(chore_id) != signature:
+                    self._index_chore_deadlines(chore_id, chore_info, now_utc)
+            return
+
+        dirty, self._deadline_dirty = self._deadline_dirty, set()
+        for chore_id in dirty:
+            marked_info = chores_data.get(chore_id)
+            if marked_info is None:
+                self._drop_chore_deadlines(chore_id)
+            else:
+                self._index_chore_deadlines(chore_id, marked_info, now_utc)
+
+    def _sync_deadline_index(self, now_utc: datetime) -> dict[str, set[str]]:
+        """Refresh changed chores and promote every pair whose deadline passed.
+
+        Returns:
+            Pairs popped from the heap by this call (chore_id -> assignee_ids).
+        """
+        self._refresh_deadline_entries(now_utc)
+
+        chores_data = self._coordinator.chores_data
+        newly_due: dict[str, set[str]] = {}
+        heap = self._deadline_heap
+        while heap and heap[0][0] <= now_utc:
+            _deadline, generation, chore_id, assignee_id = heapq.heappop(heap)
+            if self._deadline_generation.get(chore_id) != generation:
+                continue
+            self._deadline_pending[chore_id] -= 1
+            self._deadline_active.setdefault(chore_id, set()).add(assignee_id)
+            newly_due.setdefault(chore_id, set()).add(assignee_id)
+            self._push_next_threshold(
+                chore_id, chores_data[chore_id], assignee_id, now_utc
+            )
+
+        # Compact once stale entries dominate (chores rescheduled repeatedly)
+        live = sum(self._deadline_pending.values())
+        if len(heap) > 64 and len(heap) > 4 * live:
+            self._deadline_heap = [
+                item
+                for item in heap
+                if self._deadline_generation.get(item[2]) == item[1]
+            ]
+            heapq.heapify(self._deadline_heap)
+
+        return newly_due
+
+    def next_time_scan_deadline(self) -> datetime | None:
+        """Return the earliest pending time-scan threshold, if any.
+
+        Only reflects chores indexed by the most recent due_date scan.
+        """
+        heap = self._deadline_heap
+        while heap and self._deadline_generation.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def _arm_deadline_timer(self) -> None:
+        """Schedule a wakeup at the earliest pending deadline (one handle)."""
+        if self._is_unloading or not self._deadline_wakeups_enabled:
+            return
+
+        next_deadline = self.next_time_scan_deadline()
+        if self._deadline_timer is not None:
+            if next_deadline == self._deadline_timer_at:
+                return
+            self._deadline_timer.cancel()
+            self._deadline_timer = None
+        self._deadline_timer_at = next_deadline
+        if next_deadline is None:
+            return
+
+        delay = max(0.0, (next_deadline - dt_util.utcnow()).total_seconds())
+        self._deadline_timer = self.hass.loop.call_later(delay, self._on_deadline_timer)
+
+    def _on_deadline_timer(self) -> None:
+        """Run the due_date pass for pairs whose deadline just passed."""
+        self._deadline_timer = None
+        self._deadline_timer_at = None
+        if self._is_unloading:
+            return
+        # Entry-owned so an unload cancels a wakeup that is still scanning
+        self.coordinator.config_entry.async_create_background_task(
+            self.hass,
+            self._async_deadline_wakeup(),
+            f"{const.DOMAIN}_deadline_wakeup",
+        )
+
+    async def _async_deadline_wakeup(self) -> None:
+        """Scan newly due pairs in one batch so their saves and digests coalesce."""
+        async with self._coordinator.batch():
+            await self._on_periodic_update(newly_due_only=True)
+
+    def _cancel_deadline_timer(self) -> None:
+        """Cancel the deadline wakeup during config entry unload."""
+        self._is_unloading = True
+        if self._deadline_timer is not None:
+            self._deadline_timer.cancel()
+            self._deadline_timer = None
+            self._deadline_timer_at = None
 
     def _parse_due_datetime_cached(self, due_str: str | None) -> datetime | None:
         """Parse due datetime once per unique ISO string and reuse thereafter."""
@@ -329,6 +623,7 @@ class ChoreManager(BaseManager):
             payload: Event data (unused)
         """
         const.LOGGER.debug("ChoreManager: Processing DATA_READY")
+        self._invalidate_deadline_index()
         # Signal cascade continues - time checks run on first periodic update
         self.emit(const.SIGNAL_SUFFIX_CHORES_READY)
 
@@ -361,6 +656,8 @@ class ChoreManager(BaseManager):
 
         # Phase 4 Guard Rail: Reset modification tracking
         self._reset_pipeline_tracking()
+        # Nightly re-check of every chore's deadline signature
+        self._invalidate_deadline_index()
 
         reset_count = 0
         state_modified = False
@@ -385,7 +682,9 @@ class ChoreManager(BaseManager):
                 )
                 not in reset_pairs
             ]
-            await self._process_overdue(filtered_overdue, now_utc, persist=False)
+            await self._process_overdue(
+                filtered_overdue, now_utc, persist=False, digest=True
+            )
             state_modified = state_modified or len(filtered_overdue) > 0
 
             # Phase C: Advance rotation past paused turn-holders (safety net)
@@ -458,6 +757,7 @@ class ChoreManager(BaseManager):
                     const.LOGGER.exception(
                         "ChoreManager: Critical - failed to persist midnight changes"
                     )
+            self._flush_reschedule_signals()
 
     async def _on_periodic_update(
         self,
@@ -465,13 +765,17 @@ class ChoreManager(BaseManager):
         *,
         now_utc: datetime | None = None,
         trigger: str = const.CHORE_SCAN_TRIGGER_DUE_DATE,
+        newly_due_only: bool = False,
     ) -> int:
         """Handle periodic update - perform interval maintenance tasks.
 
         Follows Platinum Architecture (Choreography): ChoreManager reacts
         to PERIODIC_UPDATE signal and performs its own maintenance tasks.
 
-        Called every ~5 minutes by Coordinator's update cycle.
+        Called every ~5 minutes by Coordinator's update cycle, and by the
+        deadline wakeup timer at the instant a due window, reminder or due
+        date is reached (so notifications don't wait for the next interval).
+        The two never run concurrently; a pass that arrives mid-scan waits.
 
         Performance Optimization (v0.5.0+):
         Uses consolidated single-pass scanner for ALL periodic checks:
@@ -485,61 +789,81 @@ class ChoreManager(BaseManager):
             payload: Event data (unused, but required by signal handler signature)
             now_utc: Override current time (for testing). If None, uses utcnow().
             trigger: Scanner trigger type (for testing). Default "due_date".
+            newly_due_only: Limit the scan to pairs whose deadline just passed
+                (set by the deadline wakeup timer).
 
         Returns:
             Number of approval resets processed.
         """
-        # Phase 4 Guard Rail: Reset modification tracking
-        self._reset_pipeline_tracking()
+        async with self._time_scan_lock:
+            # Phase 4 Guard Rail: Reset modification tracking
+            self._reset_pipeline_tracking()
 
-        reset_count = 0
-        state_modified = False
+            reset_count = 0
+            state_modified = False
 
-        try:
-            if now_utc is None:
-                now_utc = dt_util.utcnow()
-
-            # Single-pass scan categorizes ALL actionable items
-            scan = self.process_time_checks(now_utc, trigger=trigger)
+            try:
+                if now_utc is None:
+                    now_utc = dt_util.utcnow()
 
-            # Phase A: Resets FIRST
-            reset_count, reset_pairs = await self._process_approval_reset_entries(
-                scan, now_utc, trigger, persist=False
-            )
-            state_modified = reset_count > 0
+                # Single-pass scan categorizes ALL actionable items
+                scan = self.process_time_checks(
+                    now_utc, trigger=trigger, newly_due_only=newly_due_only
+                )
 
-            # Phase B: Overdue, EXCLUDING anything just reset
-            filtered_overdue = [
-                e
-                for e in scan["overdue"]
-                if (e[const.CHORE_SCAN_ENTRY_USER_ID], e["chore_id"]) not in reset_pairs
-            ]
-            await self._process_overdue(filtered_overdue, now_utc, persist=False)
-            state_modified = state_modified or len(filtered_overdue) > 0
+                # Phase A: Resets FIRST
+                reset_count, reset_pairs = await self._process_approval_reset_entries(
+                    scan, now_utc, trigger, persist=False
+                )
+                state_modified = reset_count > 0
+
+                # Phase B: Overdue, EXCLUDING anything just reset
+                filtered_overdue = [
+                    e
+                    for e in scan["overdue"]
+                    if (e[const.CHORE_SCAN_ENTRY_USER_ID], e["chore_id"])
+                    not in reset_pairs
+                ]
+                await self._process_overdue(
+                    filtered_overdue, now_utc, persist=False, digest=True
+                )
+                state_modified = state_modified or len(filtered_overdue) > 0
 
-            # Phase C: Notifications (read-only, no persist needed)
-            self._process_due_window(scan[const.CHORE_SCAN_RESULT_IN_DUE_WINDOW])
-            self._process_due_reminder(scan[const.CHORE_SCAN_RESULT_DUE_REMINDER])
+                # Phase C: Notifications (read-only, no persist needed)
+                self._process_due_window(
+                    scan[const.CHORE_SCAN_RESULT_IN_DUE_WINDOW], digest=True
+                )
+                self._process_due_reminder(
+                    scan[const.CHORE_SCAN_RESULT_DUE_REMINDER], digest=True
+                )
 
-            return reset_count
-        except Exception:
-            const.LOGGER.exception("ChoreManager: Error during periodic update")
-            return 0
-        finally:
-            # Phase D: Critical - persist if ANY state was modified (prevents in-memory drift)
-            # Even if Phase B or C failed, we must persist Phase A changes to avoid corruption.
-            if state_modified:
-                try:
-                    self._coordinator._persist()
+                return reset_count
+            except Exception:
+                const.LOGGER.exception("ChoreManager: Error during periodic update")
+                return 0
+            finally:
+                # Phase D: Critical - persist if ANY state was modified (prevents in-memory drift)
+                # Even if Phase B or C failed, we must persist Phase A changes to avoid corruption.
+                if state_modified:
+                    try:
+                        self._coordinator._persist()
+                        self._coordinator.async_set_updated_data(
+                            self._coordinator._data
+                        )
+                    except Exception:
+                        const.LOGGER.exception(
+                            "ChoreManager: Critical - failed to persist periodic changes"
+                        )
+                else:
+                    # Refresh listeners even when no storage changed so time-derived
+                    # FSM states (waiting/due/pending) are re-evaluated.
                     self._coordinator.async_set_updated_data(self._coordinator._data)
-                except Exception:
-                    const.LOGGER.exception(
-                        "ChoreManager: Critical - failed to persist periodic changes"
-                    )
-            else:
-                # Refresh listeners even when no storage changed so time-derived
-                # FSM states (waiting/due/pending) are re-evaluated.
-                self._coordinator.async_set_updated_data(self._coordinator._data)
+                self._flush_reschedule_signals()
+
+                # Re-arm the wakeup for the next pending deadline
+                if trigger == const.CHORE_SCAN_TRIGGER_DUE_DATE:
+                    self._deadline_wakeups_enabled = True
+                    self._arm_deadline_timer()
 
     def _on_assignee_deleted(self, payload: dict[str, Any]) -> None:
         """Remove deleted assignee from all chore assignments.
@@ -847,7 +1171,9 @@ class ChoreManager(BaseManager):
             # _approve_chore_locked already persisted; skip our persist
         else:
             # Persist → Emit (per DEVELOPMENT_STANDARDS.md § 5.3)
-            self._coordinator._persist_and_update()
+            self._coordinator._persist_and_update(
+                changed=self._chore_persist_scope(chore_id, assignee_id)
+            )
             self._flush_overdue_resolution_signals()
 
         # Emit lifecycle milestone signal for claim handling.
@@ -1308,8 +1634,11 @@ class ChoreManager(BaseManager):
         )
 
         # Persist → Emit (per DEVELOPMENT_STANDARDS.md § 5.3)
-        self._coordinator._persist_and_update()
+        self._coordinator._persist_and_update(
+            changed=self._chore_persist_scope(chore_id, assignee_id)
+        )
         self._flush_overdue_resolution_signals()
+        self._flush_reschedule_signals()
 
         if rotation_signal_payload:
             self.emit(
@@ -1429,7 +1758,9 @@ class ChoreManager(BaseManager):
         )
 
         # Persist → Emit (per DEVELOPMENT_STANDARDS.md § 5.3)
-        self._coordinator._persist_and_update()
+        self._coordinator._persist_and_update(
+            changed=self._chore_persist_scope(chore_id, assignee_id)
+        )
         self._flush_overdue_resolution_signals()
 
         # Emit disapproval event
@@ -1514,7 +1845,9 @@ class ChoreManager(BaseManager):
         self._update_global_state(chore_id)
 
         # Persist → Emit (per DEVELOPMENT_STANDARDS.md § 5.3)
-        self._coordinator._persist_and_update()
+        self._coordinator._persist_and_update(
+            changed=self._chore_persist_scope(chore_id, assignee_id)
+        )
         self._flush_overdue_resolution_signals()
 
         # Emit undo signal - EconomyManager listens and handles point withdrawal
@@ -1636,7 +1969,9 @@ class ChoreManager(BaseManager):
         # Update global state
         self._update_global_state(chore_id)
 
-        self._coordinator._persist()
+        self._coordinator._persist(
+            changed=self._chore_persist_scope(chore_id, assignee_id)
+        )
         self._flush_overdue_resolution_signals()
         self._coordinator.async_set_updated_data(self._coordinator._data)
 
@@ -1742,6 +2077,7 @@ class ChoreManager(BaseManager):
             chore_info[const.DATA_CHORE_PER_ASSIGNEE_DUE_DATES] = per_assignee_due_dates
         else:
             chore_info.pop(const.DATA_CHORE_DUE_DATE, None)
+        self._invalidate_deadline_index(chore_id)
 
         const.LOGGER.debug(
             "Cleared stale due date for non-recurring chore %s after fresh-cycle reset",
@@ -1761,6 +2097,7 @@ class ChoreManager(BaseManager):
 
         self._coordinator._persist()
         self._coordinator.async_set_updated_data(self._coordinator._data)
+        self._flush_reschedule_signals()
 
         if rotation_payloads:
             for payload in rotation_payloads:
@@ -1823,7 +2160,11 @@ class ChoreManager(BaseManager):
         return const.CHORE_RESET_DECISION_RESET_AND_RESCHEDULE
 
     def process_time_checks(
-        self, now_utc: datetime, trigger: str = const.CHORE_SCAN_TRIGGER_DUE_DATE
+        self,
+        now_utc: datetime,
+        trigger: str = const.CHORE_SCAN_TRIGGER_DUE_DATE,
+        *,
+        newly_due_only: bool = False,
     ) -> dict[str, list[ChoreTimeEntry]]:
         """Single-pass scan of all chores, categorizing by time status.
 
@@ -1840,9 +2181,14 @@ class ChoreManager(BaseManager):
         - approval_reset_shared: SHARED/SHARED_FIRST chores past due
         - approval_reset_independent: INDEPENDENT chores with assignees past due
 
+        The due_date trigger only evaluates pairs popped from the deadline
+        index (earliest threshold <= now_utc); midnight scans every chore.
+
         Args:
             now_utc: Current UTC datetime for comparison
             trigger: "due_date" (AT_DUE_DATE_*) or "midnight" (AT_MIDNIGHT_*)
+            newly_due_only: due_date trigger only - evaluate just the pairs whose
+                deadline passed since the previous scan (deadline wakeups)
 
         Returns:
             Dict with category keys mapping to lists of ChoreTimeEntry
@@ -1857,188 +2203,224 @@ class ChoreManager(BaseManager):
             const.CHORE_SCAN_RESULT_APPROVAL_RESET_INDEPENDENT: [],
         }
 
-        for chore_id, chore_info in self._coordinator.chores_data.items():
-            # Get assigned assignees for this chore
-            assigned_assignees = chore_info.get(const.DATA_CHORE_ASSIGNED_USER_IDS, [])
-            if not assigned_assignees:
-                continue
-
-            # ─── CHORE-LEVEL CONFIG (once per chore) ───
-            # Notification settings
-            notify_due_window = chore_info.get(
-                const.DATA_CHORE_NOTIFY_ON_DUE_WINDOW,
-                const.DEFAULT_NOTIFY_ON_DUE_WINDOW,
-            )
-            notify_reminder = chore_info.get(
-                const.DATA_CHORE_NOTIFY_DUE_REMINDER,
-                const.DEFAULT_NOTIFY_DUE_REMINDER,
-            )
+        chores_data = self._coordinator.chores_data
+        if trigger == const.CHORE_SCAN_TRIGGER_DUE_DATE:
+            # Only pairs whose earliest threshold has passed can match
+            newly_due = self._sync_deadline_index(now_utc)
+            scope = newly_due if newly_due_only else self._deadline_active
+            for chore_id, chore_info in chores_data.items():
+                active_assignees = scope.get(chore_id)
+                if active_assignees:
+                    self._scan_chore_time_status(
+                        chore_id,
+                        chore_info,
+                        now_utc,
+                        trigger,
+                        result,
+                        assignee_filter=active_assignees,
+                    )
+        else:
+            # Midnight includes chores without due dates: full scan
+            for chore_id, chore_info in chores_data.items():
+                self._scan_chore_time_status(
+                    chore_id, chore_info, now_utc, trigger, result
+                )
 
-            # Overdue handling
-            overdue_handling = chore_info.get(
-                const.DATA_CHORE_OVERDUE_HANDLING_TYPE,
-                const.OVERDUE_HANDLING_AT_DUE_DATE,
-            )
-            can_be_overdue = overdue_handling != const.OVERDUE_HANDLING_NEVER_OVERDUE
+        const.LOGGER.debug(
+            "Chore time scan: %d overdue, %d in_due_window, %d due_reminder, "
+            "%d approval_reset_shared, %d approval_reset_independent",
+            len(result[const.CHORE_SCAN_RESULT_OVERDUE]),
+            len(result[const.CHORE_SCAN_RESULT_IN_DUE_WINDOW]),
+            len(result[const.CHORE_SCAN_RESULT_DUE_REMINDER]),
+            len(result[const.CHORE_SCAN_RESULT_APPROVAL_RESET_SHARED]),
+            len(result[const.CHORE_SCAN_RESULT_APPROVAL_RESET_INDEPENDENT]),
+        )
 
-            # Parse offsets once per chore revision
-            due_window_offset, reminder_offset = self._get_chore_offsets_cached(
-                chore_id,
-                cast("dict[str, Any]", chore_info),
-            )
+        return result
 
-            # ─── APPROVAL BOUNDARY CONFIG (once per chore) ───
-            approval_reset_type = chore_info.get(
-                const.DATA_CHORE_APPROVAL_RESET_TYPE,
-                const.APPROVAL_RESET_AT_MIDNIGHT_ONCE,
-            )
-            should_process_reset = ChoreEngine.should_process_at_boundary(
-                approval_reset_type, trigger
-            )
-            completion_criteria = chore_info.get(const.DATA_CHORE_COMPLETION_CRITERIA)
-            frequency = chore_info.get(
-                const.DATA_CHORE_RECURRING_FREQUENCY, const.FREQUENCY_NONE
-            )
+    def _scan_chore_time_status(
+        self,
+        chore_id: str,
+        chore_info: ChoreData | dict[str, Any],
+        now_utc: datetime,
+        trigger: str,
+        result: dict[str, list[ChoreTimeEntry]],
+        *,
+        assignee_filter: set[str] | None = None,
+    ) -> None:
+        """Categorize one chore's (assignee, chore) pairs into scan result buckets.
 
-            # ─── SHARED/ROTATION CHORE RESET CHECK (chore-level due_date) ───
-            if should_process_reset and ChoreEngine.uses_chore_level_due_date(
-                chore_info
-            ):
-                # SHARED uses chore-level due_date
-                # For AT_MIDNIGHT_*: Process if no due date OR past due date
-                # For AT_DUE_DATE_*: Only process if past due date
-                chore_due_str = chore_info.get(const.DATA_CHORE_DUE_DATE)
-                chore_due_utc = self._parse_due_datetime_cached(chore_due_str)
-
-                # Determine if this chore should be included in reset scan
-                include_in_reset = False
-                if trigger == "midnight":
-                    # AT_MIDNIGHT_*: Include if no due date OR past due date
-                    # Future due dates mean the period hasn't started yet
-                    if chore_due_utc is None or now_utc >= chore_due_utc:
-                        include_in_reset = True
-                elif chore_due_utc and now_utc >= chore_due_utc:
-                    # AT_DUE_DATE_*: Include only if past due date
-                    # Skip non-recurring past due (would immediately go OVERDUE)
-                    if not (
-                        frequency == const.FREQUENCY_NONE and now_utc > chore_due_utc
-                    ):
-                        include_in_reset = True
+        Args:
+            chore_id: The chore's internal ID
+            chore_info: The chore definition
+            now_utc: Current UTC datetime for comparison
+            trigger: "due_date" (AT_DUE_DATE_*) or "midnight" (AT_MIDNIGHT_*)
+            result: Scan result buckets to append to
+            assignee_filter: Limit per-assignee checks to these IDs (None = all)
+        """
+        # Get assigned assignees for this chore
+        assigned_assignees = chore_info.get(const.DATA_CHORE_ASSIGNED_USER_IDS, [])
+        if not assigned_assignees:
+            return
 
-                if include_in_reset:
-                    result[const.CHORE_SCAN_RESULT_APPROVAL_RESET_SHARED].append(
-                        {
-                            const.CHORE_SCAN_ENTRY_CHORE_ID: chore_id,
-                            const.CHORE_SCAN_ENTRY_CHORE_INFO: cast(
-                                "dict[str, Any]", chore_info
-                            ),
-                            const.CHORE_SCAN_ENTRY_DUE_DT: chore_due_utc,
-                        }
-                    )
+        # ─── CHORE-LEVEL CONFIG (once per chore) ───
+        # Notification settings
+        notify_due_window = chore_info.get(
+            const.DATA_CHORE_NOTIFY_ON_DUE_WINDOW,
+            const.DEFAULT_NOTIFY_ON_DUE_WINDOW,
+        )
+        notify_reminder = chore_info.get(
+            const.DATA_CHORE_NOTIFY_DUE_REMINDER,
+            const.DEFAULT_NOTIFY_DUE_REMINDER,
+        )
 
-            # ─── KID ITERATION ───
-            independent_reset_assignees: list[dict[str, Any]] = []
+        # Overdue handling
+        overdue_handling = chore_info.get(
+            const.DATA_CHORE_OVERDUE_HANDLING_TYPE,
+            const.OVERDUE_HANDLING_AT_DUE_DATE,
+        )
+        can_be_overdue = overdue_handling != const.OVERDUE_HANDLING_NEVER_OVERDUE
 
-            for assignee_id in assigned_assignees:
-                if not assignee_id:
-                    continue
+        # Parse offsets once per chore revision
+        due_window_offset, reminder_offset = self._get_chore_offsets_cached(
+            chore_id,
+            cast("dict[str, Any]", chore_info),
+        )
 
-                # Get due date (single call per assignee-chore pair)
-                due_dt = self.get_due_date(chore_id, assignee_id)
+        # ─── APPROVAL BOUNDARY CONFIG (once per chore) ───
+        approval_reset_type = chore_info.get(
+            const.DATA_CHORE_APPROVAL_RESET_TYPE,
+            const.APPROVAL_RESET_AT_MIDNIGHT_ONCE,
+        )
+        should_process_reset = ChoreEngine.should_process_at_boundary(
+            approval_reset_type, trigger
+        )
+        completion_criteria = chore_info.get(const.DATA_CHORE_COMPLETION_CRITERIA)
+        frequency = chore_info.get(
+            const.DATA_CHORE_RECURRING_FREQUENCY, const.FREQUENCY_NONE
+        )
+
+        # ─── SHARED/ROTATION CHORE RESET CHECK (chore-level due_date) ───
+        if should_process_reset and ChoreEngine.uses_chore_level_due_date(chore_info):
+            # SHARED uses chore-level due_date
+            # For AT_MIDNIGHT_*: Process if no due date OR past due date
+            # For AT_DUE_DATE_*: Only process if past due date
+            chore_due_str = chore_info.get(const.DATA_CHORE_DUE_DATE)
+            chore_due_utc = self._parse_due_datetime_cached(chore_due_str)
+
+            # Determine if this chore should be included in reset scan
+            include_in_reset = False
+            if trigger == "midnight":
+                # AT_MIDNIGHT_*: Include if no due date OR past due date
+                # Future due dates mean the period hasn't started yet
+                if chore_due_utc is None or now_utc >= chore_due_utc:
+                    include_in_reset = True
+            elif chore_due_utc and now_utc >= chore_due_utc:
+                # AT_DUE_DATE_*: Include only if past due date
+                # Skip non-recurring past due (would immediately go OVERDUE)
+                if not (frequency == const.FREQUENCY_NONE and now_utc > chore_due_utc):
+                    include_in_reset = True
+
+            if include_in_reset:
+                result[const.CHORE_SCAN_RESULT_APPROVAL_RESET_SHARED].append(
+                    {
+                        const.CHORE_SCAN_ENTRY_CHORE_ID: chore_id,
+                        const.CHORE_SCAN_ENTRY_CHORE_INFO: cast(
+                            "dict[str, Any]", chore_info
+                        ),
+                        const.CHORE_SCAN_ENTRY_DUE_DT: chore_due_utc,
+                    }
+                )
 
-                # For time-based categorization, we need a due date
-                if due_dt:
-                    # Calculate time until due (negative = overdue)
-                    time_until_due = due_dt - now_utc
-                    is_past_due = time_until_due.total_seconds() < 0
+        # ─── KID ITERATION ───
+        independent_reset_assignees: list[dict[str, Any]] = []
 
-                    # ─── TIME-BASED CATEGORIZATION (actionable chores only) ───
-                    if self.chore_is_actionable(assignee_id, chore_id):
-                        entry: ChoreTimeEntry = {
-                            const.CHORE_SCAN_ENTRY_CHORE_ID: chore_id,
-                            const.CHORE_SCAN_ENTRY_USER_ID: assignee_id,
-                            const.CHORE_SCAN_ENTRY_DUE_DT: due_dt,
-                            const.CHORE_SCAN_ENTRY_CHORE_INFO: cast(
-                                "dict[str, Any]", chore_info
-                            ),
-                            const.CHORE_SCAN_ENTRY_TIME_UNTIL_DUE: time_until_due,
-                        }
+        for assignee_id in assigned_assignees:
+            if not assignee_id:
+                continue
+            if assignee_filter is not None and assignee_id not in assignee_filter:
+                continue
 
-                        if is_past_due and can_be_overdue:
-                            result[const.CHORE_SCAN_RESULT_OVERDUE].append(entry)
-                        elif not is_past_due:
-                            if (
-                                notify_due_window
-                                and due_window_offset
-                                and time_until_due <= due_window_offset
-                            ):
-                                result[const.CHORE_SCAN_RESULT_IN_DUE_WINDOW].append(
-                                    entry
-                                )
-
-                            if (
-                                notify_reminder
-                                and reminder_offset
-                                and time_until_due <= reminder_offset
-                            ):
-                                result[const.CHORE_SCAN_RESULT_DUE_REMINDER].append(
-                                    entry
-                                )
-
-                # ─── INDEPENDENT RESET CHECK (per-assignee due_date) ───
-                # For AT_MIDNIGHT_*: Include if no due date OR past due date
-                # For AT_DUE_DATE_*: Only process if past due date
-                if (
-                    should_process_reset
-                    and completion_criteria == const.COMPLETION_CRITERIA_INDEPENDENT
-                ):
-                    # Determine if this assignee should be included in reset scan
-                    include_assignee_in_reset = False
-                    if trigger == "midnight":
-                        # AT_MIDNIGHT_*: Include if no due date OR past due date
-                        # Future due dates mean the period hasn't started yet
-                        if due_dt is None or now_utc >= due_dt:
-                            include_assignee_in_reset = True
-                    elif due_dt:
-                        # AT_DUE_DATE_*: Include only if past due date
-                        is_past_due = (due_dt - now_utc).total_seconds() < 0
-                        # Skip non-recurring past due (would immediately go OVERDUE)
-                        if is_past_due and not (
-                            frequency == const.FREQUENCY_NONE and now_utc > due_dt
-                        ):
-                            include_assignee_in_reset = True
+            # Get due date (single call per assignee-chore pair)
+            due_dt = self.get_due_date(chore_id, assignee_id)
 
-                    if include_assignee_in_reset:
-                        independent_reset_assignees.append(
-                            {
-                                const.CHORE_SCAN_ENTRY_USER_ID: assignee_id,
-                                const.CHORE_SCAN_ENTRY_DUE_DT: due_dt,
-                            }
-                        )
+            # For time-based categorization, we need a due date
+            if due_dt:
+                # Calculate time until due (negative = overdue)
+                time_until_due = due_dt - now_utc
+                is_past_due = time_until_due.total_seconds() < 0
 
-            # ─── AGGREGATE INDEPENDENT APPROVAL RESETS ───
-            if independent_reset_assignees:
-                result[const.CHORE_SCAN_RESULT_APPROVAL_RESET_INDEPENDENT].append(
-                    {
+                # ─── TIME-BASED CATEGORIZATION (actionable chores only) ───
+                if self.chore_is_actionable(assignee_id, chore_id):
+                    entry: ChoreTimeEntry = {
                         const.CHORE_SCAN_ENTRY_CHORE_ID: chore_id,
+                        const.CHORE_SCAN_ENTRY_USER_ID: assignee_id,
+                        const.CHORE_SCAN_ENTRY_DUE_DT: due_dt,
                         const.CHORE_SCAN_ENTRY_CHORE_INFO: cast(
                             "dict[str, Any]", chore_info
                         ),
-                        "assignees": independent_reset_assignees,
+                        const.CHORE_SCAN_ENTRY_TIME_UNTIL_DUE: time_until_due,
                     }
-                )
 
-        const.LOGGER.debug(
-            "Chore time scan: %d overdue, %d in_due_window, %d due_reminder, "
-            "%d approval_reset_shared, %d approval_reset_independent",
-            len(result[const.CHORE_SCAN_RESULT_OVERDUE]),
-            len(result[const.CHORE_SCAN_RESULT_IN_DUE_WINDOW]),
-            len(result[const.CHORE_SCAN_RESULT_DUE_REMINDER]),
-            len(result[const.CHORE_SCAN_RESULT_APPROVAL_RESET_SHARED]),
-            len(result[const.CHORE_SCAN_RESULT_APPROVAL_RESET_INDEPENDENT]),
-        )
+                    if is_past_due and can_be_overdue:
+                        result[const.CHORE_SCAN_RESULT_OVERDUE].append(entry)
+                    elif not is_past_due:
+                        if (
+                            notify_due_window
+                            and due_window_offset
+                            and time_until_due <= due_window_offset
+                        ):
+                            result[const.CHORE_SCAN_RESULT_IN_DUE_WINDOW].append(entry)
 
-        return result
+                        if (
+                            notify_reminder
+                            and reminder_offset
+                            and time_until_due <= reminder_offset
+                        ):
+                            result[const.CHORE_SCAN_RESULT_DUE_REMINDER].append(entry)
+
+            # ─── INDEPENDENT RESET CHECK (per-assignee due_date) ───
+            # For AT_MIDNIGHT_*: Include if no due date OR past due date
+            # For AT_DUE_DATE_*: Only process if past due date
+            if (
+                should_process_reset
+                and completion_criteria == const.COMPLETION_CRITERIA_INDEPENDENT
+            ):
+                # Determine if this assignee should be included in reset scan
+                include_assignee_in_reset = False
+                if trigger == "midnight":
+                    # AT_MIDNIGHT_*: Include if no due date OR past due date
+                    # Future due dates mean the period hasn't started yet
+                    if due_dt is None or now_utc >= due_dt:
+                        include_assignee_in_reset = True
+                elif due_dt:
+                    # AT_DUE_DATE_*: Include only if past due date
+                    is_past_due = (due_dt - now_utc).total_seconds() < 0
+                    # Skip non-recurring past due (would immediately go OVERDUE)
+                    if is_past_due and not (
+                        frequency == const.FREQUENCY_NONE and now_utc > due_dt
+                    ):
+                        include_assignee_in_reset = True
+
+                if include_assignee_in_reset:
+                    independent_reset_assignees.append(
+                        {
+                            const.CHORE_SCAN_ENTRY_USER_ID: assignee_id,
+                            const.CHORE_SCAN_ENTRY_DUE_DT: due_dt,
+                        }
+                    )
+
+        # ─── AGGREGATE INDEPENDENT APPROVAL RESETS ───
+        if independent_reset_assignees:
+            result[const.CHORE_SCAN_RESULT_APPROVAL_RESET_INDEPENDENT].append(
+                {
+                    const.CHORE_SCAN_ENTRY_CHORE_ID: chore_id,
+                    const.CHORE_SCAN_ENTRY_CHORE_INFO: cast(
+                        "dict[str, Any]", chore_info
+                    ),
+                    "assignees": independent_reset_assignees,
+                }
+            )
 
     async def _process_overdue(
         self,
@@ -2046,6 +2428,7 @@ class ChoreManager(BaseManager):
         now_utc: datetime,
         *,
         persist: bool = True,
+        digest: bool = False,
     ) -> None:
         """Process overdue entries - mark as overdue and emit signals.
 
@@ -2057,6 +2440,8 @@ class ChoreManager(BaseManager):
             entries: List of ChoreTimeEntry for chores past due
             now_utc: Current UTC datetime
             persist: If True, persist changes immediately. If False, caller handles persist.
+            digest: Mark the signals as coming from a batched time-check scan so
+                notifications may be folded into a digest.
         """
         if not entries:
             return
@@ -2254,13 +2639,17 @@ class ChoreManager(BaseManager):
         # Emit signals AFTER persist to comply with Persist→Emit pattern
         # StatisticsManager._on_chore_overdue handles cache refresh and entity notification
         for signal_data in signals_to_emit:
+            signal_data[const.CHORE_TIME_SCAN_EVENT_DIGEST] = digest
             self.emit(const.SIGNAL_SUFFIX_CHORE_OVERDUE, **signal_data)
 
-    def _process_due_window(self, entries: list[ChoreTimeEntry]) -> None:
+    def _process_due_window(
+        self, entries: list[ChoreTimeEntry], *, digest: bool = False
+    ) -> None:
         """Process due window entries and emit signals.
 
         Args:
             entries: List of ChoreTimeEntry for chores in due window
+            digest: Mark the signals as coming from a batched time-check scan
         """
         if not entries:
             return
@@ -2301,6 +2690,7 @@ class ChoreManager(BaseManager):
                 hours=hours_remaining,
                 points=points,
                 due_date=entry["due_dt"].isoformat(),
+                **{const.CHORE_TIME_SCAN_EVENT_DIGEST: digest},
             )
 
         const.LOGGER.debug(
@@ -2308,11 +2698,14 @@ class ChoreManager(BaseManager):
             len(entries),
         )
 
-    def _process_due_reminder(self, entries: list[ChoreTimeEntry]) -> None:
+    def _process_due_reminder(
+        self, entries: list[ChoreTimeEntry], *, digest: bool = False
+    ) -> None:
         """Process due reminder entries and emit signals.
 
         Args:
             entries: List of ChoreTimeEntry for chores within reminder window
+            digest: Mark the signals as coming from a batched time-check scan
         """
         if not entries:
             return
@@ -2353,6 +2746,7 @@ class ChoreManager(BaseManager):
                 minutes=minutes_remaining,
                 points=points,
                 due_date=entry["due_dt"].isoformat(),
+                **{const.CHORE_TIME_SCAN_EVENT_DIGEST: digest},
             )
 
         const.LOGGER.debug(
@@ -2922,6 +3316,7 @@ class ChoreManager(BaseManager):
                     const.DATA_CHORE_ASSIGNED_USER_IDS, []
                 ):
                     per_assignee_due_dates[assigned_assignee_id] = new_due_date_iso
+        self._invalidate_deadline_index(chore_id)
 
         # If due date cleared, reset frequency if needed
         if new_due_date_iso is None:
@@ -3138,6 +3533,7 @@ class ChoreManager(BaseManager):
     def _emit_reset_events(self, reset_events: set[tuple[str, str, str]]) -> None:
         """Emit deferred reset events after the enclosing persist succeeds."""
         self._flush_overdue_resolution_signals()
+        self._flush_reschedule_signals()
 
         for assignee_id, chore_id, chore_name in sorted(reset_events):
             self.emit(
@@ -3181,9 +3577,10 @@ class ChoreManager(BaseManager):
             reset_events.update(self._reset_chore_to_pending_internal(chore_id))
 
         if reset_events:
-            self._coordinator._persist()
-            self._emit_reset_events(reset_events)
-            self._coordinator.async_set_updated_data(self._coordinator._data)
+            async with self._coordinator.batch():
+                self._coordinator._persist()
+                self._emit_reset_events(reset_events)
+                self._coordinator.async_set_updated_data(self._coordinator._data)
 
         const.LOGGER.info("Manually reset all chores to pending")
 
@@ -3262,6 +3659,7 @@ class ChoreManager(BaseManager):
                     )
                 else:
                     chore_info.pop(const.DATA_CHORE_DUE_DATE, None)
+                self._invalidate_deadline_index(iter_chore_id)
 
                 const.LOGGER.debug(
                     "Cleared stale due date for non-recurring overdue chore %s during manual reset",
@@ -3278,9 +3676,10 @@ class ChoreManager(BaseManager):
                 self._reschedule_chore_next_due(chore_info)
 
         if reset_count > 0:
-            self._coordinator._persist()
-            self._emit_reset_events(reset_events)
-            self._coordinator.async_set_updated_data(self._coordinator._data)
+            async with self._coordinator.batch():
+                self._coordinator._persist()
+                self._emit_reset_events(reset_events)
+                self._coordinator.async_set_updated_data(self._coordinator._data)
             const.LOGGER.debug("Reset %d overdue chore assignment(s)", reset_count)
 
     # =========================================================================
@@ -3325,6 +3724,8 @@ class ChoreManager(BaseManager):
 
         # Store in coordinator data
         self._coordinator._data[const.DATA_CHORES][final_id] = chore_data
+        self._coordinator.invalidate_name_index(const.ITEM_TYPE_CHORE)
+        self._coordinator.update_assignment_index(const.ITEM_TYPE_CHORE, final_id)
         self._coordinator._persist(immediate=immediate_persist)
         self._coordinator.async_update_listeners()
 
@@ -3465,6 +3866,8 @@ class ChoreManager(BaseManager):
         chore_name = str(updated_chore.get(const.DATA_CHORE_NAME, ""))
 
         # Persist then emit (transactional integrity: signal only after persist)
+        self._coordinator.invalidate_name_index(const.ITEM_TYPE_CHORE)
+        self._coordinator.update_assignment_index(const.ITEM_TYPE_CHORE, chore_id)
         self._coordinator._persist(immediate=immediate_persist)
         self._emit_reset_events(reset_events)
         self._coordinator.async_update_listeners()
@@ -3559,6 +3962,8 @@ class ChoreManager(BaseManager):
             )
         )
 
+        self._coordinator.invalidate_name_index(const.ITEM_TYPE_CHORE)
+        self._coordinator.update_assignment_index(const.ITEM_TYPE_CHORE, chore_id)
         self._coordinator._persist(immediate=immediate_persist)
         self._coordinator.async_update_listeners()
 
@@ -4651,6 +5056,7 @@ class ChoreManager(BaseManager):
             assignee_info[
                 const.DATA_USER_CHORE_PERIODS
             ] = {}  # Tenant populates sub-keys
+            self._coordinator._mark_changed({const.DATA_USERS: [assignee_id]})
 
         # Per-chore periods structure (if chore_id provided)
         if chore_id:
@@ -4662,6 +5068,7 @@ class ChoreManager(BaseManager):
                 assignee_chore_data[
                     const.DATA_USER_CHORE_DATA_PERIODS
                 ] = {}  # Tenant populates sub-keys
+                self._coordinator._mark_changed({const.DATA_USERS: [assignee_id]})
 
     def _iter_assignee_chore_pairs(
         self,
@@ -4702,13 +5109,17 @@ class ChoreManager(BaseManager):
                         yield (iter_assignee_id, chore_id, chore_info)
         elif assignee_id:
             # Specific assignee: iterate all chores assigned to them
-            for iter_chore_id, chore_info in self._coordinator.chores_data.items():
-                if assignee_id in chore_info.get(
-                    const.DATA_CHORE_ASSIGNED_USER_IDS, []
-                ):
-                    if filter_fn and not filter_fn(assignee_id, iter_chore_id):
-                        continue
-                    yield (assignee_id, iter_chore_id, chore_info)
+            chores_data = self._coordinator.chores_data
+            assignment_index = self._coordinator.get_assignment_index(
+                const.ITEM_TYPE_CHORE
+            )
+            for iter_chore_id in assignment_index.item_ids_for(assignee_id):
+                chore_info = chores_data.get(iter_chore_id)
+                if chore_info is None:
+                    continue
+                if filter_fn and not filter_fn(assignee_id, iter_chore_id):
+                    continue
+                yield (assignee_id, iter_chore_id, chore_info)
         else:
             # All: iterate all assignee-chore pairs
             for iter_chore_id, chore_info in self._coordinator.chores_data.items():
@@ -4738,6 +5149,19 @@ class ChoreManager(BaseManager):
             self._approval_locks[lock_key] = asyncio.Lock()
         return self._approval_locks[lock_key]
 
+    def _chore_persist_scope(self, chore_id: str, *assignee_ids: str) -> PersistScope:
+        """Return the dirty persistence scope for a single-chore workflow.
+
+        Chore transitions can touch every assigned assignee's chore data
+        (shared criteria, rotation turns), so all assignees on the chore are
+        included alongside any explicitly named ones.
+        """
+        user_ids = set(assignee_ids)
+        chore_info = self._coordinator.chores_data.get(chore_id)
+        if chore_info is not None:
+            user_ids.update(chore_info.get(const.DATA_CHORE_ASSIGNED_USER_IDS, []))
+        return {const.DATA_CHORES: [chore_id], const.DATA_USERS: user_ids}
+
     def _set_assignee_chore_state(
         self,
         assignee_id: str,
@@ -4876,6 +5300,16 @@ class ChoreManager(BaseManager):
                 **signal_data,
             )
 
+    def _flush_reschedule_signals(self) -> None:
+        """Emit queued CHORE_RESCHEDULED signals after storage is persisted."""
+        signals = self._pending_reschedule_signals
+        if not signals:
+            return
+
+        self._pending_reschedule_signals = []
+        for signal_data in signals:
+            self.emit(const.SIGNAL_SUFFIX_CHORE_RESCHEDULED, **signal_data)
+
     def _transition_chore_state(
         self,
         assignee_id: str,
@@ -5093,6 +5527,7 @@ class ChoreManager(BaseManager):
         if assignee_chores is None:
             assignee_chores = {}
             assignee_info[const.DATA_USER_CHORE_DATA] = assignee_chores
+            self._coordinator._mark_changed({const.DATA_USERS: [assignee_id]})
 
         # v44+: chore_stats deleted - fully ephemeral now (generate_chore_stats())
         # All stats derived on-demand from chore_periods.all_time.* buckets
@@ -5120,6 +5555,7 @@ class ChoreManager(BaseManager):
                     dt_now_utc_iso()
                 )
             assignee_chores[chore_id] = default_data
+            self._coordinator._mark_changed({const.DATA_USERS: [assignee_id]})
 
         return assignee_chores[chore_id]
 
@@ -6489,10 +6925,24 @@ class ChoreManager(BaseManager):
                 chore_info.get(const.DATA_CHORE_NAME, "Unknown"),
             )
             return
+        self._invalidate_deadline_index(chore_id)
 
         # NOTE: State transitions are handled by callers (approve_chore for
         # UPON_COMPLETION, _transition_chore_state for scheduled resets).
-        # This method ONLY reschedules due dates.
+        # This method ONLY reschedules due dates. The signal is queued until the
+        # caller's persist (see _flush_reschedule_signals).
+        self._pending_reschedule_signals.append(
+            {
+                "assignee_id": None,
+                "chore_id": chore_id,
+                "chore_name": chore_info.get(const.DATA_CHORE_NAME, chore_id),
+                "old_due_date": (
+                    original_due_utc.isoformat() if original_due_utc else None
+                ),
+                "new_due_date": next_due_utc.isoformat(),
+                "rescheduled_by": "system",
+            }
+        )
 
         const.LOGGER.info(
             "Chore Due Date - Rescheduled (SHARED): %s, from %s to %s",
@@ -6584,12 +7034,25 @@ class ChoreManager(BaseManager):
             return
 
         # Update per-assignee storage
+        old_due_date = per_assignee_due_dates.get(assignee_id)
         per_assignee_due_dates[assignee_id] = next_due_utc.isoformat()
         chore_info[const.DATA_CHORE_PER_ASSIGNEE_DUE_DATES] = per_assignee_due_dates
+        self._invalidate_deadline_index(chore_id)
 
         # NOTE: State transitions are handled by callers (approve_chore for
         # UPON_COMPLETION, _transition_chore_state for scheduled resets).
-        # This method ONLY reschedules due dates.
+        # This method ONLY reschedules due dates. The signal is queued until the
+        # caller's persist (see _flush_reschedule_signals).
+        self._pending_reschedule_signals.append(
+            {
+                "assignee_id": assignee_id,
+                "chore_id": chore_id,
+                "chore_name": chore_info.get(const.DATA_CHORE_NAME, chore_id),
+                "old_due_date": old_due_date,
+                "new_due_date": next_due_utc.isoformat(),
+                "rescheduled_by": "system",
+            }
+        )
 
         const.LOGGER.info(
             "Chore Due Date - Rescheduled (INDEPENDENT): chore %s, assignee %s, to %s",
@@ -6896,6 +7359,7 @@ class ChoreManager(BaseManager):
                         continue
 
                 chore_info[const.DATA_CHORE_DUE_DATE] = next_due_dt.isoformat()
+                self._invalidate_deadline_index(chore_id)
                 for assigned_assignee_id in assigned_assignee_ids:
                     self._transition_chore_state(
                         assigned_assignee_id,
@@ -7043,6 +7507,7 @@ class ChoreManager(BaseManager):
                     {},
                 )
                 per_assignee_due_dates[assignee_id] = next_assignee_due_dt.isoformat()
+                self._invalidate_deadline_index(chore_id)
                 self._transition_chore_state(
                     assignee_id,
                     chore_id,
@@ -7064,9 +7529,11 @@ class ChoreManager(BaseManager):
                 )
 
         if reset_events:
-            self._coordinator._persist()
-            self._emit_reset_events(reset_events)
-            self._coordinator.async_set_updated_data(self._coordinator._data)
+            # Reset signal handlers' stats/reminder writes join this one flush
+            async with self._coordinator.batch():
+                self._coordinator._persist()
+                self._emit_reset_events(reset_events)
+                self._coordinator.async_set_updated_data(self._coordinator._data)
 
         return {
             "after": after_utc.isoformat(),
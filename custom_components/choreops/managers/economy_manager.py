@@ -24,7 +24,11 @@ from typing import TYPE_CHECKING, Any, cast
 from homeassistant.exceptions import HomeAssistantError
 
 from .. import const, data_builders as db
-from ..engines.economy_engine import EconomyEngine, InsufficientFundsError
+from ..engines.economy_engine import (
+    EconomyEngine,
+    InsufficientFundsError,
+    LedgerTimeIndex,
+)
 from ..helpers.entity_helpers import remove_entities_by_item_id
 from ..utils.math_utils import parse_points_adjust_values
 from .base_manager import BaseManager
@@ -68,6 +72,8 @@ class EconomyManager(BaseManager):
         """
         super().__init__(hass, coordinator)
         self._coordinator = coordinator
+        # Per-assignee epoch index over the ledger, maintained on append/prune
+        self._ledger_indexes: dict[str, LedgerTimeIndex] = {}
 
     @property
     def adjustment_deltas(self) -> list[float]:
@@ -103,9 +109,11 @@ class EconomyManager(BaseManager):
         )
         # Listen for chore workflow events (Platinum Architecture - Signal-First)
         # EconomyManager handles point transactions when chores are approved/undone
+        # Tracked so a batch's CHORE_POINTS_AWARDED cascade runs before it flushes
         self.listen(
             const.SIGNAL_SUFFIX_CHORE_APPROVED,
             self._on_chore_approved,
+            track_in_batch=True,
         )
         self.listen(
             const.SIGNAL_SUFFIX_CHORE_UNDONE,
@@ -251,7 +259,9 @@ class EconomyManager(BaseManager):
                 multiplier,
                 reference_id or "manual",
             )
-            self._coordinator._persist_and_update()
+            self._coordinator._persist_and_update(
+                changed={const.DATA_USERS: [assignee_id]}
+            )
 
     async def _on_achievement_earned(self, payload: dict[str, Any]) -> None:
         """Handle achievement earned event - deposit award points.
@@ -438,6 +448,38 @@ class EconomyManager(BaseManager):
             assignee_data[const.DATA_USER_LEDGER] = []  # type: ignore[typeddict-unknown-key]
         return assignee_data[const.DATA_USER_LEDGER]  # type: ignore[typeddict-item]
 
+    def _append_ledger_entry(
+        self, assignee_id: str, assignee_data: AssigneeData, entry: LedgerEntry
+    ) -> None:
+        """Append a ledger entry, prune retention, and keep the time index aligned.
+
+        Args:
+            assignee_id: The internal UUID of the assignee
+            assignee_data: The assignee's data dict (ledger modified in-place)
+            entry: The new ledger entry (newest timestamp)
+        """
+        ledger = self._ensure_ledger(assignee_data)
+        index = self._ledger_indexes.get(assignee_id)
+        if index is None or not index.is_current(ledger):
+            # First write, or the ledger was replaced or edited elsewhere
+            index = LedgerTimeIndex(ledger)
+            self._ledger_indexes[assignee_id] = index
+
+        ledger.append(entry)
+        index.append(entry)
+        retention_days = int(
+            self._coordinator.statistics_manager.get_retention_config().get(
+                const.PERIOD_DAILY,
+                const.DEFAULT_RETENTION_DAILY,
+            )
+        )
+        EconomyEngine.prune_ledger(
+            ledger,
+            max_entries=const.DEFAULT_LEDGER_MAX_ENTRIES,
+            max_age_days=retention_days,
+            index=index,
+        )
+
     def _ensure_point_structures(self, assignee_data: AssigneeData) -> None:
         """Ensure point_periods structure exists (Landlord duty).
 
@@ -500,6 +542,35 @@ class EconomyManager(BaseManager):
         # Return most recent entries (end of list = newest)
         return ledger[-limit:] if len(ledger) > limit else ledger
 
+    def get_ledger_index(self, assignee_id: str) -> LedgerTimeIndex | None:
+        """Get the chronological time index for an assignee ledger.
+
+        The index is built on first use and kept aligned by deposit/withdraw;
+        it is rebuilt whenever the stored ledger list was replaced or edited
+        outside this manager (resets, restores, migrations).
+
+        Args:
+            assignee_id: The internal UUID of the assignee
+
+        Returns:
+            LedgerTimeIndex for range reads, or None if assignee/ledger missing
+        """
+        assignee = self._get_assignee(assignee_id)
+        if not assignee:
+            self._ledger_indexes.pop(assignee_id, None)
+            return None
+
+        ledger = assignee.get(const.DATA_USER_LEDGER)
+        if not isinstance(ledger, list):
+            self._ledger_indexes.pop(assignee_id, None)
+            return None
+
+        index = self._ledger_indexes.get(assignee_id)
+        if index is None or not index.is_current(ledger):
+            index = LedgerTimeIndex(ledger)
+            self._ledger_indexes[assignee_id] = index
+        return index
+
     async def deposit(
         self,
         assignee_id: str,
@@ -566,19 +637,7 @@ class EconomyManager(BaseManager):
         assignee[const.DATA_USER_POINTS] = new_balance
 
         # Append to ledger and prune
-        ledger = self._ensure_ledger(assignee)
-        ledger.append(entry)
-        retention_days = int(
-            self._coordinator.statistics_manager.get_retention_config().get(
-                const.PERIOD_DAILY,
-                const.DEFAULT_RETENTION_DAILY,
-            )
-        )
-        EconomyEngine.prune_ledger(
-            ledger,
-            max_entries=const.DEFAULT_LEDGER_MAX_ENTRIES,
-            max_age_days=retention_days,
-        )
+        self._append_ledger_entry(assignee_id, assignee, entry)
 
         # Ensure point structures exist (Landlord duty) before emitting signal
         # StatisticsManager (tenant) expects these to exist when it receives the event
@@ -681,19 +740,7 @@ class EconomyManager(BaseManager):
         assignee[const.DATA_USER_POINTS] = new_balance
 
         # Append to ledger and prune
-        ledger = self._ensure_ledger(assignee)
-        ledger.append(entry)
-        retention_days = int(
-            self._coordinator.statistics_manager.get_retention_config().get(
-                const.PERIOD_DAILY,
-                const.DEFAULT_RETENTION_DAILY,
-            )
-        )
-        EconomyEngine.prune_ledger(
-            ledger,
-            max_entries=const.DEFAULT_LEDGER_MAX_ENTRIES,
-            max_age_days=retention_days,
-        )
+        self._append_ledger_entry(assignee_id, assignee, entry)
 
         # Ensure point structures exist (Landlord duty) before emitting signal
         # StatisticsManager (tenant) expects these to exist when it receives the event
@@ -802,7 +849,7 @@ class EconomyManager(BaseManager):
         )
 
         # Persist → Emit (per DEVELOPMENT_STANDARDS.md § 5.3)
-        self._coordinator._persist_and_update()
+        self._coordinator._persist_and_update(changed={const.DATA_USERS: [assignee_id]})
 
         # Emit event for NotificationManager to send notification
         self.emit(
@@ -1008,7 +1055,7 @@ class EconomyManager(BaseManager):
         )
 
         # Persist → Emit (per DEVELOPMENT_STANDARDS.md § 5.3)
-        self._coordinator._persist_and_update()
+        self._coordinator._persist_and_update(changed={const.DATA_USERS: [assignee_id]})
 
         # Emit event for NotificationManager to send notification
         self.emit(
@@ -1154,6 +1201,7 @@ class EconomyManager(BaseManager):
 
         # Store in coordinator data
         self._coordinator._data[const.DATA_BONUSES][internal_id] = bonus_data
+        self._coordinator.invalidate_name_index(const.ITEM_TYPE_BONUS)
         self._coordinator._persist(immediate=immediate_persist)
         self._coordinator.async_update_listeners()
 
@@ -1210,6 +1258,7 @@ class EconomyManager(BaseManager):
 
         # Store updated bonus
         self._coordinator._data[const.DATA_BONUSES][bonus_id] = updated_bonus
+        self._coordinator.invalidate_name_index(const.ITEM_TYPE_BONUS)
         self._coordinator._persist(immediate=immediate_persist)
         self._coordinator.async_update_listeners()
 
@@ -1266,6 +1315,7 @@ class EconomyManager(BaseManager):
             bonus_id,
         )
 
+        self._coordinator.invalidate_name_index(const.ITEM_TYPE_BONUS)
         self._coordinator._persist(immediate=immediate_persist)
         self._coordinator.async_update_listeners()
 
@@ -1312,6 +1362,7 @@ class EconomyManager(BaseManager):
 
         # Store in coordinator data
         self._coordinator._data[const.DATA_PENALTIES][internal_id] = penalty_data
+        self._coordinator.invalidate_name_index(const.ITEM_TYPE_PENALTY)
         self._coordinator._persist(immediate=immediate_persist)
         self._coordinator.async_update_listeners()
 
@@ -1374,6 +1425,7 @@ class EconomyManager(BaseManager):
 
         # Store updated penalty
         self._coordinator._data[const.DATA_PENALTIES][penalty_id] = updated_penalty
+        self._coordinator.invalidate_name_index(const.ITEM_TYPE_PENALTY)
         self._coordinator._persist(immediate=immediate_persist)
         self._coordinator.async_update_listeners()
 
@@ -1434,6 +1486,7 @@ class EconomyManager(BaseManager):
             penalty_id,
         )
 
+        self._coordinator.invalidate_name_index(const.ITEM_TYPE_PENALTY)
         self._coordinator._persist(immediate=immediate_persist)
         self._coordinator.async_update_listeners()
 
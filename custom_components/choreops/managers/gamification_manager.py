@@ -19,8 +19,9 @@ RELIABILITY (Phase 7.4):
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.start import async_at_started
@@ -46,6 +47,7 @@ from .base_manager import BaseManager
 
 if TYPE_CHECKING:
     import asyncio
+    from collections.abc import Callable
 
     from homeassistant.core import HomeAssistant
 
@@ -61,6 +63,7 @@ if TYPE_CHECKING:
         ChallengeProgress,
         EvaluationContext,
         EvaluationResult,
+        PersistScope,
         ScheduleConfig,
         UserData,
     )
@@ -69,6 +72,20 @@ if TYPE_CHECKING:
 # Default debounce timing (seconds)
 _DEBOUNCE_SECONDS: float = 2.0
 
+_T = TypeVar("_T")
+
+
+@dataclass(slots=True)
+class EvaluationSnapshot:
+    """Per-assignee stats reads shared by every target in one evaluation pass.
+
+    Keys are tuples of (read name, today_iso, tracked chore IDs, ...), so a
+    pass that crosses midnight never reuses yesterday's numbers.
+    """
+
+    assignee_id: str
+    reads: dict[tuple[Any, ...], Any]
+
 
 class GamificationManager(BaseManager):
     """Manager for gamification evaluation with debouncing.
@@ -101,6 +118,11 @@ class GamificationManager(BaseManager):
 
         # Pending evaluations - assignees needing re-evaluation (persisted to storage)
         self._pending_evaluations: set[str] = set()
+        # Signal families queued per pending assignee; None means evaluate all
+        # targets. Runtime-only: recovered entries are always fully evaluated.
+        self._pending_families: dict[str, set[str] | None] = {}
+        # Evaluation snapshots for assignees currently being evaluated
+        self._evaluation_snapshots: dict[str, EvaluationSnapshot] = {}
 
         # Debounce timer handle
         self._eval_timer: asyncio.TimerHandle | None = None
@@ -141,7 +163,11 @@ class GamificationManager(BaseManager):
         self.listen(const.SIGNAL_SUFFIX_PENALTY_APPLIED, self._on_penalty_applied)
 
         # Daily maintenance - cumulative badge cycle evaluation
-        self.listen(const.SIGNAL_SUFFIX_MIDNIGHT_ROLLOVER, self._on_midnight_rollover)
+        self.listen(
+            const.SIGNAL_SUFFIX_MIDNIGHT_ROLLOVER,
+            self._on_midnight_rollover,
+            track_in_batch=True,
+        )
 
         # Lifecycle events - reactive cleanup (Platinum Architecture)
         self.listen(const.SIGNAL_SUFFIX_USER_DELETED, self._on_assignee_deleted)
@@ -158,6 +184,7 @@ class GamificationManager(BaseManager):
                 len(pending),
             )
             self._pending_evaluations.update(pending)
+            self._pending_families.update(dict.fromkeys(pending))
             self._schedule_evaluation()
 
         self.coordinator.config_entry.async_on_unload(self._cancel_eval_timer)
@@ -219,11 +246,13 @@ class GamificationManager(BaseManager):
         authoritative period buckets.
 
         Args:
-            payload: Event data with assignee/user identifier.
+            payload: Event data with assignee/user identifier and the optional
+                signal family that triggered the statistics write.
         """
         assignee_id = payload.get("user_id")
         if assignee_id:
-            self._mark_pending(assignee_id)
+            family = payload.get("family")
+            self._mark_pending(assignee_id, {family} if family else None)
 
     # =========================================================================
     # EVENT HANDLERS
@@ -267,6 +296,7 @@ class GamificationManager(BaseManager):
 
         # Update cumulative badge progress (for positive deltas only)
         delta = payload.get("delta", 0.0)
+        changed: PersistScope | None = None
         if delta > 0 and assignee_id:
             assignee_info = self.coordinator.assignees_data.get(assignee_id)
             if assignee_info:
@@ -278,9 +308,14 @@ class GamificationManager(BaseManager):
                 progress[const.DATA_USER_CUMULATIVE_BADGE_PROGRESS_CYCLE_POINTS] = (
                     round(cycle_points, const.DATA_FLOAT_PRECISION)
                 )
+                changed = {const.DATA_USERS: [assignee_id]}
 
         if assignee_id:
-            self._mark_pending(assignee_id)
+            self._mark_pending(
+                assignee_id,
+                {const.GAMIFICATION_SIGNAL_FAMILY_POINTS},
+                changed=changed,
+            )
 
     def _on_chore_updated(self, payload: dict[str, Any]) -> None:
         """Handle chore_updated event (Platinum Architecture: event-driven).
@@ -305,7 +340,7 @@ class GamificationManager(BaseManager):
         """
         assignee_id = payload.get("user_id")
         if assignee_id:
-            self._mark_pending(assignee_id)
+            self._mark_pending(assignee_id, {const.GAMIFICATION_SIGNAL_FAMILY_CHORES})
 
     def _on_chore_disapproved(self, payload: dict[str, Any]) -> None:
         """Handle chore_disapproved event.
@@ -315,7 +350,7 @@ class GamificationManager(BaseManager):
         """
         assignee_id = payload.get("user_id")
         if assignee_id:
-            self._mark_pending(assignee_id)
+            self._mark_pending(assignee_id, {const.GAMIFICATION_SIGNAL_FAMILY_CHORES})
 
     def _on_chore_status_reset(self, payload: dict[str, Any]) -> None:
         """Handle chore_status_reset event.
@@ -325,7 +360,7 @@ class GamificationManager(BaseManager):
         """
         assignee_id = payload.get("user_id")
         if assignee_id:
-            self._mark_pending(assignee_id)
+            self._mark_pending(assignee_id, {const.GAMIFICATION_SIGNAL_FAMILY_CHORES})
 
     def _on_chore_overdue(self, payload: dict[str, Any]) -> None:
         """Handle chore_overdue event.
@@ -337,7 +372,7 @@ class GamificationManager(BaseManager):
         """
         assignee_id = payload.get("user_id")
         if assignee_id:
-            self._mark_pending(assignee_id)
+            self._mark_pending(assignee_id, {const.GAMIFICATION_SIGNAL_FAMILY_OVERDUE})
 
     def _on_reward_approved(self, payload: dict[str, Any]) -> None:
         """Handle reward_approved event.
@@ -347,7 +382,7 @@ class GamificationManager(BaseManager):
         """
         assignee_id = payload.get("user_id")
         if assignee_id:
-            self._mark_pending(assignee_id)
+            self._mark_pending(assignee_id, {const.GAMIFICATION_SIGNAL_FAMILY_POINTS})
 
     def _on_bonus_applied(self, payload: dict[str, Any]) -> None:
         """Handle bonus_applied event.
@@ -357,7 +392,7 @@ class GamificationManager(BaseManager):
         """
         assignee_id = payload.get("user_id")
         if assignee_id:
-            self._mark_pending(assignee_id)
+            self._mark_pending(assignee_id, {const.GAMIFICATION_SIGNAL_FAMILY_POINTS})
 
     def _on_penalty_applied(self, payload: dict[str, Any]) -> None:
         """Handle penalty_applied event.
@@ -367,7 +402,7 @@ class GamificationManager(BaseManager):
         """
         assignee_id = payload.get("user_id")
         if assignee_id:
-            self._mark_pending(assignee_id)
+            self._mark_pending(assignee_id, {const.GAMIFICATION_SIGNAL_FAMILY_POINTS})
 
     async def _on_midnight_rollover(self, payload: dict[str, Any]) -> None:
         """Handle midnight rollover event.
@@ -591,7 +626,7 @@ class GamificationManager(BaseManager):
     # PENDING TRACKING AND DEBOUNCE (Phase 7.4: Persisted Queue)
     # =========================================================================
 
-    def _persist_pending(self) -> None:
+    def _persist_pending(self, changed: PersistScope | None = None) -> None:
         """Persist pending evaluation queue to storage meta.
 
         This ensures restart resilience - if HA restarts during debounce window,
@@ -599,27 +634,50 @@ class GamificationManager(BaseManager):
 
         Uses call_soon_threadsafe since this may be called from dispatcher
         (SyncWorker thread) via signal handlers.
+
+        Args:
+            changed: Other items the caller mutated, saved with the queue.
         """
-        self.hass.loop.call_soon_threadsafe(self._persist_pending_impl)
+        self.hass.loop.call_soon_threadsafe(self._persist_pending_impl, changed)
 
-    def _persist_pending_impl(self) -> None:
+    def _persist_pending_impl(self, changed: PersistScope | None = None) -> None:
         """Internal implementation that runs on the event loop thread."""
         meta = self.coordinator._data.setdefault(const.DATA_META, {})
         meta[const.DATA_META_PENDING_EVALUATIONS] = list(self._pending_evaluations)
-        self.coordinator._persist()
+        self.coordinator._persist(changed={**(changed or {}), const.DATA_META: None})
 
-    def _mark_pending(self, assignee_id: str) -> None:
+    def _mark_pending(
+        self,
+        assignee_id: str,
+        families: set[str] | None = None,
+        *,
+        changed: PersistScope | None = None,
+    ) -> None:
         """Mark a assignee as needing re-evaluation (persisted).
 
+        Families accumulate until the next evaluation batch so only badges and
+        achievements depending on a changed signal family are re-evaluated.
+
         Args:
             assignee_id: The internal UUID of the assignee
+            families: Signal families that changed (GAMIFICATION_SIGNAL_FAMILY_*),
+                or None to re-evaluate every target.
+            changed: Items the caller mutated alongside the mark; forces a
+                persist even when the assignee was already pending.
         """
         was_already_pending = assignee_id in self._pending_evaluations
         self._pending_evaluations.add(assignee_id)
 
+        queued = self._pending_families.get(assignee_id, set())
+        if families is None or queued is None:
+            self._pending_families[assignee_id] = None
+        else:
+            queued.update(families)
+            self._pending_families[assignee_id] = queued
+
         # Only persist if this is a NEW addition (optimization for burst events)
-        if not was_already_pending:
-            self._persist_pending()
+        if not was_already_pending or changed is not None:
+            self._persist_pending(changed)
 
         self._schedule_evaluation()
         const.LOGGER.debug(
@@ -652,6 +710,7 @@ class GamificationManager(BaseManager):
             return
 
         # 1. Clean up pending evaluation queue
+        self._pending_families.pop(assignee_id, None)
         if assignee_id in self._pending_evaluations:
             self._pending_evaluations.discard(assignee_id)
             self._persist_pending()
@@ -812,7 +871,9 @@ class GamificationManager(BaseManager):
 
         # Capture and clear pending set atomically
         assignees_to_evaluate = self._pending_evaluations.copy()
+        pending_families = self._pending_families
         self._pending_evaluations.clear()
+        self._pending_families = {}
         self._persist_pending()  # Clear from storage
 
         if not assignees_to_evaluate:
@@ -825,19 +886,31 @@ class GamificationManager(BaseManager):
         )
 
         for assignee_id in assignees_to_evaluate:
+            families = pending_families.get(assignee_id)
             try:
-                await self._evaluate_assignee(assignee_id)
+                if families is None:
+                    await self._evaluate_assignee(assignee_id)
+                else:
+                    await self._evaluate_assignee(
+                        assignee_id, signal_families=frozenset(families)
+                    )
             except Exception:
                 const.LOGGER.exception(
                     "Error evaluating gamification for assignee %s",
                     assignee_id,
                 )
 
-    async def _evaluate_assignee(self, assignee_id: str) -> None:
-        """Evaluate all gamification criteria for a single assignee.
+    async def _evaluate_assignee(
+        self,
+        assignee_id: str,
+        signal_families: frozenset[str] | None = None,
+    ) -> None:
+        """Evaluate gamification criteria for a single assignee.
 
         Args:
             assignee_id: The internal UUID of the assignee
+            signal_families: Changed signal families; badges and achievements
+                that depend on none of them are skipped. None evaluates all.
         """
         # Build evaluation context
         context = self._build_evaluation_context(assignee_id)
@@ -848,11 +921,37 @@ class GamificationManager(BaseManager):
             )
             return
 
+        # Share period/streak reads across every target of this pass; nested
+        # calls for the same assignee reuse the outer snapshot.
+        owns_snapshot = assignee_id not in self._evaluation_snapshots
+        if owns_snapshot:
+            self._evaluation_snapshots[assignee_id] = EvaluationSnapshot(
+                assignee_id=assignee_id, reads={}
+            )
+        try:
+            await self._evaluate_assignee_targets(assignee_id, context, signal_families)
+        finally:
+            if owns_snapshot:
+                self._evaluation_snapshots.pop(assignee_id, None)
+
+    async def _evaluate_assignee_targets(
+        self,
+        assignee_id: str,
+        context: EvaluationContext,
+        signal_families: frozenset[str] | None,
+    ) -> None:
+        """Evaluate badges and achievements for an assignee's built context."""
         # Get badge data from coordinator
         badges_data = self.coordinator.badges_data
 
         # Evaluate each badge
         for badge_id, badge_data in badges_data.items():
+            if signal_families is not None and signal_families.isdisjoint(
+                GamificationEngine.get_badge_signal_families(
+                    cast("dict[str, Any]", badge_data)
+                )
+            ):
+                continue
             await self._evaluate_badge_for_assignee(context, badge_id, badge_data)
 
         # Get achievement data from coordinator
@@ -860,6 +959,12 @@ class GamificationManager(BaseManager):
 
         # Evaluate each achievement
         for achievement_id, achievement_data in achievements_data.items():
+            if signal_families is not None and signal_families.isdisjoint(
+                GamificationEngine.get_achievement_signal_families(
+                    cast("dict[str, Any]", achievement_data)
+                )
+            ):
+                continue
             await self._evaluate_achievement_for_assignee(
                 context, achievement_id, achievement_data
             )
@@ -1405,11 +1510,30 @@ class GamificationManager(BaseManager):
             "tracked_chore_ids"
         ) or self.get_badge_in_scope_chores_list(badge_data, assignee_id)
 
-        today_stats = self.coordinator.statistics_manager.get_badge_scoped_today_stats(
-            assignee_id,
-            tracked_chores,
-            today_iso=today_iso,
-            current_badge_progress=current_badge_progress,
+        stats_manager = self.coordinator.statistics_manager
+        tracked_key = tuple(tracked_chores)
+        # Copied because window totals are added per badge below.
+        today_stats = dict(
+            self._snapshot_read(
+                assignee_id,
+                (
+                    "today_stats",
+                    today_iso,
+                    tracked_key,
+                    current_badge_progress.get(
+                        const.DATA_USER_BADGE_PROGRESS_LAST_UPDATE_DAY
+                    ),
+                    current_badge_progress.get(
+                        const.DATA_USER_BADGE_PROGRESS_DAYS_CYCLE_COUNT
+                    ),
+                ),
+                lambda: stats_manager.get_badge_scoped_today_stats(
+                    assignee_id,
+                    tracked_chores,
+                    today_iso=today_iso,
+                    current_badge_progress=current_badge_progress,
+                ),
+            )
         )
         reset_schedule = cast(
             "dict[str, Any]",
@@ -1429,34 +1553,32 @@ class GamificationManager(BaseManager):
             const.BADGE_TARGET_THRESHOLD_TYPE_POINTS,
             const.BADGE_TARGET_THRESHOLD_TYPE_POINTS_CHORES,
         }:
-            today_stats["window_points"] = self._get_tracked_window_points_total(
+            today_stats["window_points"] = self._snapshot_read(
                 assignee_id,
-                tracked_chores,
-                window_start_iso,
-                window_end_iso,
+                ("window_points", tracked_key, window_start_iso, window_end_iso),
+                lambda: self._get_tracked_window_points_total(
+                    assignee_id,
+                    tracked_chores,
+                    window_start_iso,
+                    window_end_iso,
+                ),
             )
         if target_type == const.BADGE_TARGET_THRESHOLD_TYPE_CHORE_COUNT:
-            today_stats["window_approved"] = self._get_tracked_window_completion_total(
-                assignee_id,
-                tracked_chores,
-                window_start_iso,
-                window_end_iso,
-            )
-        today_completion = (
-            self.coordinator.statistics_manager.get_badge_scoped_today_completion(
+            today_stats["window_approved"] = self._snapshot_read(
                 assignee_id,
-                tracked_chores,
-                today_iso=today_iso,
-                only_due_today=False,
+                ("window_approved", tracked_key, window_start_iso, window_end_iso),
+                lambda: self._get_tracked_window_completion_total(
+                    assignee_id,
+                    tracked_chores,
+                    window_start_iso,
+                    window_end_iso,
+                ),
             )
+        today_completion = self._get_scoped_today_completion(
+            assignee_id, tracked_chores, today_iso, only_due_today=False
         )
-        today_completion_due = (
-            self.coordinator.statistics_manager.get_badge_scoped_today_completion(
-                assignee_id,
-                tracked_chores,
-                today_iso=today_iso,
-                only_due_today=True,
-            )
+        today_completion_due = self._get_scoped_today_completion(
+            assignee_id, tracked_chores, today_iso, only_due_today=True
         )
 
         runtime_context = cast("EvaluationContext", dict(base_context))
@@ -1521,6 +1643,7 @@ class GamificationManager(BaseManager):
             "dict[str, Any]", assignee_info.get(const.DATA_USER_BADGE_PROGRESS, {})
         )
         entry = cast("dict[str, Any]", badge_progress.setdefault(badge_id, {}))
+        field_count = len(entry)
 
         entry.setdefault(
             const.DATA_USER_BADGE_PROGRESS_NAME,
@@ -1536,6 +1659,8 @@ class GamificationManager(BaseManager):
         entry.setdefault(const.DATA_USER_BADGE_PROGRESS_OVERALL_PROGRESS, 0.0)
         entry.setdefault(const.DATA_USER_BADGE_PROGRESS_CRITERIA_MET, False)
         entry.setdefault(const.DATA_USER_BADGE_PROGRESS_LAST_UPDATE_DAY, "")
+        if len(entry) != field_count:
+            self.coordinator._mark_changed({const.DATA_USERS: [assignee_id]})
 
     def _advance_non_cumulative_badge_cycle_if_needed(
         self,
@@ -1571,6 +1696,7 @@ class GamificationManager(BaseManager):
         if not isinstance(reset_schedule_raw, dict):
             reset_schedule_raw = {}
             badge_data[const.DATA_BADGE_RESET_SCHEDULE] = reset_schedule_raw
+            self.coordinator._mark_changed({const.DATA_BADGES: [badge_id]})
         reset_schedule = cast("dict[str, Any]", reset_schedule_raw)
         recurring_frequency = str(
             reset_schedule.get(
@@ -2329,6 +2455,9 @@ class GamificationManager(BaseManager):
             default_progress: AssigneeCumulativeBadgeProgress = {}
             progress = default_progress
             assignee_data[const.DATA_USER_CUMULATIVE_BADGE_PROGRESS] = progress
+            assignee_id = assignee_data.get(const.DATA_USER_INTERNAL_ID)
+            if assignee_id:
+                self.coordinator._mark_changed({const.DATA_USERS: [assignee_id]})
         return progress
 
     # =========================================================================
@@ -2737,36 +2866,29 @@ class GamificationManager(BaseManager):
         else:
             tracked_chores = self._get_assignee_assigned_chores(assignee_id)
 
-        runtime_context["today_stats"] = (
-            self.coordinator.statistics_manager.get_badge_scoped_today_stats(
+        stats_manager = self.coordinator.statistics_manager
+        tracked_key = tuple(tracked_chores)
+        runtime_context["today_stats"] = self._snapshot_read(
+            assignee_id,
+            ("today_stats", today_iso, tracked_key, None, None),
+            lambda: stats_manager.get_badge_scoped_today_stats(
                 assignee_id,
                 tracked_chores,
                 today_iso=today_iso,
                 current_badge_progress=None,
-            )
+            ),
         )
-        runtime_context["today_completion"] = (
-            self.coordinator.statistics_manager.get_badge_scoped_today_completion(
-                assignee_id,
-                tracked_chores,
-                today_iso=today_iso,
-                only_due_today=False,
-            )
+        runtime_context["today_completion"] = self._get_scoped_today_completion(
+            assignee_id, tracked_chores, today_iso, only_due_today=False
         )
-        runtime_context["today_completion_due"] = (
-            self.coordinator.statistics_manager.get_badge_scoped_today_completion(
-                assignee_id,
-                tracked_chores,
-                today_iso=today_iso,
-                only_due_today=True,
-            )
+        runtime_context["today_completion_due"] = self._get_scoped_today_completion(
+            assignee_id, tracked_chores, today_iso, only_due_today=True
         )
         runtime_context_dict = cast("dict[str, Any]", runtime_context)
-        runtime_context_dict["tracked_current_streak"] = (
-            self._get_tracked_current_streak(
-                assignee_id,
-                tracked_chores,
-            )
+        runtime_context_dict["tracked_current_streak"] = self._snapshot_read(
+            assignee_id,
+            ("current_streak", today_iso, tracked_key),
+            lambda: self._get_tracked_current_streak(assignee_id, tracked_chores),
         )
         # Scope the all-time period stats to the tracked chores when a specific
         # chore is selected (e.g. "Chore Total" achievement with a selected
@@ -2776,11 +2898,13 @@ class GamificationManager(BaseManager):
         # empty (no scope / assignee not assigned), the scoped read returns an
         # empty bucket so the target never progresses.
         if tracked_chores:
-            runtime_context_dict["chore_periods_all_time"] = (
-                self.coordinator.statistics_manager.get_badge_scoped_all_time_stats(
+            runtime_context_dict["chore_periods_all_time"] = self._snapshot_read(
+                assignee_id,
+                ("all_time_stats", tracked_key),
+                lambda: stats_manager.get_badge_scoped_all_time_stats(
                     assignee_id,
                     tracked_chores,
-                )
+                ),
             )
         if (
             canonical_target.get("source_entity_type") == "challenge"
@@ -2798,13 +2922,15 @@ class GamificationManager(BaseManager):
             end_date_iso = str(challenge_data.get(const.DATA_CHALLENGE_END_DATE, ""))[
                 :10
             ]
-            runtime_context_dict["tracked_total_within_window"] = (
-                self._get_tracked_window_completion_total(
+            runtime_context_dict["tracked_total_within_window"] = self._snapshot_read(
+                assignee_id,
+                ("window_approved", tracked_key, start_date_iso, end_date_iso),
+                lambda: self._get_tracked_window_completion_total(
                     assignee_id,
                     tracked_chores,
                     start_date_iso,
                     end_date_iso,
-                )
+                ),
             )
 
         if current_achievement_progress is not None:
@@ -2818,6 +2944,45 @@ class GamificationManager(BaseManager):
 
         return runtime_context
 
+    def _snapshot_read(
+        self,
+        assignee_id: str,
+        key: tuple[Any, ...],
+        compute: Callable[[], _T],
+    ) -> _T:
+        """Return a stats read memoized in the assignee's evaluation snapshot.
+
+        Outside an evaluation pass (dry runs, direct handler calls) the read is
+        computed directly. Cached values are shared; callers must not mutate.
+        """
+        snapshot = self._evaluation_snapshots.get(assignee_id)
+        if snapshot is None:
+            return compute()
+        if key not in snapshot.reads:
+            snapshot.reads[key] = compute()
+        return cast("_T", snapshot.reads[key])
+
+    def _get_scoped_today_completion(
+        self,
+        assignee_id: str,
+        tracked_chores: list[str],
+        today_iso: str,
+        *,
+        only_due_today: bool,
+    ) -> dict[str, Any]:
+        """Return today's completion snapshot for tracked chores (memoized)."""
+        stats_manager = self.coordinator.statistics_manager
+        return self._snapshot_read(
+            assignee_id,
+            ("today_completion", today_iso, tuple(tracked_chores), only_due_today),
+            lambda: stats_manager.get_badge_scoped_today_completion(
+                assignee_id,
+                tracked_chores,
+                today_iso=today_iso,
+                only_due_today=only_due_today,
+            ),
+        )
+
     def _streak_alive(self, last_value: Any) -> bool:
         """Return True if a streak's last activity keeps it alive today.
 
@@ -3438,12 +3603,17 @@ class GamificationManager(BaseManager):
 
     def _get_assignee_assigned_chores(self, assignee_id: str) -> list[str]:
         """Return all chore IDs currently assigned to the assignee."""
-        assignee_assigned_chores: list[str] = []
-        for chore_id, chore_info in self.coordinator.chores_data.items():
-            chore_assigned_to = chore_info.get(const.DATA_CHORE_ASSIGNED_USER_IDS, [])
-            if not chore_assigned_to or assignee_id in chore_assigned_to:
-                assignee_assigned_chores.append(chore_id)
-        return assignee_assigned_chores
+
+        def _compute() -> tuple[str, ...]:
+            # Chores with no assignees count as assigned to everyone
+            assignment_index = self.coordinator.get_assignment_index(
+                const.ITEM_TYPE_CHORE
+            )
+            return tuple(
+                assignment_index.item_ids_for(assignee_id, include_unassigned=True)
+            )
+
+        return list(self._snapshot_read(assignee_id, ("assigned_chores",), _compute))
 
     def get_cumulative_badge_levels(
         self, assignee_id: str
@@ -4868,6 +5038,8 @@ class GamificationManager(BaseManager):
         # Recalculate badges to trigger initial evaluation
         self.recalculate_all_badges()
 
+        self.coordinator.invalidate_name_index(const.ITEM_TYPE_BADGE)
+        self.coordinator.update_assignment_index(const.ITEM_TYPE_BADGE, final_id)
         self.coordinator._persist(immediate=immediate_persist)
         self.coordinator.async_update_listeners()
 
@@ -4938,6 +5110,8 @@ class GamificationManager(BaseManager):
             self.sync_badge_progress_for_assignee(assignee_id)
         self.recalculate_all_badges()
 
+        self.coordinator.invalidate_name_index(const.ITEM_TYPE_BADGE)
+        self.coordinator.update_assignment_index(const.ITEM_TYPE_BADGE, badge_id)
         self.coordinator._persist(immediate=immediate_persist)
         self.coordinator.async_update_listeners()
 
@@ -5012,6 +5186,8 @@ class GamificationManager(BaseManager):
             badge_id,
         )
 
+        self.coordinator.invalidate_name_index(const.ITEM_TYPE_BADGE)
+        self.coordinator.update_assignment_index(const.ITEM_TYPE_BADGE, badge_id)
         self.coordinator._persist(immediate=immediate_persist)
         self.coordinator.async_update_listeners()
 
@@ -5067,6 +5243,7 @@ class GamificationManager(BaseManager):
             achievement_data
         )
 
+        self.coordinator.invalidate_name_index(const.ITEM_TYPE_ACHIEVEMENT)
         self.coordinator._persist(immediate=immediate_persist)
         self.coordinator.async_update_listeners()
 
@@ -5129,6 +5306,7 @@ class GamificationManager(BaseManager):
             updated_achievement
         )
 
+        self.coordinator.invalidate_name_index(const.ITEM_TYPE_ACHIEVEMENT)
         self.coordinator._persist(immediate=immediate_persist)
         self.coordinator.async_update_listeners()
 
@@ -5189,6 +5367,7 @@ class GamificationManager(BaseManager):
             achievement_id,
         )
 
+        self.coordinator.invalidate_name_index(const.ITEM_TYPE_ACHIEVEMENT)
         self.coordinator._persist(immediate=immediate_persist)
         self.coordinator.async_update_listeners()
 
@@ -5245,6 +5424,7 @@ class GamificationManager(BaseManager):
             challenge_data
         )
 
+        self.coordinator.invalidate_name_index(const.ITEM_TYPE_CHALLENGE)
         self.coordinator._persist(immediate=immediate_persist)
         self.coordinator.async_update_listeners()
 
@@ -5305,6 +5485,7 @@ class GamificationManager(BaseManager):
         # Store updated challenge
         self.coordinator._data[const.DATA_CHALLENGES][challenge_id] = updated_challenge
 
+        self.coordinator.invalidate_name_index(const.ITEM_TYPE_CHALLENGE)
         self.coordinator._persist(immediate=immediate_persist)
         self.coordinator.async_update_listeners()
 
@@ -5365,6 +5546,7 @@ class GamificationManager(BaseManager):
             challenge_id,
         )
 
+        self.coordinator.invalidate_name_index(const.ITEM_TYPE_CHALLENGE)
         self.coordinator._persist(immediate=immediate_persist)
         self.coordinator.async_update_listeners()
 
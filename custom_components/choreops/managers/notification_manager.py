@@ -21,19 +21,33 @@ Event-driven architecture (v0.5.0+):
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import heapq
 import time
 from typing import TYPE_CHECKING, Any, cast
 import uuid
 
+from homeassistant.const import (
+    ATTR_DOMAIN,
+    ATTR_SERVICE,
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
+)
+from homeassistant.core import callback
+
 from .. import const
 from ..engines.chore_engine import ChoreEngine
 from ..helpers import translation_helpers as th
-from ..utils.dt_utils import dt_format_short, dt_now_utc_iso, dt_to_utc
+from ..utils.dt_utils import dt_format_short, dt_now_utc, dt_to_utc
 from ..utils.math_utils import round_points
 from .base_manager import BaseManager
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from collections.abc import Callable
+
+    from homeassistant.core import Event, HomeAssistant
 
     from ..coordinator import ChoreOpsDataCoordinator
     from ..type_defs import AssigneeData, ChoreData, RewardData
@@ -97,6 +111,58 @@ async def async_send_notification(
     await hass.services.async_call(domain, svc, payload, blocking=True)
 
 
+@dataclass(slots=True)
+class NotificationDispatchStats:
+    """Running counters for the notification dispatch queue."""
+
+    queued: int = 0
+    sent: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+
+
+@dataclass(slots=True)
+class _QueuedNotification:
+    """One notify service call waiting for a dispatch worker."""
+
+    notify_service: str
+    tag: str | None
+    title: str
+    message: str
+    actions: list[dict[str, str]] | None
+    extra_data: dict[str, str] | None
+    ready_at: float  # loop time at which the hold window ends
+
+
+@dataclass(slots=True)
+class _DigestEntry:
+    """One notification held back for an assignee digest.
+
+    Due/overdue entries from time-check scans name a chore; bulk service
+    entries name the chore, reward or bonus the notification was about.
+    """
+
+    notif_type: str
+    item_id: str
+    item_name: str
+    payload: dict[str, Any]
+
+
+# Bulk digest line marker per held notification type (assignee updates)
+_BULK_DIGEST_MARKERS: dict[str, str] = {
+    "chore_approved": "🎉",
+    "reward_approved": "🎁",
+    "bonus_applied": "⭐",
+}
+
+# Digest line order and marker per Schedule-Lock type (most urgent first)
+_DIGEST_MARKERS: dict[str, str] = {
+    "overdue": "⏰",
+    "due_reminder": "🎯",
+    "due_start": "🎯",
+}
+
+
 class NotificationManager(BaseManager):
     """Manager for sending notifications to assignees and approvers.
 
@@ -106,6 +172,7 @@ class NotificationManager(BaseManager):
     - Build notification action buttons
     - Handle notification tag generation for smart replacement
     - Clear notifications via tag
+    - Queue mobile notify calls with bounded concurrency and tag coalescing
 
     Uses coordinator for:
     - assignees_data, approvers_data, chores_data, rewards_data lookups
@@ -126,7 +193,46 @@ class NotificationManager(BaseManager):
             coordinator: Approver coordinator for data access
         """
         super().__init__(hass, coordinator)
-        # No additional state needed - manager delegates to coordinator data
+
+        # Snoozed "remind me later" queue: (assignee_id, item key, item_id) ->
+        # fire time (epoch seconds). The heap orders the same entries and is
+        # pruned lazily when a snooze moves; one loop timer serves the head.
+        # Mirrored to meta.pending_reminders so reminders survive restarts.
+        self._reminders: dict[tuple[str, str, str], float] = {}
+        self._reminder_heap: list[tuple[float, str, str, str]] = []
+        self._reminder_timer: asyncio.TimerHandle | None = None
+        self._reminder_timer_at: float | None = None
+
+        # Mobile notify dispatch queue. Messages are held for a short window
+        # and then wait for one of at most NOTIFY_DISPATCH_MAX_WORKERS workers;
+        # a queued message is replaced in place by a newer one for the same
+        # (service, tag), since the device would only show the newer one anyway.
+        self._dispatch_queue: deque[_QueuedNotification] = deque()
+        self._dispatch_pending: dict[tuple[str, str], _QueuedNotification] = {}
+        self._dispatch_workers = 0
+        self._dispatch_hold_seconds = (
+            0.0 if coordinator._test_mode else const.NOTIFY_DISPATCH_HOLD_SECONDS
+        )
+        self._dispatch_idle = asyncio.Event()
+        self._dispatch_idle.set()
+        self.dispatch_stats = NotificationDispatchStats()
+
+        # (domain, service) -> has_service() result, dropped per key when the
+        # service registry reports that service registered or removed
+        self._service_available: dict[tuple[str, str], bool] = {}
+
+        # Due/overdue notifications raised while a coordinator batch is open
+        # (one process_time_checks scan), grouped per assignee until it flushes
+        self._digest_entries: dict[str, list[_DigestEntry]] = {}
+        # Claim/approval/reward/bonus notifications from an open bulk service
+        # batch, grouped per assignee until it flushes
+        self._bulk_entries: dict[str, list[_DigestEntry]] = {}
+
+        # Schedule-Lock shadow: (assignee_id, chore_id, field) -> (ISO string,
+        # epoch seconds) for DATA_NOTIFICATIONS timestamps and approval period
+        # starts. An entry is used only while the stored string still matches,
+        # so values changed elsewhere (restore, chore edits) are parsed once.
+        self._lock_epochs: dict[tuple[str, str, str], tuple[str, float]] = {}
 
     async def async_setup(self) -> None:
         """Set up the notification manager with event subscriptions.
@@ -158,7 +264,13 @@ class NotificationManager(BaseManager):
         )
 
         # Chore events
-        self.listen(const.SIGNAL_SUFFIX_CHORE_CLAIMED, self._handle_chore_claimed)
+        # Claim/approval/reward/bonus handlers are tracked so a bulk service
+        # batch holds their notifications until it flushes (see bulk digests)
+        self.listen(
+            const.SIGNAL_SUFFIX_CHORE_CLAIMED,
+            self._handle_chore_claimed,
+            track_in_batch=True,
+        )
         self.listen(
             const.SIGNAL_SUFFIX_CHORE_CLAIM_UNDONE, self._handle_chore_claim_undone
         )
@@ -170,6 +282,7 @@ class NotificationManager(BaseManager):
         self.listen(
             const.SIGNAL_SUFFIX_CHORE_POINTS_AWARDED,
             self._handle_chore_points_awarded,
+            track_in_batch=True,
         )
         self.listen(
             const.SIGNAL_SUFFIX_CHORE_DISAPPROVED, self._handle_chore_disapproved
@@ -180,13 +293,21 @@ class NotificationManager(BaseManager):
         self.listen(
             const.SIGNAL_SUFFIX_REWARD_CLAIM_UNDONE, self._handle_reward_claim_undone
         )
-        self.listen(const.SIGNAL_SUFFIX_REWARD_APPROVED, self._handle_reward_approved)
+        self.listen(
+            const.SIGNAL_SUFFIX_REWARD_APPROVED,
+            self._handle_reward_approved,
+            track_in_batch=True,
+        )
         self.listen(
             const.SIGNAL_SUFFIX_REWARD_DISAPPROVED, self._handle_reward_disapproved
         )
 
         # Bonus/Penalty events
-        self.listen(const.SIGNAL_SUFFIX_BONUS_APPLIED, self._handle_bonus_applied)
+        self.listen(
+            const.SIGNAL_SUFFIX_BONUS_APPLIED,
+            self._handle_bonus_applied,
+            track_in_batch=True,
+        )
         self.listen(const.SIGNAL_SUFFIX_PENALTY_APPLIED, self._handle_penalty_applied)
         self.listen(
             const.SIGNAL_SUFFIX_POINTS_MULTIPLIER_CHANGE_REQUESTED,
@@ -194,11 +315,22 @@ class NotificationManager(BaseManager):
         )
 
         # Chore due date notification events (v0.6.0+: dual notification types)
-        self.listen(const.SIGNAL_SUFFIX_CHORE_DUE_WINDOW, self._handle_chore_due_window)
+        # Tracked so a scan's signals are all buffered before its batch flushes
+        self.listen(
+            const.SIGNAL_SUFFIX_CHORE_DUE_WINDOW,
+            self._handle_chore_due_window,
+            track_in_batch=True,
+        )
         self.listen(
-            const.SIGNAL_SUFFIX_CHORE_DUE_REMINDER, self._handle_chore_due_reminder
+            const.SIGNAL_SUFFIX_CHORE_DUE_REMINDER,
+            self._handle_chore_due_reminder,
+            track_in_batch=True,
+        )
+        self.listen(
+            const.SIGNAL_SUFFIX_CHORE_OVERDUE,
+            self._handle_chore_overdue,
+            track_in_batch=True,
         )
-        self.listen(const.SIGNAL_SUFFIX_CHORE_OVERDUE, self._handle_chore_overdue)
         # Phase 3 Step 9: Missed lock notification (v0.5.0)
         self.listen(const.SIGNAL_SUFFIX_CHORE_MISSED, self._handle_chore_missed)
 
@@ -207,6 +339,17 @@ class NotificationManager(BaseManager):
         self.listen(const.SIGNAL_SUFFIX_REWARD_DELETED, self._handle_reward_deleted)
         self.listen(const.SIGNAL_SUFFIX_USER_DELETED, self._handle_assignee_deleted)
 
+        # Re-arm snoozed reminders queued before the last restart/reload
+        self._restore_reminders()
+        self.coordinator.config_entry.async_on_unload(self._cancel_reminder_timer)
+
+        # Keep the cached notify service availability in step with the registry
+        for event_type in (EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED):
+            self.coordinator.config_entry.async_on_unload(
+                self.hass.bus.async_listen(event_type, self._on_service_changed)
+            )
+        self.coordinator.config_entry.async_on_unload(self._discard_dispatch_queue)
+
         const.LOGGER.debug(
             "NotificationManager initialized with 18 event subscriptions for entry %s",
             self.entry_id,
@@ -293,6 +436,11 @@ class NotificationManager(BaseManager):
     # 6. CLEANUP VIA SIGNALS: CHORE_DELETED and KID_DELETED signals trigger
     #    cleanup in our notifications bucket (choreographed janitor pattern).
     #
+    # 7. EPOCH SHADOW: _lock_epochs mirrors both timestamps as epoch floats,
+    #    refreshed on our writes and on CHORE_STATUS_RESET, so the per-scan
+    #    check is a float compare. A stale entry (stored string changed
+    #    elsewhere) is detected by string equality and re-parsed once.
+    #
     # Structure: notifications[assignee_id][chore_id] = {
     #     "last_due_start": ISO timestamp,
     #     "last_due_reminder": ISO timestamp,
@@ -322,7 +470,10 @@ class NotificationManager(BaseManager):
         """
         notifications = self._get_chore_notifications_bucket()
         assignee_notifs = notifications.setdefault(assignee_id, {})
-        return assignee_notifs.setdefault(chore_id, {})
+        if chore_id not in assignee_notifs:
+            assignee_notifs[chore_id] = {}
+            self.coordinator._mark_changed({const.DATA_NOTIFICATIONS: [assignee_id]})
+        return assignee_notifs[chore_id]
 
     def _get_chore_approval_period_start(
         self, assignee_id: str, chore_id: str
@@ -393,8 +544,15 @@ class NotificationManager(BaseManager):
         if not period_start_str:
             return True  # No period defined - send it
 
-        last_notified = dt_to_utc(last_notified_str)
-        period_start = dt_to_utc(period_start_str)
+        last_notified = self._get_lock_epoch(
+            assignee_id, chore_id, notif_key, last_notified_str
+        )
+        period_start = self._get_lock_epoch(
+            assignee_id,
+            chore_id,
+            const.DATA_CHORE_APPROVAL_PERIOD_START,
+            period_start_str,
+        )
 
         if last_notified is None or period_start is None:
             return True  # Parse error - send to be safe
@@ -419,8 +577,12 @@ class NotificationManager(BaseManager):
         notif_key = self._get_chore_notif_key(notif_type)
 
         notif_record = self._get_chore_notification_record(assignee_id, chore_id)
-        notif_record[notif_key] = dt_now_utc_iso()
-        self.coordinator._persist()  # Debounced persist
+        notif_record[notif_key] = self._stamp_lock_epoch(
+            assignee_id, chore_id, notif_key
+        )
+        self.coordinator._persist(  # Debounced persist
+            changed={const.DATA_NOTIFICATIONS: [assignee_id]}
+        )
 
         const.LOGGER.debug(
             "Recorded chore notification timestamp for assignee=%s chore=%s type=%s",
@@ -429,6 +591,104 @@ class NotificationManager(BaseManager):
             notif_type,
         )
 
+    def _record_chore_notifications_sent(
+        self, sent: dict[str, list[tuple[str, str]]]
+    ) -> None:
+        """Record many chore notification timestamps with a single persist.
+
+        Args:
+            sent: assignee_id -> list of (chore_id, notif_type) pairs
+        """
+        if not sent:
+            return
+        now_utc = dt_now_utc()
+        for assignee_id, pairs in sent.items():
+            for chore_id, notif_type in pairs:
+                notif_key = self._get_chore_notif_key(notif_type)
+                notif_record = self._get_chore_notification_record(
+                    assignee_id, chore_id
+                )
+                notif_record[notif_key] = self._stamp_lock_epoch(
+                    assignee_id, chore_id, notif_key, now_utc
+                )
+        self.coordinator._persist(changed={const.DATA_NOTIFICATIONS: list(sent)})
+
+        const.LOGGER.debug(
+            "Recorded %d chore notification timestamps for %d assignee(s)",
+            sum(len(pairs) for pairs in sent.values()),
+            len(sent),
+        )
+
+    def _get_lock_epoch(
+        self, assignee_id: str, chore_id: str, field: str, iso_value: str
+    ) -> float | None:
+        """Return a Schedule-Lock timestamp as epoch seconds via the shadow.
+
+        Args:
+            assignee_id: The assignee's internal ID (UUID)
+            chore_id: The chore's internal ID (UUID)
+            field: Notification record key or approval period start key
+            iso_value: The stored ISO timestamp for that field
+
+        Returns:
+            Epoch seconds, or None if the timestamp cannot be parsed
+        """
+        key = (assignee_id, chore_id, field)
+        cached = self._lock_epochs.get(key)
+        if cached is not None and cached[0] == iso_value:
+            return cached[1]
+
+        parsed = dt_to_utc(iso_value)
+        if parsed is None:
+            self._lock_epochs.pop(key, None)
+            return None
+        epoch = parsed.timestamp()
+        self._lock_epochs[key] = (iso_value, epoch)
+        return epoch
+
+    def _stamp_lock_epoch(
+        self,
+        assignee_id: str,
+        chore_id: str,
+        field: str,
+        now_utc: datetime | None = None,
+    ) -> str:
+        """Shadow a new notification timestamp and return its ISO string."""
+        if now_utc is None:
+            now_utc = dt_now_utc()
+        iso_value = now_utc.isoformat()
+        self._lock_epochs[(assignee_id, chore_id, field)] = (
+            iso_value,
+            now_utc.timestamp(),
+        )
+        return iso_value
+
+    def _refresh_period_start_epoch(self, assignee_id: str, chore_id: str) -> None:
+        """Re-shadow an approval period start after the chore resets."""
+        self._lock_epochs.pop(
+            (assignee_id, chore_id, const.DATA_CHORE_APPROVAL_PERIOD_START), None
+        )
+        period_start_str = self._get_chore_approval_period_start(assignee_id, chore_id)
+        if period_start_str:
+            self._get_lock_epoch(
+                assignee_id,
+                chore_id,
+                const.DATA_CHORE_APPROVAL_PERIOD_START,
+                period_start_str,
+            )
+
+    def _discard_lock_epochs(
+        self, *, assignee_id: str | None = None, chore_id: str | None = None
+    ) -> None:
+        """Drop shadowed timestamps for a deleted assignee and/or chore."""
+        for key in [
+            key
+            for key in self._lock_epochs
+            if (assignee_id is None or key[0] == assignee_id)
+            and (chore_id is None or key[1] == chore_id)
+        ]:
+            del self._lock_epochs[key]
+
     def _build_assignee_chore_status_tag(self, assignee_id: str, chore_id: str) -> str:
         """Build the canonical assignee transient-family tag for a chore.
 
@@ -467,6 +727,7 @@ class NotificationManager(BaseManager):
         Args:
             chore_id: The deleted chore's internal ID (UUID)
         """
+        self._discard_lock_epochs(chore_id=chore_id)
         notifications = self._get_chore_notifications_bucket()
         cleaned = 0
         for assignee_id in list(notifications.keys()):
@@ -494,10 +755,11 @@ class NotificationManager(BaseManager):
         Args:
             assignee_id: The deleted assignee's internal ID (UUID)
         """
+        self._discard_lock_epochs(assignee_id=assignee_id)
         notifications = self._get_chore_notifications_bucket()
         if assignee_id in notifications:
             del notifications[assignee_id]
-            self.coordinator._persist()
+            self.coordinator._persist(changed={const.DATA_NOTIFICATIONS: [assignee_id]})
             const.LOGGER.debug(
                 "Cleaned notification records for deleted assignee=%s",
                 assignee_id[:8],
@@ -532,6 +794,28 @@ class NotificationManager(BaseManager):
             },
         ]
 
+    @staticmethod
+    def build_approve_action(
+        assignee_id: str, chore_id: str, entry_id: str
+    ) -> list[dict[str, str]]:
+        """Build an approve action button for approver digests.
+
+        Args:
+            assignee_id: The internal ID of the assignee
+            chore_id: The internal ID of the chore
+            entry_id: The config entry ID (will be truncated to 8 chars)
+
+        Returns:
+            List containing one action dictionary with 'action' and 'title' keys.
+        """
+        truncated_entry_id = entry_id[:8]
+        return [
+            {
+                const.NOTIFY_ACTION: f"{const.ACTION_APPROVE_CHORE}|{truncated_entry_id}|{assignee_id}|{chore_id}",
+                const.NOTIFY_TITLE: const.TRANS_KEY_NOTIF_ACTION_APPROVE,
+            },
+        ]
+
     @staticmethod
     def build_skip_action(
         assignee_id: str, chore_id: str, entry_id: str
@@ -789,6 +1073,10 @@ class NotificationManager(BaseManager):
             action_key = action_title_key.replace("notif_action_", "")
             # Look up translation, fallback to original key
             translated_title = action_translations.get(action_key, action_title_key)
+            # Digest buttons name the chore they act on
+            title_detail = translated_action.pop(const.NOTIFY_TITLE_DETAIL, None)
+            if title_detail:
+                translated_title = f"{translated_title}: {title_detail}"
             translated_action[const.NOTIFY_TITLE] = translated_title
             translated_actions.append(translated_action)
 
@@ -852,8 +1140,12 @@ class NotificationManager(BaseManager):
         Gracefully handles missing notification services (common in fresh installs,
         migrations, or when mobile app isn't configured yet).
 
-        Uses the module-level async_send_notification function which can be
-        easily mocked in tests.
+        The message goes through the dispatch queue, which holds it for
+        NOTIFY_DISPATCH_HOLD_SECONDS, bounds concurrent service calls and
+        coalesces queued messages sharing a (service, tag). Returns as soon as
+        the message is queued; await _drain_dispatch_queue() to wait for
+        delivery. Delivery uses the module-level async_send_notification
+        function which can be easily mocked in tests.
         """
         # Parse service name into domain and service components
         if const.DISPLAY_DOT not in notify_service:
@@ -863,7 +1155,7 @@ class NotificationManager(BaseManager):
             domain, service = notify_service.split(".", 1)
 
         # Validate service exists before attempting to send
-        if not self.hass.services.has_service(domain, service):
+        if not self._has_notify_service(domain, service):
             const.LOGGER.warning(
                 "Notification service '%s.%s' not available - skipping notification. "
                 "This is normal during migration or if the mobile app/notification "
@@ -871,10 +1163,11 @@ class NotificationManager(BaseManager):
                 domain,
                 service,
             )
+            self.dispatch_stats.dropped += 1
             return
 
         const.LOGGER.debug(
-            "Sending notification via '%s.%s': title='%s', message='%s', actions=%s",
+            "Queueing notification via '%s.%s': title='%s', message='%s', actions=%s",
             domain,
             service,
             title,
@@ -882,28 +1175,134 @@ class NotificationManager(BaseManager):
             actions,
         )
 
-        try:
-            # Use module-level function for testability
-            await async_send_notification(
-                self.hass,
-                notify_service,
-                title,
-                message,
-                actions,
-                extra_data,
+        tag = extra_data.get(const.NOTIFY_TAG) if extra_data else None
+        pending = self._dispatch_pending.get((notify_service, tag)) if tag else None
+        if pending is not None:
+            # Same (service, tag) still waiting for a worker: newest content wins
+            pending.title = title
+            pending.message = message
+            pending.actions = actions
+            pending.extra_data = extra_data
+            self.dispatch_stats.coalesced += 1
+            const.LOGGER.debug(
+                "Coalesced notification via '%s.%s' with queued tag '%s'",
+                domain,
+                service,
+                tag,
             )
-            const.LOGGER.debug("Notification sent via '%s.%s'", domain, service)
+            return
 
-        except Exception as err:
-            # Broad exception allowed: This runs in fire-and-forget background tasks
-            # per AGENTS.md guidelines. We must catch all exceptions to prevent
-            # "Task exception was never retrieved" errors in logs.
-            const.LOGGER.error(
-                "Unexpected error sending notification via '%s.%s': %s",
+        if len(self._dispatch_queue) >= const.NOTIFY_DISPATCH_MAX_QUEUED:
+            const.LOGGER.warning(
+                "Notification queue full (%d waiting) - dropping notification via "
+                "'%s.%s'",
+                len(self._dispatch_queue),
                 domain,
                 service,
-                err,
             )
+            self.dispatch_stats.dropped += 1
+            return
+
+        queued = _QueuedNotification(
+            notify_service=notify_service,
+            tag=tag,
+            title=title,
+            message=message,
+            actions=actions,
+            extra_data=extra_data,
+            ready_at=self.hass.loop.time() + self._dispatch_hold_seconds,
+        )
+        self._dispatch_queue.append(queued)
+        if tag:
+            self._dispatch_pending[(notify_service, tag)] = queued
+        self.dispatch_stats.queued += 1
+        self._dispatch_idle.clear()
+        self._start_dispatch_worker()
+
+    # =========================================================================
+    # Notification Dispatch Queue
+    # =========================================================================
+
+    def _has_notify_service(self, domain: str, service: str) -> bool:
+        """Return whether a notify service exists, cached until it changes."""
+        key = (domain, service)
+        available = self._service_available.get(key)
+        if available is None:
+            available = self.hass.services.has_service(domain, service)
+            self._service_available[key] = available
+        return available
+
+    @callback
+    def _on_service_changed(self, event: Event) -> None:
+        """Forget cached availability for a registered or removed service."""
+        self._service_available.pop(
+            (event.data.get(ATTR_DOMAIN), event.data.get(ATTR_SERVICE)), None
+        )
+
+    def _start_dispatch_worker(self) -> None:
+        """Start another dispatch worker if the queue outgrew the running ones."""
+        if (
+            not self._dispatch_queue
+            or self._dispatch_workers >= const.NOTIFY_DISPATCH_MAX_WORKERS
+        ):
+            return
+        self._dispatch_workers += 1
+        self.hass.async_create_task(self._async_dispatch_worker())
+
+    async def _async_dispatch_worker(self) -> None:
+        """Send queued notifications until the queue is empty."""
+        try:
+            while self._dispatch_queue:
+                # Queue is FIFO, so the head's hold window ends first
+                hold = self._dispatch_queue[0].ready_at - self.hass.loop.time()
+                if hold > 0:
+                    await asyncio.sleep(hold)
+                    continue
+                queued = self._dispatch_queue.popleft()
+                if queued.tag:
+                    self._dispatch_pending.pop(
+                        (queued.notify_service, queued.tag), None
+                    )
+                try:
+                    # Use module-level function for testability
+                    await async_send_notification(
+                        self.hass,
+                        queued.notify_service,
+                        queued.title,
+                        queued.message,
+                        queued.actions,
+                        queued.extra_data,
+                    )
+                except Exception as err:
+                    # Broad exception allowed: one failed service call must not
+                    # stop the worker while messages are still queued.
+                    const.LOGGER.error(
+                        "Unexpected error sending notification via '%s': %s",
+                        queued.notify_service,
+                        err,
+                    )
+                    self.dispatch_stats.dropped += 1
+                else:
+                    const.LOGGER.debug(
+                        "Notification sent via '%s'", queued.notify_service
+                    )
+                    self.dispatch_stats.sent += 1
+        finally:
+            self._dispatch_workers -= 1
+            if not self._dispatch_workers:
+                self._dispatch_idle.set()
+
+    async def _drain_dispatch_queue(self) -> None:
+        """Wait until every queued message was sent or dropped."""
+        await self._dispatch_idle.wait()
+
+    def _discard_dispatch_queue(self) -> None:
+        """Drop messages still waiting for a worker (entry unload)."""
+        self.dispatch_stats.dropped += len(self._dispatch_queue)
+        self._dispatch_queue.clear()
+        self._dispatch_pending.clear()
+        if not self._dispatch_workers:
+            self._dispatch_idle.set()
 
     # =========================================================================
     # Persistent Notification (System)
@@ -1798,6 +2197,10 @@ class NotificationManager(BaseManager):
         if clear_tasks:
             await asyncio.gather(*clear_tasks)
 
+    # =========================================================================
+    # Snoozed Reminder Queue
+    # =========================================================================
+
     async def remind_in_minutes(
         self,
         assignee_id: str,
@@ -1806,11 +2209,23 @@ class NotificationManager(BaseManager):
         chore_id: str | None = None,
         reward_id: str | None = None,
     ) -> None:
-        """Schedule a reminder notification after specified minutes.
+        """Queue a reminder notification after specified minutes.
 
-        If a chore_id is provided, checks the chore's state before sending.
-        If a reward_id is provided, checks whether that reward is still pending.
+        Reminders live in a persisted queue served by a single timer, so they
+        survive restarts. Snoozing the same chore or reward again moves its
+        queued reminder instead of adding a second one.
         """
+        if chore_id:
+            key = (assignee_id, const.DATA_CHORE_ID, chore_id)
+        elif reward_id:
+            key = (assignee_id, const.DATA_REWARD_ID, reward_id)
+        else:
+            const.LOGGER.debug(
+                "Reminder for Assignee ID '%s' has no chore or reward. Skipping",
+                assignee_id,
+            )
+            return
+
         const.LOGGER.debug(
             "Scheduling reminder for Assignee ID '%s', Chore ID '%s', Reward ID '%s' in %d minutes",
             assignee_id,
@@ -1820,8 +2235,172 @@ class NotificationManager(BaseManager):
         )
         # Use 5 seconds in test mode, convert minutes to seconds in production
         delay_seconds = 5 if self.coordinator._test_mode else (minutes * 60)
-        await asyncio.sleep(delay_seconds)
+        self._queue_reminder(key, time.time() + delay_seconds)
+        self._persist_reminders()
+        self._arm_reminder_timer()
+
+    async def async_send_due_reminders(self, now: float | None = None) -> int:
+        """Send every queued reminder that is due, as one batch.
+
+        Args:
+            now: Epoch seconds to treat as the current time (defaults to now).
+
+        Returns:
+            Number of reminders taken off the queue.
+        """
+        if now is None:
+            now = time.time()
+
+        due: list[tuple[str, str, str]] = []
+        while (fire_at := self._next_reminder_at()) is not None and fire_at <= now:
+            _fire_at, assignee_id, item_key, item_id = heapq.heappop(
+                self._reminder_heap
+            )
+            del self._reminders[(assignee_id, item_key, item_id)]
+            due.append((assignee_id, item_key, item_id))
+
+        if due:
+            self._persist_reminders()
+        self._arm_reminder_timer()
+
+        results = await asyncio.gather(
+            *(
+                self._send_reminder(
+                    assignee_id,
+                    chore_id=item_id if item_key == const.DATA_CHORE_ID else None,
+                    reward_id=item_id if item_key == const.DATA_REWARD_ID else None,
+                )
+                for assignee_id, item_key, item_id in due
+            ),
+            return_exceptions=True,
+        )
+        for (assignee_id, _item_key, item_id), result in zip(due, results, strict=True):
+            if isinstance(result, Exception):
+                const.LOGGER.error(
+                    "Failed to send reminder for '%s' to Assignee ID '%s': %s",
+                    item_id,
+                    assignee_id,
+                    result,
+                )
+        return len(due)
+
+    def _queue_reminder(self, key: tuple[str, str, str], fire_at: float) -> None:
+        """Queue (or move) the reminder for one assignee + chore/reward."""
+        self._reminders[key] = fire_at
+        heapq.heappush(self._reminder_heap, (fire_at, *key))
+
+    def _discard_reminders(
+        self, *, assignee_id: str | None = None, item_id: str | None = None
+    ) -> None:
+        """Drop queued reminders for a deleted assignee, chore or reward."""
+        stale_keys = [
+            key
+            for key in self._reminders
+            if (assignee_id is None or key[0] == assignee_id)
+            and (item_id is None or key[2] == item_id)
+        ]
+        if not stale_keys:
+            return
+        for key in stale_keys:
+            del self._reminders[key]
+        self._persist_reminders()
+        self._arm_reminder_timer()
+
+    def _next_reminder_at(self) -> float | None:
+        """Return the earliest live fire time, popping superseded heap entries."""
+        heap = self._reminder_heap
+        while heap:
+            fire_at, assignee_id, item_key, item_id = heap[0]
+            if self._reminders.get((assignee_id, item_key, item_id)) == fire_at:
+                return fire_at
+            heapq.heappop(heap)
+        return None
+
+    def _arm_reminder_timer(self) -> None:
+        """Point the single reminder timer at the earliest queued reminder."""
+        fire_at = self._next_reminder_at()
+        if fire_at is not None and fire_at == self._reminder_timer_at:
+            return
+        self._cancel_reminder_timer()
+        if fire_at is None:
+            return
+        loop = self.hass.loop
+        self._reminder_timer = loop.call_at(
+            loop.time() + max(0.0, fire_at - time.time()), self._on_reminder_timer
+        )
+        self._reminder_timer_at = fire_at
+
+    def _cancel_reminder_timer(self) -> None:
+        """Cancel the pending reminder timer, if any."""
+        if self._reminder_timer is not None:
+            self._reminder_timer.cancel()
+        self._reminder_timer = None
+        self._reminder_timer_at = None
+
+    def _on_reminder_timer(self) -> None:
+        """Fire due reminders when the queue head comes due."""
+        self._reminder_timer = None
+        self._reminder_timer_at = None
+        self.hass.async_create_task(self.async_send_due_reminders())
+
+    def _persist_reminders(self) -> None:
+        """Mirror the reminder queue to storage meta (debounced)."""
+        meta = self.coordinator._data.setdefault(const.DATA_META, {})
+        meta[const.DATA_META_PENDING_REMINDERS] = [
+            {
+                const.DATA_REMINDER_FIRE_AT: datetime.fromtimestamp(
+                    fire_at, UTC
+                ).isoformat(),
+                const.DATA_USER_ID: assignee_id,
+                item_key: item_id,
+            }
+            for (assignee_id, item_key, item_id), fire_at in sorted(
+                self._reminders.items(), key=lambda item: item[1]
+            )
+        ]
+        self.coordinator._persist(changed={const.DATA_META: None})
 
+    def _restore_reminders(self) -> None:
+        """Load the persisted reminder queue and arm its timer."""
+        meta = self.coordinator._data.get(const.DATA_META, {})
+        for entry in meta.get(const.DATA_META_PENDING_REMINDERS, []):
+            if not isinstance(entry, dict):
+                continue
+            assignee_id = entry.get(const.DATA_USER_ID)
+            fire_at = dt_to_utc(entry.get(const.DATA_REMINDER_FIRE_AT))
+            item_key = next(
+                (
+                    key
+                    for key in (const.DATA_CHORE_ID, const.DATA_REWARD_ID)
+                    if entry.get(key)
+                ),
+                None,
+            )
+            if not assignee_id or fire_at is None or item_key is None:
+                continue
+            self._queue_reminder(
+                (assignee_id, item_key, entry[item_key]), fire_at.timestamp()
+            )
+
+        if self._reminders:
+            const.LOGGER.info(
+                "NotificationManager: Restored %d queued reminders from storage",
+                len(self._reminders),
+            )
+            self._arm_reminder_timer()
+
+    async def _send_reminder(
+        self,
+        assignee_id: str,
+        *,
+        chore_id: str | None = None,
+        reward_id: str | None = None,
+    ) -> None:
+        """Send one due reminder if its chore or reward still needs action.
+
+        A chore reminder is only sent while the chore is still pending/overdue
+        and a reward reminder only while the reward is still pending.
+        """
         assignee_info: AssigneeData | None = self.coordinator.assignees_data.get(
             assignee_id
         )
@@ -2192,6 +2771,10 @@ class NotificationManager(BaseManager):
                 assignee_name = assignee_info.get(const.DATA_USER_NAME, "")
             if not assignee_name:
                 return
+
+        if self._hold_for_bulk_digest("chore_claimed", payload, chore_id, chore_name):
+            return
+
         chore_points = chore_info.get(
             const.DATA_CHORE_DEFAULT_POINTS, const.DEFAULT_ZERO
         )
@@ -2370,6 +2953,18 @@ class NotificationManager(BaseManager):
             const.DATA_REWARD_ID: reward_id,
         }
 
+        # Clear the original claim notification from approvers' devices
+        await self.clear_notification_for_approvers(
+            assignee_id,
+            const.NOTIFY_TAG_TYPE_STATUS,
+            reward_id,
+        )
+
+        if self._hold_for_bulk_digest(
+            "reward_approved", payload, reward_id, reward_name
+        ):
+            return
+
         # Notify assignee
         await self.notify_assignee_translated(
             assignee_id,
@@ -2379,13 +2974,6 @@ class NotificationManager(BaseManager):
             extra_data=extra_data,
         )
 
-        # Clear the original claim notification from approvers' devices
-        await self.clear_notification_for_approvers(
-            assignee_id,
-            const.NOTIFY_TAG_TYPE_STATUS,
-            reward_id,
-        )
-
         const.LOGGER.debug(
             "NotificationManager: Sent reward approved notification for assignee=%s, reward=%s",
             assignee_id,
@@ -2521,6 +3109,10 @@ class NotificationManager(BaseManager):
         if not assignee_id or not chore_id:
             return
 
+        # The reset advanced the approval period; shadow its new start now so
+        # the next scan compares floats without re-parsing
+        self._refresh_period_start_epoch(assignee_id, chore_id)
+
         await self._clear_reset_chore_notifications(assignee_id, chore_id)
 
         const.LOGGER.debug(
@@ -2548,6 +3140,9 @@ class NotificationManager(BaseManager):
                 const.DATA_CHORE_NOTIFY_ON_APPROVAL,
                 const.DEFAULT_NOTIFY_ON_APPROVAL,
             )
+            and not self._hold_for_bulk_digest(
+                "chore_approved", payload, chore_id, chore_name
+            )
         ):
             await self.notify_assignee_translated(
                 assignee_id,
@@ -2573,6 +3168,9 @@ class NotificationManager(BaseManager):
         if not assignee_id:
             return
 
+        if self._hold_for_bulk_digest("bonus_applied", payload, bonus_id, bonus_name):
+            return
+
         extra_data = {
             const.DATA_USER_ID: assignee_id,
             const.DATA_BONUS_ID: bonus_id,
@@ -2705,6 +3303,9 @@ class NotificationManager(BaseManager):
         if not assignee_id or not chore_id:
             return
 
+        if self._hold_for_digest("due_start", payload):
+            return
+
         # Schedule-Lock: Check if already notified this period
         if not self._should_send_chore_notification(assignee_id, chore_id, "due_start"):
             const.LOGGER.debug(
@@ -2759,6 +3360,9 @@ class NotificationManager(BaseManager):
         if not assignee_id or not chore_id:
             return
 
+        if self._hold_for_digest("due_reminder", payload):
+            return
+
         # Schedule-Lock: Check if already notified this period
         if not self._should_send_chore_notification(
             assignee_id, chore_id, "due_reminder"
@@ -2833,6 +3437,9 @@ class NotificationManager(BaseManager):
             )
             return
 
+        if self._hold_for_digest("overdue", payload):
+            return
+
         await self._send_overdue_notification_to_assignee(
             assignee_id, chore_id, chore_name, due_date, payload
         )
@@ -3118,6 +3725,348 @@ class NotificationManager(BaseManager):
             assignee_id,
         )
 
+    # =========================================================================
+    # Due/Overdue Digests
+    # =========================================================================
+    #
+    # Periodic, wakeup and midnight time checks run inside coordinator.batch()
+    # and flag their due-window, due-reminder and overdue signals with
+    # CHORE_TIME_SCAN_EVENT_DIGEST. Instead of one push per (assignee, chore),
+    # flagged notifications are held here and sent when that scan's batch
+    # flushes: assignees with NOTIFY_DIGEST_MIN_ENTRIES or more chores get one
+    # digest (plus one approver digest for the overdue ones), tagged per
+    # assignee so each digest replaces the previous one. Digests carry claim
+    # (assignee) and complete/skip/remind (approver) buttons and clear the
+    # per-chore STATUS notifications they supersede. Their Schedule-Lock
+    # timestamps are recorded with a single persist. Standby and steal
+    # requests, and everything else, use the regular per-chore notification.
+
+    def _hold_for_digest(self, notif_type: str, payload: dict[str, Any]) -> bool:
+        """Hold a due/overdue notification for the open batch's digest.
+
+        Args:
+            notif_type: "due_start", "due_reminder", or "overdue"
+            payload: The signal payload, replayed if no digest is sent
+
+        Returns:
+            True if the notification was held and the handler should stop.
+        """
+        if (
+            not payload.get(const.CHORE_TIME_SCAN_EVENT_DIGEST)
+            or not self.coordinator.in_batch
+        ):
+            return False
+
+        # Standby and steal requests keep their own wording
+        if notif_type == "overdue" and (
+            payload.get(
+                const.CHORE_OVERDUE_EVENT_MESSAGE_TYPE,
+                const.CHORE_OVERDUE_NOTIFICATION_TYPE_DEFAULT,
+            )
+            != const.CHORE_OVERDUE_NOTIFICATION_TYPE_DEFAULT
+        ):
+            return False
+
+        assignee_id = payload.get("user_id", "")
+        chore_id = payload.get("chore_id", "")
+        if not self._should_send_chore_notification(assignee_id, chore_id, notif_type):
+            return False  # Handler logs the Schedule-Lock suppression
+
+        self._digest_entries.setdefault(assignee_id, []).append(
+            _DigestEntry(
+                notif_type=notif_type,
+                item_id=chore_id,
+                item_name=payload.get("chore_name", "Unknown Chore"),
+                payload=payload,
+            )
+        )
+        self.coordinator.async_call_after_batch(self._on_digest_batch_flushed)
+        return True
+
+    @callback
+    def _on_digest_batch_flushed(self) -> None:
+        """Send the notifications held while the batch was open."""
+        self.hass.async_create_task(self._async_send_digests())
+
+    async def _async_send_digests(self) -> None:
+        """Send one digest per assignee, or the held notifications as-is."""
+        held_entries, self._digest_entries = self._digest_entries, {}
+        if not held_entries:
+            return
+
+        handlers = {
+            "due_start": self._handle_chore_due_window,
+            "due_reminder": self._handle_chore_due_reminder,
+            "overdue": self._handle_chore_overdue,
+        }
+        digest_assignee_ids: list[str] = []
+        digest_sends: list[Any] = []
+        single_sends: list[Any] = []
+        for assignee_id, entries in held_entries.items():
+            if (
+                len({entry.item_id for entry in entries})
+                >= const.NOTIFY_DIGEST_MIN_ENTRIES
+            ):
+                digest_assignee_ids.append(assignee_id)
+                digest_sends.append(self._send_chore_digest(assignee_id, entries))
+            else:
+                single_sends.extend(
+                    handlers[entry.notif_type](
+                        {**entry.payload, const.CHORE_TIME_SCAN_EVENT_DIGEST: False}
+                    )
+                    for entry in entries
+                )
+
+        results = await asyncio.gather(
+            *digest_sends, *single_sends, return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                const.LOGGER.warning("Failed to send chore notification: %s", result)
+
+        # Schedule-Lock every chore covered by a delivered digest in one write
+        self._record_chore_notifications_sent(
+            {
+                assignee_id: [
+                    (entry.item_id, entry.notif_type)
+                    for entry in held_entries[assignee_id]
+                ]
+                for assignee_id, result in zip(
+                    digest_assignee_ids, results, strict=False
+                )
+                if not isinstance(result, Exception)
+            }
+        )
+
+    async def _send_chore_digest(
+        self, assignee_id: str, entries: list[_DigestEntry]
+    ) -> None:
+        """Send one digest of an assignee's due/overdue chores.
+
+        Args:
+            assignee_id: The assignee whose chores are summarized
+            entries: Held entries; a chore held more than once is listed once
+                under its most urgent type
+        """
+        urgency = list(_DIGEST_MARKERS)
+        by_chore: dict[str, _DigestEntry] = {}
+        for entry in entries:
+            listed = by_chore.get(entry.item_id)
+            if listed is None or urgency.index(entry.notif_type) < urgency.index(
+                listed.notif_type
+            ):
+                by_chore[entry.item_id] = entry
+        listed_entries = sorted(
+            by_chore.values(), key=lambda entry: urgency.index(entry.notif_type)
+        )
+
+        await self.notify_assignee_translated(
+            assignee_id,
+            title_key=const.TRANS_KEY_NOTIF_TITLE_CHORE_DIGEST_ASSIGNEE,
+            message_key=const.TRANS_KEY_NOTIF_MESSAGE_CHORE_DIGEST_ASSIGNEE,
+            message_data={
+                "count": len(listed_entries),
+                "chore_list": ", ".join(
+                    f"{_DIGEST_MARKERS[entry.notif_type]} {entry.item_name}"
+                    for entry in listed_entries
+                ),
+            },
+            actions=self._digest_actions(
+                assignee_id, listed_entries, self.build_claim_action
+            ),
+            tag_type=const.NOTIFY_TAG_TYPE_DIGEST,
+            tag_identifiers=(assignee_id,),
+        )
+
+        # The digest supersedes earlier per-chore pushes for the same chores
+        status_tags = [
+            self._build_assignee_chore_status_tag(assignee_id, entry.item_id)
+            for entry in listed_entries
+            if self._get_chore_notification_record(assignee_id, entry.item_id)
+        ]
+        if status_tags:
+            await asyncio.gather(
+                *[
+                    self.clear_notification_for_assignee(assignee_id, tag)
+                    for tag in status_tags
+                ]
+            )
+
+        # Approver copy covers overdue chores
+        overdue_entries = [
+            entry for entry in listed_entries if entry.notif_type == "overdue"
+        ]
+        if overdue_entries:
+            if len(overdue_entries) == 1:
+                chore_id = overdue_entries[0].item_id
+                approver_actions = [
+                    *self.build_complete_action(assignee_id, chore_id, self.entry_id),
+                    *self.build_skip_action(assignee_id, chore_id, self.entry_id),
+                    *self.build_remind_action(assignee_id, chore_id, self.entry_id),
+                ]
+            else:
+                approver_actions = self._digest_actions(
+                    assignee_id, overdue_entries, self.build_complete_action
+                )
+            await self.notify_approvers_translated(
+                assignee_id,
+                title_key=const.TRANS_KEY_NOTIF_TITLE_CHORE_DIGEST_APPROVER,
+                message_key=const.TRANS_KEY_NOTIF_MESSAGE_CHORE_DIGEST_APPROVER,
+                message_data={
+                    "assignee_name": overdue_entries[0].payload.get("user_name", ""),
+                    "count": len(overdue_entries),
+                    "chore_list": ", ".join(
+                        entry.item_name for entry in overdue_entries
+                    ),
+                },
+                actions=approver_actions,
+                tag_type=const.NOTIFY_TAG_TYPE_DIGEST,
+                tag_identifiers=(assignee_id, "approver"),
+            )
+
+        const.LOGGER.debug(
+            "NotificationManager: Sent digest of %d chore(s) to assignee=%s",
+            len(listed_entries),
+            assignee_id,
+        )
+
+    def _digest_actions(
+        self,
+        assignee_id: str,
+        entries: list[_DigestEntry],
+        build_action: Callable[[str, str, str], list[dict[str, str]]],
+    ) -> list[dict[str, str]]:
+        """Return one action button per digest chore, titled with its name."""
+        return [
+            {**action, const.NOTIFY_TITLE_DETAIL: entry.item_name}
+            for entry in entries[: const.NOTIFY_DIGEST_MAX_ACTIONS]
+            for action in build_action(assignee_id, entry.item_id, self.entry_id)
+        ]
+
+    # =========================================================================
+    # Bulk Service Digests
+    # =========================================================================
+    #
+    # Bulk services (claim_chores, approve_chores, approve_rewards,
+    # apply_bonus_bulk) run in coordinator.batch(digest_notifications=True), so
+    # every signal they raise carries NOTIFY_EVENT_BULK_DIGEST. The claim,
+    # approval, reward and bonus handlers still clear what they supersede, but
+    # hold their push until the batch flushes. Then each assignee's approvers
+    # get one message for NOTIFY_DIGEST_MIN_ENTRIES or more claims, and the
+    # assignee one message for that many approvals, rewards and bonuses;
+    # smaller groups are replayed as the regular per-item notifications.
+
+    def _hold_for_bulk_digest(
+        self, notif_type: str, payload: dict[str, Any], item_id: str, item_name: str
+    ) -> bool:
+        """Hold a claim/approval notification for the open bulk batch.
+
+        Args:
+            notif_type: "chore_claimed", "chore_approved", "reward_approved"
+                or "bonus_applied"
+            payload: The signal payload, replayed if no digest is sent
+            item_id: Chore, reward or bonus the notification is about
+            item_name: Display name for the digest line
+
+        Returns:
+            True if the notification was held and the handler should stop.
+        """
+        if (
+            not payload.get(const.NOTIFY_EVENT_BULK_DIGEST)
+            or not self.coordinator.in_batch
+        ):
+            return False
+
+        self._bulk_entries.setdefault(payload.get("user_id", ""), []).append(
+            _DigestEntry(
+                notif_type=notif_type,
+                item_id=item_id,
+                item_name=item_name,
+                payload=payload,
+            )
+        )
+        self.coordinator.async_call_after_batch(self._on_bulk_batch_flushed)
+        return True
+
+    @callback
+    def _on_bulk_batch_flushed(self) -> None:
+        """Send the notifications held while the bulk batch was open."""
+        self.hass.async_create_task(self._async_send_bulk_digests())
+
+    async def _async_send_bulk_digests(self) -> None:
+        """Send merged claim/update messages per assignee, or replay singles."""
+        held_entries, self._bulk_entries = self._bulk_entries, {}
+        if not held_entries:
+            return
+
+        handlers = {
+            "chore_claimed": self._handle_chore_claimed,
+            "chore_approved": self._handle_chore_points_awarded,
+            "reward_approved": self._handle_reward_approved,
+            "bonus_applied": self._handle_bonus_applied,
+        }
+        sends: list[Any] = []
+        for assignee_id, entries in held_entries.items():
+            claims = [e for e in entries if e.notif_type == "chore_claimed"]
+            updates = [e for e in entries if e.notif_type != "chore_claimed"]
+            for group, send_digest in (
+                (claims, self._send_bulk_claim_digest),
+                (updates, self._send_bulk_update_digest),
+            ):
+                if len(group) >= const.NOTIFY_DIGEST_MIN_ENTRIES:
+                    sends.append(send_digest(assignee_id, group))
+                    continue
+                sends.extend(
+                    handlers[entry.notif_type](
+                        {**entry.payload, const.NOTIFY_EVENT_BULK_DIGEST: False}
+                    )
+                    for entry in group
+                )
+
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                const.LOGGER.warning("Failed to send bulk notification: %s", result)
+
+    async def _send_bulk_claim_digest(
+        self, assignee_id: str, entries: list[_DigestEntry]
+    ) -> None:
+        """Send approvers one message for an assignee's bulk claims."""
+        await self.notify_approvers_translated(
+            assignee_id,
+            title_key=const.TRANS_KEY_NOTIF_TITLE_BULK_CLAIMED_APPROVER,
+            message_key=const.TRANS_KEY_NOTIF_MESSAGE_BULK_CLAIMED_APPROVER,
+            message_data={
+                "assignee_name": entries[0].payload.get("user_name", ""),
+                "count": len(entries),
+                "chore_list": ", ".join(entry.item_name for entry in entries),
+            },
+            actions=self._digest_actions(
+                assignee_id, entries, self.build_approve_action
+            ),
+            tag_type=const.NOTIFY_TAG_TYPE_DIGEST,
+            tag_identifiers=(assignee_id, "claimed"),
+        )
+
+    async def _send_bulk_update_digest(
+        self, assignee_id: str, entries: list[_DigestEntry]
+    ) -> None:
+        """Send an assignee one message for bulk approvals, rewards and bonuses."""
+        lines = []
+        for entry in entries:
+            points = entry.payload.get(
+                "points_awarded", entry.payload.get("points", 0)
+            )
+            line = f"{_BULK_DIGEST_MARKERS[entry.notif_type]} {entry.item_name}"
+            lines.append(f"{line} (+{points})" if points else line)
+
+        await self.notify_assignee_translated(
+            assignee_id,
+            title_key=const.TRANS_KEY_NOTIF_TITLE_BULK_UPDATES_ASSIGNEE,
+            message_key=const.TRANS_KEY_NOTIF_MESSAGE_BULK_UPDATES_ASSIGNEE,
+            message_data={"count": len(entries), "item_list": ", ".join(lines)},
+        )
+
     # =========================================================================
     # DELETED Event Handlers - Clear Ghost Notifications (Phase 7.3.7)
     # =========================================================================
@@ -3153,6 +4102,7 @@ class NotificationManager(BaseManager):
 
         # Clean up notification records in our bucket (Schedule-Lock janitor)
         self._cleanup_chore_notifications(chore_id)
+        self._discard_reminders(item_id=chore_id)
 
         # Clear notifications for each assignee that had this chore assigned
         for assignee_id in assigned_assignees:
@@ -3194,6 +4144,7 @@ class NotificationManager(BaseManager):
             reward_name,
             reward_id,
         )
+        self._discard_reminders(item_id=reward_id)
 
         # Clear reward-related approver notifications for all assignees.
         # Active reward claim/approval workflows use STATUS tags today, while
@@ -3240,6 +4191,7 @@ class NotificationManager(BaseManager):
 
         # Clean up notification records in our bucket (Schedule-Lock janitor)
         self._cleanup_assignee_chore_notifications(assignee_id)
+        self._discard_reminders(assignee_id=assignee_id)
 
         const.LOGGER.debug(
             "Clearing all notifications for deleted assignee '%s' (id=%s)",
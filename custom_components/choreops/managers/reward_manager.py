@@ -173,8 +173,10 @@ class RewardManager(BaseManager):
         assignee_info: UserData = cast(
             "UserData", self.coordinator.assignees_data.get(assignee_id, {})
         )
+        created = const.DATA_USER_REWARD_DATA not in assignee_info
         reward_data = assignee_info.setdefault(const.DATA_USER_REWARD_DATA, {})
         if create and reward_id not in reward_data:
+            created = True
             reward_data[reward_id] = {
                 const.DATA_USER_REWARD_DATA_NAME: cast(
                     "RewardData", self.coordinator.rewards_data.get(reward_id, {})
@@ -193,6 +195,8 @@ class RewardManager(BaseManager):
                     const.DATA_USER_REWARD_DATA_PERIODS_YEARLY: {},
                 },
             }
+        if created and assignee_id in self.coordinator.assignees_data:
+            self.coordinator._mark_changed({const.DATA_USERS: [assignee_id]})
         return cast("dict[str, Any]", reward_data.get(reward_id, {}))
 
     def _ensure_assignee_structures(
@@ -226,6 +230,7 @@ class RewardManager(BaseManager):
             assignee_info[
                 const.DATA_USER_REWARD_PERIODS
             ] = {}  # Tenant populates sub-keys
+            self.coordinator._mark_changed({const.DATA_USERS: [assignee_id]})
 
         # Per-reward periods structure (if reward_id provided)
         if reward_id:
@@ -239,6 +244,7 @@ class RewardManager(BaseManager):
                 assignee_reward_data[
                     const.DATA_USER_REWARD_DATA_PERIODS
                 ] = {}  # Tenant populates sub-keys
+                self.coordinator._mark_changed({const.DATA_USERS: [assignee_id]})
 
     def get_pending_approvals(self) -> list[dict[str, Any]]:
         """Compute pending reward approvals dynamically from assignee reward data.
@@ -843,6 +849,8 @@ class RewardManager(BaseManager):
 
         # Store in coordinator data
         self.coordinator._data[const.DATA_REWARDS][internal_id] = reward_data
+        self.coordinator.invalidate_name_index(const.ITEM_TYPE_REWARD)
+        self.coordinator.update_assignment_index(const.ITEM_TYPE_REWARD, internal_id)
         self.coordinator._persist(immediate=immediate_persist)
         self.coordinator.async_update_listeners()
 
@@ -902,6 +910,8 @@ class RewardManager(BaseManager):
 
         # Store updated reward
         self.coordinator._data[const.DATA_REWARDS][reward_id] = updated_reward
+        self.coordinator.invalidate_name_index(const.ITEM_TYPE_REWARD)
+        self.coordinator.update_assignment_index(const.ITEM_TYPE_REWARD, reward_id)
         self.coordinator._persist(immediate=immediate_persist)
         self.coordinator.async_update_listeners()
 
@@ -973,6 +983,8 @@ class RewardManager(BaseManager):
                     "Removed orphaned reward '%s' from assignee reward data", rid
                 )
 
+        self.coordinator.invalidate_name_index(const.ITEM_TYPE_REWARD)
+        self.coordinator.update_assignment_index(const.ITEM_TYPE_REWARD, reward_id)
         self.coordinator._persist(immediate=immediate_persist)
         self.coordinator.async_update_listeners()
 
@@ -104,9 +104,19 @@ class StatisticsManager(BaseManager):
         """Get the StatisticsEngine from coordinator."""
         return self._coordinator.stats
 
-    def _emit_stats_updated(self, assignee_id: str) -> None:
-        """Emit a post-statistics update signal for an assignee."""
-        self.emit(const.SIGNAL_SUFFIX_STATS_UPDATED, user_id=assignee_id)
+    def _emit_stats_updated(
+        self,
+        assignee_id: str,
+        family: str = const.GAMIFICATION_SIGNAL_FAMILY_CHORES,
+    ) -> None:
+        """Emit a post-statistics update signal for an assignee.
+
+        Args:
+            assignee_id: Assignee whose statistics changed.
+            family: Gamification signal family (GAMIFICATION_SIGNAL_FAMILY_*) of
+                the write, so dependents can skip unrelated targets.
+        """
+        self.emit(const.SIGNAL_SUFFIX_STATS_UPDATED, user_id=assignee_id, family=family)
 
     async def async_setup(self) -> None:
         """Set up event subscriptions for statistics tracking.
@@ -383,15 +393,15 @@ class StatisticsManager(BaseManager):
         self._stats_engine.prune_history(periods_data, self.get_retention_config())
 
         # === 5) Persist changes ===
-        self._coordinator._persist()
+        self._coordinator._persist(changed={const.DATA_USERS: [assignee_id]})
 
         # === 6) Refresh presentation cache (BEFORE notifying sensors) ===
-        # Must refresh cache synchronously before async_set_updated_data() triggers sensor reads
+        # Must refresh cache synchronously before the listener update triggers sensor reads
         self._refresh_point_cache(assignee_id)
 
         # === 7) Notify Home Assistant of data update ===
-        self._coordinator.async_set_updated_data(self._coordinator._data)
-        self._emit_stats_updated(assignee_id)
+        self._coordinator.async_set_updated_data_for({const.DATA_USERS: [assignee_id]})
+        self._emit_stats_updated(assignee_id, const.GAMIFICATION_SIGNAL_FAMILY_POINTS)
 
         const.LOGGER.debug(
             "StatisticsManager._on_points_changed: assignee=%s, delta=%.2f, source=%s",
@@ -442,7 +452,9 @@ class StatisticsManager(BaseManager):
         ):
             # Transactional Flush: cache was refreshed inside _record_chore_transaction,
             # now notify sensors that data has changed
-            self._coordinator.async_set_updated_data(self._coordinator._data)
+            self._coordinator.async_set_updated_data_for(
+                {const.DATA_USERS: [assignee_id], const.DATA_CHORES: [chore_id]}
+            )
             const.LOGGER.debug(
                 "StatisticsManager._on_chore_approved: assignee=%s, chore=%s",
                 assignee_id,
@@ -469,7 +481,9 @@ class StatisticsManager(BaseManager):
         if self._record_chore_transaction(
             assignee_id, chore_id, increments, effective_date
         ):
-            self._coordinator.async_set_updated_data(self._coordinator._data)
+            self._coordinator.async_set_updated_data_for(
+                {const.DATA_USERS: [assignee_id], const.DATA_CHORES: [chore_id]}
+            )
             const.LOGGER.debug(
                 "StatisticsManager._on_chore_points_awarded: assignee=%s, chore=%s, points=%.2f",
                 assignee_id,
@@ -606,10 +620,14 @@ class StatisticsManager(BaseManager):
                 self._refresh_chore_cache(assignee_id)
 
         # Persist once after all assignees updated
-        self._coordinator._persist()
+        self._coordinator._persist(
+            changed={const.DATA_USERS: assignee_ids, const.DATA_CHORES: [chore_id]}
+        )
 
         # Transactional Flush: notify sensors that all batch updates are complete
-        self._coordinator.async_set_updated_data(self._coordinator._data)
+        self._coordinator.async_set_updated_data_for(
+            {const.DATA_USERS: assignee_ids, const.DATA_CHORES: [chore_id]}
+        )
         for assignee_id in assignee_ids:
             if assignee_id:
                 self._emit_stats_updated(assignee_id)
@@ -632,7 +650,9 @@ class StatisticsManager(BaseManager):
         ):
             # Transactional Flush: cache was refreshed inside _record_chore_transaction,
             # now notify sensors that data has changed
-            self._coordinator.async_set_updated_data(self._coordinator._data)
+            self._coordinator.async_set_updated_data_for(
+                {const.DATA_USERS: [assignee_id], const.DATA_CHORES: [chore_id]}
+            )
             const.LOGGER.debug(
                 "StatisticsManager._on_chore_claimed: assignee=%s, chore=%s",
                 assignee_id,
@@ -651,7 +671,9 @@ class StatisticsManager(BaseManager):
         ):
             # Transactional Flush: cache was refreshed inside _record_chore_transaction,
             # now notify sensors that data has changed
-            self._coordinator.async_set_updated_data(self._coordinator._data)
+            self._coordinator.async_set_updated_data_for(
+                {const.DATA_USERS: [assignee_id], const.DATA_CHORES: [chore_id]}
+            )
             const.LOGGER.debug(
                 "StatisticsManager._on_chore_disapproved: assignee=%s, chore=%s",
                 assignee_id,
@@ -712,7 +734,9 @@ class StatisticsManager(BaseManager):
         ):
             # Transactional Flush: cache was refreshed inside _record_chore_transaction,
             # now notify sensors that data has changed
-            self._coordinator.async_set_updated_data(self._coordinator._data)
+            self._coordinator.async_set_updated_data_for(
+                {const.DATA_USERS: [assignee_id], const.DATA_CHORES: [chore_id]}
+            )
             const.LOGGER.debug(
                 "StatisticsManager._on_chore_overdue: assignee=%s, chore=%s",
                 assignee_id,
@@ -757,7 +781,9 @@ class StatisticsManager(BaseManager):
                 const.DATA_USER_CHORE_DATA_PERIOD_OVERDUE_DURATION_MAX_SECONDS: overdue_duration_seconds,
             },
         ):
-            self._coordinator.async_set_updated_data(self._coordinator._data)
+            self._coordinator.async_set_updated_data_for(
+                {const.DATA_USERS: [assignee_id], const.DATA_CHORES: [chore_id]}
+            )
             const.LOGGER.debug(
                 "StatisticsManager._on_chore_overdue_resolved: assignee=%s, chore=%s, duration=%s",
                 assignee_id,
@@ -856,7 +882,9 @@ class StatisticsManager(BaseManager):
         if self._record_chore_transaction(assignee_id, chore_id, increments):
             # Transactional Flush: cache was refreshed inside _record_chore_transaction,
             # now notify sensors that data has changed
-            self._coordinator.async_set_updated_data(self._coordinator._data)
+            self._coordinator.async_set_updated_data_for(
+                {const.DATA_USERS: [assignee_id], const.DATA_CHORES: [chore_id]}
+            )
             const.LOGGER.debug(
                 "StatisticsManager._on_chore_missed: assignee=%s, chore=%s",
                 assignee_id,
@@ -884,7 +912,9 @@ class StatisticsManager(BaseManager):
         if assignee_id:
             # Transactional Flush: Refresh cache synchronously, then notify sensors
             self._refresh_chore_cache(assignee_id)
-            self._coordinator.async_set_updated_data(self._coordinator._data)
+            self._coordinator.async_set_updated_data_for(
+                {const.DATA_USERS: [assignee_id], const.DATA_CHORES: [chore_id]}
+            )
             const.LOGGER.debug(
                 "StatisticsManager._on_chore_status_reset: assignee=%s, chore=%s",
                 assignee_id,
@@ -915,7 +945,9 @@ class StatisticsManager(BaseManager):
         if assignee_id:
             # Transactional Flush: Refresh cache synchronously, then notify sensors
             self._refresh_chore_cache(assignee_id)
-            self._coordinator.async_set_updated_data(self._coordinator._data)
+            self._coordinator.async_set_updated_data_for(
+                {const.DATA_USERS: [assignee_id], const.DATA_CHORES: [chore_id]}
+            )
             const.LOGGER.debug(
                 "StatisticsManager._on_chore_undone: assignee=%s, chore=%s",
                 assignee_id,
@@ -999,11 +1031,11 @@ class StatisticsManager(BaseManager):
             return
 
         # Transactional Flush: Persist, refresh caches synchronously, then notify sensors
-        self._coordinator._persist()
+        self._coordinator._persist(changed={const.DATA_USERS: [assignee_id]})
         # Point cache was already refreshed by _on_points_changed (EconomyManager.withdraw)
         # Reward cache needs update for reward-specific stats (claim counts, etc.)
         self._refresh_reward_cache(assignee_id)
-        self._coordinator.async_set_updated_data(self._coordinator._data)
+        self._coordinator.async_set_updated_data_for({const.DATA_USERS: [assignee_id]})
 
         const.LOGGER.debug(
             "StatisticsManager._on_reward_approved: assignee=%s, reward=%s, cost=%.2f",
@@ -1060,9 +1092,9 @@ class StatisticsManager(BaseManager):
             return
 
         # Transactional Flush: Persist, refresh cache synchronously, then notify sensors
-        self._coordinator._persist()
+        self._coordinator._persist(changed={const.DATA_USERS: [assignee_id]})
         self._refresh_reward_cache(assignee_id)
-        self._coordinator.async_set_updated_data(self._coordinator._data)
+        self._coordinator.async_set_updated_data_for({const.DATA_USERS: [assignee_id]})
 
         const.LOGGER.debug(
             "StatisticsManager._on_reward_claimed: assignee=%s, reward=%s",
@@ -1118,9 +1150,9 @@ class StatisticsManager(BaseManager):
             return
 
         # Transactional Flush: Persist, refresh cache synchronously, then notify sensors
-        self._coordinator._persist()
+        self._coordinator._persist(changed={const.DATA_USERS: [assignee_id]})
         self._refresh_reward_cache(assignee_id)
-        self._coordinator.async_set_updated_data(self._coordinator._data)
+        self._coordinator.async_set_updated_data_for({const.DATA_USERS: [assignee_id]})
 
         const.LOGGER.debug(
             "StatisticsManager._on_reward_disapproved: assignee=%s, reward=%s",
@@ -1205,8 +1237,8 @@ class StatisticsManager(BaseManager):
         )
 
         # Persist and notify
-        self._coordinator._persist()
-        self._coordinator.async_set_updated_data(self._coordinator._data)
+        self._coordinator._persist(changed={const.DATA_USERS: [assignee_id]})
+        self._coordinator.async_set_updated_data_for({const.DATA_USERS: [assignee_id]})
 
         const.LOGGER.debug(
             "StatisticsManager._on_badge_earned: assignee=%s, badge=%s",
@@ -1296,8 +1328,8 @@ class StatisticsManager(BaseManager):
         self._stats_engine.prune_history(periods, self.get_retention_config())
 
         # Persist and notify
-        self._coordinator._persist()
-        self._coordinator.async_set_updated_data(self._coordinator._data)
+        self._coordinator._persist(changed={const.DATA_USERS: [assignee_id]})
+        self._coordinator.async_set_updated_data_for({const.DATA_USERS: [assignee_id]})
 
         const.LOGGER.debug(
             "StatisticsManager._on_bonus_applied: assignee=%s, bonus=%s (%s), points=%.2f",
@@ -1389,8 +1421,8 @@ class StatisticsManager(BaseManager):
         self._stats_engine.prune_history(periods, self.get_retention_config())
 
         # Persist and notify
-        self._coordinator._persist()
-        self._coordinator.async_set_updated_data(self._coordinator._data)
+        self._coordinator._persist(changed={const.DATA_USERS: [assignee_id]})
+        self._coordinator.async_set_updated_data_for({const.DATA_USERS: [assignee_id]})
 
         const.LOGGER.debug(
             "StatisticsManager._on_penalty_applied: assignee=%s, penalty=%s (%s), points=%.2f",
@@ -1579,7 +1611,10 @@ class StatisticsManager(BaseManager):
 
         # Optionally persist and refresh cache
         if persist:
-            self._coordinator._persist()
+            # Name the chore so only its cached dashboard rows go stale
+            self._coordinator._persist(
+                changed={const.DATA_USERS: [assignee_id], const.DATA_CHORES: [chore_id]}
+            )
             self._refresh_chore_cache(assignee_id)
             self._emit_stats_updated(assignee_id)
 
@@ -1706,9 +1741,11 @@ class StatisticsManager(BaseManager):
 
         # Optionally persist and refresh cache
         if persist:
-            self._coordinator._persist()
+            self._coordinator._persist(changed={const.DATA_USERS: [assignee_id]})
             self._refresh_reward_cache(assignee_id)
-            self._emit_stats_updated(assignee_id)
+            self._emit_stats_updated(
+                assignee_id, const.GAMIFICATION_SIGNAL_FAMILY_POINTS
+            )
 
         return True
 
@@ -2302,7 +2339,11 @@ class StatisticsManager(BaseManager):
         start_iso: str,
         end_iso: str,
     ) -> dict[str, int | float]:
-        """Sum selected metrics across daily period keys in a date range."""
+        """Sum selected metrics across daily period keys in a date range.
+
+        Reads go through the engine's memoized prefix-sum index, so repeated
+        report queries cost two binary searches per metric.
+        """
         parsed_start = dt_parse(start_iso)
         parsed_end = dt_parse(end_iso)
         if not isinstance(parsed_start, datetime) or not isinstance(
@@ -2317,19 +2358,8 @@ class StatisticsManager(BaseManager):
         if not isinstance(daily_data, dict):
             return dict.fromkeys(metrics, 0)
 
-        sums: dict[str, int | float] = dict.fromkeys(metrics, 0)
-        for day_key, bucket in daily_data.items():
-            if not isinstance(day_key, str) or not isinstance(bucket, dict):
-                continue
-            if day_key < start_key or day_key > end_key:
-                continue
-
-            for metric in metrics:
-                value = bucket.get(metric, 0)
-                if isinstance(value, (int, float)):
-                    sums[metric] = sums[metric] + value
-
-        return sums
+        index = self._stats_engine.get_daily_range_index(daily_data)
+        return {metric: index.sum(metric, start_key, end_key) for metric in metrics}
 
     def _max_daily_metric(
         self,
@@ -2353,18 +2383,8 @@ class StatisticsManager(BaseManager):
         if not isinstance(daily_data, dict):
             return 0
 
-        max_value: int | float = 0
-        for day_key, bucket in daily_data.items():
-            if not isinstance(day_key, str) or not isinstance(bucket, dict):
-                continue
-            if day_key < start_key or day_key > end_key:
-                continue
-
-            value = bucket.get(metric, 0)
-            if isinstance(value, (int, float)):
-                max_value = max(max_value, value)
-
-        return max_value
+        index = self._stats_engine.get_daily_range_index(daily_data)
+        return index.max(metric, start_key, end_key)
 
     def _get_assignee(self, assignee_id: str) -> dict[str, Any] | None:
         """Get assignee data by ID.
@@ -134,14 +134,28 @@ class SystemManager(BaseManager):
         - UIManager: bump past datetime helpers
         """
         const.LOGGER.debug("SystemManager: Midnight rollover triggered")
-        self.emit(const.SIGNAL_SUFFIX_MIDNIGHT_ROLLOVER)
-        self._stamp_midnight_processed()
+        self.coordinator.config_entry.async_create_background_task(
+            self.hass,
+            self._async_emit_midnight_rollover(),
+            f"{const.DOMAIN}_midnight_rollover",
+        )
+
+    async def _async_emit_midnight_rollover(self, *, catch_up: bool = False) -> None:
+        """Run one rollover fan-out as a single coordinator batch.
+
+        Every manager's nightly resets, rescheduling and the processed stamp
+        flush as one storage write and one entity refresh.
+        """
+        payload: dict[str, Any] = {"catch_up": True} if catch_up else {}
+        async with self.coordinator.batch():
+            self.emit(const.SIGNAL_SUFFIX_MIDNIGHT_ROLLOVER, **payload)
+            self._stamp_midnight_processed()
 
     def _stamp_midnight_processed(self) -> None:
         """Persist the timestamp of the most recent midnight rollover handling."""
         meta = self.coordinator._data.setdefault(const.DATA_META, {})
         meta[const.DATA_META_LAST_MIDNIGHT_PROCESSED] = dt_util.utcnow().isoformat()
-        self.coordinator._persist()
+        self.coordinator._persist(changed={const.DATA_META: None})
 
     def _get_last_midnight_processed_utc(self) -> datetime | None:
         """Return parsed last-midnight timestamp in UTC, or None if unavailable."""
@@ -185,8 +199,7 @@ class SystemManager(BaseManager):
             last_processed_utc.isoformat() if last_processed_utc else "missing",
             today_midnight_utc.isoformat(),
         )
-        self.emit(const.SIGNAL_SUFFIX_MIDNIGHT_ROLLOVER, catch_up=True)
-        self._stamp_midnight_processed()
+        await self._async_emit_midnight_rollover(catch_up=True)
 
     # =========================================================================
     # Data Integrity (Boot Cascade - called from Coordinator)
@@ -309,7 +322,8 @@ class SystemManager(BaseManager):
         const.LOGGER.info("SystemManager: Data integrity verified")
 
         # 3. THE BATON PASS: Data is now clean and safe
-        # Signal domain managers to begin their initialization
+        # Index final assignments, then signal domain managers to initialize
+        self.coordinator.rebuild_assignment_indexes()
         self.emit(const.SIGNAL_SUFFIX_DATA_READY)
 
     async def run_startup_safety_net(self) -> int:
@@ -877,7 +891,8 @@ class SystemManager(BaseManager):
         # =====================================================================
         # 4F: Call Managers (Based on Scope + Item Type)
         # =====================================================================
-        await self._call_data_reset_managers(scope, user_id, item_type, item_id)
+        async with self.coordinator.batch():
+            await self._call_data_reset_managers(scope, user_id, item_type, item_id)
 
         # =====================================================================
         # 4G: Send Notification
@@ -17,7 +17,9 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, Literal
 
+from homeassistant.core import Event, callback
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.label_registry import EVENT_LABEL_REGISTRY_UPDATED
 from homeassistant.util import dt as dt_util
 
 from .. import const
@@ -43,6 +45,15 @@ class HelperShardRuntimePlan:
     last_reconciliation_outcome: str
 
 
+@dataclass(slots=True)
+class ChoreRowCacheEntry:
+    """Memoized dashboard chore row for one user and chore."""
+
+    revision: tuple[tuple[int, int, int], tuple[int, int, int], str | None]
+    valid_until: datetime
+    row: dict[str, Any] | None
+
+
 class UIManager(BaseManager):
     """Manager for UI features including translation sensors and datetime helpers.
 
@@ -77,6 +88,10 @@ class UIManager(BaseManager):
             const.HELPER_SHARD_FAMILY_CHORES: {}
         }
 
+        # Dashboard chore rows keyed by user ID then chore ID. Shared by the
+        # dashboard helper, its chore shard helpers and shard planning.
+        self._chore_row_cache: dict[str, dict[str, ChoreRowCacheEntry]] = {}
+
     async def async_setup(self) -> None:
         """Set up the UI manager.
 
@@ -105,7 +120,18 @@ class UIManager(BaseManager):
         self.listen(const.SIGNAL_SUFFIX_REWARD_STATUS_RESET, self._on_reward_changed)
 
         # Listen for midnight rollover to bump datetime helpers
-        self.listen(const.SIGNAL_SUFFIX_MIDNIGHT_ROLLOVER, self._on_midnight_rollover)
+        self.listen(
+            const.SIGNAL_SUFFIX_MIDNIGHT_ROLLOVER,
+            self._on_midnight_rollover,
+            track_in_batch=True,
+        )
+
+        # Chore rows embed friendly label names; drop them when labels change
+        self.coordinator.config_entry.async_on_unload(
+            self.hass.bus.async_listen(
+                EVENT_LABEL_REGISTRY_UPDATED, self._on_label_registry_updated
+            )
+        )
 
         await self.async_prepare_startup_chore_shard_plans()
 
@@ -143,8 +169,14 @@ class UIManager(BaseManager):
         user_id = payload.get(const.DATA_USER_ID)
         if isinstance(user_id, str) and user_id:
             self.clear_helper_shard_plan(user_id, const.HELPER_SHARD_FAMILY_CHORES)
+            self._chore_row_cache.pop(user_id, None)
             self._remove_chore_shard_entities_for_user(user_id)
 
+    @callback
+    def _on_label_registry_updated(self, event: Event) -> None:
+        """Drop cached chore rows after a label is created, renamed or removed."""
+        self._chore_row_cache.clear()
+
     def _on_chore_changed(self, payload: dict[str, Any]) -> None:
         """Handle chore state change - mark pending approvals as changed.
 
@@ -344,6 +376,7 @@ class UIManager(BaseManager):
         """Clear runtime-only UI manager state on unload."""
         self._translation_sensors_created.clear()
         self._helper_shard_plans = {const.HELPER_SHARD_FAMILY_CHORES: {}}
+        self._chore_row_cache.clear()
         self._sensor_add_entities_callback = None
 
     def get_helper_shard_plan(
@@ -364,6 +397,10 @@ class UIManager(BaseManager):
         if family_plans is not None:
             family_plans.pop(user_id, None)
 
+    def get_chore_row_cache(self, user_id: str) -> dict[str, ChoreRowCacheEntry]:
+        """Return the mutable dashboard chore row cache for one user."""
+        return self._chore_row_cache.setdefault(user_id, {})
+
     def get_chore_shard_helper_eids(self, user_id: str) -> list[str]:
         """Return ordered chore shard helper entity IDs for one user."""
         plan = self.get_helper_shard_plan(user_id, const.HELPER_SHARD_FAMILY_CHORES)
@@ -94,6 +94,7 @@ class UserManager(BaseManager):
                 cleaned = True
 
         if cleaned:
+            self.coordinator.invalidate_user_views()
             self.coordinator._persist()
             const.LOGGER.debug(
                 "UserManager: Cleaned associated_user_ids for deleted assignment participant %s",
@@ -523,7 +524,9 @@ class UserManager(BaseManager):
 
         user_records = self._user_records()
         user_records[user_id] = user_record
+        self.coordinator.invalidate_user_views()
 
+        self.coordinator.invalidate_name_index(const.ITEM_TYPE_USER)
         self.coordinator._persist(immediate=immediate_persist)
         self.coordinator.async_update_listeners()
 
@@ -581,7 +584,9 @@ class UserManager(BaseManager):
             internal_id=user_id,
         )
         user_records[user_id] = normalized_user
+        self.coordinator.invalidate_user_views()
 
+        self.coordinator.invalidate_name_index(const.ITEM_TYPE_USER)
         self.coordinator._persist(immediate=immediate_persist)
         self.coordinator.async_update_listeners()
 
@@ -631,6 +636,8 @@ class UserManager(BaseManager):
         )
 
         del user_records[user_id]
+        self.coordinator.invalidate_user_views()
+        self.coordinator.remove_user_from_assignment_indexes(user_id)
 
         if can_be_assigned:
             remove_entities_by_item_id(
@@ -657,6 +664,7 @@ class UserManager(BaseManager):
                     user_id,
                 )
 
+        self.coordinator.invalidate_name_index(const.ITEM_TYPE_USER)
         self.coordinator._persist(immediate=immediate_persist)
 
         self.emit(
@@ -499,6 +499,7 @@ class AssigneeDashboardHelperChoresSelect(ChoreOpsSelectBase):
         """
         super().__init__(coordinator, entry)
         self._assignee_id = assignee_id
+        self._update_keys = frozenset({(const.DATA_USERS, assignee_id)})
         assignee_data: dict[str, Any] = cast(
             "dict[str, Any]", coordinator.assignees_data.get(assignee_id, {})
         )
@@ -87,7 +87,7 @@ from .helpers.entity_helpers import (
     should_create_workflow_buttons,
 )
 from .helpers.translation_helpers import load_dashboard_translation
-from .managers.ui_manager import HelperShardRuntimePlan
+from .managers.ui_manager import ChoreRowCacheEntry, HelperShardRuntimePlan
 from .sensor_legacy import (
     AssigneeBonusAppliedSensor,
     AssigneeChoreCompletionDailySensor,
@@ -883,6 +883,7 @@ class AssigneeChoreStatusSensor(ChoreOpsCoordinatorEntity, SensorEntity):
         self._assignee_id = assignee_id
         self._assignee_name = assignee_name
         self._chore_id = chore_id
+        self._update_keys = frozenset({(const.DATA_CHORES, chore_id)})
         self._chore_name = chore_name
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}_{chore_id}{const.SENSOR_KC_UID_SUFFIX_CHORE_STATUS_SENSOR}"
@@ -1424,6 +1425,7 @@ class AssigneePointsSensor(ChoreOpsCoordinatorEntity, SensorEntity):
 
         super().__init__(coordinator)
         self._assignee_id = assignee_id
+        self._update_keys = frozenset({(const.DATA_USERS, assignee_id)})
         self._assignee_name = assignee_name
         self._points_label = points_label
         self._points_icon = points_icon
@@ -1608,6 +1610,7 @@ class AssigneeChoresSensor(ChoreOpsCoordinatorEntity, SensorEntity):
         """
         super().__init__(coordinator)
         self._assignee_id = assignee_id
+        self._update_keys = frozenset({(const.DATA_USERS, assignee_id)})
         self._assignee_name = assignee_name
         self._attr_unique_id = (
             f"{entry.entry_id}_{assignee_id}{const.SENSOR_KC_UID_SUFFIX_CHORES_SENSOR}"
@@ -1899,6 +1902,7 @@ class AssigneeBadgesSensor(ChoreOpsCoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._entry = entry
         self._assignee_id = assignee_id
+        self._update_keys = frozenset({(const.DATA_USERS, assignee_id)})
         self._assignee_name = assignee_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}{const.SENSOR_KC_UID_SUFFIX_ASSIGNEE_BADGES_SENSOR}"
         self._attr_translation_placeholders = {
@@ -2239,6 +2243,12 @@ class AssigneeBadgeProgressSensor(ChoreOpsCoordinatorEntity, SensorEntity):
         self._assignee_id = assignee_id
         self._assignee_name = assignee_name
         self._badge_id = badge_id
+        self._update_keys = frozenset(
+            {
+                (const.DATA_USERS, assignee_id),
+                (const.DATA_BADGES, badge_id),
+            }
+        )
         self._badge_name = badge_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}_{badge_id}{const.SENSOR_KC_UID_SUFFIX_BADGE_PROGRESS_SENSOR}"
         self._attr_translation_placeholders = {
@@ -2637,6 +2647,7 @@ class SystemChoreSharedStateSensor(ChoreOpsCoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._entry = entry
         self._chore_id = chore_id
+        self._update_keys = frozenset({(const.DATA_CHORES, chore_id)})
         self._chore_name = chore_name
         self._attr_unique_id = f"{entry.entry_id}_{chore_id}{const.SENSOR_KC_UID_SUFFIX_SHARED_CHORE_GLOBAL_STATE_SENSOR}"
         self._attr_translation_placeholders = {
@@ -2899,6 +2910,12 @@ class AssigneeRewardStatusSensor(ChoreOpsCoordinatorEntity, SensorEntity):
         self._assignee_id = assignee_id
         self._assignee_name = assignee_name
         self._reward_id = reward_id
+        self._update_keys = frozenset(
+            {
+                (const.DATA_USERS, assignee_id),
+                (const.DATA_REWARDS, reward_id),
+            }
+        )
         self._reward_name = reward_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}_{reward_id}{const.SENSOR_KC_UID_SUFFIX_REWARD_STATUS_SENSOR}"
         self._attr_translation_placeholders = {
@@ -3676,6 +3693,12 @@ class AssigneeAchievementProgressSensor(ChoreOpsCoordinatorEntity, SensorEntity)
         self._assignee_id = assignee_id
         self._assignee_name = assignee_name
         self._achievement_id = achievement_id
+        self._update_keys = frozenset(
+            {
+                (const.DATA_USERS, assignee_id),
+                (const.DATA_ACHIEVEMENTS, achievement_id),
+            }
+        )
         self._achievement_name = achievement_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}_{achievement_id}{const.SENSOR_KC_UID_SUFFIX_ACHIEVEMENT_PROGRESS_SENSOR}"
         self._attr_native_unit_of_measurement = PERCENTAGE
@@ -3967,6 +3990,12 @@ class AssigneeChallengeProgressSensor(ChoreOpsCoordinatorEntity, SensorEntity):
         self._assignee_id = assignee_id
         self._assignee_name = assignee_name
         self._challenge_id = challenge_id
+        self._update_keys = frozenset(
+            {
+                (const.DATA_USERS, assignee_id),
+                (const.DATA_CHALLENGES, challenge_id),
+            }
+        )
         self._challenge_name = challenge_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}_{challenge_id}{const.SENSOR_KC_UID_SUFFIX_CHALLENGE_PROGRESS_SENSOR}"
         self._attr_native_unit_of_measurement = PERCENTAGE
@@ -4241,6 +4270,48 @@ def _build_chore_shard_payload(
     }
 
 
+def _pack_chore_shards(
+    chores_attr: list[dict[str, Any]],
+) -> list[list[dict[str, Any]]]:
+    """Greedily bin chore rows into shards below HELPER_SHARD_ENTER_BYTES.
+
+    Each sanitized row is serialized once. A shard payload's size is its empty
+    envelope plus the row sizes and one separator per extra row, which matches
+    the compact sort_keys serialization of the full payload byte for byte.
+    """
+    row_sizes = [
+        _serialized_payload_size(row)
+        for row in AssigneeDashboardHelperSensor._sanitize_dashboard_chore_rows(
+            chores_attr
+        )
+    ]
+    shard_groups: list[list[dict[str, Any]]] = []
+    current_group: list[dict[str, Any]] = []
+    current_rows_size = 0
+    envelope_size = _serialized_payload_size(_build_chore_shard_payload([], 1, 1))
+
+    for chore, row_size in zip(chores_attr, row_sizes, strict=True):
+        candidate_size = (
+            envelope_size + current_rows_size + row_size + len(current_group)
+        )
+        if current_group and candidate_size >= const.HELPER_SHARD_ENTER_BYTES:
+            shard_groups.append(current_group)
+            shard_number = len(shard_groups) + 1
+            envelope_size = _serialized_payload_size(
+                _build_chore_shard_payload([], shard_number, shard_number)
+            )
+            current_group = [chore]
+            current_rows_size = row_size
+        else:
+            current_group.append(chore)
+            current_rows_size += row_size
+
+    if current_group:
+        shard_groups.append(current_group)
+
+    return shard_groups
+
+
 def build_chore_shard_plan(
     hass: HomeAssistant,
     coordinator: ChoreOpsDataCoordinator,
@@ -4316,28 +4387,7 @@ def build_chore_shard_plan(
             last_reconciliation_outcome="planned_mode=inline",
         )
 
-    shard_groups: list[list[dict[str, Any]]] = []
-    current_group: list[dict[str, Any]] = []
-
-    for chore in chores_attr:
-        candidate_group = [*current_group, chore]
-        candidate_payload = _build_chore_shard_payload(
-            candidate_group,
-            len(shard_groups) + 1,
-            len(shard_groups) + 1,
-        )
-        if (
-            current_group
-            and _serialized_payload_size(candidate_payload)
-            >= const.HELPER_SHARD_ENTER_BYTES
-        ):
-            shard_groups.append(current_group)
-            current_group = [chore]
-        else:
-            current_group = candidate_group
-
-    if current_group:
-        shard_groups.append(current_group)
+    shard_groups = _pack_chore_shards(chores_attr)
 
     placeholder_eids = [
         f"sensor.choreops_chore_shard_{index}"
@@ -4390,6 +4440,7 @@ class AssigneeDashboardChoreShardSensor(ChoreOpsCoordinatorEntity, SensorEntity)
         super().__init__(coordinator)
         self._entry = entry
         self._assignee_id = assignee_id
+        self._update_keys = frozenset({(const.DATA_USERS, assignee_id)})
         self._assignee_name = assignee_name
         self._shard_index = shard_index
         self._attr_unique_id = coordinator.ui_manager.get_chore_shard_unique_id(
@@ -4587,6 +4638,7 @@ class AssigneeDashboardHelperSensor(ChoreOpsCoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._entry = entry
         self._assignee_id = assignee_id
+        self._update_keys = frozenset({(const.DATA_USERS, assignee_id)})
         self._assignee_name = assignee_name
         self._points_label = points_label
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}{const.SENSOR_KC_UID_SUFFIX_UI_DASHBOARD_HELPER}"
@@ -4665,18 +4717,32 @@ class AssigneeDashboardHelperSensor(ChoreOpsCoordinatorEntity, SensorEntity):
         entity_registry,
         included_chore_ids: set[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Build chore rows for this helper, optionally restricted to specific IDs."""
+        """Build chore rows for this helper, optionally restricted to specific IDs.
+
+        Rows are memoized in the UIManager row cache shared with the chore shard
+        helpers and shard planning. A cached row is reused while the chore's data
+        revision, the assignee's state revision for that chore (claims,
+        approvals, resets and other user-scoped writes) and the entity ID are
+        unchanged, and before its next time boundary (due window start, due
+        date, local midnight or the Monday 7am cutoff). Label registry updates
+        clear the cache.
+        """
         assignee_info: AssigneeData = cast(
             "AssigneeData", self.coordinator.assignees_data.get(self._assignee_id, {})
         )
         chores_attr: list[dict[str, Any]] = []
+        row_cache = self.coordinator.ui_manager.get_chore_row_cache(self._assignee_id)
+        now_local = dt_now_local()
 
-        for chore_id, chore_info in self.coordinator.chores_data.items():
+        chores_data = self.coordinator.chores_data
+        assigned_chore_ids = self.coordinator.get_assignment_index(
+            const.ITEM_TYPE_CHORE
+        ).item_ids_for(self._assignee_id)
+        for chore_id in assigned_chore_ids:
             if included_chore_ids is not None and chore_id not in included_chore_ids:
                 continue
-            if self._assignee_id not in chore_info.get(
-                const.DATA_CHORE_ASSIGNED_USER_IDS, []
-            ):
+            chore_info = chores_data.get(chore_id)
+            if chore_info is None:
                 continue
 
             chore_eid = None
@@ -4689,12 +4755,40 @@ class AssigneeDashboardHelperSensor(ChoreOpsCoordinatorEntity, SensorEntity):
                     "sensor", const.DOMAIN, unique_id
                 )
 
-            chore_attrs = self._calculate_chore_attributes(
-                chore_id, chore_info, assignee_info, chore_eid
+            revision = (
+                self.coordinator.get_data_revision(const.DATA_CHORES, chore_id),
+                self.coordinator.get_assignee_chore_revision(
+                    self._assignee_id, chore_id
+                ),
+                chore_eid,
             )
+            cached_row = row_cache.get(chore_id)
+            if (
+                cached_row is not None
+                and cached_row.revision == revision
+                and now_local < cached_row.valid_until
+            ):
+                chore_attrs = cached_row.row
+            else:
+                chore_attrs = self._calculate_chore_attributes(
+                    chore_id, chore_info, assignee_info, chore_eid
+                )
+                row_cache[chore_id] = ChoreRowCacheEntry(
+                    revision=revision,
+                    valid_until=self._get_chore_row_valid_until(chore_id, now_local),
+                    row=chore_attrs,
+                )
             if chore_attrs:
                 chores_attr.append(chore_attrs)
 
+        if included_chore_ids is None and len(row_cache) > len(chores_attr):
+            # Drop rows for chores that were deleted or unassigned
+            live_chore_ids = {chore["_chore_id"] for chore in chores_attr}
+            for stale_chore_id in [
+                chore_id for chore_id in row_cache if chore_id not in live_chore_ids
+            ]:
+                del row_cache[stale_chore_id]
+
         chores_attr.sort(
             key=lambda chore: (
                 chore.get(const.ATTR_CHORE_DUE_DATE) is None,
@@ -4704,6 +4798,30 @@ class AssigneeDashboardHelperSensor(ChoreOpsCoordinatorEntity, SensorEntity):
         )
         return chores_attr
 
+    def _get_chore_row_valid_until(
+        self, chore_id: str, now_local: datetime
+    ) -> datetime:
+        """Return the next instant at which a chore row's time-derived fields flip.
+
+        Display state, is_today_am and primary_group only depend on the clock
+        through the due window start, the due date and the local day/week
+        boundaries used for grouping.
+        """
+        boundaries = [
+            (now_local + timedelta(days=1)).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            ),
+            self._get_next_monday_7am_local(),
+        ]
+        chore_manager = self.coordinator.chore_manager
+        for boundary in (
+            chore_manager.get_due_window_start(chore_id, self._assignee_id),
+            chore_manager.get_due_date(chore_id, self._assignee_id),
+        ):
+            if boundary is not None and boundary > now_local:
+                boundaries.append(boundary)
+        return min(boundaries)
+
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator.
 
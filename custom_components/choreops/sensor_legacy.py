@@ -106,6 +106,7 @@ class AssigneeChoreCompletionSensor(ChoreOpsCoordinatorEntity, SensorEntity):
         show_legacy = entry.options.get(const.CONF_SHOW_LEGACY_ENTITIES, False)
         self._attr_entity_registry_enabled_default = show_legacy
         self._assignee_id = assignee_id
+        self._update_keys = frozenset({(const.DATA_USERS, assignee_id)})
         self._assignee_name = assignee_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}{const.SENSOR_KC_UID_SUFFIX_COMPLETED_TOTAL_SENSOR}"
         self._attr_native_unit_of_measurement = const.DEFAULT_CHORES_UNIT
@@ -182,6 +183,7 @@ class AssigneeChoreCompletionDailySensor(ChoreOpsCoordinatorEntity, SensorEntity
         show_legacy = entry.options.get(const.CONF_SHOW_LEGACY_ENTITIES, False)
         self._attr_entity_registry_enabled_default = show_legacy
         self._assignee_id = assignee_id
+        self._update_keys = frozenset({(const.DATA_USERS, assignee_id)})
         self._assignee_name = assignee_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}{const.SENSOR_KC_UID_SUFFIX_COMPLETED_DAILY_SENSOR}"
         self._attr_native_unit_of_measurement = const.DEFAULT_CHORES_UNIT
@@ -247,6 +249,7 @@ class AssigneeChoreCompletionWeeklySensor(ChoreOpsCoordinatorEntity, SensorEntit
         show_legacy = entry.options.get(const.CONF_SHOW_LEGACY_ENTITIES, False)
         self._attr_entity_registry_enabled_default = show_legacy
         self._assignee_id = assignee_id
+        self._update_keys = frozenset({(const.DATA_USERS, assignee_id)})
         self._assignee_name = assignee_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}{const.SENSOR_KC_UID_SUFFIX_COMPLETED_WEEKLY_SENSOR}"
         self._attr_native_unit_of_measurement = const.DEFAULT_CHORES_UNIT
@@ -312,6 +315,7 @@ class AssigneeChoreCompletionMonthlySensor(ChoreOpsCoordinatorEntity, SensorEnti
         show_legacy = entry.options.get(const.CONF_SHOW_LEGACY_ENTITIES, False)
         self._attr_entity_registry_enabled_default = show_legacy
         self._assignee_id = assignee_id
+        self._update_keys = frozenset({(const.DATA_USERS, assignee_id)})
         self._assignee_name = assignee_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}{const.SENSOR_KC_UID_SUFFIX_COMPLETED_MONTHLY_SENSOR}"
         self._attr_native_unit_of_measurement = const.DEFAULT_CHORES_UNIT
@@ -592,6 +596,7 @@ class AssigneePointsEarnedDailySensor(ChoreOpsCoordinatorEntity, SensorEntity):
         show_legacy = entry.options.get(const.CONF_SHOW_LEGACY_ENTITIES, False)
         self._attr_entity_registry_enabled_default = show_legacy
         self._assignee_id = assignee_id
+        self._update_keys = frozenset({(const.DATA_USERS, assignee_id)})
         self._assignee_name = assignee_name
         self._points_label = points_label
         self._points_icon = points_icon
@@ -670,6 +675,7 @@ class AssigneePointsEarnedWeeklySensor(ChoreOpsCoordinatorEntity, SensorEntity):
         show_legacy = entry.options.get(const.CONF_SHOW_LEGACY_ENTITIES, False)
         self._attr_entity_registry_enabled_default = show_legacy
         self._assignee_id = assignee_id
+        self._update_keys = frozenset({(const.DATA_USERS, assignee_id)})
         self._assignee_name = assignee_name
         self._points_label = points_label
         self._points_icon = points_icon
@@ -748,6 +754,7 @@ class AssigneePointsEarnedMonthlySensor(ChoreOpsCoordinatorEntity, SensorEntity)
         show_legacy = entry.options.get(const.CONF_SHOW_LEGACY_ENTITIES, False)
         self._attr_entity_registry_enabled_default = show_legacy
         self._assignee_id = assignee_id
+        self._update_keys = frozenset({(const.DATA_USERS, assignee_id)})
         self._assignee_name = assignee_name
         self._points_label = points_label
         self._points_icon = points_icon
@@ -826,6 +833,7 @@ class AssigneePointsMaxEverSensor(ChoreOpsCoordinatorEntity, SensorEntity):
         show_legacy = entry.options.get(const.CONF_SHOW_LEGACY_ENTITIES, False)
         self._attr_entity_registry_enabled_default = show_legacy
         self._assignee_id = assignee_id
+        self._update_keys = frozenset({(const.DATA_USERS, assignee_id)})
         self._assignee_name = assignee_name
         self._points_label = points_label
         self._points_icon = points_icon
@@ -916,6 +924,7 @@ class AssigneeChoreStreakSensor(ChoreOpsCoordinatorEntity, SensorEntity):
         self._attr_entity_registry_enabled_default = show_legacy
         self._entry = entry
         self._assignee_id = assignee_id
+        self._update_keys = frozenset({(const.DATA_USERS, assignee_id)})
         self._assignee_name = assignee_name
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}{const.SENSOR_KC_UID_SUFFIX_ASSIGNEE_HIGHEST_STREAK_SENSOR}"
         # No unit of measurement - streak is a count, not a duration
@@ -1040,6 +1049,12 @@ class AssigneePenaltyAppliedSensor(ChoreOpsCoordinatorEntity, SensorEntity):
         self._assignee_id = assignee_id
         self._assignee_name = assignee_name
         self._penalty_id = penalty_id
+        self._update_keys = frozenset(
+            {
+                (const.DATA_USERS, assignee_id),
+                (const.DATA_PENALTIES, penalty_id),
+            }
+        )
         self._penalty_name = penalty_name
 
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}_{penalty_id}{const.SENSOR_KC_UID_SUFFIX_PENALTY_APPLIES_SENSOR}"
@@ -1163,6 +1178,12 @@ class AssigneeBonusAppliedSensor(ChoreOpsCoordinatorEntity, SensorEntity):
         self._assignee_id = assignee_id
         self._assignee_name = assignee_name
         self._bonus_id = bonus_id
+        self._update_keys = frozenset(
+            {
+                (const.DATA_USERS, assignee_id),
+                (const.DATA_BONUSES, bonus_id),
+            }
+        )
         self._bonus_name = bonus_name
 
         self._attr_unique_id = f"{entry.entry_id}_{assignee_id}_{bonus_id}{const.SENSOR_KC_UID_SUFFIX_BONUS_APPLIES_SENSOR}"
@@ -5,6 +5,8 @@ These services allow direct actions through scripts or automations.
 Includes UI editor support with selectors for dropdowns and text inputs.
 """
 
+from collections import deque
+from collections.abc import Awaitable, Callable
 from copy import deepcopy
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, cast
@@ -260,6 +262,74 @@ def _dedupe_service_string_list(values: list[str] | None) -> list[str]:
     return deduped_values
 
 
+async def _run_bulk_items(
+    coordinator: "ChoreOpsDataCoordinator",
+    items: list[dict[str, Any]],
+    process_item: Callable[[dict[str, Any]], Awaitable[None]],
+    log_label: str,
+) -> dict[str, Any]:
+    """Process bulk service items inside one coordinator batch.
+
+    A failing item does not abort the call; its error (validation or
+    unexpected) is recorded and the remaining items still run. Persistence and
+    entity refreshes for every item are flushed once when the batch closes.
+
+    The batch also merges notifications: per assignee, approvers get one
+    message for the claims and the assignee one message for the approvals,
+    rewards and bonuses (see NotificationManager bulk digests).
+
+    Returns:
+        Response payload with one result per input item (in input order).
+    """
+    results: list[dict[str, Any]] = []
+    async with coordinator.batch(digest_notifications=True):
+        for item in items:
+            try:
+                await process_item(item)
+            except HomeAssistantError as err:
+                const.LOGGER.warning("%s: %s", log_label, err)
+                results.append({**item, "success": False, "error": str(err)})
+            except Exception as err:
+                const.LOGGER.exception("%s: unexpected error for %s", log_label, item)
+                results.append(
+                    {**item, "success": False, "error": str(err) or repr(err)}
+                )
+            else:
+                results.append({**item, "success": True})
+
+    succeeded_count = sum(1 for result in results if result["success"])
+    const.LOGGER.info(
+        "%s: processed %s items (succeeded=%s failed=%s)",
+        log_label,
+        len(results),
+        succeeded_count,
+        len(results) - succeeded_count,
+    )
+    return {
+        "results": results,
+        "succeeded_count": succeeded_count,
+        "failed_count": len(results) - succeeded_count,
+    }
+
+
+def _build_ledger_entry_payload(raw_entry: dict[str, Any]) -> dict[str, Any]:
+    """Project one stored ledger entry into the get_ledger response shape."""
+    source = str(raw_entry.get(const.DATA_LEDGER_SOURCE, const.POINTS_SOURCE_OTHER))
+    return {
+        const.DATA_LEDGER_TIMESTAMP: raw_entry.get(const.DATA_LEDGER_TIMESTAMP, ""),
+        const.DATA_LEDGER_AMOUNT: float(raw_entry.get(const.DATA_LEDGER_AMOUNT, 0.0)),
+        const.DATA_LEDGER_BALANCE_AFTER: raw_entry.get(
+            const.DATA_LEDGER_BALANCE_AFTER, 0.0
+        ),
+        const.DATA_LEDGER_SOURCE: source,
+        "source_label": const.LEDGER_SOURCE_LABELS.get(
+            source, const.POINTS_SOURCE_OTHER
+        ),
+        const.DATA_LEDGER_ITEM_NAME: raw_entry.get(const.DATA_LEDGER_ITEM_NAME, ""),
+        const.DATA_LEDGER_REFERENCE_ID: raw_entry.get(const.DATA_LEDGER_REFERENCE_ID),
+    }
+
+
 def _resolve_service_chore_ids(
     coordinator: "ChoreOpsDataCoordinator",
     call_data: dict[str, Any],
@@ -458,6 +528,73 @@ APPLY_BONUS_SCHEMA = vol.Schema(
     _with_service_target_fields(_APPROVER_ASSIGNEE_BONUS_BASE)
 )
 
+_BULK_ITEMS_VALIDATOR = vol.Length(min=1, max=const.SERVICE_BULK_MAX_ITEMS)
+
+CLAIM_CHORES_SCHEMA = vol.Schema(
+    _with_service_target_fields(
+        {
+            vol.Required(const.SERVICE_FIELD_ITEMS): vol.All(
+                cv.ensure_list,
+                [vol.Schema(_ASSIGNEE_CHORE_BASE)],
+                _BULK_ITEMS_VALIDATOR,
+            ),
+        }
+    )
+)
+
+_APPROVE_CHORES_ITEM: dict[Any, Any] = {
+    **_ASSIGNEE_CHORE_BASE,
+    vol.Optional(const.SERVICE_FIELD_CHORE_POINTS_AWARDED): vol.Coerce(float),
+}
+
+APPROVE_CHORES_SCHEMA = vol.Schema(
+    _with_service_target_fields(
+        {
+            vol.Required(const.SERVICE_FIELD_APPROVER_NAME): cv.string,
+            vol.Required(const.SERVICE_FIELD_ITEMS): vol.All(
+                cv.ensure_list,
+                [vol.Schema(_APPROVE_CHORES_ITEM)],
+                _BULK_ITEMS_VALIDATOR,
+            ),
+        }
+    )
+)
+
+APPROVE_REWARDS_SCHEMA = vol.Schema(
+    _with_service_target_fields(
+        {
+            vol.Required(const.SERVICE_FIELD_APPROVER_NAME): cv.string,
+            vol.Required(const.SERVICE_FIELD_ITEMS): vol.All(
+                cv.ensure_list,
+                [
+                    vol.Schema(
+                        {
+                            vol.Required(const.SERVICE_FIELD_USER_NAME): cv.string,
+                            vol.Required(const.SERVICE_FIELD_REWARD_NAME): cv.string,
+                            vol.Optional(
+                                const.SERVICE_FIELD_REWARD_COST_OVERRIDE
+                            ): vol.Coerce(float),
+                        }
+                    )
+                ],
+                _BULK_ITEMS_VALIDATOR,
+            ),
+        }
+    )
+)
+
+APPLY_BONUS_BULK_SCHEMA = vol.Schema(
+    _with_service_target_fields(
+        {
+            vol.Required(const.SERVICE_FIELD_APPROVER_NAME): cv.string,
+            vol.Required(const.SERVICE_FIELD_BONUS_NAME): cv.string,
+            vol.Required(const.SERVICE_FIELD_USER_NAMES): vol.All(
+                cv.ensure_list, [cv.string], _BULK_ITEMS_VALIDATOR
+            ),
+        }
+    )
+)
+
 MANUAL_ADJUST_POINTS_SCHEMA = vol.All(
     vol.Schema(
         _with_service_target_fields(
@@ -641,6 +778,11 @@ GENERATE_ACTIVITY_REPORT_SCHEMA = vol.Schema(
                     const.REPORT_OUTPUT_FORMAT_BOTH,
                 ]
             ),
+            vol.Optional(const.SERVICE_FIELD_PAGE_CURSOR): cv.string,
+            vol.Optional(const.SERVICE_FIELD_PAGE_SIZE): vol.All(
+                vol.Coerce(int),
+                vol.Range(min=1, max=const.REPORT_PAGE_MAX_DAYS),
+            ),
         }
     )
 )
@@ -653,6 +795,11 @@ GET_LEDGER_SCHEMA = vol.Schema(
                 const.SERVICE_FIELD_LEDGER_LIMIT,
                 default=const.DEFAULT_LEDGER_MAX_ENTRIES,
             ): cv.positive_int,
+            vol.Optional(const.SERVICE_FIELD_PAGE_CURSOR): cv.string,
+            vol.Optional(const.SERVICE_FIELD_PAGE_SIZE): vol.All(
+                vol.Coerce(int),
+                vol.Range(min=1, max=const.DEFAULT_LEDGER_MAX_ENTRIES),
+            ),
         }
     )
 )
@@ -1876,6 +2023,62 @@ def async_setup_services(hass: HomeAssistant):
         schema=CLAIM_CHORE_SCHEMA,
     )
 
+    async def handle_claim_chores(call: ServiceCall) -> dict[str, Any]:
+        """Handle claiming several chores in one batched call."""
+        entry_id = _resolve_target_entry_id(hass, dict(call.data))
+        if not entry_id:
+            raise HomeAssistantError(
+                translation_domain=const.DOMAIN,
+                translation_key=const.TRANS_KEY_ERROR_MSG_NO_ENTRY_FOUND,
+            )
+
+        coordinator = _get_coordinator_by_entry_id(hass, entry_id)
+        user_id = call.context.user_id
+
+        async def claim_item(item: dict[str, Any]) -> None:
+            assignee_id = get_item_id_or_raise(
+                coordinator,
+                const.ITEM_TYPE_USER,
+                item[const.SERVICE_FIELD_USER_NAME],
+                role=const.ROLE_ASSIGNEE,
+            )
+            chore_id = get_item_id_or_raise(
+                coordinator, const.ITEM_TYPE_CHORE, item[const.SERVICE_FIELD_CHORE_NAME]
+            )
+            if user_id and not await is_user_authorized_for_action(
+                hass,
+                user_id,
+                AUTH_ACTION_PARTICIPATION,
+                target_user_id=assignee_id,
+            ):
+                raise HomeAssistantError(
+                    translation_domain=const.DOMAIN,
+                    translation_key=const.TRANS_KEY_ERROR_NOT_AUTHORIZED_ACTION,
+                    translation_placeholders={
+                        "action": const.ERROR_ACTION_CLAIM_CHORES
+                    },
+                )
+            await coordinator.chore_manager.claim_chore(
+                assignee_id=assignee_id,
+                chore_id=chore_id,
+                user_name=f"user:{user_id}",
+            )
+
+        return await _run_bulk_items(
+            coordinator,
+            call.data[const.SERVICE_FIELD_ITEMS],
+            claim_item,
+            "Claim Chores",
+        )
+
+    hass.services.async_register(
+        const.DOMAIN,
+        const.SERVICE_CLAIM_CHORES,
+        handle_claim_chores,
+        schema=CLAIM_CHORES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
     async def handle_approve_chore(call: ServiceCall):
         """Handle approving a claimed chore."""
         entry_id = _resolve_target_entry_id(hass, dict(call.data))
@@ -1976,6 +2179,64 @@ def async_setup_services(hass: HomeAssistant):
         schema=APPROVE_CHORE_SCHEMA,
     )
 
+    async def handle_approve_chores(call: ServiceCall) -> dict[str, Any]:
+        """Handle approving several claimed chores in one batched call."""
+        entry_id = _resolve_target_entry_id(hass, dict(call.data))
+        if not entry_id:
+            raise HomeAssistantError(
+                translation_domain=const.DOMAIN,
+                translation_key=const.TRANS_KEY_ERROR_MSG_NO_ENTRY_FOUND,
+            )
+
+        coordinator = _get_coordinator_by_entry_id(hass, entry_id)
+        user_id = call.context.user_id
+        approver_name = call.data[const.SERVICE_FIELD_APPROVER_NAME]
+
+        async def approve_item(item: dict[str, Any]) -> None:
+            assignee_id = get_item_id_or_raise(
+                coordinator,
+                const.ITEM_TYPE_USER,
+                item[const.SERVICE_FIELD_USER_NAME],
+                role=const.ROLE_ASSIGNEE,
+            )
+            chore_id = get_item_id_or_raise(
+                coordinator, const.ITEM_TYPE_CHORE, item[const.SERVICE_FIELD_CHORE_NAME]
+            )
+            if user_id and not await is_user_authorized_for_action(
+                hass,
+                user_id,
+                AUTH_ACTION_APPROVAL,
+                target_user_id=assignee_id,
+            ):
+                raise HomeAssistantError(
+                    translation_domain=const.DOMAIN,
+                    translation_key=const.TRANS_KEY_ERROR_NOT_AUTHORIZED_ACTION,
+                    translation_placeholders={
+                        "action": const.ERROR_ACTION_APPROVE_CHORES
+                    },
+                )
+            await coordinator.chore_manager.approve_chore(
+                approver_name,
+                assignee_id=assignee_id,
+                chore_id=chore_id,
+                points_override=item.get(const.SERVICE_FIELD_CHORE_POINTS_AWARDED),
+            )
+
+        return await _run_bulk_items(
+            coordinator,
+            call.data[const.SERVICE_FIELD_ITEMS],
+            approve_item,
+            "Approve Chores",
+        )
+
+    hass.services.async_register(
+        const.DOMAIN,
+        const.SERVICE_APPROVE_CHORES,
+        handle_approve_chores,
+        schema=APPROVE_CHORES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
     async def handle_disapprove_chore(call: ServiceCall):
         """Handle disapproving a chore."""
         entry_id = _resolve_target_entry_id(hass, dict(call.data))
@@ -2881,6 +3142,66 @@ def async_setup_services(hass: HomeAssistant):
         schema=APPROVE_REWARD_SCHEMA,
     )
 
+    async def handle_approve_rewards(call: ServiceCall) -> dict[str, Any]:
+        """Handle approving several reward redemptions in one batched call."""
+        entry_id = _resolve_target_entry_id(hass, dict(call.data))
+        if not entry_id:
+            raise HomeAssistantError(
+                translation_domain=const.DOMAIN,
+                translation_key=const.TRANS_KEY_ERROR_MSG_NO_ENTRY_FOUND,
+            )
+
+        coordinator = _get_coordinator_by_entry_id(hass, entry_id)
+        user_id = call.context.user_id
+        approver_name = call.data[const.SERVICE_FIELD_APPROVER_NAME]
+
+        async def approve_item(item: dict[str, Any]) -> None:
+            assignee_id = get_item_id_or_raise(
+                coordinator,
+                const.ITEM_TYPE_USER,
+                item[const.SERVICE_FIELD_USER_NAME],
+                role=const.ROLE_ASSIGNEE,
+            )
+            reward_id = get_item_id_or_raise(
+                coordinator,
+                const.ITEM_TYPE_REWARD,
+                item[const.SERVICE_FIELD_REWARD_NAME],
+            )
+            if user_id and not await is_user_authorized_for_action(
+                hass,
+                user_id,
+                AUTH_ACTION_APPROVAL,
+                target_user_id=assignee_id,
+            ):
+                raise HomeAssistantError(
+                    translation_domain=const.DOMAIN,
+                    translation_key=const.TRANS_KEY_ERROR_NOT_AUTHORIZED_ACTION,
+                    translation_placeholders={
+                        "action": const.ERROR_ACTION_APPROVE_REWARDS
+                    },
+                )
+            await coordinator.reward_manager.approve(
+                approver_name,
+                assignee_id=assignee_id,
+                reward_id=reward_id,
+                cost_override=item.get(const.SERVICE_FIELD_REWARD_COST_OVERRIDE),
+            )
+
+        return await _run_bulk_items(
+            coordinator,
+            call.data[const.SERVICE_FIELD_ITEMS],
+            approve_item,
+            "Approve Rewards",
+        )
+
+    hass.services.async_register(
+        const.DOMAIN,
+        const.SERVICE_APPROVE_REWARDS,
+        handle_approve_rewards,
+        schema=APPROVE_REWARDS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
     async def handle_disapprove_reward(call: ServiceCall):
         """Handle disapproving a reward."""
         entry_id = _resolve_target_entry_id(hass, dict(call.data))
@@ -3099,6 +3420,66 @@ def async_setup_services(hass: HomeAssistant):
         schema=APPLY_BONUS_SCHEMA,
     )
 
+    async def handle_apply_bonus_bulk(call: ServiceCall) -> dict[str, Any]:
+        """Handle applying one bonus to several assignees in one batched call."""
+        entry_id = _resolve_target_entry_id(hass, dict(call.data))
+        if not entry_id:
+            raise HomeAssistantError(
+                translation_domain=const.DOMAIN,
+                translation_key=const.TRANS_KEY_ERROR_MSG_NO_ENTRY_FOUND,
+            )
+
+        coordinator = _get_coordinator_by_entry_id(hass, entry_id)
+        approver_name = call.data[const.SERVICE_FIELD_APPROVER_NAME]
+        bonus_name = call.data[const.SERVICE_FIELD_BONUS_NAME]
+
+        # Bonus resolution and management authorization apply to the whole call
+        bonus_id = get_item_id_or_raise(coordinator, const.ITEM_TYPE_BONUS, bonus_name)
+        user_id = call.context.user_id
+        if user_id and not await is_user_authorized_for_action(
+            hass,
+            user_id,
+            AUTH_ACTION_MANAGEMENT,
+        ):
+            const.LOGGER.warning("Apply Bonus Bulk: User not authorized")
+            raise HomeAssistantError(
+                translation_domain=const.DOMAIN,
+                translation_key=const.TRANS_KEY_ERROR_NOT_AUTHORIZED_ACTION,
+                translation_placeholders={"action": const.ERROR_ACTION_APPLY_BONUSES},
+            )
+
+        async def apply_item(item: dict[str, Any]) -> None:
+            assignee_id = get_item_id_or_raise(
+                coordinator,
+                const.ITEM_TYPE_USER,
+                item[const.SERVICE_FIELD_USER_NAME],
+                role=const.ROLE_ASSIGNEE,
+            )
+            await coordinator.economy_manager.apply_bonus(
+                approver_name, assignee_id=assignee_id, bonus_id=bonus_id
+            )
+
+        return await _run_bulk_items(
+            coordinator,
+            [
+                {
+                    const.SERVICE_FIELD_USER_NAME: assignee_name,
+                    const.SERVICE_FIELD_BONUS_NAME: bonus_name,
+                }
+                for assignee_name in call.data[const.SERVICE_FIELD_USER_NAMES]
+            ],
+            apply_item,
+            "Apply Bonus Bulk",
+        )
+
+    hass.services.async_register(
+        const.DOMAIN,
+        const.SERVICE_APPLY_BONUS_BULK,
+        handle_apply_bonus_bulk,
+        schema=APPLY_BONUS_BULK_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
     # ======================================================================
     # MANUAL POINTS ADJUSTMENT SERVICE HANDLERS
     # ======================================================================
@@ -3437,32 +3818,67 @@ def async_setup_services(hass: HomeAssistant):
             ),
         )
 
-        report_response = report_helpers.build_activity_report(
-            assignees_data=coordinator.assignees_data,
-            range_result=range_result,
-            assignee_id=assignee_id,
-            report_title=cast(
-                "str | None",
-                call.data.get(const.SERVICE_FIELD_REPORT_TITLE),
-            ),
-            report_style=const.REPORT_STYLE_ASSIGNEE,
-            stats_manager=coordinator.statistics_manager,
-            report_translations=await translation_helpers.load_report_translation(
-                hass,
-                language=report_language,
-            ),
-            include_supplemental=False,
+        report_translations = await translation_helpers.load_report_translation(
+            hass,
+            language=report_language,
         )
+        cursor = cast("str | None", call.data.get(const.SERVICE_FIELD_PAGE_CURSOR))
+        report_page: dict[str, Any] | None = None
+        if cursor is not None or const.SERVICE_FIELD_PAGE_SIZE in call.data:
+            # Paged mode renders only this page's day blocks, newest day first
+            try:
+                page_result = report_helpers.build_activity_report_page(
+                    coordinator.assignees_data,
+                    range_result,
+                    assignee_id,
+                    cursor=cursor,
+                    page_size=int(
+                        call.data.get(
+                            const.SERVICE_FIELD_PAGE_SIZE,
+                            const.DEFAULT_REPORT_PAGE_SIZE,
+                        )
+                    ),
+                    report_translations=report_translations,
+                    economy_manager=coordinator.economy_manager,
+                )
+            except ValueError as err:
+                raise HomeAssistantError(
+                    translation_domain=const.DOMAIN,
+                    translation_key=const.TRANS_KEY_ERROR_INVALID_PAGE_CURSOR,
+                    translation_placeholders={"cursor": str(cursor)},
+                ) from err
+            report_markdown = page_result["markdown"]
+            report_page = {
+                "cursor": page_result["cursor"],
+                "next_cursor": page_result["next_cursor"],
+                "page_size": page_result["page_size"],
+                "days": [block["date"] for block in page_result["daily"]],
+            }
+            if "summary" in page_result:
+                report_page["summary"] = page_result["summary"]
+        else:
+            report_response = report_helpers.build_activity_report(
+                assignees_data=coordinator.assignees_data,
+                range_result=range_result,
+                assignee_id=assignee_id,
+                report_title=cast(
+                    "str | None",
+                    call.data.get(const.SERVICE_FIELD_REPORT_TITLE),
+                ),
+                report_style=const.REPORT_STYLE_ASSIGNEE,
+                stats_manager=coordinator.statistics_manager,
+                report_translations=report_translations,
+                include_supplemental=False,
+                economy_manager=coordinator.economy_manager,
+            )
+            report_markdown = report_response["markdown"]
 
         html_body: str | None = None
         if report_output_format in {
             const.REPORT_OUTPUT_FORMAT_HTML,
             const.REPORT_OUTPUT_FORMAT_BOTH,
         }:
-            html_body = report_helpers.convert_markdown_to_html(
-                report_response["markdown"]
-            )
-            report_response["html"] = html_body
+            html_body = report_helpers.convert_markdown_to_html(report_markdown)
 
         notify_service = cast(
             "str | None",
@@ -3480,9 +3896,7 @@ def async_setup_services(hass: HomeAssistant):
 
             if hass.services.has_service(notify_domain, notify_action):
                 try:
-                    notify_message = _strip_yaml_block_wrapper(
-                        report_response["markdown"]
-                    )
+                    notify_message = _strip_yaml_block_wrapper(report_markdown)
                     notify_payload: dict[str, Any] = {
                         "title": call.data.get(const.SERVICE_FIELD_REPORT_TITLE)
                         or "ChoreOps Activity Report",
@@ -3526,7 +3940,7 @@ def async_setup_services(hass: HomeAssistant):
             "delivered": delivered,
         }
 
-        assignee_ready_report = report_response["markdown"]
+        assignee_ready_report = report_markdown
         if (
             report_output_format == const.REPORT_OUTPUT_FORMAT_HTML
             and html_body is not None
@@ -3542,9 +3956,11 @@ def async_setup_services(hass: HomeAssistant):
             "delivery": delivery_status,
         }
         if report_output_format == const.REPORT_OUTPUT_FORMAT_BOTH:
-            response_payload["markdown"] = report_response["markdown"]
+            response_payload["markdown"] = report_markdown
             if html_body is not None:
                 response_payload["html"] = html_body
+        if report_page is not None:
+            response_payload["page"] = report_page
 
         return response_payload
 
@@ -3589,62 +4005,65 @@ def async_setup_services(hass: HomeAssistant):
             [assignee_id] if assignee_id else list(coordinator.assignees_data.keys())
         )
 
-        entries: list[dict[str, Any]] = []
-        total_earned = 0.0
-        total_spent = 0.0
-
-        for candidate_assignee_id in assignee_ids:
-            assignee_info: dict[str, Any] = cast(
-                "dict[str, Any]",
-                coordinator.assignees_data.get(candidate_assignee_id, {}),
-            )
-            ledger = assignee_info.get(const.DATA_USER_LEDGER, [])
-            if not isinstance(ledger, list):
-                continue
+        cursor = cast("str | None", call.data.get(const.SERVICE_FIELD_PAGE_CURSOR))
+        page_mode = cursor is not None or const.SERVICE_FIELD_PAGE_SIZE in call.data
+        page_size = int(
+            call.data.get(const.SERVICE_FIELD_PAGE_SIZE, const.DEFAULT_LEDGER_PAGE_SIZE)
+        )
 
-            assignee_display_name = str(
-                assignee_info.get(const.DATA_USER_NAME, candidate_assignee_id)
+        # Per-assignee chronological streams merged by epoch; only the entries
+        # that end up in the response are held in memory
+        try:
+            ledger_stream = report_helpers.iter_ledger_stream(
+                coordinator.assignees_data,
+                assignee_ids,
+                coordinator.economy_manager,
+                cursor=cursor if page_mode else None,
             )
-            for raw_entry in ledger:
-                if not isinstance(raw_entry, dict):
-                    continue
-                amount = float(raw_entry.get(const.DATA_LEDGER_AMOUNT, 0.0))
-                source = str(
-                    raw_entry.get(const.DATA_LEDGER_SOURCE, const.POINTS_SOURCE_OTHER)
-                )
-                entry_payload: dict[str, Any] = {
-                    const.DATA_LEDGER_TIMESTAMP: raw_entry.get(
-                        const.DATA_LEDGER_TIMESTAMP, ""
-                    ),
-                    const.DATA_LEDGER_AMOUNT: amount,
-                    const.DATA_LEDGER_BALANCE_AFTER: raw_entry.get(
-                        const.DATA_LEDGER_BALANCE_AFTER, 0.0
-                    ),
-                    const.DATA_LEDGER_SOURCE: source,
-                    "source_label": const.LEDGER_SOURCE_LABELS.get(
-                        source, const.POINTS_SOURCE_OTHER
-                    ),
-                    const.DATA_LEDGER_ITEM_NAME: raw_entry.get(
-                        const.DATA_LEDGER_ITEM_NAME, ""
-                    ),
-                    const.DATA_LEDGER_REFERENCE_ID: raw_entry.get(
-                        const.DATA_LEDGER_REFERENCE_ID
-                    ),
-                }
-                if assignee_id is None:
-                    entry_payload[const.DATA_USER_INTERNAL_ID] = candidate_assignee_id
-                    entry_payload[const.DATA_USER_NAME] = assignee_display_name
+        except ValueError as err:
+            raise HomeAssistantError(
+                translation_domain=const.DOMAIN,
+                translation_key=const.TRANS_KEY_ERROR_INVALID_PAGE_CURSOR,
+                translation_placeholders={"cursor": str(cursor)},
+            ) from err
 
-                if amount >= 0:
-                    total_earned += amount
-                else:
-                    total_spent += abs(amount)
-                entries.append(entry_payload)
+        # Page mode returns the next `page_size` entries oldest first; default
+        # mode keeps only the most recent `limit` entries in a bounded deque
+        selected: deque[tuple[str, dict[str, Any]]] = deque(
+            maxlen=None if page_mode else limit
+        )
+        total_earned = 0.0
+        total_spent = 0.0
+        total_count = 0
+        next_cursor: str | None = None
+        last_cursor: str | None = None
+
+        for entry_cursor, candidate_assignee_id, raw_entry in ledger_stream:
+            if page_mode and len(selected) >= page_size:
+                next_cursor = last_cursor
+                break
+            last_cursor = entry_cursor
+            amount = float(raw_entry.get(const.DATA_LEDGER_AMOUNT, 0.0))
+            if amount >= 0:
+                total_earned += amount
+            else:
+                total_spent += abs(amount)
+            selected.append((candidate_assignee_id, cast("dict[str, Any]", raw_entry)))
+            total_count += 1
 
-        # Sort by timestamp ascending, then take the most recent `limit` entries
-        entries.sort(key=lambda entry: str(entry.get(const.DATA_LEDGER_TIMESTAMP, "")))
-        truncated = len(entries) > limit
-        entries = entries[-limit:]
+        entries: list[dict[str, Any]] = []
+        for entry_assignee_id, selected_entry in selected:
+            entry_payload = _build_ledger_entry_payload(selected_entry)
+            if assignee_id is None:
+                assignee_info: dict[str, Any] = cast(
+                    "dict[str, Any]",
+                    coordinator.assignees_data.get(entry_assignee_id, {}),
+                )
+                entry_payload[const.DATA_USER_INTERNAL_ID] = entry_assignee_id
+                entry_payload[const.DATA_USER_NAME] = str(
+                    assignee_info.get(const.DATA_USER_NAME, entry_assignee_id)
+                )
+            entries.append(entry_payload)
 
         resolved_assignee_name: str | None = None
         if assignee_id is not None:
@@ -3655,17 +4074,25 @@ def async_setup_services(hass: HomeAssistant):
                 assignee_record.get(const.DATA_USER_NAME, assignee_id)
             )
 
+        totals = {
+            "total_earned": round(total_earned, const.DATA_FLOAT_PRECISION),
+            "total_spent": round(total_spent, const.DATA_FLOAT_PRECISION),
+            "net": round(total_earned - total_spent, const.DATA_FLOAT_PRECISION),
+        }
+        # Page mode only reads as far as the page, so its summary covers the
+        # returned page; the default mode's summary covers the whole ledger
         return {
             "assignee_id": assignee_id,
             "assignee_name": resolved_assignee_name,
             "count": len(entries),
             "limit": limit,
-            "truncated": truncated,
-            "summary": {
-                "total_earned": round(total_earned, const.DATA_FLOAT_PRECISION),
-                "total_spent": round(total_spent, const.DATA_FLOAT_PRECISION),
-                "net": round(total_earned - total_spent, const.DATA_FLOAT_PRECISION),
-            },
+            "page_size": page_size if page_mode else None,
+            "cursor": cursor,
+            "next_cursor": next_cursor,
+            "truncated": (
+                next_cursor is not None if page_mode else total_count > limit
+            ),
+            "summary": totals,
             "entries": entries,
         }
 
@@ -3933,7 +4360,9 @@ async def async_unload_services(hass: HomeAssistant) -> None:
 
     services = [
         const.SERVICE_CLAIM_CHORE,
+        const.SERVICE_CLAIM_CHORES,
         const.SERVICE_APPROVE_CHORE,
+        const.SERVICE_APPROVE_CHORES,
         const.SERVICE_CREATE_CHORE,
         const.SERVICE_CREATE_REWARD,
         const.SERVICE_DELETE_CHORE,
@@ -3943,8 +4372,10 @@ async def async_unload_services(hass: HomeAssistant) -> None:
         const.SERVICE_DISAPPROVE_REWARD,
         const.SERVICE_APPLY_PENALTY,
         const.SERVICE_APPLY_BONUS,
+        const.SERVICE_APPLY_BONUS_BULK,
         const.SERVICE_MANUAL_ADJUST_POINTS,
         const.SERVICE_APPROVE_REWARD,
+        const.SERVICE_APPROVE_REWARDS,
         const.SERVICE_MANAGE_UI_CONTROL,
         const.SERVICE_RESET_CHORES_TO_PENDING_STATE,  # Renamed from SERVICE_RESET_ALL_CHORES
         const.SERVICE_RESET_OVERDUE_CHORES,
@@ -16,6 +16,8 @@ from homeassistant.helpers.storage import Store
 from . import const
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from homeassistant.core import HomeAssistant
 
 
@@ -42,6 +44,12 @@ class ChoreOpsStore:
         self._store: Store = Store(hass, const.STORAGE_VERSION, scoped_storage_key)
         self._data: dict[str, Any] = {}  # In-memory data cache for quick access.
 
+        # Dirty tracking for incremental snapshots (see sync_data).
+        # - bucket key -> set of changed item IDs, or None for "whole bucket"
+        # - full sync flag forces the next sync to rebuild the entire snapshot
+        self._dirty_items: dict[str, set[str] | None] = {}
+        self._full_sync_required = True
+
     @staticmethod
     def get_default_structure() -> dict[str, Any]:
         """Return canonical empty data structure for fresh installations.
@@ -59,6 +67,7 @@ class ChoreOpsStore:
             const.DATA_META: {
                 const.DATA_META_SCHEMA_VERSION: const.SCHEMA_VERSION_CURRENT,
                 const.DATA_META_PENDING_EVALUATIONS: [],
+                const.DATA_META_PENDING_REMINDERS: [],
                 const.DATA_META_LAST_MIDNIGHT_PROCESSED: None,
                 const.DATA_META_SHARED_ADMIN_UI_CONTROL: {},
             },
@@ -337,43 +346,57 @@ class ChoreOpsStore:
                 )
 
             for item_key, item_value in bucket_value.items():
-                if not isinstance(item_value, dict):
-                    return (
-                        False,
-                        normalized_data,
-                        (
-                            f"Entity bucket '{bucket_key}' item '{item_key}' "
-                            "must be a dict"
-                        ),
-                    )
-
-                internal_id_value = item_value.get(internal_id_key)
-                if not isinstance(internal_id_value, str) or not internal_id_value:
-                    item_value[internal_id_key] = item_key
-                    continue
-
-                if internal_id_value != item_key:
-                    item_value[internal_id_key] = item_key
+                item_error = ChoreOpsStore._normalize_entity_item(
+                    bucket_key, internal_id_key, item_key, item_value
+                )
+                if item_error is not None:
+                    return False, normalized_data, item_error
 
         users_bucket = normalized_data.get(const.DATA_USERS)
         if isinstance(users_bucket, dict):
             for user_id, user_value in users_bucket.items():
-                if not isinstance(user_value, dict):
-                    continue
+                ChoreOpsStore._normalize_user_item(user_id, user_value)
 
-                ui_preferences = user_value.get(const.DATA_USER_UI_PREFERENCES)
-                if isinstance(ui_preferences, dict):
-                    user_value[const.DATA_USER_UI_PREFERENCES] = dict(ui_preferences)
-                    continue
+        return True, normalized_data, None
 
-                user_value[const.DATA_USER_UI_PREFERENCES] = {}
-                const.LOGGER.debug(
-                    "Normalized missing or invalid %s for user %s",
-                    const.DATA_USER_UI_PREFERENCES,
-                    user_id,
-                )
+    @staticmethod
+    def _normalize_entity_item(
+        bucket_key: str,
+        internal_id_key: str,
+        item_key: str,
+        item_value: Any,
+    ) -> str | None:
+        """Validate one entity bucket item and repair its internal id in place.
 
-        return True, normalized_data, None
+        Returns:
+            Validation error message, or None when the item is acceptable.
+        """
+        if not isinstance(item_value, dict):
+            return f"Entity bucket '{bucket_key}' item '{item_key}' must be a dict"
+
+        internal_id_value = item_value.get(internal_id_key)
+        if not isinstance(internal_id_value, str) or internal_id_value != item_key:
+            item_value[internal_id_key] = item_key
+
+        return None
+
+    @staticmethod
+    def _normalize_user_item(user_id: str, user_value: Any) -> None:
+        """Ensure a user record carries a detached ui_preferences mapping."""
+        if not isinstance(user_value, dict):
+            return
+
+        ui_preferences = user_value.get(const.DATA_USER_UI_PREFERENCES)
+        if isinstance(ui_preferences, dict):
+            user_value[const.DATA_USER_UI_PREFERENCES] = dict(ui_preferences)
+            return
+
+        user_value[const.DATA_USER_UI_PREFERENCES] = {}
+        const.LOGGER.debug(
+            "Normalized missing or invalid %s for user %s",
+            const.DATA_USER_UI_PREFERENCES,
+            user_id,
+        )
 
     @staticmethod
     def _snapshot_data(value: Any) -> Any:
@@ -420,6 +443,191 @@ class ChoreOpsStore:
             },
         )
         self._data = ChoreOpsStore._snapshot_data(normalized_data)
+        self._dirty_items.clear()
+        self._full_sync_required = False
+        return True
+
+    def mark_dirty(
+        self, bucket_key: str, item_ids: Iterable[str] | None = None
+    ) -> None:
+        """Record that part of a top-level bucket changed since the last sync.
+
+        Args:
+            bucket_key: Top-level data key (e.g., const.DATA_USERS).
+            item_ids: IDs of changed items inside the bucket. None marks the
+                whole bucket dirty.
+        """
+        if self._full_sync_required:
+            return
+
+        if item_ids is None:
+            self._dirty_items[bucket_key] = None
+            return
+
+        existing = self._dirty_items.get(bucket_key, set())
+        if existing is None:
+            return
+
+        existing.update(item_ids)
+        self._dirty_items[bucket_key] = existing
+
+    def mark_all_dirty(self) -> None:
+        """Force the next sync_data() call to rebuild the full snapshot."""
+        self._full_sync_required = True
+        self._dirty_items.clear()
+
+    def sync_data(
+        self, new_data: dict[str, Any], *, verify: bool = False, strict: bool = False
+    ) -> bool:
+        """Apply pending changes from new_data to the in-memory snapshot.
+
+        Only buckets and items recorded via mark_dirty() are re-validated and
+        re-snapshotted; metadata is always refreshed. Falls back to a full
+        set_data() when a full sync was requested, when the top-level layout
+        changed, or when no detached snapshot exists yet.
+
+        Previous snapshot containers are never mutated, so a save that is still
+        serializing an older snapshot is unaffected by this call.
+
+        Args:
+            new_data: Live coordinator data.
+            verify: Compare the scoped result against new_data and fall back to
+                a full snapshot if any unmarked change was missed (debug/tests).
+            strict: With verify, raise after the fallback snapshot so callers
+                that mutate data without naming it fail loudly (tests).
+
+        Returns:
+            True when changes are applied, False when the payload is rejected.
+
+        Raises:
+            RuntimeError: If strict verification found unmarked changes.
+        """
+        if (
+            self._full_sync_required
+            or not self._data
+            or new_data is self._data
+            or new_data.keys() != self._data.keys()
+        ):
+            return self.set_data(new_data)
+
+        schema_version = ChoreOpsStore._extract_schema_version(new_data)
+        validate_items = (
+            schema_version is not None
+            and schema_version >= const.SCHEMA_VERSION_STORAGE_ONLY
+        )
+        internal_id_map = ChoreOpsStore._get_entity_internal_id_map()
+        default_structure = ChoreOpsStore.get_default_structure()
+        staged: dict[str, Any] = {}
+
+        for bucket_key, item_ids in self._dirty_items.items():
+            source_bucket = new_data.get(bucket_key)
+            snapshot_bucket = self._data.get(bucket_key)
+            expected_type = type(default_structure.get(bucket_key, {}))
+            if not isinstance(source_bucket, expected_type):
+                return self.set_data(new_data)
+
+            # Unmarked inserts or deletes (or a replaced container) mean the
+            # caller's dirty set is incomplete - snapshot the whole bucket.
+            if (
+                item_ids is not None
+                and isinstance(source_bucket, dict)
+                and isinstance(snapshot_bucket, dict)
+                and (source_bucket.keys() ^ snapshot_bucket.keys()) - item_ids
+            ):
+                item_ids = None
+
+            if item_ids is None or not isinstance(source_bucket, dict):
+                if validate_items and bucket_key in internal_id_map:
+                    for item_key, item_value in source_bucket.items():
+                        if not self._validate_dirty_item(
+                            bucket_key, item_key, item_value
+                        ):
+                            return False
+                staged[bucket_key] = ChoreOpsStore._snapshot_data(source_bucket)
+                continue
+
+            updated_bucket = dict(snapshot_bucket or {})
+            for item_id in item_ids:
+                if item_id not in source_bucket:
+                    updated_bucket.pop(item_id, None)
+                    continue
+                item_value = source_bucket[item_id]
+                if (
+                    validate_items
+                    and bucket_key in internal_id_map
+                    and not self._validate_dirty_item(bucket_key, item_id, item_value)
+                ):
+                    return False
+                updated_bucket[item_id] = ChoreOpsStore._snapshot_data(item_value)
+            staged[bucket_key] = updated_bucket
+
+        if const.DATA_META in new_data:
+            staged[const.DATA_META] = ChoreOpsStore._snapshot_data(
+                new_data[const.DATA_META]
+            )
+
+        const.LOGGER.debug(
+            "DEBUG: Storage manager sync_data applied %s dirty bucket(s): %s",
+            len(self._dirty_items),
+            {
+                bucket_key: "all" if item_ids is None else len(item_ids)
+                for bucket_key, item_ids in self._dirty_items.items()
+            },
+        )
+        self._data = {**self._data, **staged}
+        self._dirty_items.clear()
+
+        if verify:
+            missed = self._find_unmarked_changes(new_data)
+            if missed:
+                const.LOGGER.error(
+                    "ERROR: Scoped persist missed unmarked changes, taking a full "
+                    "snapshot: %s",
+                    missed,
+                )
+                applied = self.set_data(new_data)
+                if strict:
+                    raise RuntimeError(
+                        f"Scoped persist missed unmarked changes: {missed}"
+                    )
+                return applied
+        return True
+
+    def _find_unmarked_changes(self, new_data: dict[str, Any]) -> list[str]:
+        """Return bucket/item paths where the snapshot differs from new_data."""
+        missed: list[str] = []
+        for bucket_key, source_bucket in new_data.items():
+            snapshot_bucket = self._data.get(bucket_key)
+            if not isinstance(source_bucket, dict) or not isinstance(
+                snapshot_bucket, dict
+            ):
+                if source_bucket != snapshot_bucket:
+                    missed.append(bucket_key)
+                continue
+            missed.extend(
+                f"{bucket_key}/{item_id}"
+                for item_id in source_bucket.keys() | snapshot_bucket.keys()
+                if source_bucket.get(item_id) != snapshot_bucket.get(item_id)
+            )
+        return missed
+
+    def _validate_dirty_item(
+        self, bucket_key: str, item_key: str, item_value: Any
+    ) -> bool:
+        """Validate a single dirty entity item, logging rejected payloads."""
+        internal_id_key = ChoreOpsStore._get_entity_internal_id_map()[bucket_key]
+        item_error = ChoreOpsStore._normalize_entity_item(
+            bucket_key, internal_id_key, item_key, item_value
+        )
+        if item_error is not None:
+            const.LOGGER.error(
+                "ERROR: Rejected invalid storage payload in sync_data: %s",
+                item_error,
+            )
+            return False
+
+        if bucket_key == const.DATA_USERS:
+            ChoreOpsStore._normalize_user_item(item_key, item_value)
         return True
 
     async def async_save(self) -> None:
@@ -465,6 +673,7 @@ class ChoreOpsStore:
 
         # Set the default empty structure
         self._data = ChoreOpsStore.get_default_structure()
+        self.mark_all_dirty()
         await self.async_save()
 
     async def async_delete_storage(self) -> None:
@@ -504,6 +713,7 @@ class ChoreOpsStore:
         if key in self._data:
             const.LOGGER.debug("DEBUG: Updating data for key: %s", key)
             self._data[key] = value
+            self.mark_all_dirty()
             await self.async_save()
         else:
             const.LOGGER.warning(
@@ -44,6 +44,7 @@ NOTE: TypedDict is STATIC ANALYSIS ONLY. All runtime error handling
 TypedDict does NOT enforce types at runtime.
 """
 
+from collections.abc import Collection
 from typing import Any, Literal, NotRequired, TypedDict
 
 # =============================================================================
@@ -123,6 +124,19 @@ class ActivityReportResponse(TypedDict):
     delivery: ReportDeliveryStatus
 
 
+class ActivityReportPage(TypedDict):
+    """One cursor page of daily blocks for generate_activity_report."""
+
+    range: ReportRangeResult
+    scope: dict[str, Any]
+    cursor: str | None
+    next_cursor: str | None
+    page_size: int
+    daily: list[ReportDailyBlock]
+    markdown: str
+    summary: NotRequired[dict[str, float | int]]
+
+
 class RewardData(TypedDict):
     """Type definition for a reward entity."""
 
@@ -835,6 +849,14 @@ BonusesCollection = dict[str, BonusData]
 AchievementsCollection = dict[str, AchievementData]
 ChallengesCollection = dict[str, ChallengeData]
 
+# Dirty scope for incremental persistence: top-level bucket key -> changed item
+# IDs (None marks the whole bucket changed). See ChoreOpsStore.sync_data().
+PersistScope = dict[str, Collection[str] | None]
+
+# Targeted entity refresh key: (top-level bucket key, item ID), e.g.
+# (DATA_CHORES, chore_id). Matches PersistScope entries one-to-one.
+UpdateKey = tuple[str, str]
+
 # Per-assignee progress type aliases (used in sensor.py for type annotations)
 # These are the per-assignee progress entries from the progress dict
 # Using union with dict[str, Any] to handle empty dict {} default values
@@ -1188,8 +1210,10 @@ class ChoreOverdueResolvedEvent(TypedDict, total=False):
 class ChoreRescheduledEvent(TypedDict, total=False):
     """Event payload for SIGNAL_SUFFIX_CHORE_RESCHEDULED (not skipped).
 
-    Emitted by: ChoreManager.skip_chore_due_date()
-    Consumed by: NotificationManager (optional notification)
+    Queued by: ChoreManager._reschedule_chore_next_due() and
+        ChoreManager._reschedule_chore_next_due_date_for_assignee(), emitted
+        after the enclosing persist
+    Consumed by: ChoreManager (time-scan caches), calendar entities
     """
 
     assignee_id: (
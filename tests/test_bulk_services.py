@@ -0,0 +1,587 @@
+"""Test bulk workflow services and the coordinator batch scope.
+
+This module tests the following services:
+- claim_chores
+- approve_chores
+- approve_rewards
+- apply_bonus_bulk
+
+Each bulk call runs inside coordinator.batch(), so persistence and entity
+refreshes are flushed once for the whole call, notifications are merged per
+assignee, and the response reports a result for every item.
+
+See tests/AGENT_TEST_CREATION_INSTRUCTIONS.md for patterns used.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+import pytest
+
+from custom_components.choreops import const
+from tests.helpers.setup import SetupResult, setup_from_yaml
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+async def scenario_full(
+    hass: HomeAssistant,
+    mock_hass_users: dict[str, Any],
+) -> SetupResult:
+    """Load full scenario: 3 assignees, 2 approvers, 8 chores, 3 rewards."""
+    return await setup_from_yaml(
+        hass,
+        mock_hass_users,
+        "tests/scenarios/scenario_full.yaml",
+    )
+
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+
+def get_assignee_points(coordinator: Any, assignee_id: str) -> float:
+    """Get current points for an assignee."""
+    assignee_info = coordinator.assignees_data.get(assignee_id, {})
+    return assignee_info.get(const.DATA_USER_POINTS, 0.0)
+
+
+# ============================================================================
+# TEST CLASS: Coordinator batch scope
+# ============================================================================
+
+
+class TestCoordinatorBatch:
+    """Test persistence and refresh coalescing in coordinator.batch()."""
+
+    async def test_batch_flushes_one_save_and_one_merged_refresh(
+        self,
+        hass: HomeAssistant,
+        scenario_full: SetupResult,
+    ) -> None:
+        """Nested persists inside a batch flush once when the outer scope exits."""
+        coordinator = scenario_full.coordinator
+        zoe_id = scenario_full.assignee_ids["Zoë"]
+        feed_id = scenario_full.chore_ids["Feed the cåts"]
+        lego_id = scenario_full.chore_ids["Pick up Lëgo!"]
+
+        save_mock = MagicMock()
+        refresh_mock = MagicMock()
+        with (
+            patch.object(coordinator, "_schedule_save", save_mock),
+            patch.object(coordinator, "async_update_listeners_for", refresh_mock),
+        ):
+            async with coordinator.batch():
+                coordinator._persist_and_update(changed={const.DATA_CHORES: [feed_id]})
+                async with coordinator.batch():
+                    coordinator._persist_and_update(
+                        changed={
+                            const.DATA_CHORES: [lego_id],
+                            const.DATA_USERS: [zoe_id],
+                        }
+                    )
+                save_mock.assert_not_called()
+                coordinator._persist(changed={const.DATA_META: None})
+
+                save_mock.assert_not_called()
+                refresh_mock.assert_not_called()
+
+        save_mock.assert_called_once_with(False, True)
+        refresh_mock.assert_called_once_with(
+            {
+                const.DATA_CHORES: {feed_id, lego_id},
+                const.DATA_USERS: {zoe_id},
+            }
+        )
+
+    async def test_unscoped_update_inside_batch_refreshes_everything(
+        self,
+        hass: HomeAssistant,
+        scenario_full: SetupResult,
+    ) -> None:
+        """A full listener update inside a batch widens the flush to all entities."""
+        coordinator = scenario_full.coordinator
+        feed_id = scenario_full.chore_ids["Feed the cåts"]
+
+        refresh_mock = MagicMock()
+        with patch.object(coordinator, "async_update_listeners_for", refresh_mock):
+            async with coordinator.batch():
+                coordinator._persist_and_update(changed={const.DATA_CHORES: [feed_id]})
+                coordinator.async_update_listeners()
+
+        refresh_mock.assert_called_once_with(None)
+
+    async def test_scoped_set_updated_data_keeps_coordinator_bookkeeping(
+        self,
+        hass: HomeAssistant,
+        scenario_full: SetupResult,
+    ) -> None:
+        """Scoped data updates run the base bookkeeping with a keyed fan-out."""
+        coordinator = scenario_full.coordinator
+        zoe_id = scenario_full.assignee_ids["Zoë"]
+        scope = {const.DATA_USERS: [zoe_id]}
+        coordinator.last_update_success = False
+
+        schedule_mock = MagicMock()
+        full_refresh_mock = MagicMock()
+        with (
+            patch.object(coordinator, "_schedule_refresh", schedule_mock),
+            patch.object(
+                DataUpdateCoordinator, "async_update_listeners", full_refresh_mock
+            ),
+            patch.object(
+                coordinator,
+                "async_update_listeners_for",
+                wraps=coordinator.async_update_listeners_for,
+            ) as keyed_refresh,
+        ):
+            coordinator.async_set_updated_data_for(scope)
+            assert coordinator.last_update_success is True
+            schedule_mock.assert_called_once_with()
+            # Pins the base method ending in async_update_listeners(): the
+            # scoped override relies on it to hand over the keyed fan-out.
+            keyed_refresh.assert_called_once_with(scope)
+
+        assert coordinator.data is coordinator._data
+        assert coordinator._scoped_fan_out is None
+        # Keyed refresh only: the full listener update is never used
+        full_refresh_mock.assert_not_called()
+
+    async def test_deferred_callback_runs_once_after_flush(
+        self,
+        hass: HomeAssistant,
+        scenario_full: SetupResult,
+    ) -> None:
+        """Callbacks queued inside a batch are deduplicated and run after it."""
+        coordinator = scenario_full.coordinator
+        state_write = MagicMock()
+
+        async with coordinator.batch():
+            coordinator.async_call_after_batch(state_write)
+            coordinator.async_call_after_batch(state_write)
+            state_write.assert_not_called()
+
+        state_write.assert_called_once_with()
+
+        coordinator.async_call_after_batch(state_write)
+        assert state_write.call_count == 2
+
+    async def test_batch_waits_for_tracked_handler_tasks(
+        self,
+        hass: HomeAssistant,
+        scenario_full: SetupResult,
+    ) -> None:
+        """Persists from tracked signal handlers join the batch flush."""
+        coordinator = scenario_full.coordinator
+        handler_done = asyncio.Event()
+
+        async def _handler() -> None:
+            await asyncio.sleep(0.01)
+            coordinator._persist()
+            handler_done.set()
+
+        save_mock = MagicMock()
+        with patch.object(coordinator, "_schedule_save", save_mock):
+            async with coordinator.batch():
+                coordinator.async_track_batch_task(hass.async_create_task(_handler()))
+
+            assert handler_done.is_set()
+            save_mock.assert_called_once_with(False, True)
+
+    async def test_immediate_persist_and_other_tasks_bypass_batch(
+        self,
+        hass: HomeAssistant,
+        scenario_full: SetupResult,
+    ) -> None:
+        """Immediate saves and persists from unrelated tasks are not deferred."""
+        coordinator = scenario_full.coordinator
+        batch_open = asyncio.Event()
+        release = asyncio.Event()
+
+        async def _hold_batch() -> None:
+            async with coordinator.batch():
+                coordinator._persist()
+                batch_open.set()
+                await release.wait()
+
+        save_mock = MagicMock()
+        with patch.object(coordinator, "_schedule_save", save_mock):
+            holder = hass.async_create_task(_hold_batch())
+            await batch_open.wait()
+
+            assert not coordinator.in_batch
+            coordinator._persist()
+            save_mock.assert_called_once_with(False, True)
+
+            release.set()
+            await holder
+
+        assert save_mock.call_count == 2
+
+        save_mock.reset_mock()
+        with patch.object(coordinator, "_schedule_save", save_mock):
+            async with coordinator.batch():
+                coordinator._persist(immediate=True)
+                save_mock.assert_called_once_with(True, True)
+
+        save_mock.assert_called_once_with(True, True)
+
+    async def test_cancelled_settle_still_closes_batch(
+        self,
+        hass: HomeAssistant,
+        scenario_full: SetupResult,
+    ) -> None:
+        """Cancelling the outer exit while it settles still flushes and closes."""
+        coordinator = scenario_full.coordinator
+        settling = asyncio.Event()
+
+        async def _slow_handler() -> None:
+            settling.set()
+            await asyncio.sleep(10)
+
+        handler_tasks: list[asyncio.Task[None]] = []
+
+        async def _run_batch() -> None:
+            async with coordinator.batch():
+                coordinator._persist()
+                handler_tasks.append(hass.async_create_task(_slow_handler()))
+                coordinator.async_track_batch_task(handler_tasks[0])
+
+        save_mock = MagicMock()
+        with patch.object(coordinator, "_schedule_save", save_mock):
+            runner = hass.async_create_task(_run_batch())
+            await settling.wait()
+            await asyncio.sleep(0)
+            runner.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await runner
+
+            save_mock.assert_called_once_with(False, True)
+            coordinator._persist()
+            assert save_mock.call_count == 2
+
+        handler_tasks[0].cancel()
+
+    async def test_production_saves_sample_full_diff_verification(
+        self,
+        hass: HomeAssistant,
+        scenario_full: SetupResult,
+    ) -> None:
+        """Without tests or debug logging, every Nth scoped save is verified."""
+        coordinator = scenario_full.coordinator
+        coordinator._test_mode = False
+        coordinator._saves_since_verify = 0
+        sync_mock = MagicMock(return_value=True)
+
+        with (
+            patch.object(coordinator.store, "sync_data", sync_mock),
+            patch.object(const.LOGGER, "isEnabledFor", return_value=False),
+        ):
+            for _ in range(2 * const.STORAGE_VERIFY_EVERY_N_SAVES):
+                coordinator._sync_store()
+
+        verified = [
+            index
+            for index, call in enumerate(sync_mock.call_args_list, start=1)
+            if call.kwargs["verify"]
+        ]
+        assert verified == [
+            const.STORAGE_VERIFY_EVERY_N_SAVES,
+            2 * const.STORAGE_VERIFY_EVERY_N_SAVES,
+        ]
+        assert not any(call.kwargs["strict"] for call in sync_mock.call_args_list)
+
+
+# ============================================================================
+# TEST CLASS: Bulk chore services
+# ============================================================================
+
+
+class TestBulkChoreServices:
+    """Test claim_chores and approve_chores."""
+
+    async def test_claim_then_approve_chores_reports_each_item(
+        self,
+        hass: HomeAssistant,
+        scenario_full: SetupResult,
+    ) -> None:
+        """Bulk claim and approve process every item and isolate failures."""
+        coordinator = scenario_full.coordinator
+        zoe_id = scenario_full.assignee_ids["Zoë"]
+        max_id = scenario_full.assignee_ids["Max!"]
+        feed_id = scenario_full.chore_ids["Feed the cåts"]
+        lego_id = scenario_full.chore_ids["Pick up Lëgo!"]
+        zoe_start = get_assignee_points(coordinator, zoe_id)
+        max_start = get_assignee_points(coordinator, max_id)
+
+        items = [
+            {"user_name": "Zoë", "chore_name": "Feed the cåts"},
+            {"user_name": "Max!", "chore_name": "Pick up Lëgo!"},
+        ]
+        with (
+            patch.object(
+                coordinator.notification_manager, "notify_assignee", new=AsyncMock()
+            ),
+            patch.object(
+                coordinator.notification_manager,
+                "notify_approvers_translated",
+                new=AsyncMock(),
+            ),
+        ):
+            claim_response = await hass.services.async_call(
+                const.DOMAIN,
+                const.SERVICE_CLAIM_CHORES,
+                {const.SERVICE_FIELD_ITEMS: items},
+                blocking=True,
+                return_response=True,
+            )
+            approve_response = await hass.services.async_call(
+                const.DOMAIN,
+                const.SERVICE_APPROVE_CHORES,
+                {
+                    const.SERVICE_FIELD_APPROVER_NAME: "Môm Astrid Stârblüm",
+                    const.SERVICE_FIELD_ITEMS: [
+                        *items,
+                        {"user_name": "Zoë", "chore_name": "Not A Chore"},
+                    ],
+                },
+                blocking=True,
+                return_response=True,
+            )
+
+        assert claim_response["succeeded_count"] == 2
+        assert claim_response["failed_count"] == 0
+
+        assert approve_response["succeeded_count"] == 2
+        assert approve_response["failed_count"] == 1
+        results = approve_response["results"]
+        assert [result["success"] for result in results] == [True, True, False]
+        assert results[2]["chore_name"] == "Not A Chore"
+        assert results[2]["error"]
+
+        assert coordinator.chore_manager.chore_is_approved_in_period(zoe_id, feed_id)
+        assert coordinator.chore_manager.chore_is_approved_in_period(max_id, lego_id)
+        assert get_assignee_points(coordinator, zoe_id) == zoe_start + 10.0
+        assert get_assignee_points(coordinator, max_id) == max_start + 15.0
+
+    async def test_bulk_notifications_merge_per_assignee(
+        self,
+        hass: HomeAssistant,
+        scenario_full: SetupResult,
+    ) -> None:
+        """Several items for one assignee send one message; a lone item is as usual."""
+        coordinator = scenario_full.coordinator
+        manager = coordinator.notification_manager
+        max_id = scenario_full.assignee_ids["Max!"]
+        zoe_id = scenario_full.assignee_ids["Zoë"]
+        items = [
+            {"user_name": "Max!", "chore_name": "Pick up Lëgo!"},
+            {"user_name": "Max!", "chore_name": "Charge Røbot"},
+            {"user_name": "Zoë", "chore_name": "Feed the cåts"},
+        ]
+
+        def _sent(mock: AsyncMock, title_key: str) -> list[tuple[str, Any]]:
+            return [
+                (call.args[0], call.kwargs.get("message_data", {}))
+                for call in mock.await_args_list
+                if call.kwargs.get("title_key") == title_key
+            ]
+
+        with (
+            patch.object(
+                manager, "notify_assignee_translated", new=AsyncMock()
+            ) as notify_assignee,
+            patch.object(
+                manager, "notify_approvers_translated", new=AsyncMock()
+            ) as notify_approvers,
+        ):
+            await hass.services.async_call(
+                const.DOMAIN,
+                const.SERVICE_CLAIM_CHORES,
+                {const.SERVICE_FIELD_ITEMS: items},
+                blocking=True,
+                return_response=True,
+            )
+            await hass.async_block_till_done()
+
+            claimed = _sent(
+                notify_approvers, const.TRANS_KEY_NOTIF_TITLE_BULK_CLAIMED_APPROVER
+            )
+            assert [(assignee_id, data["count"]) for assignee_id, data in claimed] == [
+                (max_id, 2)
+            ]
+            assert claimed[0][1]["chore_list"] == "Pick up Lëgo!, Charge Røbot"
+            assert [
+                assignee_id
+                for assignee_id, _ in _sent(
+                    notify_approvers,
+                    const.TRANS_KEY_NOTIF_TITLE_CHORE_CLAIMED_APPROVER,
+                )
+            ] == [zoe_id]
+
+            await hass.services.async_call(
+                const.DOMAIN,
+                const.SERVICE_APPROVE_CHORES,
+                {
+                    const.SERVICE_FIELD_APPROVER_NAME: "Môm Astrid Stârblüm",
+                    const.SERVICE_FIELD_ITEMS: items,
+                },
+                blocking=True,
+                return_response=True,
+            )
+            await hass.async_block_till_done()
+
+        updates = _sent(
+            notify_assignee, const.TRANS_KEY_NOTIF_TITLE_BULK_UPDATES_ASSIGNEE
+        )
+        assert [(assignee_id, data["count"]) for assignee_id, data in updates] == [
+            (max_id, 2)
+        ]
+        assert "🎉 Pick up Lëgo!" in updates[0][1]["item_list"]
+        assert "🎉 Charge Røbot" in updates[0][1]["item_list"]
+        assert [
+            assignee_id
+            for assignee_id, _ in _sent(
+                notify_assignee, const.TRANS_KEY_NOTIF_TITLE_CHORE_APPROVED_ASSIGNEE
+            )
+        ] == [zoe_id]
+        assert manager._bulk_entries == {}
+
+    async def test_unexpected_item_error_is_recorded_without_extra_refresh(
+        self,
+        hass: HomeAssistant,
+        scenario_full: SetupResult,
+    ) -> None:
+        """A non-HomeAssistantError failure is reported per item, not raised."""
+        coordinator = scenario_full.coordinator
+
+        claim_mock = AsyncMock(side_effect=[None, RuntimeError("boom")])
+        with (
+            patch.object(coordinator.chore_manager, "claim_chore", new=claim_mock),
+            patch.object(
+                coordinator, "async_request_refresh", new=AsyncMock()
+            ) as refresh_mock,
+        ):
+            response = await hass.services.async_call(
+                const.DOMAIN,
+                const.SERVICE_CLAIM_CHORES,
+                {
+                    const.SERVICE_FIELD_ITEMS: [
+                        {"user_name": "Zoë", "chore_name": "Feed the cåts"},
+                        {"user_name": "Max!", "chore_name": "Pick up Lëgo!"},
+                    ]
+                },
+                blocking=True,
+                return_response=True,
+            )
+
+        assert response["succeeded_count"] == 1
+        assert response["failed_count"] == 1
+        assert response["results"][1]["error"] == "boom"
+        refresh_mock.assert_not_awaited()
+
+
+# ============================================================================
+# TEST CLASS: Bulk economy services
+# ============================================================================
+
+
+class TestBulkEconomyServices:
+    """Test apply_bonus_bulk and approve_rewards."""
+
+    async def test_apply_bonus_bulk_awards_each_assignee(
+        self,
+        hass: HomeAssistant,
+        scenario_full: SetupResult,
+    ) -> None:
+        """One bonus is applied to every resolvable assignee in the list."""
+        coordinator = scenario_full.coordinator
+        zoe_id = scenario_full.assignee_ids["Zoë"]
+        lila_id = scenario_full.assignee_ids["Lila"]
+        zoe_start = get_assignee_points(coordinator, zoe_id)
+        lila_start = get_assignee_points(coordinator, lila_id)
+
+        with patch.object(
+            coordinator.notification_manager, "notify_assignee", new=AsyncMock()
+        ):
+            response = await hass.services.async_call(
+                const.DOMAIN,
+                const.SERVICE_APPLY_BONUS_BULK,
+                {
+                    const.SERVICE_FIELD_APPROVER_NAME: "Dad Leo",
+                    const.SERVICE_FIELD_BONUS_NAME: "Extra Effort",
+                    const.SERVICE_FIELD_USER_NAMES: ["Zoë", "Nobody", "Lila"],
+                },
+                blocking=True,
+                return_response=True,
+            )
+
+        assert response["succeeded_count"] == 2
+        assert response["failed_count"] == 1
+        assert response["results"][1]["user_name"] == "Nobody"
+        assert get_assignee_points(coordinator, zoe_id) == zoe_start + 20.0
+        assert get_assignee_points(coordinator, lila_id) == lila_start + 20.0
+
+    async def test_approve_rewards_applies_cost_override_per_item(
+        self,
+        hass: HomeAssistant,
+        scenario_full: SetupResult,
+    ) -> None:
+        """Each pending redemption is approved with its own optional override."""
+        coordinator = scenario_full.coordinator
+        zoe_id = scenario_full.assignee_ids["Zoë"]
+        max_id = scenario_full.assignee_ids["Max!"]
+        reward_id = scenario_full.reward_ids["Extra Screen Time"]
+        coordinator.assignees_data[zoe_id][const.DATA_USER_POINTS] = 100.0
+        coordinator.assignees_data[max_id][const.DATA_USER_POINTS] = 100.0
+
+        with (
+            patch.object(
+                coordinator.notification_manager, "notify_assignee", new=AsyncMock()
+            ),
+            patch.object(
+                coordinator.notification_manager,
+                "notify_approvers_translated",
+                new=AsyncMock(),
+            ),
+        ):
+            for assignee_id in (zoe_id, max_id):
+                await coordinator.reward_manager.redeem(
+                    approver_name="Môm Astrid Stârblüm",
+                    assignee_id=assignee_id,
+                    reward_id=reward_id,
+                )
+
+            response = await hass.services.async_call(
+                const.DOMAIN,
+                const.SERVICE_APPROVE_REWARDS,
+                {
+                    const.SERVICE_FIELD_APPROVER_NAME: "Môm Astrid Stârblüm",
+                    const.SERVICE_FIELD_ITEMS: [
+                        {"user_name": "Zoë", "reward_name": "Extra Screen Time"},
+                        {
+                            "user_name": "Max!",
+                            "reward_name": "Extra Screen Time",
+                            "cost_override": 0,
+                        },
+                    ],
+                },
+                blocking=True,
+                return_response=True,
+            )
+
+        assert response["succeeded_count"] == 2
+        assert get_assignee_points(coordinator, zoe_id) == 50.0
+        assert get_assignee_points(coordinator, max_id) == 100.0
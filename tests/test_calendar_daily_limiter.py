@@ -9,6 +9,7 @@ from homeassistant.components.calendar import CalendarEvent
 
 from custom_components.choreops import const
 from custom_components.choreops.calendar import AssigneeScheduleCalendar
+from custom_components.choreops.helpers.entity_helpers import AssignmentIndex
 
 
 def _build_calendar(duration_days: int) -> AssigneeScheduleCalendar:
@@ -18,6 +19,11 @@ def _build_calendar(duration_days: int) -> AssigneeScheduleCalendar:
     calendar._assignee_id = "assignee-1"
     calendar._assignee_name = "Leo"
     calendar._events_cache = {}
+    calendar._occurrence_store = {}
+    calendar._chore_tokens = {}
+    calendar._challenge_tokens = {}
+    calendar._tokens_primed = False
+    calendar._cache_revision = 0
     calendar._max_cache_entries = 8
     calendar._recurrence_engine_cache = {}
     calendar._rrule_cache = {}
@@ -55,6 +61,10 @@ def _attach_fake_coordinator(calendar: AssigneeScheduleCalendar) -> None:
             "chores_data": {},
             "challenges_data": {},
             "chore_manager": fake_manager,
+            "async_call_after_batch": staticmethod(lambda callback: callback()),
+            "get_assignment_index": lambda self, _item_type: AssignmentIndex.build(
+                self.chores_data, const.DATA_CHORE_ASSIGNED_USER_IDS
+            ),
             "assignees_data": {
                 "assignee-1": {
                     const.DATA_USER_NAME: "Leo",
@@ -185,6 +195,8 @@ def test_event_window_cache_invalidates_when_chore_revision_changes() -> None:
     calendar.coordinator.chores_data[chore_id][const.DATA_CHORE_DUE_DATE] = (
         "2025-01-02T10:00:00+00:00"
     )
+    calendar.async_write_ha_state = lambda: None  # type: ignore[method-assign]
+    calendar._on_chore_schedule_changed({"chore_id": chore_id})
     calendar._get_cached_events(window_start, window_end)
 
     assert calls["count"] == 2
@@ -226,14 +238,68 @@ def test_event_window_cache_invalidates_when_due_window_changes() -> None:
     calendar.coordinator.chores_data[chore_id][const.DATA_CHORE_DUE_WINDOW_OFFSET] = (
         "3h"
     )
+    calendar.async_write_ha_state = lambda: None  # type: ignore[method-assign]
+    calendar._on_calendar_data_changed({"chore_id": chore_id})
+    calendar._get_cached_events(window_start, window_end)
+
+    assert calls["count"] == 2
+
+
+def test_schedule_signal_without_token_change_keeps_cached_window() -> None:
+    """Status resets that leave the schedule untouched keep cached windows."""
+    calendar = _build_calendar(90)
+    _attach_fake_coordinator(calendar)
+
+    chore_id = "chore-1"
+    calendar.coordinator.chores_data[chore_id] = {
+        const.DATA_CHORE_INTERNAL_ID: chore_id,
+        const.DATA_CHORE_ASSIGNED_USER_IDS: ["assignee-1"],
+        const.DATA_CHORE_SHOW_ON_CALENDAR: True,
+        const.DATA_CHORE_RECURRING_FREQUENCY: const.FREQUENCY_WEEKLY,
+        const.DATA_CHORE_DUE_DATE: "2025-01-01T10:00:00+00:00",
+        const.DATA_CHORE_APPLICABLE_DAYS: [],
+    }
+
+    calls: dict[str, int] = {"count": 0}
+    writes: dict[str, int] = {"count": 0}
+
+    def _generate(
+        window_start: datetime.datetime,
+        window_end: datetime.datetime,
+    ) -> list[CalendarEvent]:
+        calls["count"] += 1
+        return []
+
+    def _mark_write() -> None:
+        writes["count"] += 1
+
+    calendar._generate_all_events = _generate  # type: ignore[method-assign]
+    calendar.async_write_ha_state = _mark_write  # type: ignore[method-assign]
+
+    window_start = datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC)
+    window_end = window_start + datetime.timedelta(days=1)
+
+    calendar._get_cached_events(window_start, window_end)
+    calendar._on_chore_schedule_changed({"chore_id": chore_id})
+    calendar._get_cached_events(window_start, window_end)
+
+    assert calls["count"] == 1
+    assert writes["count"] == 0
+
+    calendar.coordinator.chores_data[chore_id][const.DATA_CHORE_DUE_DATE] = (
+        "2025-01-08T10:00:00+00:00"
+    )
+    calendar._on_chore_schedule_changed({"chore_id": chore_id})
     calendar._get_cached_events(window_start, window_end)
 
     assert calls["count"] == 2
+    assert writes["count"] == 1
 
 
 def test_calendar_data_changed_handler_clears_caches() -> None:
     """Signal handler clears all calendar caches and triggers state write."""
     calendar = _build_calendar(90)
+    _attach_fake_coordinator(calendar)
 
     event_key = ("2025-01-01T00:00:00+00:00", "2025-01-02T00:00:00+00:00", 123)
     recurrence_key = (
@@ -263,6 +329,115 @@ def test_calendar_data_changed_handler_clears_caches() -> None:
     assert writes["count"] == 1
 
 
+def test_occurrence_store_reuses_materialized_series_across_windows() -> None:
+    """Window queries share one materialized series and only extend it."""
+    calendar = _build_calendar(90)
+    _attach_fake_coordinator(calendar)
+
+    for chore_id, name in (("chore-1", "Trash"), ("chore-2", "Dishes")):
+        calendar.coordinator.chores_data[chore_id] = {
+            const.DATA_CHORE_INTERNAL_ID: chore_id,
+            const.DATA_CHORE_NAME: name,
+            const.DATA_CHORE_ASSIGNED_USER_IDS: ["assignee-1"],
+            const.DATA_CHORE_SHOW_ON_CALENDAR: True,
+            const.DATA_CHORE_RECURRING_FREQUENCY: const.FREQUENCY_WEEKLY,
+            const.DATA_CHORE_DUE_DATE: "2025-01-01T10:00:00+00:00",
+            const.DATA_CHORE_APPLICABLE_DAYS: [],
+            const.DATA_CHORE_COMPLETION_CRITERIA: const.COMPLETION_CRITERIA_SHARED,
+        }
+
+    window_start = datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC)
+    short_end = window_start + datetime.timedelta(days=15)
+    long_end = window_start + datetime.timedelta(days=60)
+
+    short_events = calendar._generate_all_events(window_start, short_end)
+    entry = calendar._occurrence_store["chore-1"]
+    materialized = len(entry.events)
+    long_events = calendar._generate_all_events(window_start, long_end)
+
+    assert calendar._occurrence_store["chore-1"] is entry
+    assert len(entry.events) > materialized
+    assert len(short_events) == 2 * materialized
+    assert [event.start for event in long_events] == [
+        event.start
+        for chore in calendar.coordinator.chores_data.values()
+        for event in calendar._generate_events_for_chore(chore, window_start, long_end)
+    ]
+
+    calendar.async_write_ha_state = lambda: None  # type: ignore[method-assign]
+    calendar._on_calendar_data_changed({"chore_id": "chore-1"})
+
+    assert "chore-1" not in calendar._occurrence_store
+    assert "chore-2" in calendar._occurrence_store
+
+
+def test_occurrence_store_stops_materializing_past_anchor_horizon() -> None:
+    """A series is never expanded past anchor + daily horizon."""
+    calendar = _build_calendar(30)
+    _attach_fake_coordinator(calendar)
+    calendar.coordinator.chores_data["chore-1"] = {
+        const.DATA_CHORE_INTERNAL_ID: "chore-1",
+        const.DATA_CHORE_NAME: "Trash",
+        const.DATA_CHORE_ASSIGNED_USER_IDS: ["assignee-1"],
+        const.DATA_CHORE_SHOW_ON_CALENDAR: True,
+        const.DATA_CHORE_RECURRING_FREQUENCY: const.FREQUENCY_DAILY,
+        const.DATA_CHORE_DUE_DATE: "2025-01-05T10:00:00+00:00",
+        const.DATA_CHORE_APPLICABLE_DAYS: [],
+        const.DATA_CHORE_COMPLETION_CRITERIA: const.COMPLETION_CRITERIA_SHARED,
+    }
+
+    anchor = datetime.datetime(2025, 1, 5, 10, 0, tzinfo=datetime.UTC)
+    window_end = anchor + datetime.timedelta(days=365)
+    for window_start in (
+        datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC),
+        datetime.datetime(2025, 1, 3, tzinfo=datetime.UTC),
+        anchor,
+    ):
+        calendar._generate_all_events(window_start, window_end)
+
+    entry = calendar._occurrence_store["chore-1"]
+    limit = anchor + datetime.timedelta(days=10)
+    assert entry.limit == limit
+    assert entry.dues[0] == anchor
+    assert entry.dues[-1] == limit
+    assert entry.source is None
+    assert entry.pending is None
+
+
+def test_occurrence_store_rebuilds_chore_when_token_changes() -> None:
+    """A changed chore token re-materializes only that chore's occurrences."""
+    calendar = _build_calendar(90)
+    _attach_fake_coordinator(calendar)
+
+    chore = {
+        const.DATA_CHORE_INTERNAL_ID: "chore-1",
+        const.DATA_CHORE_NAME: "Trash",
+        const.DATA_CHORE_ASSIGNED_USER_IDS: ["assignee-1"],
+        const.DATA_CHORE_SHOW_ON_CALENDAR: True,
+        const.DATA_CHORE_RECURRING_FREQUENCY: const.FREQUENCY_NONE,
+        const.DATA_CHORE_DUE_DATE: "2025-01-02T10:00:00+00:00",
+        const.DATA_CHORE_COMPLETION_CRITERIA: const.COMPLETION_CRITERIA_SHARED,
+    }
+    calendar.coordinator.chores_data["chore-1"] = chore
+
+    window_start = datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC)
+    window_end = window_start + datetime.timedelta(days=30)
+
+    first = calendar._generate_all_events(window_start, window_end)
+    entry = calendar._occurrence_store["chore-1"]
+    calendar._generate_all_events(window_start, window_end)
+    assert calendar._occurrence_store["chore-1"] is entry
+
+    chore[const.DATA_CHORE_DUE_DATE] = "2025-01-03T10:00:00+00:00"
+    calendar.async_write_ha_state = lambda: None  # type: ignore[method-assign]
+    calendar._on_chore_schedule_changed({"chore_id": "chore-1"})
+    second = calendar._generate_all_events(window_start, window_end)
+
+    assert calendar._occurrence_store["chore-1"] is not entry
+    assert first[0].end == datetime.datetime(2025, 1, 2, 10, 0, tzinfo=datetime.UTC)
+    assert second[0].end == datetime.datetime(2025, 1, 3, 10, 0, tzinfo=datetime.UTC)
+
+
 @freeze_time("2025-01-01 00:00:00")
 def test_daily_without_due_date_does_not_generate_calendar_events() -> None:
     """Date-less daily chores are intentionally excluded from the calendar."""
@@ -9,9 +9,10 @@ Tests verify:
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant.exceptions import ServiceValidationError
 import pytest
@@ -170,6 +171,31 @@ def test_overdue_resolution_signal_uses_time_in_overdue_state(
 # ============================================================================
 
 
+@pytest.mark.asyncio
+async def test_reschedule_signal_waits_for_enclosing_persist(
+    chore_manager: ChoreManager,
+    mock_coordinator: MagicMock,
+) -> None:
+    """CHORE_RESCHEDULED is queued by the reschedule and emitted after persist."""
+    chore = mock_coordinator.chores_data["chore-1"]
+    chore[const.DATA_CHORE_INTERNAL_ID] = "chore-1"
+    chore[const.DATA_CHORE_COMPLETION_CRITERIA] = const.COMPLETION_CRITERIA_SHARED
+    chore[const.DATA_CHORE_RECURRING_FREQUENCY] = const.FREQUENCY_DAILY
+    chore[const.DATA_CHORE_DUE_DATE] = (dt_now_utc() + timedelta(days=1)).isoformat()
+
+    order: list[str] = []
+    mock_coordinator._persist.side_effect = lambda *args, **kwargs: order.append(
+        "persist"
+    )
+    chore_manager.emit.side_effect = lambda suffix, **payload: order.append(suffix)
+
+    await chore_manager.skip_due_date("chore-1")
+
+    assert order.count(const.SIGNAL_SUFFIX_CHORE_RESCHEDULED) == 1
+    assert order.index("persist") < order.index(const.SIGNAL_SUFFIX_CHORE_RESCHEDULED)
+    assert chore_manager._pending_reschedule_signals == []
+
+
 class TestValidation:
     """Tests for entity validation."""
 
@@ -329,6 +355,176 @@ class TestTimeScanCache:
         assert len(scan[const.CHORE_SCAN_RESULT_APPROVAL_RESET_SHARED]) == 1
         assert len(scan[const.CHORE_SCAN_RESULT_APPROVAL_RESET_INDEPENDENT]) == 0
 
+    def test_process_time_checks_defers_pairs_until_deadline(
+        self,
+        chore_manager: ChoreManager,
+        mock_coordinator: MagicMock,
+    ) -> None:
+        """Due-date scans skip pairs until their earliest threshold passes."""
+        now_utc = dt_now_utc()
+        due_dt = now_utc + timedelta(hours=2)
+        chore = mock_coordinator.chores_data["chore-1"]
+        chore[const.DATA_CHORE_PER_ASSIGNEE_DUE_DATES] = {
+            "assignee-1": due_dt.isoformat(),
+            "assignee-2": (due_dt + timedelta(days=1)).isoformat(),
+        }
+        chore[const.DATA_CHORE_NOTIFY_ON_DUE_WINDOW] = True
+        chore[const.DATA_CHORE_DUE_WINDOW_OFFSET] = "1h"
+        chore[const.DATA_CHORE_NOTIFY_DUE_REMINDER] = False
+
+        scan = chore_manager.process_time_checks(now_utc)
+
+        assert all(not entries for entries in scan.values())
+        assert chore_manager.next_time_scan_deadline() == due_dt - timedelta(hours=1)
+
+        scan = chore_manager.process_time_checks(now_utc + timedelta(minutes=65))
+
+        in_window = scan[const.CHORE_SCAN_RESULT_IN_DUE_WINDOW]
+        assert [e[const.CHORE_SCAN_ENTRY_USER_ID] for e in in_window] == ["assignee-1"]
+        assert chore_manager.next_time_scan_deadline() == due_dt
+
+    def test_process_time_checks_newly_due_only_limits_to_popped_pairs(
+        self,
+        chore_manager: ChoreManager,
+        mock_coordinator: MagicMock,
+    ) -> None:
+        """Deadline wakeups only evaluate pairs whose deadline just passed."""
+        now_utc = dt_now_utc()
+        chore = mock_coordinator.chores_data["chore-1"]
+        chore[const.DATA_CHORE_PER_ASSIGNEE_DUE_DATES] = {
+            "assignee-1": (now_utc + timedelta(minutes=10)).isoformat(),
+            "assignee-2": (now_utc + timedelta(hours=3)).isoformat(),
+        }
+        chore[const.DATA_CHORE_NOTIFY_ON_DUE_WINDOW] = False
+        chore[const.DATA_CHORE_NOTIFY_DUE_REMINDER] = False
+
+        chore_manager.process_time_checks(now_utc)
+
+        first = chore_manager.process_time_checks(
+            now_utc + timedelta(minutes=15), newly_due_only=True
+        )
+        second = chore_manager.process_time_checks(
+            now_utc + timedelta(minutes=20), newly_due_only=True
+        )
+        full = chore_manager.process_time_checks(now_utc + timedelta(minutes=20))
+
+        assert [
+            e[const.CHORE_SCAN_ENTRY_USER_ID]
+            for e in first[const.CHORE_SCAN_RESULT_OVERDUE]
+        ] == ["assignee-1"]
+        assert second[const.CHORE_SCAN_RESULT_OVERDUE] == []
+        assert [
+            e[const.CHORE_SCAN_ENTRY_USER_ID]
+            for e in full[const.CHORE_SCAN_RESULT_OVERDUE]
+        ] == ["assignee-1"]
+
+    @pytest.mark.asyncio
+    async def test_periodic_update_arms_wakeup_for_next_deadline(
+        self,
+        chore_manager: ChoreManager,
+        mock_hass: MagicMock,
+        mock_coordinator: MagicMock,
+    ) -> None:
+        """Periodic updates arm one timer for the earliest pending deadline."""
+        now_utc = dt_now_utc()
+        chore = mock_coordinator.chores_data["chore-1"]
+        chore[const.DATA_CHORE_PER_ASSIGNEE_DUE_DATES] = {
+            "assignee-1": (now_utc + timedelta(hours=2)).isoformat(),
+        }
+        chore[const.DATA_CHORE_NOTIFY_ON_DUE_WINDOW] = True
+        chore[const.DATA_CHORE_DUE_WINDOW_OFFSET] = "1h"
+        chore[const.DATA_CHORE_NOTIFY_DUE_REMINDER] = False
+
+        await chore_manager._on_periodic_update(now_utc=now_utc)
+        await chore_manager._on_periodic_update(now_utc=now_utc)
+
+        mock_hass.loop.call_later.assert_called_once()
+        delay, wakeup = mock_hass.loop.call_later.call_args.args
+        assert delay == pytest.approx(3600, abs=5)
+        assert wakeup == chore_manager._on_deadline_timer
+
+        wakeup()
+        create_task = mock_coordinator.config_entry.async_create_background_task
+        create_task.assert_called_once()
+        hass_arg, wakeup_coro, task_name = create_task.call_args.args
+        assert hass_arg is mock_hass
+        assert task_name.endswith("deadline_wakeup")
+        wakeup_coro.close()
+
+        chore_manager._arm_deadline_timer()
+        chore_manager._cancel_deadline_timer()
+        mock_hass.loop.call_later.return_value.cancel.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_deadline_wakeup_waits_for_running_scan_inside_batch(
+        self,
+        chore_manager: ChoreManager,
+        mock_coordinator: MagicMock,
+    ) -> None:
+        """A wakeup never interleaves with the interval pass and runs batched."""
+        events: list[str] = []
+
+        async def _slow_resets(scan, now_utc, trigger, persist):
+            events.append(f"start:{trigger}")
+            await asyncio.sleep(0.01)
+            events.append(f"end:{trigger}")
+            return 0, set()
+
+        chore_manager._process_approval_reset_entries = _slow_resets  # type: ignore[method-assign]
+
+        await asyncio.gather(
+            chore_manager._on_periodic_update(
+                trigger=const.CHORE_SCAN_TRIGGER_MIDNIGHT
+            ),
+            chore_manager._async_deadline_wakeup(),
+        )
+
+        assert events == [
+            f"start:{const.CHORE_SCAN_TRIGGER_MIDNIGHT}",
+            f"end:{const.CHORE_SCAN_TRIGGER_MIDNIGHT}",
+            f"start:{const.CHORE_SCAN_TRIGGER_DUE_DATE}",
+            f"end:{const.CHORE_SCAN_TRIGGER_DUE_DATE}",
+        ]
+        mock_coordinator.batch.assert_called_once_with()
+
+    def test_process_time_checks_reindexes_only_marked_chores(
+        self,
+        chore_manager: ChoreManager,
+        mock_coordinator: MagicMock,
+    ) -> None:
+        """A tick re-indexes the chores writers marked, not every chore."""
+        now_utc = dt_now_utc()
+        chore = mock_coordinator.chores_data["chore-1"]
+        chore[const.DATA_CHORE_PER_ASSIGNEE_DUE_DATES] = {
+            "assignee-1": (now_utc + timedelta(days=3)).isoformat(),
+        }
+        chore[const.DATA_CHORE_OVERDUE_HANDLING_TYPE] = (
+            const.OVERDUE_HANDLING_AT_DUE_DATE
+        )
+
+        scan = chore_manager.process_time_checks(now_utc)
+        assert scan[const.CHORE_SCAN_RESULT_OVERDUE] == []
+
+        chore[const.DATA_CHORE_PER_ASSIGNEE_DUE_DATES]["assignee-1"] = (
+            now_utc - timedelta(minutes=5)
+        ).isoformat()
+
+        with patch.object(
+            chore_manager,
+            "_index_chore_deadlines",
+            wraps=chore_manager._index_chore_deadlines,
+        ) as index_spy:
+            scan = chore_manager.process_time_checks(now_utc)
+            index_spy.assert_not_called()
+            assert scan[const.CHORE_SCAN_RESULT_OVERDUE] == []
+
+            chore_manager._invalidate_deadline_index("chore-1")
+            scan = chore_manager.process_time_checks(now_utc)
+
+        assert [call.args[0] for call in index_spy.call_args_list] == ["chore-1"]
+        overdue = scan[const.CHORE_SCAN_RESULT_OVERDUE]
+        assert [e[const.CHORE_SCAN_ENTRY_USER_ID] for e in overdue] == ["assignee-1"]
+
     @pytest.mark.asyncio
     async def test_midnight_rollover_resets_daily_shared_without_due_date(
         self,
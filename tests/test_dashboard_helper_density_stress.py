@@ -13,11 +13,20 @@ from __future__ import annotations
 
 import json
 import os
+import time
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
 import pytest
 
 from custom_components.choreops import const
+from custom_components.choreops.sensor import (
+    _build_chore_shard_payload,
+    _serialized_payload_size,
+    build_chore_shard_plan,
+)
 from tests.helpers.setup import setup_from_yaml
 
 if TYPE_CHECKING:
@@ -27,6 +36,8 @@ RUN_STRESS = os.environ.get("CHOREOPS_RUN_STRESS") == "1"
 RECORDER_LIMIT_BYTES = 16 * 1024
 SCENARIO_COUNTS = (40, 50, 60, 70, 80, 90, 100, 120)
 ASSIGNEE_SLUGS = ("zoe", "max", "lila")
+SHARD_PLAN_SCENARIO_COUNTS = (100, 120)
+SHARD_PLAN_BUDGET_SECONDS = 0.5
 
 pytestmark = [
     pytest.mark.slow,
@@ -128,3 +139,108 @@ async def test_dense_scenario_claim_chore_stays_operational(
         chore for chore in chores if chore.get("name") == "Zoë Dense Chore 001"
     )
     assert claimed_chore["state"] in {"claimed", "completed", "waiting"}
+
+
+@pytest.mark.parametrize("chores_per_assignee", SCENARIO_COUNTS)
+async def test_dense_scenario_claim_refreshes_only_affected_entities(
+    hass: HomeAssistant,
+    mock_hass_users: dict[str, object],
+    chores_per_assignee: int,
+) -> None:
+    """Verify a claim writes state for a small slice of the entity graph."""
+    scenario_path = (
+        f"tests/scenarios/scenario_density_starblum_{chores_per_assignee}.yaml"
+    )
+    setup_result = await setup_from_yaml(hass, mock_hass_users, scenario_path)
+    coordinator = setup_result.coordinator
+    zoe_id = setup_result.assignee_ids["Zoë"]
+    first_chore_id = setup_result.chore_ids["Zoë Dense Chore 001"]
+    await hass.async_block_till_done()
+
+    entity_count = len(
+        er.async_entries_for_config_entry(
+            er.async_get(hass), setup_result.config_entry.entry_id
+        )
+    )
+    original_write = Entity.async_write_ha_state
+    written: list[str] = []
+
+    def _count_write(entity: Entity) -> None:
+        written.append(entity.entity_id)
+        original_write(entity)
+
+    with patch.object(
+        Entity, "async_write_ha_state", autospec=True, side_effect=_count_write
+    ):
+        await coordinator.chore_manager.claim_chore(zoe_id, first_chore_id, "Zoë")
+        await hass.async_block_till_done()
+
+    print(
+        f"claim state writes | chores_per_assignee={chores_per_assignee} "
+        f"| writes={len(written)} | unique={len(set(written))} "
+        f"| entities={entity_count}"
+    )
+    assert written, "Claim did not refresh any entities"
+    assert len(set(written)) < entity_count // 2, (
+        f"Claim refreshed {len(set(written))} of {entity_count} entities"
+    )
+
+
+@pytest.mark.parametrize("chores_per_assignee", SHARD_PLAN_SCENARIO_COUNTS)
+async def test_dense_scenario_shard_plan_is_fast_and_tightly_packed(
+    hass: HomeAssistant,
+    mock_hass_users: dict[str, object],
+    chores_per_assignee: int,
+) -> None:
+    """Verify shard planning stays within budget and packs shards greedily."""
+    scenario_path = (
+        f"tests/scenarios/scenario_density_starblum_{chores_per_assignee}.yaml"
+    )
+    setup_result = await setup_from_yaml(hass, mock_hass_users, scenario_path)
+    coordinator = setup_result.coordinator
+    zoe_id = setup_result.assignee_ids["Zoë"]
+    await hass.async_block_till_done()
+
+    # Cold row cache so the timing covers row building as well as packing.
+    coordinator.ui_manager.get_chore_row_cache(zoe_id).clear()
+    started = time.perf_counter()
+    plan = build_chore_shard_plan(
+        hass,
+        coordinator,
+        setup_result.config_entry,
+        zoe_id,
+        "Zoë",
+        previous_plan=None,
+    )
+    elapsed = time.perf_counter() - started
+    print(
+        f"shard plan timing | chores_per_assignee={chores_per_assignee} "
+        f"| shards={plan.expected_shard_count} | seconds={elapsed:.4f}"
+    )
+
+    assert plan.mode == const.HELPER_SHARD_MODE_SHARDED
+    assert elapsed < SHARD_PLAN_BUDGET_SECONDS, (
+        f"Shard planning took {elapsed:.3f}s for {chores_per_assignee} chores"
+    )
+    assert sum(len(ids) for ids in plan.shard_item_ids) == chores_per_assignee
+
+    row_cache = coordinator.ui_manager.get_chore_row_cache(zoe_id)
+    rows_by_id = {
+        chore_id: entry.row
+        for chore_id, entry in row_cache.items()
+        if entry.row is not None
+    }
+    for shard_number, shard_ids in enumerate(plan.shard_item_ids, start=1):
+        shard_rows = [rows_by_id[chore_id] for chore_id in shard_ids]
+        shard_size = _serialized_payload_size(
+            _build_chore_shard_payload(shard_rows, shard_number, shard_number)
+        )
+        assert shard_size < const.HELPER_SHARD_ENTER_BYTES
+        if shard_number < len(plan.shard_item_ids):
+            next_row = rows_by_id[plan.shard_item_ids[shard_number][0]]
+            overfull_size = _serialized_payload_size(
+                _build_chore_shard_payload(
+                    [*shard_rows, next_row], shard_number, shard_number
+                )
+            )
+            assert overfull_size >= const.HELPER_SHARD_ENTER_BYTES
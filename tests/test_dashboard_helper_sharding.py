@@ -4,15 +4,17 @@ from __future__ import annotations
 
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 from uuid import uuid4
 
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import entity_registry as er, label_registry as lr
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
 import pytest
 
 from custom_components.choreops import const
 from custom_components.choreops.sensor import (
     AssigneeDashboardChoreShardSensor,
+    AssigneeDashboardHelperSensor,
     build_chore_shard_plan,
 )
 from tests.helpers.setup import SetupResult, setup_from_yaml
@@ -556,6 +558,83 @@ class TestDashboardHelperSharding:
 
         assert claimed_chore["state"] in {"claimed", "completed", "waiting"}
 
+    async def test_chore_rows_are_reused_until_their_chore_changes(
+        self,
+        hass: HomeAssistant,
+        scenario_density_80: SetupResult,
+    ) -> None:
+        """Shard planning reuses cached rows; a claim recomputes only its row."""
+        coordinator = scenario_density_80.coordinator
+        zoe_id = scenario_density_80.assignee_ids["Zoë"]
+        first_chore_id = scenario_density_80.chore_ids["Zoë Dense Chore 001"]
+        await coordinator.async_request_refresh()
+        await hass.async_block_till_done()
+        plan = _build_plan_for_user(scenario_density_80, "Zoë", None)
+        assert plan.mode == const.HELPER_SHARD_MODE_SHARDED
+
+        original_calculate = AssigneeDashboardHelperSensor._calculate_chore_attributes
+        calculated: list[str] = []
+
+        def _count_calculate(helper, chore_id, *args):
+            calculated.append(chore_id)
+            return original_calculate(helper, chore_id, *args)
+
+        with patch.object(
+            AssigneeDashboardHelperSensor,
+            "_calculate_chore_attributes",
+            autospec=True,
+            side_effect=_count_calculate,
+        ):
+            _build_plan_for_user(scenario_density_80, "Zoë", plan)
+            assert calculated == []
+
+            await coordinator.chore_manager.claim_chore(zoe_id, first_chore_id, "Zoë")
+            await hass.async_block_till_done()
+            _build_plan_for_user(scenario_density_80, "Zoë", plan)
+
+        assert set(calculated) == {first_chore_id}
+
+    async def test_chore_rows_rebuild_after_user_scoped_writes_and_label_updates(
+        self,
+        hass: HomeAssistant,
+        scenario_density_80: SetupResult,
+    ) -> None:
+        """User-only persists and label registry changes invalidate cached rows."""
+        coordinator = scenario_density_80.coordinator
+        zoe_id = scenario_density_80.assignee_ids["Zoë"]
+        await coordinator.async_request_refresh()
+        await hass.async_block_till_done()
+        plan = _build_plan_for_user(scenario_density_80, "Zoë", None)
+        row_count = len(coordinator.ui_manager.get_chore_row_cache(zoe_id))
+        assert row_count > 0
+
+        original_calculate = AssigneeDashboardHelperSensor._calculate_chore_attributes
+        calculated: list[str] = []
+
+        def _count_calculate(helper, chore_id, *args):
+            calculated.append(chore_id)
+            return original_calculate(helper, chore_id, *args)
+
+        with patch.object(
+            AssigneeDashboardHelperSensor,
+            "_calculate_chore_attributes",
+            autospec=True,
+            side_effect=_count_calculate,
+        ):
+            # A user-scoped write naming no chore may touch any of its rows
+            coordinator._persist(changed={const.DATA_USERS: [zoe_id]})
+            _build_plan_for_user(scenario_density_80, "Zoë", plan)
+            assert len(calculated) == row_count
+
+            calculated.clear()
+            hass.bus.async_fire(
+                lr.EVENT_LABEL_REGISTRY_UPDATED,
+                {"action": "update", "label_id": "chores"},
+            )
+            await hass.async_block_till_done()
+            _build_plan_for_user(scenario_density_80, "Zoë", plan)
+            assert len(calculated) == row_count
+
     async def test_reload_reconstructs_shard_helpers_without_unavailable_entities(
         self,
         hass: HomeAssistant,
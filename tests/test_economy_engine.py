@@ -14,6 +14,7 @@ Test Categories:
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 import pytest
@@ -22,6 +23,7 @@ from custom_components.choreops import const
 from custom_components.choreops.engines.economy_engine import (
     EconomyEngine,
     InsufficientFundsError,
+    LedgerTimeIndex,
 )
 
 if TYPE_CHECKING:
@@ -406,3 +408,205 @@ class TestPruneLedger:
     def test_default_max_entries(self) -> None:
         """Test default max_entries value."""
         assert EconomyEngine.DEFAULT_MAX_LEDGER_ENTRIES == 50
+
+    def test_age_pruning_drops_expired_prefix(self) -> None:
+        """Test that entries older than max_age_days are trimmed from the front."""
+        now_utc = datetime(2026, 1, 31, 12, 0, tzinfo=UTC)
+        ledger = []
+        for day in range(1, 31):
+            entry = self._make_entry(day)
+            entry[const.DATA_LEDGER_TIMESTAMP] = f"2026-01-{day:02d}T12:00:00+00:00"
+            ledger.append(entry)
+
+        result = EconomyEngine.prune_ledger(
+            ledger, max_entries=50, max_age_days=7, now_utc=now_utc
+        )
+
+        assert result is ledger
+        assert [entry[const.DATA_LEDGER_AMOUNT] for entry in ledger] == list(
+            range(24, 31)
+        )
+
+    def test_age_pruning_keeps_ledger_when_oldest_in_range(self) -> None:
+        """Test that no entries are removed when the oldest is within retention."""
+        now_utc = datetime(2026, 1, 24, 13, 0, tzinfo=UTC)
+        ledger = [self._make_entry(i) for i in range(10)]
+        ledger.append({**self._make_entry(10), const.DATA_LEDGER_TIMESTAMP: "bad"})
+
+        EconomyEngine.prune_ledger(
+            ledger, max_entries=50, max_age_days=1, now_utc=now_utc
+        )
+
+        assert len(ledger) == 11
+
+    def _dated_ledger(self, days: range) -> list[LedgerEntry]:
+        """Helper to create one entry per January day at noon UTC."""
+        ledger = []
+        for day in days:
+            entry = self._make_entry(day)
+            entry[const.DATA_LEDGER_TIMESTAMP] = f"2026-01-{day:02d}T12:00:00+00:00"
+            ledger.append(entry)
+        return ledger
+
+    def test_age_pruning_keeps_bad_head_entry(self) -> None:
+        """Test that an unparseable head entry survives the expired prefix."""
+        now_utc = datetime(2026, 1, 31, 12, 0, tzinfo=UTC)
+        ledger = [
+            {**self._make_entry(0), const.DATA_LEDGER_TIMESTAMP: "bad"},
+            *self._dated_ledger(range(1, 31)),
+        ]
+
+        EconomyEngine.prune_ledger(
+            ledger, max_entries=50, max_age_days=7, now_utc=now_utc
+        )
+
+        assert [entry[const.DATA_LEDGER_AMOUNT] for entry in ledger] == [
+            0,
+            *range(24, 31),
+        ]
+
+    def test_age_pruning_keeps_bad_middle_entries(self) -> None:
+        """Test that unparseable entries are kept on either side of the cutoff."""
+        now_utc = datetime(2026, 1, 31, 12, 0, tzinfo=UTC)
+        ledger = self._dated_ledger(range(1, 31))
+        # Directly after the last expired day, and directly after the first kept one
+        ledger.insert(23, {**self._make_entry(99), const.DATA_LEDGER_TIMESTAMP: None})
+        ledger.insert(25, {**self._make_entry(98), const.DATA_LEDGER_TIMESTAMP: "x"})
+
+        EconomyEngine.prune_ledger(
+            ledger, max_entries=50, max_age_days=7, now_utc=now_utc
+        )
+
+        assert [entry[const.DATA_LEDGER_AMOUNT] for entry in ledger] == [
+            99,
+            24,
+            98,
+            *range(25, 31),
+        ]
+
+    def test_age_pruning_filters_out_of_order_ledger(self) -> None:
+        """Test that a restored out-of-order ledger keeps every recent entry."""
+        now_utc = datetime(2026, 1, 31, 12, 0, tzinfo=UTC)
+        ledger = [
+            *self._dated_ledger(range(2, 3)),
+            *self._dated_ledger(range(28, 29)),
+            *self._dated_ledger(range(3, 4)),
+            *self._dated_ledger(range(29, 30)),
+        ]
+
+        EconomyEngine.prune_ledger(
+            ledger, max_entries=50, max_age_days=7, now_utc=now_utc
+        )
+
+        assert [entry[const.DATA_LEDGER_AMOUNT] for entry in ledger] == [28, 29]
+
+    def test_age_pruning_keeps_index_aligned(self) -> None:
+        """Test that a passed index mirrors the ledger after age and cap pruning."""
+        now_utc = datetime(2026, 1, 31, 12, 0, tzinfo=UTC)
+        ledger = self._dated_ledger(range(1, 31))
+        ledger.insert(10, {**self._make_entry(99), const.DATA_LEDGER_TIMESTAMP: "x"})
+        index = LedgerTimeIndex(ledger)
+
+        EconomyEngine.prune_ledger(
+            ledger, max_entries=5, max_age_days=7, now_utc=now_utc, index=index
+        )
+
+        assert index.is_current(ledger)
+        assert [e[const.DATA_LEDGER_AMOUNT] for _, e in index.iter_entries()] == [
+            e[const.DATA_LEDGER_AMOUNT] for e in ledger
+        ]
+        assert [e[const.DATA_LEDGER_AMOUNT] for e in ledger] == list(range(26, 31))
+
+
+# =============================================================================
+# Test: LedgerTimeIndex
+# =============================================================================
+
+
+class TestLedgerTimeIndex:
+    """Tests for the chronological ledger time index."""
+
+    def _make_entry(self, amount: float, timestamp: str) -> LedgerEntry:
+        """Helper to create minimal ledger entry with a timestamp."""
+        return {
+            const.DATA_LEDGER_TIMESTAMP: timestamp,
+            const.DATA_LEDGER_AMOUNT: amount,
+            const.DATA_LEDGER_BALANCE_AFTER: 100.0,
+            const.DATA_LEDGER_SOURCE: const.POINTS_SOURCE_MANUAL,
+            const.DATA_LEDGER_REFERENCE_ID: None,
+        }
+
+    def _daily_ledger(self, days: range) -> list[LedgerEntry]:
+        """Helper to create one entry per January day at noon UTC."""
+        return [
+            self._make_entry(day, f"2026-01-{day:02d}T12:00:00+00:00") for day in days
+        ]
+
+    def test_range_is_inclusive_and_chronological(self) -> None:
+        """Test that range() bisects inclusive bounds and yields oldest first."""
+        index = LedgerTimeIndex(self._daily_ledger(range(1, 11)))
+
+        result = list(
+            index.range(
+                datetime(2026, 1, 3, 12, 0, tzinfo=UTC),
+                datetime(2026, 1, 5, 12, 0, tzinfo=UTC),
+            )
+        )
+
+        assert [entry[const.DATA_LEDGER_AMOUNT] for _, entry in result] == [3, 4, 5]
+        assert result[0][0] == datetime(2026, 1, 3, 12, 0, tzinfo=UTC).timestamp()
+
+    def test_range_skips_unparseable_timestamps(self) -> None:
+        """Test that entries without a valid timestamp are excluded from ranges."""
+        ledger = self._daily_ledger(range(1, 4))
+        ledger.insert(1, self._make_entry(99, "not-a-date"))
+        index = LedgerTimeIndex(ledger)
+
+        result = list(
+            index.range(
+                datetime(2026, 1, 1, tzinfo=UTC), datetime(2026, 1, 31, tzinfo=UTC)
+            )
+        )
+
+        assert [entry[const.DATA_LEDGER_AMOUNT] for _, entry in result] == [1, 2, 3]
+        assert len(list(index.iter_entries())) == 4
+
+    def test_append_and_trim_track_pruned_ledger(self) -> None:
+        """Test that append/trim keep the index aligned with prune_ledger."""
+        ledger = self._daily_ledger(range(1, 6))
+        index = LedgerTimeIndex(ledger)
+
+        entry = self._make_entry(6, "2026-01-06T12:00:00+00:00")
+        ledger.append(entry)
+        EconomyEngine.prune_ledger(ledger, max_entries=3)
+        index.append(entry)
+        index.trim(len(ledger))
+
+        assert index.is_current(ledger)
+        assert [e[const.DATA_LEDGER_AMOUNT] for _, e in index.iter_entries()] == [
+            4,
+            5,
+            6,
+        ]
+
+    def test_is_current_detects_external_edits(self) -> None:
+        """Test that replaced or edited ledgers invalidate the index."""
+        ledger = self._daily_ledger(range(1, 4))
+        index = LedgerTimeIndex(ledger)
+
+        assert not index.is_current(list(ledger))
+        ledger.append(self._make_entry(4, "2026-01-04T12:00:00+00:00"))
+        assert not index.is_current(ledger)
+
+    def test_out_of_order_ledger_uses_sorted_fallback(self) -> None:
+        """Test that restored out-of-order ledgers still yield chronological ranges."""
+        ledger = self._daily_ledger(range(5, 8)) + self._daily_ledger(range(1, 3))
+        index = LedgerTimeIndex(ledger)
+
+        result = list(
+            index.range(
+                datetime(2026, 1, 2, tzinfo=UTC), datetime(2026, 1, 6, 23, tzinfo=UTC)
+            )
+        )
+
+        assert [entry[const.DATA_LEDGER_AMOUNT] for _, entry in result] == [2, 5, 6]
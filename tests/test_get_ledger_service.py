@@ -90,6 +90,37 @@ async def test_get_ledger_returns_all_users_by_default(
         assert const.DATA_USER_NAME in entry
 
 
+async def test_get_ledger_merges_users_chronologically(
+    hass: HomeAssistant,
+    scenario_full: SetupResult,
+) -> None:
+    """get_ledger merges per-user ledgers oldest first and keeps the newest tail."""
+    coordinator = scenario_full.coordinator
+    zoe_id = scenario_full.assignee_ids["Zoë"]
+    max_id = scenario_full.assignee_ids["Max!"]
+
+    for assignee_id, item_name in (
+        (zoe_id, "First"),
+        (max_id, "Second"),
+        (zoe_id, "Third"),
+    ):
+        await coordinator.economy_manager.deposit(
+            assignee_id=assignee_id,
+            amount=1.0,
+            source=const.POINTS_SOURCE_MANUAL,
+            item_name=item_name,
+        )
+
+    response = await _call_get_ledger(hass, limit=3)
+
+    timestamps = [entry[const.DATA_LEDGER_TIMESTAMP] for entry in response["entries"]]
+    assert timestamps == sorted(timestamps)
+    assert [
+        (entry[const.DATA_USER_INTERNAL_ID], entry[const.DATA_LEDGER_ITEM_NAME])
+        for entry in response["entries"]
+    ] == [(zoe_id, "First"), (max_id, "Second"), (zoe_id, "Third")]
+
+
 async def test_get_ledger_filters_to_single_user(
     hass: HomeAssistant,
     scenario_full: SetupResult,
@@ -205,3 +236,58 @@ async def test_get_ledger_summary_totals(
     assert response["summary"]["total_earned"] == 10.0
     assert response["summary"]["total_spent"] == 4.0
     assert response["summary"]["net"] == 6.0
+
+
+async def test_get_ledger_page_mode_walks_cursor_oldest_first(
+    hass: HomeAssistant,
+    scenario_full: SetupResult,
+) -> None:
+    """get_ledger with page_size pages oldest first until next_cursor is None."""
+    coordinator = scenario_full.coordinator
+    zoe_id = scenario_full.assignee_ids["Zoë"]
+
+    for item_name in ("One", "Two", "Three"):
+        await coordinator.economy_manager.deposit(
+            assignee_id=zoe_id,
+            amount=1.0,
+            source=const.POINTS_SOURCE_MANUAL,
+            item_name=item_name,
+        )
+    expected_count = len(coordinator.economy_manager.get_history(zoe_id))
+
+    collected: list[str] = []
+    cursor: str | None = None
+    while True:
+        data: dict[str, Any] = {
+            const.SERVICE_FIELD_USER_NAME: "Zoë",
+            const.SERVICE_FIELD_PAGE_SIZE: 2,
+        }
+        if cursor is not None:
+            data[const.SERVICE_FIELD_PAGE_CURSOR] = cursor
+        response = await hass.services.async_call(
+            const.DOMAIN,
+            const.SERVICE_GET_LEDGER,
+            data,
+            blocking=True,
+            return_response=True,
+        )
+        assert isinstance(response, dict)
+        assert response["count"] <= 2
+        assert response["limit"] == const.DEFAULT_LEDGER_MAX_ENTRIES
+        assert response["summary"]["total_earned"] == round(
+            sum(
+                entry[const.DATA_LEDGER_AMOUNT]
+                for entry in response["entries"]
+                if entry[const.DATA_LEDGER_AMOUNT] >= 0
+            ),
+            const.DATA_FLOAT_PRECISION,
+        )
+        collected.extend(
+            entry[const.DATA_LEDGER_ITEM_NAME] for entry in response["entries"]
+        )
+        cursor = response["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(collected) == expected_count
+    assert collected[-3:] == ["One", "Two", "Three"]
@@ -30,6 +30,8 @@ from custom_components.choreops.helpers.auth_helpers import (
     is_user_authorized_for_action,
 )
 from custom_components.choreops.helpers.entity_helpers import (
+    AssignmentIndex,
+    NameIndex,
     build_orphan_detection_regex,
     get_integration_entities,
     get_item_id_by_name,
@@ -144,6 +146,91 @@ class TestEntityLookupHelpers:
                 role=const.ROLE_ASSIGNEE,
             )
 
+    async def test_lookup_is_case_insensitive(
+        self, hass: HomeAssistant, scenario_minimal: SetupResult
+    ) -> None:
+        """Should resolve a unique name regardless of case."""
+        coordinator = scenario_minimal.coordinator
+        chore_id = scenario_minimal.chore_ids["Make bed"]
+
+        result = get_item_id_by_name(coordinator, const.ITEM_TYPE_CHORE, "MAKE BED")
+
+        assert result == chore_id
+
+    async def test_lookup_follows_manager_rename(
+        self, hass: HomeAssistant, scenario_minimal: SetupResult
+    ) -> None:
+        """Should drop the old name and resolve the new one after an update."""
+        coordinator = scenario_minimal.coordinator
+        chore_id = scenario_minimal.chore_ids["Make bed"]
+        assert (
+            get_item_id_by_name(coordinator, const.ITEM_TYPE_CHORE, "Make bed")
+            == chore_id
+        )
+
+        coordinator.chore_manager.update_chore(
+            chore_id,
+            {const.DATA_CHORE_NAME: "Make the bed"},
+            immediate_persist=True,
+        )
+
+        assert (
+            get_item_id_by_name(coordinator, const.ITEM_TYPE_CHORE, "Make bed") is None
+        )
+        assert (
+            get_item_id_by_name(coordinator, const.ITEM_TYPE_CHORE, "make the bed")
+            == chore_id
+        )
+
+    async def test_name_index_reports_case_folded_duplicates(self) -> None:
+        """Should keep exact matches but refuse ambiguous case-folded names."""
+        records = {
+            "id-1": {"name": "Dishes"},
+            "id-2": {"name": "dishes"},
+            "id-3": {"name": "Laundry"},
+        }
+
+        index = NameIndex.build(records, "name", (len(records), 0))
+
+        assert index.duplicates == {"dishes": ["id-1", "id-2"]}
+        assert index.lookup("Dishes") == "id-1"
+        assert index.lookup("dishes") == "id-2"
+        assert index.lookup("DISHES") is None
+        assert index.lookup("laundry") == "id-3"
+
+    async def test_assignment_index_tracks_both_directions(self) -> None:
+        """Should keep assignee and item views in sync through patches."""
+        records: dict[str, Any] = {
+            "chore-1": {const.DATA_ASSIGNED_USER_IDS: ["zoe", "max"]},
+            "chore-2": {const.DATA_ASSIGNED_USER_IDS: []},
+            "chore-3": {const.DATA_ASSIGNED_USER_IDS: ["zoe"]},
+        }
+
+        index = AssignmentIndex.build(records, const.DATA_ASSIGNED_USER_IDS)
+
+        assert index.item_ids_for("zoe") == ["chore-1", "chore-3"]
+        assert index.item_ids_for("max", include_unassigned=True) == [
+            "chore-1",
+            "chore-2",
+        ]
+        assert index.assignees_for("chore-1") == frozenset({"zoe", "max"})
+
+        records["chore-1"][const.DATA_ASSIGNED_USER_IDS] = ["max"]
+        index.update_item("chore-1")
+        del records["chore-3"]
+        index.update_item("chore-3")
+
+        assert index.item_ids_for("zoe") == []
+        assert "zoe" not in index.by_assignee
+
+        index.remove_assignee("max")
+
+        assert index.assignees_for("chore-1") == frozenset()
+        assert index.item_ids_for("anyone", include_unassigned=True) == [
+            "chore-1",
+            "chore-2",
+        ]
+
 
 class TestEntityRegistryUtilities:
     """Test entity registry query and parsing utilities."""
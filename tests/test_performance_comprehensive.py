@@ -3,7 +3,7 @@
 Measures actual expensive operations:
 - Badge checking operations
 - Overdue chore checking
-- Storage persistence operations
+- Storage persistence operations (full vs dirty-scoped snapshots)
 - Entity creation and registration
 
 **Run with default scenario (scenario_stress.yaml)**:
@@ -25,6 +25,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 import pytest
 
+from custom_components.choreops import const
+from custom_components.choreops.store import ChoreOpsStore
 from custom_components.choreops.utils.dt_utils import dt_now_utc
 from tests.helpers import setup_from_yaml
 
@@ -204,3 +206,198 @@ async def test_scenario_performance(
 
     finally:
         ha_logger.setLevel(original_level)
+
+
+def _build_persist_benchmark_payload(
+    user_count: int, chore_count: int, ledger_size: int
+) -> dict[str, Any]:
+    """Build a synthetic storage payload with history-heavy user records."""
+    payload = ChoreOpsStore.get_default_structure()
+    payload[const.DATA_CHORES] = {
+        f"chore_{index}": {
+            const.DATA_CHORE_INTERNAL_ID: f"chore_{index}",
+            const.DATA_CHORE_NAME: f"Chore {index}",
+            const.DATA_CHORE_ASSIGNED_USER_IDS: [
+                f"user_{user_index}" for user_index in range(user_count)
+            ],
+        }
+        for index in range(chore_count)
+    }
+    payload[const.DATA_USERS] = {
+        f"user_{index}": {
+            const.DATA_USER_INTERNAL_ID: f"user_{index}",
+            const.DATA_USER_NAME: f"User {index}",
+            const.DATA_USER_POINTS: 0.0,
+            const.DATA_USER_LEDGER: [
+                {"timestamp": f"2026-01-01T00:00:{entry % 60:02d}", "delta": 1.0}
+                for entry in range(ledger_size)
+            ],
+            const.DATA_USER_CHORE_DATA: {
+                f"chore_{chore_index}": {
+                    const.DATA_USER_CHORE_DATA_PERIODS: {
+                        "daily": {
+                            f"2026-01-{day:02d}": {"approved": 1}
+                            for day in range(1, 29)
+                        }
+                    }
+                }
+                for chore_index in range(chore_count)
+            },
+        }
+        for index in range(user_count)
+    }
+    return payload
+
+
+@pytest.mark.timeout(120)
+async def test_incremental_persist_scales_with_mutations(hass: HomeAssistant) -> None:
+    """Benchmark dirty-scoped store sync against a full snapshot.
+
+    Full snapshots copy every bucket, so their cost follows total data size.
+    Dirty-scoped syncs copy only marked items, so their cost follows the number
+    of mutated items.
+    """
+    payload = _build_persist_benchmark_payload(
+        user_count=40, chore_count=60, ledger_size=500
+    )
+    store = ChoreOpsStore(hass)
+
+    full_start = time.perf_counter()
+    assert store.set_data(payload)
+    full_ms = (time.perf_counter() - full_start) * 1000
+
+    incremental_ms: dict[int, float] = {}
+    user_ids = list(payload[const.DATA_USERS])
+    for mutated_count in (1, 5, 20):
+        for user_id in user_ids[:mutated_count]:
+            payload[const.DATA_USERS][user_id][const.DATA_USER_POINTS] += 1.0
+            store.mark_dirty(const.DATA_USERS, [user_id])
+
+        sync_start = time.perf_counter()
+        assert store.sync_data(payload)
+        incremental_ms[mutated_count] = (time.perf_counter() - sync_start) * 1000
+
+        for user_id in user_ids[:mutated_count]:
+            assert (
+                store.data[const.DATA_USERS][user_id][const.DATA_USER_POINTS]
+                == payload[const.DATA_USERS][user_id][const.DATA_USER_POINTS]
+            )
+
+    print(
+        f"\n💾 PERSIST: full={full_ms:.2f}ms | "
+        + " | ".join(
+            f"{count} dirty={duration:.2f}ms"
+            for count, duration in incremental_ms.items()
+        )
+    )
+
+    # Single-item saves must be a small fraction of a full snapshot, and cost
+    # must grow with the number of mutated items rather than total data size.
+    assert incremental_ms[1] < full_ms / 5
+    assert incremental_ms[1] < incremental_ms[20]
+
+
+@pytest.mark.timeout(120)
+async def test_role_views_are_cached_between_user_mutations(
+    hass: HomeAssistant,
+    mock_hass_users: dict[str, Any],
+) -> None:
+    """Role views are built once per users revision, not once per access."""
+    setup_result = await setup_from_yaml(hass, mock_hass_users, DEFAULT_SCENARIO)
+    coordinator = setup_result.config_entry.runtime_data
+
+    assignees = coordinator.assignees_data
+    approvers = coordinator.approvers_data
+    users = coordinator.users_data
+
+    start = time.perf_counter()
+    for _ in range(10000):
+        assert coordinator.assignees_data is assignees
+        assert coordinator.approvers_data is approvers
+        assert coordinator.users_data is users
+    cached_read_ms = (time.perf_counter() - start) * 1000
+    print(f"\n📊 30k cached role-view reads: {cached_read_ms:.2f}ms")
+
+    # Ordinary persists, including users-bucket writes, leave the views alone
+    coordinator._persist(changed={const.DATA_CHORES: []})
+    coordinator._persist(changed={const.DATA_USERS: [next(iter(assignees))]})
+    coordinator._persist()
+    assert coordinator.assignees_data is assignees
+
+    # User CRUD invalidates them and the rebuilt view reflects new role flags
+    assignee_id = next(iter(assignees))
+    coordinator.user_manager.update_user(
+        assignee_id, {const.DATA_USER_CAN_APPROVE: True}
+    )
+    assert coordinator.assignees_data is not assignees
+    assert assignee_id in coordinator.approvers_data
+
+
+@pytest.mark.timeout(120)
+async def test_recalculate_all_badges_shares_stats_reads_per_assignee(
+    hass: HomeAssistant,
+    mock_hass_users: dict[str, Any],
+) -> None:
+    """Benchmark a full badge recalculation on the stress scenario.
+
+    Each assignee's evaluation pass memoizes stats reads in a snapshot, so a
+    tracked-chore scope is read at most once per assignee per batch no matter
+    how many badges and achievements share it.
+    """
+    setup_result = await setup_from_yaml(hass, mock_hass_users, DEFAULT_SCENARIO)
+    coordinator = setup_result.config_entry.runtime_data
+    manager = coordinator.gamification_manager
+    stats_manager = coordinator.statistics_manager
+
+    completion_reads: list[tuple[str, tuple[str, ...], str, bool]] = []
+    original_completion = stats_manager.get_badge_scoped_today_completion
+
+    def _count_completion(
+        assignee_id: str,
+        tracked_chores: list[str],
+        *,
+        today_iso: str,
+        only_due_today: bool,
+    ) -> dict[str, Any]:
+        completion_reads.append(
+            (assignee_id, tuple(tracked_chores), today_iso, only_due_today)
+        )
+        return original_completion(
+            assignee_id,
+            tracked_chores,
+            today_iso=today_iso,
+            only_due_today=only_due_today,
+        )
+
+    with (
+        patch.object(
+            stats_manager,
+            "get_badge_scoped_today_completion",
+            side_effect=_count_completion,
+        ),
+        patch.object(
+            coordinator.notification_manager,
+            "notify_assignee_translated",
+            new=AsyncMock(),
+        ),
+        patch.object(
+            coordinator.notification_manager,
+            "notify_approvers_translated",
+            new=AsyncMock(),
+        ),
+    ):
+        start = time.perf_counter()
+        manager.recalculate_all_badges()
+        await manager._evaluate_pending_assignees()
+        recalc_ms = (time.perf_counter() - start) * 1000
+
+    print(
+        f"\n🏅 RECALC: {len(coordinator.assignees_data)} assignees x "
+        f"{len(coordinator.badges_data)} badges + "
+        f"{len(coordinator.achievements_data)} achievements = {recalc_ms:.2f}ms | "
+        f"{len(completion_reads)} completion reads"
+    )
+
+    assert manager._evaluation_snapshots == {}
+    assert len(completion_reads) == len(set(completion_reads))
+    assert recalc_ms < max(1500, len(coordinator.assignees_data) * 150)
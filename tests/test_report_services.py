@@ -365,3 +365,73 @@ def test_build_activity_report_honors_report_style(
     assert ("# ChoreOps Activity Report" in markdown) is expect_automation_header
     assert ("## 📊 Weekly summary" in markdown) is expect_assignee_header
     assert ("\n\n---\n\n" in markdown) is expect_splitter
+
+
+def test_build_activity_report_page_follows_cursor_newest_first() -> None:
+    """Paged reports return day blocks newest first and resume from next_cursor."""
+    range_result = report_helpers.resolve_report_range(
+        mode=const.REPORT_RANGE_MODE_CUSTOM,
+        start_date=datetime(2026, 2, 10, tzinfo=UTC),
+        end_date=datetime(2026, 2, 12, tzinfo=UTC),
+    )
+    assignees_data = _build_test_assignees_data()
+
+    first_page = report_helpers.build_activity_report_page(
+        assignees_data, range_result, "assignee-1", page_size=1
+    )
+
+    assert [block["date"] for block in first_page["daily"]] == ["2026-02-11"]
+    assert first_page["next_cursor"] == "2026-02-10"
+    assert first_page["summary"]["net"] == 7.0
+    assert "Screen Time" in first_page["markdown"]
+
+    second_page = report_helpers.build_activity_report_page(
+        assignees_data,
+        range_result,
+        "assignee-1",
+        cursor=first_page["next_cursor"],
+        page_size=1,
+    )
+
+    assert [block["date"] for block in second_page["daily"]] == ["2026-02-10"]
+    assert second_page["next_cursor"] is None
+    assert "summary" not in second_page
+    assert "Dishes" in second_page["markdown"]
+
+
+def test_build_activity_report_page_stops_at_size_budget() -> None:
+    """Paged reports stop adding day blocks once the character budget is hit."""
+    range_result = report_helpers.resolve_report_range(
+        mode=const.REPORT_RANGE_MODE_CUSTOM,
+        start_date=datetime(2026, 2, 10, tzinfo=UTC),
+        end_date=datetime(2026, 2, 12, tzinfo=UTC),
+    )
+
+    page = report_helpers.build_activity_report_page(
+        _build_test_assignees_data(),
+        range_result,
+        "assignee-1",
+        page_size=7,
+        max_chars=1,
+    )
+
+    assert len(page["daily"]) == 1
+    assert page["next_cursor"] == "2026-02-10"
+
+
+def test_iter_ledger_stream_resumes_after_cursor_without_duplicates() -> None:
+    """Ledger stream cursors resume across entries that share a timestamp."""
+    assignees_data = _build_test_assignees_data()
+    ledger = assignees_data["assignee-1"][const.DATA_USER_LEDGER]
+    ledger.append({**ledger[-1], const.DATA_LEDGER_ITEM_NAME: "Same Time"})
+
+    items = list(report_helpers.iter_ledger_stream(assignees_data, ["assignee-1"]))
+    resumed = list(
+        report_helpers.iter_ledger_stream(
+            assignees_data, ["assignee-1"], cursor=items[1][0]
+        )
+    )
+
+    assert [item[2][const.DATA_LEDGER_ITEM_NAME] for item in resumed] == ["Same Time"]
+    with pytest.raises(ValueError):
+        report_helpers.iter_ledger_stream(assignees_data, ["assignee-1"], cursor="x")
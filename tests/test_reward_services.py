@@ -12,6 +12,7 @@ See tests/AGENT_TEST_CREATION_INSTRUCTIONS.md for patterns used.
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, patch
 
@@ -294,16 +295,10 @@ class TestApproveRewardCostOverride:
                 }
             )
 
-        with (
-            patch.object(
-                coordinator.notification_manager,
-                "notify_approvers_translated",
-                new=capture_approver_notification,
-            ),
-            patch(
-                "custom_components.choreops.managers.notification_manager.asyncio.sleep",
-                new=AsyncMock(),
-            ),
+        with patch.object(
+            coordinator.notification_manager,
+            "notify_approvers_translated",
+            new=capture_approver_notification,
         ):
             await coordinator.reward_manager.redeem(
                 approver_name="Zoë",
@@ -315,6 +310,9 @@ class TestApproveRewardCostOverride:
                 30,
                 reward_id=reward_id,
             )
+            await coordinator.notification_manager.async_send_due_reminders(
+                now=time.time() + 3600
+            )
             await hass.async_block_till_done()
 
         assert len(approver_calls) == 2
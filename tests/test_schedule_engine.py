@@ -12,7 +12,8 @@ Tests edge cases per Phase 2a plan:
 - EC-09: MAX_ITERATIONS safety limit (stubbed for loop protection)
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
+import time
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
@@ -619,6 +620,127 @@ class TestGetOccurrences:
         assert len(occurrences) == 10
 
 
+# One config per frequency family; weekday filters exercise rrule byweekday
+# and relativedelta snapping
+BATCH_FREQUENCY_CONFIGS: "list[ScheduleConfig]" = [
+    {"frequency": const.FREQUENCY_DAILY},
+    {"frequency": const.FREQUENCY_DAILY, "applicable_days": [0, 2, 4]},
+    {"frequency": const.FREQUENCY_WEEKLY},
+    {"frequency": const.FREQUENCY_BIWEEKLY, "applicable_days": [1, 3]},
+    {"frequency": const.FREQUENCY_MONTHLY},
+    {"frequency": const.FREQUENCY_QUARTERLY},
+    {"frequency": const.FREQUENCY_YEARLY},
+    {
+        "frequency": const.FREQUENCY_CUSTOM,
+        "interval": 3,
+        "interval_unit": const.TIME_UNIT_DAYS,
+        "applicable_days": [5, 6],
+    },
+    {
+        "frequency": const.FREQUENCY_CUSTOM,
+        "interval": 2,
+        "interval_unit": const.TIME_UNIT_MONTHS,
+    },
+    {
+        "frequency": const.FREQUENCY_CUSTOM_FROM_COMPLETE,
+        "interval": 10,
+        "interval_unit": const.TIME_UNIT_HOURS,
+    },
+    {"frequency": const.FREQUENCY_DAILY_MULTI, "daily_multi_times": "08:00|18:00"},
+    {"frequency": const.PERIOD_DAY_END},
+    {"frequency": const.PERIOD_WEEK_END},
+    {"frequency": const.PERIOD_MONTH_END},
+    {"frequency": const.PERIOD_QUARTER_END},
+    {"frequency": const.PERIOD_YEAR_END},
+]
+
+
+def _batch_config(config: "ScheduleConfig") -> "ScheduleConfig":
+    """Return a frequency config anchored on a fixed base date."""
+    return {"base_date": "2026-01-31T17:30:00+00:00", **config}
+
+
+def _chained_occurrences(
+    engine: RecurrenceEngine, start: datetime, end: datetime, limit: int
+) -> list[datetime]:
+    """Reference expansion: one get_next_occurrence() call per occurrence."""
+    occurrences: list[datetime] = []
+    current = engine.get_next_occurrence(after=start, require_future=False)
+    iteration = 0
+    while current and current <= end and iteration < limit:
+        if current >= start:
+            occurrences.append(current)
+        current = engine.get_next_occurrence(after=current, require_future=True)
+        iteration += 1
+    return occurrences
+
+
+class TestBatchOccurrences:
+    """Test batch get_occurrences() against chained next-occurrence calls."""
+
+    @pytest.mark.parametrize(
+        "config",
+        BATCH_FREQUENCY_CONFIGS,
+        ids=lambda config: "-".join(
+            [config["frequency"], *map(str, config.get("applicable_days", []))]
+        ),
+    )
+    def test_batch_matches_chained_next_occurrence(
+        self, config: "ScheduleConfig"
+    ) -> None:
+        """Batch iteration yields exactly the chained occurrence series."""
+        engine = RecurrenceEngine(_batch_config(config))
+        start = make_utc_dt(2026, 2, 3, 9)
+        end = start + timedelta(days=366)
+
+        batch = engine.get_occurrences(start, end, limit=1000)
+
+        assert batch
+        assert batch == _chained_occurrences(engine, start, end, 1000)
+
+    def test_rrule_is_compiled_once(self) -> None:
+        """The rrule path reuses one compiled rule across calls."""
+        engine = RecurrenceEngine(_batch_config({"frequency": const.FREQUENCY_DAILY}))
+
+        engine.get_next_occurrence(after=make_utc_dt(2026, 2, 1))
+        rule = engine._compiled_rule
+        engine.get_occurrences(make_utc_dt(2026, 3, 1), make_utc_dt(2026, 4, 1))
+
+        assert rule is not None
+        assert engine._compiled_rule is rule
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize(
+    "config",
+    BATCH_FREQUENCY_CONFIGS,
+    ids=lambda config: "-".join(
+        [config["frequency"], *map(str, config.get("applicable_days", []))]
+    ),
+)
+def test_get_occurrences_one_year_benchmark(config: "ScheduleConfig") -> None:
+    """Micro-benchmark: 1-year batch expansion versus chained next calls."""
+    engine = RecurrenceEngine(_batch_config(config))
+    start = make_utc_dt(2026, 2, 1, 0)
+    end = start + timedelta(days=365)
+
+    started = time.perf_counter()
+    batch = engine.get_occurrences(start, end, limit=1000)
+    batch_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    chained = _chained_occurrences(engine, start, end, 1000)
+    chained_seconds = time.perf_counter() - started
+
+    print(
+        f"get_occurrences 1y | frequency={config['frequency']} "
+        f"| occurrences={len(batch)} | batch={batch_seconds * 1000:.2f}ms "
+        f"| chained={chained_seconds * 1000:.2f}ms"
+    )
+    assert batch == chained
+    assert batch_seconds < 0.5
+
+
 # =============================================================================
 # to_rrule_string() tests
 # =============================================================================
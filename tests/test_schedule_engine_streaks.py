@@ -6,12 +6,15 @@ Tests schedule-aware streak calculation logic:
 - HMO-07 to HMO-08: Weekly frequency scenarios
 - HMO-09 to HMO-10: Monthly frequency scenarios
 - HMO-11 to HMO-15: Edge cases (FREQUENCY_NONE, same-day, biweekly, applicable_days)
+- HMO-16 to HMO-17: Long gaps resolve without expanding the occurrence range
 
 Reference: STREAK_SYSTEM_IN-PROCESS.md Phase 3 Test Scenarios
 """
 
 from datetime import UTC, datetime
 
+import pytest
+
 from custom_components.choreops import const
 from custom_components.choreops.engines.schedule_engine import RecurrenceEngine
 from custom_components.choreops.type_defs import ScheduleConfig
@@ -354,3 +357,47 @@ class TestHasMissedOccurrences:
 
         # Consecutive Mondays = no missed occurrence
         assert result is False, "Consecutive Mondays should not break weekly streak"
+
+    # -------------------------------------------------------------------------
+    # HMO-16 to HMO-17: Long gaps (constant-time check)
+    # -------------------------------------------------------------------------
+
+    def test_hmo_16_hourly_long_gap_is_closed_form(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Hourly chore across a long vacation: missed, without range expansion."""
+        config = make_config(
+            frequency=const.FREQUENCY_CUSTOM,
+            base_date="2024-01-01T10:00:00+00:00",
+            interval=1,
+            interval_unit=const.TIME_UNIT_HOURS,
+        )
+        engine = RecurrenceEngine(config)
+
+        def _no_range_expansion(*_args: object, **_kwargs: object) -> list[datetime]:
+            raise AssertionError("has_missed_occurrences expanded the range")
+
+        monkeypatch.setattr(engine, "get_occurrences", _no_range_expansion)
+
+        last = make_utc_dt(2026, 1, 1, 10)
+        within_hour = make_utc_dt(2026, 1, 1, 10, 30)
+        after_vacation = make_utc_dt(2026, 7, 1, 10)
+
+        assert engine.has_missed_occurrences(last, within_hour) is False
+        assert engine.has_missed_occurrences(last, after_vacation) is True
+
+    def test_hmo_17_weekly_long_gap_uses_single_rule_step(self) -> None:
+        """Weekly chore: on-time after a week, missed after a half-year gap."""
+        config = make_config(
+            frequency=const.FREQUENCY_WEEKLY,
+            base_date="2026-01-05T10:00:00+00:00",
+            applicable_days=[0],
+        )
+        engine = RecurrenceEngine(config)
+
+        last = make_utc_dt(2026, 1, 5, 10)
+
+        assert (
+            engine.has_missed_occurrences(last, make_utc_dt(2026, 1, 12, 10)) is False
+        )
+        assert engine.has_missed_occurrences(last, make_utc_dt(2026, 7, 6, 10)) is True
@@ -783,6 +783,85 @@ class TestGetPeriodTotal:
         assert result == 50
 
 
+class TestDailyRangeIndex:
+    """Tests for memoized daily range sums and maxima."""
+
+    def test_range_sum_and_max_match_bucket_scan(self, stats: StatisticsEngine) -> None:
+        """Range queries should match a direct scan of in-range buckets."""
+        daily = {
+            f"2026-01-{day:02d}": {"approved": day, "max_seconds": (day * 7) % 11}
+            for day in range(1, 32)
+        }
+        daily["2026-01-15"] = {"max_seconds": "bad"}
+        index = stats.get_daily_range_index(daily)
+
+        for start, end in (
+            ("2026-01-01", "2026-01-31"),
+            ("2026-01-05", "2026-01-05"),
+            ("2026-01-10", "2026-01-20"),
+            ("2025-12-01", "2026-01-03"),
+            ("2026-02-01", "2026-02-28"),
+        ):
+            in_range = [bucket for key, bucket in daily.items() if start <= key <= end]
+            expected_sum = sum(bucket.get("approved", 0) for bucket in in_range)
+            expected_max = max(
+                [0]
+                + [
+                    value
+                    for bucket in in_range
+                    if isinstance(value := bucket.get("max_seconds", 0), int)
+                ]
+            )
+            assert index.sum("approved", start, end) == expected_sum
+            assert index.max("max_seconds", start, end) == expected_max
+
+    def test_index_is_memoized_until_recorded(self, stats: StatisticsEngine) -> None:
+        """record_transaction should drop the memoized index for its container."""
+        periods: dict[str, Any] = {"daily": {"2026-01-18": {"approved": 1}}}
+        index = stats.get_daily_range_index(periods["daily"])
+        assert stats.get_daily_range_index(periods["daily"]) is index
+
+        stats.record_transaction(
+            periods,
+            increments={"approved": 2},
+            reference_date=date(2026, 1, 18),
+        )
+
+        rebuilt = stats.get_daily_range_index(periods["daily"])
+        assert rebuilt is not index
+        assert rebuilt.sum("approved", "2026-01-01", "2026-01-31") == 3
+
+    def test_index_tracks_container_revision(self, stats: StatisticsEngine) -> None:
+        """Maxima and prunes bump the revision; other edits need invalidation."""
+        periods: dict[str, Any] = {
+            "daily": {"2026-01-01": {"max_seconds": 5}, "2026-01-18": {}}
+        }
+        index = stats.get_daily_range_index(periods["daily"])
+
+        stats.record_maximum(
+            periods,
+            maximums={"max_seconds": 9},
+            reference_date=date(2026, 1, 18),
+        )
+        index = stats.get_daily_range_index(periods["daily"])
+        assert index.max("max_seconds", "2026-01-01", "2026-01-31") == 9
+
+        stats.prune_history(
+            periods,
+            retention_config={const.PERIOD_DAILY: 7},
+            reference_date=date(2026, 1, 18),
+        )
+        index = stats.get_daily_range_index(periods["daily"])
+        assert index.day_keys == ["2026-01-18"]
+
+        # Same day count, edited outside the engine: explicit invalidation
+        periods["daily"]["2026-01-18"]["max_seconds"] = 42
+        assert stats.get_daily_range_index(periods["daily"]) is index
+        stats.invalidate_range_index(periods)
+        index = stats.get_daily_range_index(periods["daily"])
+        assert index.max("max_seconds", "2026-01-01", "2026-01-31") == 42
+
+
 class TestEdgeCases:
     """Tests for edge cases and integration scenarios."""
 
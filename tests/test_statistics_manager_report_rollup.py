@@ -243,7 +243,7 @@ def test_chore_overdue_resolved_records_duration_to_both_buckets() -> None:
         },
         _data={},
         _persist=MagicMock(),
-        async_set_updated_data=MagicMock(),
+        async_set_updated_data_for=MagicMock(),
     )
 
     def _get_assignee(
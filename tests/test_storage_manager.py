@@ -573,6 +573,151 @@ async def test_async_initialize_repairs_internal_id_mismatch(
     )
 
 
+def _build_sync_payload() -> dict:
+    """Return a modern payload with a few users and chores for sync tests."""
+    payload = ChoreOpsStore.get_default_structure()
+    payload[const.DATA_USERS] = {
+        f"user_{index}": {
+            const.DATA_USER_INTERNAL_ID: f"user_{index}",
+            const.DATA_USER_NAME: f"User {index}",
+            const.DATA_USER_POINTS: 0.0,
+        }
+        for index in range(3)
+    }
+    payload[const.DATA_CHORES] = {
+        "chore_1": {const.DATA_CHORE_INTERNAL_ID: "chore_1", "name": "Dishes"}
+    }
+    return payload
+
+
+async def test_sync_data_first_call_takes_full_snapshot(
+    hass: HomeAssistant,
+    store: ChoreOpsStore,
+) -> None:
+    """Test sync_data falls back to a full snapshot before any baseline exists."""
+    payload = _build_sync_payload()
+
+    assert store.sync_data(payload)
+
+    assert store.data == payload
+    assert store.data[const.DATA_USERS] is not payload[const.DATA_USERS]
+
+
+async def test_sync_data_only_snapshots_dirty_items(
+    hass: HomeAssistant,
+    store: ChoreOpsStore,
+) -> None:
+    """Test sync_data re-snapshots marked items and leaves others untouched."""
+    payload = _build_sync_payload()
+    assert store.sync_data(payload)
+    previous_snapshot = store.data
+    untouched_user = previous_snapshot[const.DATA_USERS]["user_2"]
+
+    payload[const.DATA_USERS]["user_0"][const.DATA_USER_POINTS] = 10.0
+    payload[const.DATA_USERS]["user_2"][const.DATA_USER_POINTS] = 99.0
+    store.mark_dirty(const.DATA_USERS, ["user_0"])
+
+    assert store.sync_data(payload)
+
+    users = store.data[const.DATA_USERS]
+    assert users["user_0"][const.DATA_USER_POINTS] == 10.0
+    # Unmarked item keeps its previous snapshot object
+    assert users["user_2"] is untouched_user
+    assert users["user_2"][const.DATA_USER_POINTS] == 0.0
+    # Previous snapshot is detached from the new one (safe for in-flight saves)
+    assert previous_snapshot[const.DATA_USERS]["user_0"][const.DATA_USER_POINTS] == 0.0
+
+
+async def test_sync_data_handles_item_deletion_and_unmarked_inserts(
+    hass: HomeAssistant,
+    store: ChoreOpsStore,
+) -> None:
+    """Test deletions apply and unmarked inserts trigger a bucket re-snapshot."""
+    payload = _build_sync_payload()
+    assert store.sync_data(payload)
+
+    del payload[const.DATA_USERS]["user_1"]
+    payload[const.DATA_CHORES]["chore_2"] = {"name": "Laundry"}
+    store.mark_dirty(const.DATA_USERS, ["user_1"])
+    store.mark_dirty(const.DATA_CHORES, ["chore_1"])
+
+    assert store.sync_data(payload)
+
+    assert "user_1" not in store.data[const.DATA_USERS]
+    chore_2 = store.data[const.DATA_CHORES]["chore_2"]
+    assert chore_2[const.DATA_CHORE_INTERNAL_ID] == "chore_2"
+
+
+async def test_sync_data_full_resync_after_mark_all_dirty(
+    hass: HomeAssistant,
+    store: ChoreOpsStore,
+) -> None:
+    """Test mark_all_dirty forces the next sync to pick up every change."""
+    payload = _build_sync_payload()
+    assert store.sync_data(payload)
+
+    payload[const.DATA_USERS]["user_2"][const.DATA_USER_POINTS] = 5.0
+    store.mark_all_dirty()
+
+    assert store.sync_data(payload)
+    assert store.data[const.DATA_USERS]["user_2"][const.DATA_USER_POINTS] == 5.0
+
+
+async def test_sync_data_rejects_invalid_dirty_item(
+    hass: HomeAssistant,
+    store: ChoreOpsStore,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test sync_data validates dirty items and keeps the previous snapshot."""
+    payload = _build_sync_payload()
+    assert store.sync_data(payload)
+
+    payload[const.DATA_CHORES]["chore_1"] = "corrupt"
+    store.mark_dirty(const.DATA_CHORES, ["chore_1"])
+
+    assert not store.sync_data(payload)
+    assert isinstance(store.data[const.DATA_CHORES]["chore_1"], dict)
+    assert "Rejected invalid storage payload in sync_data" in caplog.text
+
+
+async def test_sync_data_verify_recovers_unmarked_changes(
+    hass: HomeAssistant,
+    store: ChoreOpsStore,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test verify mode falls back to a full snapshot for unmarked edits."""
+    payload = _build_sync_payload()
+    assert store.sync_data(payload)
+
+    payload[const.DATA_USERS]["user_0"][const.DATA_USER_POINTS] = 10.0
+    payload[const.DATA_USERS]["user_2"][const.DATA_USER_POINTS] = 99.0
+    store.mark_dirty(const.DATA_USERS, ["user_0"])
+
+    assert store.sync_data(payload, verify=True)
+
+    assert store.data[const.DATA_USERS]["user_2"][const.DATA_USER_POINTS] == 99.0
+    assert "Scoped persist missed unmarked changes" in caplog.text
+    assert "users/user_2" in caplog.text
+    assert "users/user_0" not in caplog.text
+
+
+async def test_sync_data_strict_verify_raises_after_full_snapshot(
+    hass: HomeAssistant,
+    store: ChoreOpsStore,
+) -> None:
+    """Test strict verify raises on unmarked edits once the snapshot is repaired."""
+    payload = _build_sync_payload()
+    assert store.sync_data(payload)
+
+    payload[const.DATA_USERS]["user_2"][const.DATA_USER_POINTS] = 99.0
+    store.mark_dirty(const.DATA_USERS, ["user_0"])
+
+    with pytest.raises(RuntimeError, match="users/user_2"):
+        store.sync_data(payload, verify=True, strict=True)
+
+    assert store.data[const.DATA_USERS]["user_2"][const.DATA_USER_POINTS] == 99.0
+
+
 async def test_custom_storage_key(hass: HomeAssistant) -> None:
     """Test store with custom storage key."""
     custom_key = "test_storage_key"
@@ -20,10 +20,15 @@ import json
 from pathlib import Path
 from typing import Any
 
+from homeassistant.core import HomeAssistant
 import pytest
 
 # Import const for tests that verify constant existence in source module
 from custom_components.choreops import const
+from custom_components.choreops.helpers.translation_helpers import (
+    clear_translation_cache,
+    load_notification_translation,
+)
 from tests.helpers import (
     TRANS_KEY_NOTIF_ACTION_APPROVE,
     TRANS_KEY_NOTIF_ACTION_DISAPPROVE,
@@ -307,6 +312,22 @@ class TestMultiLanguageNotifications:
                     f"{language}: Empty translation for '{key}'"
                 )
 
+    async def test_loader_fills_missing_keys_from_english(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Keys a language file lacks are served from English."""
+        sk_file = load_notification_translations("sk")
+        assert "chore_digest_assignee" not in sk_file
+
+        clear_translation_cache()
+        translations = await load_notification_translation(hass, "sk")
+
+        english = load_notification_translations("en")
+        assert translations["chore_digest_assignee"] == (
+            english["chore_digest_assignee"]
+        )
+        assert translations["actions"]["approve"] == sk_file["actions"]["approve"]
+
 
 class TestMultiLanguageDashboard:
     """Verify non-English dashboard translations are valid."""
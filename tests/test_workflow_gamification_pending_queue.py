@@ -60,6 +60,68 @@ class TestGamificationPendingQueueEvents:
         )
         assert pending_meta == []
 
+    async def test_pending_signal_families_limit_evaluated_targets(
+        self,
+        hass: HomeAssistant,
+        setup_minimal: SetupResult,
+    ) -> None:
+        """Points-only signals skip badges that depend solely on chore activity."""
+        coordinator = setup_minimal.coordinator
+        manager = coordinator.gamification_manager
+        assignee_id = next(iter(coordinator.assignees_data.keys()))
+
+        # Drain the full re-evaluation queued at startup so only the signals
+        # below decide which families are pending
+        await manager._drain_pending_evaluations_now()
+        await hass.async_block_till_done()
+
+        coordinator.badges_data["badge-points"] = {
+            const.DATA_BADGE_TYPE: const.BADGE_TYPE_PERIODIC,
+            const.DATA_BADGE_TARGET: {
+                const.DATA_BADGE_TARGET_TYPE: const.BADGE_TARGET_THRESHOLD_TYPE_POINTS
+            },
+        }
+        coordinator.badges_data["badge-streak"] = {
+            const.DATA_BADGE_TYPE: const.BADGE_TYPE_PERIODIC,
+            const.DATA_BADGE_TARGET: {
+                const.DATA_BADGE_TARGET_TYPE: (
+                    const.BADGE_TARGET_THRESHOLD_TYPE_STREAK_SELECTED_CHORES
+                )
+            },
+        }
+
+        evaluated: list[str] = []
+
+        async def _capture_badge(
+            _context: Any, badge_id: str, _badge_data: Any
+        ) -> None:
+            evaluated.append(badge_id)
+
+        manager._evaluate_badge_for_assignee = _capture_badge
+
+        manager._on_penalty_applied({"user_id": assignee_id})
+        manager._on_bonus_applied({"user_id": assignee_id})
+        assert manager._pending_families[assignee_id] == {
+            const.GAMIFICATION_SIGNAL_FAMILY_POINTS
+        }
+
+        await manager._evaluate_pending_assignees()
+        await hass.async_block_till_done()
+
+        assert "badge-points" in evaluated
+        assert "badge-streak" not in evaluated
+
+        evaluated.clear()
+        manager._on_chore_overdue({"user_id": assignee_id})
+        manager.recalculate_all_badges()
+        assert manager._pending_families[assignee_id] is None
+
+        await manager._evaluate_pending_assignees()
+        await hass.async_block_till_done()
+
+        assert {"badge-points", "badge-streak"} <= set(evaluated)
+        assert manager._pending_families == {}
+
     async def test_midnight_rollover_marks_all_assignees_pending(
         self,
         hass: HomeAssistant,
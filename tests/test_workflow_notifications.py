@@ -22,8 +22,10 @@ Notification System:
 
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
+import time
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, call, patch
 
@@ -870,6 +872,48 @@ class TestDueDateReminders:
             "Old notification timestamp should be before new period (auto-invalidated)"
         )
 
+    @pytest.mark.asyncio
+    async def test_schedule_lock_epoch_shadow_follows_stored_timestamps(
+        self,
+        hass: HomeAssistant,
+        scenario_notifications: SetupResult,
+    ) -> None:
+        """Shadowed epochs are reused until the stored period start changes."""
+        coordinator = scenario_notifications.coordinator
+        manager = coordinator.notification_manager
+        assignee_id = scenario_notifications.assignee_ids["Zoë"]
+        chore_id = scenario_notifications.chore_ids["Feed the cat"]
+
+        assignee_chore_data = coordinator.assignees_data[assignee_id].setdefault(
+            const.DATA_USER_CHORE_DATA, {}
+        )
+        chore_data = assignee_chore_data.setdefault(chore_id, {})
+        chore_data[const.DATA_USER_CHORE_DATA_APPROVAL_PERIOD_START] = (
+            "2020-01-01T00:00:00+00:00"
+        )
+
+        manager._record_chore_notification_sent(assignee_id, chore_id, "due_start")
+        assert not manager._should_send_chore_notification(
+            assignee_id, chore_id, "due_start"
+        )
+        assert (
+            assignee_id,
+            chore_id,
+            const.DATA_NOTIF_LAST_DUE_START,
+        ) in manager._lock_epochs
+
+        # A period start written outside the reset signal is re-parsed once
+        chore_data[const.DATA_USER_CHORE_DATA_APPROVAL_PERIOD_START] = (
+            "2999-01-01T00:00:00+00:00"
+        )
+        assert manager._should_send_chore_notification(
+            assignee_id, chore_id, "due_start"
+        )
+        period_iso, _period_epoch = manager._lock_epochs[
+            (assignee_id, chore_id, const.DATA_CHORE_APPROVAL_PERIOD_START)
+        ]
+        assert period_iso == "2999-01-01T00:00:00+00:00"
+
     @pytest.mark.asyncio
     async def test_reset_clears_due_window_overdue_and_approver_status_notifications(
         self,
@@ -934,6 +978,247 @@ class TestDueDateReminders:
         assert call(assignee_id, due_window_tag) in clear_assignee.await_args_list
 
 
+class TestSnoozedReminderQueue:
+    """Tests for the persisted "remind me later" queue."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_snooze_keeps_one_persisted_reminder(
+        self,
+        hass: HomeAssistant,
+        scenario_notifications: SetupResult,
+    ) -> None:
+        """Snoozing the same chore twice moves its reminder instead of adding one."""
+        coordinator = scenario_notifications.coordinator
+        manager = coordinator.notification_manager
+        assignee_id = scenario_notifications.assignee_ids["Zoë"]
+        chore_id = scenario_notifications.chore_ids["Feed the cat"]
+
+        await manager.remind_in_minutes(assignee_id, 30, chore_id=chore_id)
+        first_fire_at = manager._reminders[(assignee_id, const.DATA_CHORE_ID, chore_id)]
+        await manager.remind_in_minutes(assignee_id, 30, chore_id=chore_id)
+
+        assert len(manager._reminders) == 1
+        assert (
+            manager._reminders[(assignee_id, const.DATA_CHORE_ID, chore_id)]
+            >= first_fire_at
+        )
+        queued = coordinator._data[const.DATA_META][const.DATA_META_PENDING_REMINDERS]
+        assert len(queued) == 1
+        assert queued[0][const.DATA_USER_ID] == assignee_id
+        assert queued[0][const.DATA_CHORE_ID] == chore_id
+
+    @pytest.mark.asyncio
+    async def test_persisted_reminder_restored_and_sent_once(
+        self,
+        hass: HomeAssistant,
+        scenario_notifications: SetupResult,
+    ) -> None:
+        """A reminder queued before a restart is restored, sent, then dequeued."""
+        coordinator = scenario_notifications.coordinator
+        manager = coordinator.notification_manager
+        assignee_id = scenario_notifications.assignee_ids["Zoë"]
+        chore_id = scenario_notifications.chore_ids["Feed the cat"]
+        coordinator.chores_data[chore_id][const.DATA_CHORE_NOTIFY_DUE_REMINDER] = True
+
+        await manager.remind_in_minutes(assignee_id, 30, chore_id=chore_id)
+        manager._cancel_reminder_timer()
+        manager._reminders.clear()
+        manager._reminder_heap.clear()
+
+        manager._restore_reminders()
+        assert manager._reminder_timer is not None
+
+        approver_notify = AsyncMock()
+        with patch.object(manager, "notify_approvers_translated", approver_notify):
+            sent = await manager.async_send_due_reminders(now=time.time() + 3600)
+
+        assert sent == 1
+        approver_notify.assert_awaited_once()
+        assert (
+            approver_notify.await_args.kwargs["title_key"]
+            == const.TRANS_KEY_NOTIF_TITLE_CHORE_REMINDER_APPROVER
+        )
+        assert manager._reminder_timer is None
+        assert (
+            coordinator._data[const.DATA_META][const.DATA_META_PENDING_REMINDERS] == []
+        )
+
+
+class TestChoreNotificationDigest:
+    """Tests for per-assignee due/overdue digests from one time-check batch."""
+
+    @pytest.mark.asyncio
+    async def test_batched_entries_send_one_digest_and_one_lock_write(
+        self,
+        hass: HomeAssistant,
+        scenario_notifications: SetupResult,
+    ) -> None:
+        """Two chores flagged in one batch produce one digest per recipient."""
+        coordinator = scenario_notifications.coordinator
+        manager = coordinator.notification_manager
+        assignee_id = scenario_notifications.assignee_ids["Zoë"]
+        feed_id = scenario_notifications.chore_ids["Feed the cat"]
+        walk_id = scenario_notifications.chore_ids["Walk the dog"]
+        coordinator.chores_data[feed_id][const.DATA_CHORE_NOTIFY_ON_OVERDUE] = True
+
+        with (
+            patch.object(
+                manager, "notify_assignee_translated", new=AsyncMock()
+            ) as notify_assignee,
+            patch.object(
+                manager, "notify_approvers_translated", new=AsyncMock()
+            ) as notify_approvers,
+            patch.object(coordinator, "_persist") as persist,
+        ):
+            async with coordinator.batch():
+                await manager._handle_chore_overdue(
+                    {
+                        "user_id": assignee_id,
+                        "user_name": "Zoë",
+                        "chore_id": feed_id,
+                        "chore_name": "Feed the cat",
+                        "due_date": "2026-01-01T00:00:00+00:00",
+                        const.CHORE_TIME_SCAN_EVENT_DIGEST: True,
+                    }
+                )
+                await manager._handle_chore_due_window(
+                    {
+                        "user_id": assignee_id,
+                        "chore_id": walk_id,
+                        "chore_name": "Walk the dog",
+                        "hours": 1,
+                        "points": 8,
+                        const.CHORE_TIME_SCAN_EVENT_DIGEST: True,
+                    }
+                )
+                notify_assignee.assert_not_awaited()
+
+            await hass.async_block_till_done()
+
+        notify_assignee.assert_awaited_once()
+        kwargs = notify_assignee.await_args.kwargs
+        assert kwargs["title_key"] == const.TRANS_KEY_NOTIF_TITLE_CHORE_DIGEST_ASSIGNEE
+        assert kwargs["tag_type"] == const.NOTIFY_TAG_TYPE_DIGEST
+        assert kwargs["message_data"]["count"] == 2
+        assert kwargs["message_data"]["chore_list"] == (
+            "⏰ Feed the cat, 🎯 Walk the dog"
+        )
+        assert [
+            (action[const.NOTIFY_TITLE], action[const.NOTIFY_TITLE_DETAIL])
+            for action in kwargs["actions"]
+        ] == [
+            (const.TRANS_KEY_NOTIF_ACTION_CLAIM, "Feed the cat"),
+            (const.TRANS_KEY_NOTIF_ACTION_CLAIM, "Walk the dog"),
+        ]
+
+        notify_approvers.assert_awaited_once()
+        approver_kwargs = notify_approvers.await_args.kwargs
+        assert approver_kwargs["message_data"]["count"] == 1
+        assert [
+            action[const.NOTIFY_TITLE] for action in approver_kwargs["actions"]
+        ] == [
+            const.TRANS_KEY_NOTIF_ACTION_COMPLETE,
+            const.TRANS_KEY_NOTIF_ACTION_SKIP,
+            const.TRANS_KEY_NOTIF_ACTION_REMIND_30,
+        ]
+
+        persist.assert_called_once_with(
+            changed={const.DATA_NOTIFICATIONS: [assignee_id]}
+        )
+        assert not manager._should_send_chore_notification(
+            assignee_id, feed_id, "overdue"
+        )
+        assert not manager._should_send_chore_notification(
+            assignee_id, walk_id, "due_start"
+        )
+
+    @pytest.mark.asyncio
+    async def test_single_batched_entry_keeps_regular_notification(
+        self,
+        hass: HomeAssistant,
+        scenario_notifications: SetupResult,
+    ) -> None:
+        """One flagged chore in a batch is sent as its usual notification."""
+        coordinator = scenario_notifications.coordinator
+        manager = coordinator.notification_manager
+        assignee_id = scenario_notifications.assignee_ids["Zoë"]
+        chore_id = scenario_notifications.chore_ids["Feed the cat"]
+
+        with patch.object(
+            manager, "notify_assignee_translated", new=AsyncMock()
+        ) as notify_assignee:
+            async with coordinator.batch():
+                await manager._handle_chore_due_window(
+                    {
+                        "user_id": assignee_id,
+                        "chore_id": chore_id,
+                        "chore_name": "Feed the cat",
+                        "hours": 1,
+                        "points": 5,
+                        const.CHORE_TIME_SCAN_EVENT_DIGEST: True,
+                    }
+                )
+            await hass.async_block_till_done()
+
+        notify_assignee.assert_awaited_once()
+        kwargs = notify_assignee.await_args.kwargs
+        assert (
+            kwargs["title_key"] == const.TRANS_KEY_NOTIF_TITLE_CHORE_DUE_WINDOW_ASSIGNEE
+        )
+        assert kwargs["tag_type"] == const.NOTIFY_TAG_TYPE_STATUS
+
+    @pytest.mark.asyncio
+    async def test_unflagged_and_standby_entries_bypass_digest(
+        self,
+        hass: HomeAssistant,
+        scenario_notifications: SetupResult,
+    ) -> None:
+        """Only flagged default entries are held; others send per chore at once."""
+        coordinator = scenario_notifications.coordinator
+        manager = coordinator.notification_manager
+        assignee_id = scenario_notifications.assignee_ids["Zoë"]
+        feed_id = scenario_notifications.chore_ids["Feed the cat"]
+        walk_id = scenario_notifications.chore_ids["Walk the dog"]
+        coordinator.chores_data[walk_id][const.DATA_CHORE_NOTIFY_ON_OVERDUE] = True
+
+        with patch.object(
+            manager, "notify_assignee_translated", new=AsyncMock()
+        ) as notify_assignee:
+            async with coordinator.batch():
+                await manager._handle_chore_due_window(
+                    {
+                        "user_id": assignee_id,
+                        "chore_id": feed_id,
+                        "chore_name": "Feed the cat",
+                        "hours": 1,
+                        "points": 5,
+                    }
+                )
+                await manager._handle_chore_overdue(
+                    {
+                        "user_id": assignee_id,
+                        "user_name": "Zoë",
+                        "chore_id": walk_id,
+                        "chore_name": "Walk the dog",
+                        "due_date": "2026-01-01T00:00:00+00:00",
+                        const.CHORE_OVERDUE_EVENT_MESSAGE_TYPE: (
+                            const.CHORE_OVERDUE_NOTIFICATION_TYPE_STANDBY_NEEDED
+                        ),
+                        const.CHORE_TIME_SCAN_EVENT_DIGEST: True,
+                    }
+                )
+                assert notify_assignee.await_count == 2
+            await hass.async_block_till_done()
+
+        assert manager._digest_entries == {}
+        assert [
+            call.kwargs["title_key"] for call in notify_assignee.await_args_list
+        ] == [
+            const.TRANS_KEY_NOTIF_TITLE_CHORE_DUE_WINDOW_ASSIGNEE,
+            const.TRANS_KEY_NOTIF_TITLE_CHORE_STANDBY_NEEDED,
+        ]
+
+
 class TestNotificationLifecycleContract:
     """Tests for the Phase 3B assignee notification lifecycle contract."""
 
@@ -2073,6 +2358,132 @@ class TestConcurrentNotifications:
             assert call_count >= 1, "Expected notifications to be attempted"
 
 
+class TestNotificationDispatchQueue:
+    """Tests for the bounded, coalescing notification dispatch queue."""
+
+    @pytest.mark.asyncio
+    async def test_queued_messages_with_same_tag_coalesce(
+        self,
+        hass: HomeAssistant,
+        scenario_notifications: SetupResult,
+    ) -> None:
+        """A newer message replaces a queued one with the same (service, tag)."""
+        from custom_components.choreops.managers import notification_manager
+
+        manager = scenario_notifications.coordinator.notification_manager
+        stats_before = (
+            manager.dispatch_stats.sent,
+            manager.dispatch_stats.coalesced,
+        )
+        first_started = asyncio.Event()
+        release = asyncio.Event()
+        sent_messages: list[str] = []
+
+        async def slow_notification(
+            hass_arg: HomeAssistant,
+            service: str,
+            title: str,
+            message: str,
+            actions: list[dict[str, Any]] | None = None,
+            extra_data: dict[str, Any] | None = None,
+        ) -> None:
+            sent_messages.append(message)
+            first_started.set()
+            await release.wait()
+
+        tag = {const.NOTIFY_TAG: "choreops-status-test"}
+        with (
+            patch.object(
+                notification_manager,
+                "async_send_notification",
+                new=slow_notification,
+            ),
+            patch.object(const, "NOTIFY_DISPATCH_MAX_WORKERS", 1),
+        ):
+            await manager._send_notification(
+                "notify.mobile_app_zoe", "Title", "first", extra_data=tag
+            )
+            await first_started.wait()
+            for message in ("second", "third"):
+                await manager._send_notification(
+                    "notify.mobile_app_zoe", "Title", message, extra_data=tag
+                )
+            release.set()
+            await manager._drain_dispatch_queue()
+
+        assert sent_messages == ["first", "third"]
+        assert manager.dispatch_stats.sent - stats_before[0] == 2
+        assert manager.dispatch_stats.coalesced - stats_before[1] == 1
+
+    @pytest.mark.asyncio
+    async def test_send_returns_when_queued_and_hold_window_coalesces(
+        self,
+        hass: HomeAssistant,
+        scenario_notifications: SetupResult,
+    ) -> None:
+        """Senders don't wait for delivery; the hold merges back-to-back tags."""
+        from custom_components.choreops.managers import notification_manager
+
+        manager = scenario_notifications.coordinator.notification_manager
+        manager._dispatch_hold_seconds = 0.05
+        sent: list[tuple[str, str]] = []
+
+        async def record_notification(
+            hass_arg: HomeAssistant,
+            service: str,
+            title: str,
+            message: str,
+            actions: list[dict[str, Any]] | None = None,
+            extra_data: dict[str, Any] | None = None,
+        ) -> None:
+            sent.append((service, message))
+
+        with patch.object(
+            notification_manager,
+            "async_send_notification",
+            new=record_notification,
+        ):
+            for service, tag, message in (
+                ("notify.mobile_app_zoe", "status-feed", "claimed"),
+                ("notify.mobile_app_zoe", "status-walk", "walk"),
+                ("notify.mobile_app_zoe", "status-feed", "approved"),
+                ("notify.mobile_app_max", "status-feed", "other phone"),
+            ):
+                await manager._send_notification(
+                    service, "Title", message, extra_data={const.NOTIFY_TAG: tag}
+                )
+
+            assert sent == []
+            await manager._drain_dispatch_queue()
+
+        assert sorted(sent) == [
+            ("notify.mobile_app_max", "other phone"),
+            ("notify.mobile_app_zoe", "approved"),
+            ("notify.mobile_app_zoe", "walk"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_service_availability_cache_follows_registry(
+        self,
+        hass: HomeAssistant,
+        scenario_notifications: SetupResult,
+    ) -> None:
+        """Registering a notify service invalidates its cached availability."""
+        manager = scenario_notifications.coordinator.notification_manager
+
+        assert not manager._has_notify_service("notify", "mobile_app_new_phone")
+
+        async def mock_notify_service(call: Any) -> None:
+            """Mock notify service handler."""
+
+        hass.services.async_register(
+            "notify", "mobile_app_new_phone", mock_notify_service
+        )
+        await hass.async_block_till_done()
+
+        assert manager._has_notify_service("notify", "mobile_app_new_phone")
+
+
 class TestNonGamifiedNotificationRouting:
     """Tests for notification routing when gamification is disabled.
 